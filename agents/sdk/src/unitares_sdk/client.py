@@ -318,23 +318,7 @@ class GovernanceClient:
 
         raw = await self.call_tool("process_agent_update", args)
         self._raise_for_tool_failure("process_agent_update", raw)
-
-        # Extract verdict for potential error raising
-        decision = raw.get("decision", {})
-        verdict = decision.get("action", raw.get("verdict", "proceed"))
-        guidance = decision.get("guidance") or raw.get("guidance")
-
-        # Build result with flattened verdict
-        result_data = dict(raw)
-        result_data["verdict"] = verdict
-        if guidance:
-            result_data["guidance"] = guidance
-
-        # Extract coherence/risk from metrics if present
         metrics = raw.get("metrics", {})
-        if metrics:
-            result_data.setdefault("coherence", metrics.get("coherence"))
-            result_data.setdefault("risk", metrics.get("risk"))
 
         # RFC §7.13: emit substrate observation to lease_plane.surface_leases
         # alongside the existing process_agent_update path. Failure does NOT
@@ -354,7 +338,28 @@ class GovernanceClient:
         except Exception as exc:  # noqa: BLE001 — observational-only by contract
             logger.debug("[SDK] substrate emit failed (observational-only): %r", exc)
 
-        return CheckinResult.model_validate(result_data)
+        return CheckinResult.from_tool_result(raw)
+
+    async def checkin_many(
+        self,
+        checkins: list[dict[str, Any]],
+        response_mode: str = "compact",
+        **kwargs: Any,
+    ) -> list[CheckinResult]:
+        """Submit several check-ins in one call. Maps to server tool:
+        process_agent_updates_batch.
+
+        Each item holds checkin()'s arguments (response_text, complexity,
+        confidence, ...); an item for another agent carries that agent's
+        continuity_token. Results come back in submission order. A failed
+        item yields ``success=False, verdict="error"`` with ``error`` set
+        instead of raising, so one bad item does not hide the others.
+        """
+        args: dict[str, Any] = {"checkins": checkins, "response_mode": response_mode}
+        args.update(kwargs)
+        raw = await self.call_tool("process_agent_updates_batch", args)
+        self._raise_for_tool_failure("process_agent_updates_batch", raw)
+        return [CheckinResult.from_tool_result(item) for item in raw.get("results", [])]
 
     # --- Knowledge graph ---
 
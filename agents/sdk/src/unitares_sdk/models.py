@@ -40,6 +40,24 @@ class CheckinResult(_GovModel):
     coherence: float | None = None
     risk: float | None = None
     metrics: dict | None = None
+    error: str | None = None
+
+    @classmethod
+    def from_tool_result(cls, raw: dict) -> "CheckinResult":
+        """Build from a process_agent_update result, flattening the verdict."""
+        if raw.get("success") is False:
+            return cls(success=False, verdict="error", error=str(raw.get("error", "Unknown error")))
+        decision = raw.get("decision", {})
+        result_data = dict(raw)
+        result_data["verdict"] = decision.get("action", raw.get("verdict", "proceed"))
+        guidance = decision.get("guidance") or raw.get("guidance")
+        if guidance:
+            result_data["guidance"] = guidance
+        metrics = raw.get("metrics", {})
+        if metrics:
+            result_data.setdefault("coherence", metrics.get("coherence"))
+            result_data.setdefault("risk", metrics.get("risk"))
+        return cls.model_validate(result_data)
 
 
 class NoteResult(_GovModel):
@@ -171,20 +171,7 @@ class SyncGovernanceClient:
         args.update(kwargs)
         raw = self.call_tool("process_agent_update", args)
         self._raise_for_tool_failure("process_agent_update", raw)
-
-        decision = raw.get("decision", {})
-        verdict = decision.get("action", raw.get("verdict", "proceed"))
-        guidance = decision.get("guidance") or raw.get("guidance")
-
-        result_data = dict(raw)
-        result_data["verdict"] = verdict
-        if guidance:
-            result_data["guidance"] = guidance
-
         metrics = raw.get("metrics", {})
-        if metrics:
-            result_data.setdefault("coherence", metrics.get("coherence"))
-            result_data.setdefault("risk", metrics.get("risk"))
 
         # RFC §7.13: emit substrate observation alongside process_agent_update
         # (mirrors UnitaresClient.checkin). Failure observational-only.
@@ -200,7 +187,20 @@ class SyncGovernanceClient:
         except Exception as exc:  # noqa: BLE001 — observational-only by contract
             logger.debug("[SDK] substrate emit failed (observational-only): %r", exc)
 
-        return CheckinResult.model_validate(result_data)
+        return CheckinResult.from_tool_result(raw)
+
+    def checkin_many(
+        self,
+        checkins: list[dict[str, Any]],
+        response_mode: str = "compact",
+        **kwargs: Any,
+    ) -> list[CheckinResult]:
+        """Batched checkin(); see GovernanceClient.checkin_many."""
+        args: dict[str, Any] = {"checkins": checkins, "response_mode": response_mode}
+        args.update(kwargs)
+        raw = self.call_tool("process_agent_updates_batch", args)
+        self._raise_for_tool_failure("process_agent_updates_batch", raw)
+        return [CheckinResult.from_tool_result(item) for item in raw.get("results", [])]
 
     # --- Knowledge graph ---
 
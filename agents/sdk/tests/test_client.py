@@ -244,6 +244,23 @@ class TestToolMapping:
         assert tool_name == "process_agent_update"
         assert isinstance(result, CheckinResult)
 
+    @pytest.mark.asyncio
+    async def test_checkin_many_maps_to_batch_tool(self):
+        session = AsyncMock()
+        session.call_tool = AsyncMock(return_value=make_mcp_result({
+            "success": True,
+            "results": [
+                {"success": True, "decision": {"action": "guide", "guidance": "slow down"}},
+                {"success": True, "decision": {"action": "proceed"}},
+            ],
+        }))
+        client = make_client_with_session(session)
+
+        results = await client.checkin_many([{"response_text": "a"}, {"response_text": "b"}])
+        assert session.call_tool.call_args[0][0] == "process_agent_updates_batch"
+        assert [r.verdict for r in results] == ["guide", "proceed"]
+        assert results[0].guidance == "slow down"
+
     @pytest.mark.asyncio
     async def test_get_metrics_maps_to_get_governance_metrics(self):
         session = AsyncMock()
@@ -182,6 +182,28 @@ class TestSyncToolMapping:
         assert calls[-1] == "process_agent_update"
         assert isinstance(result, CheckinResult)
 
+    def test_checkin_many_maps_to_batch_tool_and_keeps_order(self):
+        client = SyncGovernanceClient(transport="rest")
+        calls = []
+
+        def fake_call(tool_name, arguments, **kwargs):
+            calls.append((tool_name, arguments))
+            return {
+                "success": True,
+                "results": [
+                    {"success": True, "decision": {"action": "proceed"}, "metrics": {"coherence": 0.5}},
+                    {"success": False, "error": "Session mismatch"},
+                ],
+            }
+
+        client.call_tool = fake_call
+        results = client.checkin_many([{"response_text": "a"}, {"response_text": "b"}])
+        assert calls[-1][0] == "process_agent_updates_batch"
+        assert calls[-1][1]["checkins"] == [{"response_text": "a"}, {"response_text": "b"}]
+        assert [r.success for r in results] == [True, False]
+        assert results[0].verdict == "proceed" and results[0].coherence == 0.5
+        assert results[1].verdict == "error" and results[1].error == "Session mismatch"
+
     def test_get_metrics_maps_to_get_governance_metrics(self):
         client = SyncGovernanceClient(transport="rest")
         calls = []
@@ -16,6 +16,7 @@ CREATE TABLE IF NOT EXISTS core.discovery_embeddings_bge_m3 (
     discovery_id        TEXT PRIMARY KEY,
     embedding           vector(1024) NOT NULL,
     model_name          TEXT NOT NULL DEFAULT 'BAAI/bge-m3',
+    content_hash        TEXT,                       -- migration 040
     created_at          TIMESTAMPTZ NOT NULL DEFAULT now(),
     updated_at          TIMESTAMPTZ NOT NULL DEFAULT now()
 );
@@ -25,6 +25,7 @@ CREATE TABLE IF NOT EXISTS core.discovery_embeddings (
     discovery_id        TEXT PRIMARY KEY,
     embedding           vector(384) NOT NULL,
     model_name          TEXT NOT NULL DEFAULT 'all-MiniLM-L6-v2',
+    content_hash        TEXT,                       -- migration 040
     created_at          TIMESTAMPTZ NOT NULL DEFAULT now(),
     updated_at          TIMESTAMPTZ NOT NULL DEFAULT now()
 );
@@ -0,0 +1,101 @@
+-- Migration 038: write-through core.agent_latest_state
+--
+-- Replaces the 60s `REFRESH MATERIALIZED VIEW CONCURRENTLY
+-- core.mv_latest_agent_states` loop in background_tasks.py. The refresh
+-- rescanned all of core.agent_state every minute whether anything changed
+-- or not, and get_all_latest_agent_states could still be up to a minute
+-- stale.
+--
+-- core.agent_latest_state holds the latest measured row per
+-- (identity_id, epoch). An AFTER INSERT trigger on core.agent_state upserts
+-- it in the same statement, so every writer — record_agent_state, the
+-- batched executemany path, ad-hoc SQL — keeps it current with zero lag.
+--
+-- Rules mirror the matview (migration 023) and the base-table fallback in
+-- get_all_latest_agent_states:
+--   - measured only: the trigger fires WHEN (NEW.synthetic = false), so
+--     bootstrap rows never land here;
+--   - epoch: keyed per epoch, readers filter `epoch = CURRENT_EPOCH`;
+--   - latest wins by recorded_at (ties: the later insert); an out-of-order
+--     insert with an older recorded_at does not overwrite a newer row.
+--
+-- Deletes: ON DELETE CASCADE via identity_id. cleanup_old_agent_state()
+-- never deletes the latest row per identity, so it cannot orphan an entry.
+-- StateMixin.check_agent_latest_state() / scripts/ops/agent_latest_state.py
+-- report any drift; backfill_agent_latest_state() repairs it.
+--
+-- The matview is left in place (no longer refreshed by the server) so a
+-- rollback only needs to re-enable the refresh loop. A later migration can
+-- drop it.
+
+CREATE TABLE IF NOT EXISTS core.agent_latest_state (
+    identity_id         BIGINT NOT NULL REFERENCES core.identities(identity_id) ON DELETE CASCADE,
+    epoch               INTEGER NOT NULL,
+    state_id            BIGINT NOT NULL,
+    recorded_at         TIMESTAMPTZ NOT NULL,
+    entropy             REAL NOT NULL,
+    integrity           REAL NOT NULL,
+    stability_index     REAL NOT NULL,
+    volatility          REAL NOT NULL,
+    regime              TEXT NOT NULL,
+    coherence           REAL NOT NULL,
+    state_json          JSONB NOT NULL DEFAULT '{}'::jsonb,
+    PRIMARY KEY (identity_id, epoch)
+);
+
+CREATE INDEX IF NOT EXISTS idx_agent_latest_state_epoch
+    ON core.agent_latest_state (epoch);
+
+CREATE OR REPLACE FUNCTION core.agent_latest_state_upsert()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO core.agent_latest_state AS l (
+        identity_id, epoch, state_id, recorded_at,
+        entropy, integrity, stability_index, volatility,
+        regime, coherence, state_json
+    )
+    VALUES (
+        NEW.identity_id, NEW.epoch, NEW.state_id, NEW.recorded_at,
+        NEW.entropy, NEW.integrity, NEW.stability_index, NEW.volatility,
+        NEW.regime, NEW.coherence, NEW.state_json
+    )
+    ON CONFLICT (identity_id, epoch) DO UPDATE SET
+        state_id = EXCLUDED.state_id,
+        recorded_at = EXCLUDED.recorded_at,
+        entropy = EXCLUDED.entropy,
+        integrity = EXCLUDED.integrity,
+        stability_index = EXCLUDED.stability_index,
+        volatility = EXCLUDED.volatility,
+        regime = EXCLUDED.regime,
+        coherence = EXCLUDED.coherence,
+        state_json = EXCLUDED.state_json
+    WHERE EXCLUDED.recorded_at >= l.recorded_at;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_agent_state_latest ON core.agent_state;
+CREATE TRIGGER trg_agent_state_latest
+    AFTER INSERT ON core.agent_state
+    FOR EACH ROW
+    WHEN (NEW.synthetic = false)
+    EXECUTE FUNCTION core.agent_latest_state_upsert();
+
+-- One-shot backfill from existing history (idempotent).
+INSERT INTO core.agent_latest_state (
+    identity_id, epoch, state_id, recorded_at,
+    entropy, integrity, stability_index, volatility,
+    regime, coherence, state_json
+)
+SELECT DISTINCT ON (s.identity_id, s.epoch)
+       s.identity_id, s.epoch, s.state_id, s.recorded_at,
+       s.entropy, s.integrity, s.stability_index, s.volatility,
+       s.regime, s.coherence, s.state_json
+FROM core.agent_state s
+WHERE s.synthetic = false
+ORDER BY s.identity_id, s.epoch, s.recorded_at DESC, s.state_id DESC
+ON CONFLICT (identity_id, epoch) DO NOTHING;
+
+INSERT INTO core.schema_migrations (version, name, applied_at)
+VALUES (38, 'agent_latest_state', NOW())
+ON CONFLICT (version) DO NOTHING;
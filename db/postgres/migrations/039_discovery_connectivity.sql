@@ -0,0 +1,101 @@
+-- Migration 039: knowledge.discovery_connectivity in-degree counters
+--
+-- Every semantic/hybrid search ranks its candidates by connectivity. Until
+-- now that meant an AGE Cypher UNWIND with three OPTIONAL MATCH traversals
+-- (RELATED_TO, RESPONDS_TO, SUPERSEDES) per search, and
+-- _blend_with_connectivity could not rank until it returned.
+--
+-- knowledge.discovery_connectivity holds the inbound edge counts per
+-- discovery, so ranking is one primary-key lookup:
+--   related       — distinct discoveries with a RELATED_TO edge to it
+--   responds      — distinct discoveries with a RESPONDS_TO edge to it
+--   superseded_by — distinct discoveries with a SUPERSEDES edge to it
+--
+-- Counts are derived from knowledge.discovery_edges (PRIMARY KEY
+-- (src_id, dst_id, edge_type), so one row per distinct source — the same
+-- thing the Cypher `count(DISTINCT ...)` counted). An AFTER INSERT OR
+-- DELETE trigger keeps them current for every writer:
+--   - _sync_discovery_edges (payload related_to / response_to edges),
+--   - link_discoveries (edge_type 'related', metadata.source = 'link'),
+--   - supersede_discovery (edge_type 'supersedes').
+-- Archival only changes status; edges and counts stay, as they did in the
+-- graph. Rows for deleted discoveries go with ON DELETE CASCADE.
+--
+-- Edges created in AGE before this migration by link_discoveries /
+-- supersede_discovery have no discovery_edges row. The backfill below
+-- counts what discovery_edges knows; KnowledgeGraphAGE
+-- .reconcile_connectivity() / scripts/ops/kg_connectivity.py compare the
+-- table against the graph and, with --repair, overwrite it with the graph
+-- counts.
+
+CREATE TABLE IF NOT EXISTS knowledge.discovery_connectivity (
+    discovery_id        TEXT PRIMARY KEY REFERENCES knowledge.discoveries(id) ON DELETE CASCADE,
+    related             INTEGER NOT NULL DEFAULT 0,
+    responds            INTEGER NOT NULL DEFAULT 0,
+    superseded_by       INTEGER NOT NULL DEFAULT 0,
+    updated_at          TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE OR REPLACE FUNCTION knowledge.discovery_connectivity_apply()
+RETURNS TRIGGER AS $$
+DECLARE
+    edge  knowledge.discovery_edges%ROWTYPE;
+    delta INTEGER;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        edge := NEW;
+        delta := 1;
+    ELSE
+        edge := OLD;
+        delta := -1;
+    END IF;
+
+    IF edge.edge_type NOT IN ('related', 'responds_to', 'supersedes') THEN
+        RETURN NULL;
+    END IF;
+
+    INSERT INTO knowledge.discovery_connectivity AS c (
+        discovery_id, related, responds, superseded_by
+    )
+    SELECT edge.dst_id,
+           GREATEST(0, CASE WHEN edge.edge_type = 'related' THEN delta ELSE 0 END),
+           GREATEST(0, CASE WHEN edge.edge_type = 'responds_to' THEN delta ELSE 0 END),
+           GREATEST(0, CASE WHEN edge.edge_type = 'supersedes' THEN delta ELSE 0 END)
+    -- The dst row is already gone when the delete cascades from it.
+    WHERE EXISTS (SELECT 1 FROM knowledge.discoveries WHERE id = edge.dst_id)
+    ON CONFLICT (discovery_id) DO UPDATE SET
+        related = GREATEST(0, c.related
+            + CASE WHEN edge.edge_type = 'related' THEN delta ELSE 0 END),
+        responds = GREATEST(0, c.responds
+            + CASE WHEN edge.edge_type = 'responds_to' THEN delta ELSE 0 END),
+        superseded_by = GREATEST(0, c.superseded_by
+            + CASE WHEN edge.edge_type = 'supersedes' THEN delta ELSE 0 END),
+        updated_at = now();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_discovery_edges_connectivity ON knowledge.discovery_edges;
+CREATE TRIGGER trg_discovery_edges_connectivity
+    AFTER INSERT OR DELETE ON knowledge.discovery_edges
+    FOR EACH ROW
+    EXECUTE FUNCTION knowledge.discovery_connectivity_apply();
+
+-- One-shot backfill from existing edge rows (idempotent: recomputes).
+INSERT INTO knowledge.discovery_connectivity (discovery_id, related, responds, superseded_by)
+SELECT e.dst_id,
+       COUNT(*) FILTER (WHERE e.edge_type = 'related'),
+       COUNT(*) FILTER (WHERE e.edge_type = 'responds_to'),
+       COUNT(*) FILTER (WHERE e.edge_type = 'supersedes')
+FROM knowledge.discovery_edges e
+WHERE e.edge_type IN ('related', 'responds_to', 'supersedes')
+GROUP BY e.dst_id
+ON CONFLICT (discovery_id) DO UPDATE SET
+    related = EXCLUDED.related,
+    responds = EXCLUDED.responds,
+    superseded_by = EXCLUDED.superseded_by,
+    updated_at = now();
+
+INSERT INTO core.schema_migrations (version, name, applied_at)
+VALUES (39, 'discovery_connectivity', NOW())
+ON CONFLICT (version) DO NOTHING;
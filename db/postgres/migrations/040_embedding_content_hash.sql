@@ -0,0 +1,43 @@
+-- Migration 040: content_hash on the discovery embedding tables
+--
+-- An embedding row did not record which text it was computed from, so the
+-- only way to find vectors left stale by summary/details edits (or by a
+-- missed _refresh_embedding) was to re-embed the whole corpus.
+--
+-- content_hash is the sha256 (hex) of the embedded text:
+--   summary || E'\n' || left(details, 6000)
+-- 6000 is EMBED_DETAILS_WINDOW (src/mcp_handlers/knowledge/limits.py); the
+-- Python side is src/storage/knowledge_graph_age.py embedding_content_hash().
+-- knowledge.discovery_embedding_hash(summary, details) computes the same
+-- value in SQL, so "missing or stale" is one join:
+--
+--   SELECT d.id FROM knowledge.discoveries d
+--   LEFT JOIN core.discovery_embeddings e ON e.discovery_id = d.id
+--   WHERE e.content_hash IS DISTINCT FROM
+--         knowledge.discovery_embedding_hash(d.summary, d.details);
+--
+-- Rows written before this migration have content_hash NULL and count as
+-- stale until the backfill (scripts/migration/backfill_embeddings.py
+-- --mode stale) re-embeds them; --mode missing leaves them alone.
+
+ALTER TABLE core.discovery_embeddings
+    ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+-- Parallel bge-m3 table (embeddings_bge_m3_schema.sql) may not exist.
+ALTER TABLE IF EXISTS core.discovery_embeddings_bge_m3
+    ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+CREATE OR REPLACE FUNCTION knowledge.discovery_embedding_hash(summary TEXT, details TEXT)
+RETURNS TEXT AS $$
+    SELECT encode(
+        sha256(convert_to(
+            COALESCE(summary, '') || E'\n' || left(COALESCE(details, ''), 6000),
+            'UTF8'
+        )),
+        'hex'
+    );
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+INSERT INTO core.schema_migrations (version, name, applied_at)
+VALUES (40, 'embedding_content_hash', NOW())
+ON CONFLICT (version) DO NOTHING;
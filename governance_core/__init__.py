@@ -52,6 +52,12 @@ from .parameters import (
 
 from .dynamics import DEFAULT_STATE
 
+from .fleet import (
+    FleetState,
+    compute_fleet_dynamics,
+    simulate_fleet,
+)
+
 from .utils import (
     clip,
     drift_norm,
@@ -92,6 +98,11 @@ from .stability import (
     gershgorin_stability_bound,
     sweep_stability,
     optimize_stability_metric,
+    equilibrium_batch,
+    jacobian_batch,
+    contraction_batch,
+    gershgorin_batch,
+    clear_sweep_cache,
 )
 
 __all__ = [
@@ -102,6 +113,11 @@ __all__ = [
     'step_state',
     'compute_saturation_diagnostics',
 
+    # Vectorized fleet dynamics
+    'FleetState',
+    'compute_fleet_dynamics',
+    'simulate_fleet',
+
     # Coherence functions
     'coherence',
     'lambda1',
@@ -156,6 +172,13 @@ __all__ = [
     'gershgorin_stability_bound',
     'sweep_stability',
     'optimize_stability_metric',
+
+    # Batched stability analysis
+    'equilibrium_batch',
+    'jacobian_batch',
+    'contraction_batch',
+    'gershgorin_batch',
+    'clear_sweep_cache',
 ]
 
-__version__ = '2.5.0'  # Lyapunov stability verification
+__version__ = '2.7.0'  # Batched stability sweeps
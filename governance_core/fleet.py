@@ -0,0 +1,298 @@
+"""
+UNITARES Governance Core - Vectorized Fleet Dynamics
+
+Struct-of-arrays counterpart of `dynamics.compute_dynamics`: advances N
+agents' EISV states one step at a time with NumPy, instead of one `State`
+per call. Replay, simulation and research scripts use it to step 10^5
+trajectories at once.
+
+The kernel mirrors the scalar derivative, barrier, clipping and
+complexity-floor arithmetic operation for operation, so each row of the
+result agrees with `compute_dynamics` on the same inputs up to the last
+bit of `tanh` (NumPy's and libm's may differ by one ulp).
+
+Every per-agent input is an array of shape (N,) or a scalar broadcast to
+all agents:
+    state:        FleetState (E, I, S, V arrays)
+    delta_eta:    (N, k) ethical drift vectors, or None for no drift
+    theta:        Theta whose C1 / eta1 / eta2 are scalars or (N,) arrays
+    dt, noise_S, complexity: scalars or (N,) arrays
+    sensor_eisv:  FleetState of anchors; rows with NaN E are unanchored
+
+The integrator and I-dynamics mode are read from the environment once per
+call (not per derivative evaluation) unless passed explicitly.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from .dynamics import State
+from .parameters import DynamicsParams, Theta, get_i_dynamics_mode, get_integrator_mode
+
+ArrayLike = Union[float, np.ndarray]
+
+
+@dataclass
+class FleetState:
+    """EISV states of N agents, one float64 array per variable."""
+
+    E: np.ndarray
+    I: np.ndarray
+    S: np.ndarray
+    V: np.ndarray
+
+    def __post_init__(self):
+        self.E, self.I, self.S, self.V = np.broadcast_arrays(
+            *(np.asarray(x, dtype=np.float64) for x in (self.E, self.I, self.S, self.V))
+        )
+
+    def __len__(self) -> int:
+        return self.E.shape[0]
+
+    def __getitem__(self, i: int) -> State:
+        return State(E=float(self.E[i]), I=float(self.I[i]), S=float(self.S[i]), V=float(self.V[i]))
+
+    @classmethod
+    def from_states(cls, states: Sequence[Optional[State]]) -> "FleetState":
+        """Pack State objects; None entries become NaN rows (e.g. no sensor)."""
+        arr = np.full((len(states), 4), np.nan)
+        for row, s in enumerate(states):
+            if s is not None:
+                arr[row] = (s.E, s.I, s.S, s.V)
+        return cls.from_array(arr)
+
+    @classmethod
+    def from_array(cls, arr: np.ndarray) -> "FleetState":
+        """Build from an (N, 4) array with columns E, I, S, V."""
+        arr = np.asarray(arr, dtype=np.float64)
+        return cls(arr[:, 0].copy(), arr[:, 1].copy(), arr[:, 2].copy(), arr[:, 3].copy())
+
+    def to_array(self) -> np.ndarray:
+        """(N, 4) array with columns E, I, S, V."""
+        return np.stack([self.E, self.I, self.S, self.V], axis=1)
+
+    def to_states(self) -> List[State]:
+        return [self[i] for i in range(len(self))]
+
+
+def _clip(x: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    # utils.clip is max(lo, min(hi, x)); keep the same order.
+    return np.maximum(lo, np.minimum(hi, x))
+
+
+def _barrier(x: np.ndarray, lo: float, hi: float, strength: float, margin: float) -> np.ndarray:
+    """Vectorized utils.barrier."""
+    near_lo = x - lo < margin
+    near_hi = hi - x < margin
+    if not (near_lo.any() or near_hi.any()):
+        return 0.0  # interior everywhere; adding 0.0 is exact
+    t_lo = 1.0 - (x - lo) / margin
+    t_hi = 1.0 - (hi - x) / margin
+    push_up = np.where(near_lo, strength * t_lo * t_lo * t_lo, 0.0)
+    push_down = np.where(near_hi, strength * t_hi * t_hi * t_hi, 0.0)
+    return push_up - push_down
+
+
+def _lambda1(eta1: ArrayLike, lambda1_min: float = 0.05, lambda1_max: float = 0.20) -> np.ndarray:
+    """Vectorized coherence.lambda1 (eta1 [0.1, 0.5] -> [lambda1_min, lambda1_max])."""
+    eta1_min, eta1_max = 0.1, 0.5
+    clamped = np.maximum(eta1_min, np.minimum(eta1_max, eta1))
+    return lambda1_min + (clamped - eta1_min) / (eta1_max - eta1_min) * (lambda1_max - lambda1_min)
+
+
+def _lambda2(eta2: Optional[ArrayLike], params: DynamicsParams,
+             lambda2_min: float = 0.02, lambda2_max: float = 0.10) -> ArrayLike:
+    """Vectorized coherence.lambda2."""
+    if eta2 is None:
+        return params.lambda2_base
+    eta2_min, eta2_max = 0.1, 0.5
+    clamped = np.maximum(eta2_min, np.minimum(eta2_max, eta2))
+    return lambda2_min + (clamped - eta2_min) / (eta2_max - eta2_min) * (lambda2_max - lambda2_min)
+
+
+class _Kernel:
+    """Per-call constants of the derivative function, evaluated once per step."""
+
+    def __init__(self, d_eta_sq, theta: Theta, params: DynamicsParams, noise_S, complexity,
+                 sensor: Optional[FleetState], i_mode: str):
+        self.p = params
+        self.d_eta_sq = d_eta_sq
+        self.C1 = np.asarray(theta.C1, dtype=np.float64)
+        self.lam1 = _lambda1(np.asarray(theta.eta1, dtype=np.float64))
+        eta2 = getattr(theta, "eta2", None)
+        self.lam2 = _lambda2(None if eta2 is None else np.asarray(eta2, dtype=np.float64), params)
+        self.noise_S = noise_S
+        self.complexity = complexity
+        self.linear = i_mode == "linear"
+        self.sensor = sensor
+        if sensor is not None:
+            self.anchored = ~np.isnan(sensor.E)
+
+    def derivatives(self, E, I, S, V):
+        """Vectorized dynamics._derivatives."""
+        p = self.p
+        C = p.Cmax * 0.5 * (1.0 + np.tanh(self.C1 * V))
+
+        dE = p.alpha * (I - E) - p.beta_E * E * S + p.gamma_E * self.d_eta_sq
+
+        A = p.beta_I * C - p.k * S
+        if self.linear:
+            dI = A - p.gamma_I * I
+        else:
+            dI = A - p.gamma_I * I * (1 - I)
+
+        dS = (
+            -p.mu * S
+            + self.lam1 * self.d_eta_sq
+            - self.lam2 * C
+            + p.beta_complexity * self.complexity
+            + self.noise_S
+        )
+
+        dV = p.kappa * (E - I) - p.delta * V
+
+        if self.sensor is not None:
+            E_range = p.E_max - p.E_min
+            S_range = p.S_max - p.S_min
+            V_range = p.V_max - p.V_min
+            a, sen = self.anchored, self.sensor
+            dE = dE + np.where(a, p.k_anchor * (sen.E - E) / E_range, 0.0)
+            dI = dI + np.where(a, p.k_anchor * (sen.I - I) / E_range, 0.0)
+            dS = dS + np.where(a, p.k_anchor * (sen.S - S) / S_range, 0.0)
+            dV = dV + np.where(a, p.k_anchor * (sen.V - V) / V_range, 0.0)
+
+        m = p.barrier_margin
+        s = p.barrier_strength
+        dE = dE + _barrier(E, p.E_min, p.E_max, s, m)
+        dI = dI + _barrier(I, p.I_min, p.I_max, s, m)
+        dS = dS + _barrier(S, p.S_min, p.S_max, s, m * (p.S_max - p.S_min))
+        dV = dV + _barrier(V, p.V_min, p.V_max, s, m * (p.V_max - p.V_min))
+        return dE, dI, dS, dV
+
+    def clipped(self, E, I, S, V):
+        p = self.p
+        return (
+            _clip(E, p.E_min, p.E_max),
+            _clip(I, p.I_min, p.I_max),
+            _clip(S, p.S_min, p.S_max),
+            _clip(V, p.V_min, p.V_max),
+        )
+
+    def euler(self, x, dt):
+        k = self.derivatives(*x)
+        return self.clipped(*(xi + ki * dt for xi, ki in zip(x, k)))
+
+    def rk4(self, x, dt):
+        k1 = self.derivatives(*x)
+        k2 = self.derivatives(*self.clipped(*(xi + 0.5 * dt * ki for xi, ki in zip(x, k1))))
+        k3 = self.derivatives(*self.clipped(*(xi + 0.5 * dt * ki for xi, ki in zip(x, k2))))
+        k4 = self.derivatives(*self.clipped(*(xi + dt * ki for xi, ki in zip(x, k3))))
+        dt6 = dt / 6.0
+        return self.clipped(*(
+            xi + dt6 * (a + 2 * b + 2 * c + d)
+            for xi, a, b, c, d in zip(x, k1, k2, k3, k4)
+        ))
+
+
+def fleet_drift_sq(delta_eta: Optional[np.ndarray], n: int) -> np.ndarray:
+    """‖Δη‖² per agent from an (N, k) drift matrix, as utils.drift_norm squares it."""
+    if delta_eta is None:
+        return np.zeros(n)
+    delta_eta = np.asarray(delta_eta, dtype=np.float64)
+    if delta_eta.ndim != 2 or delta_eta.shape[0] != n:
+        raise ValueError(f"delta_eta must have shape ({n}, k), got {delta_eta.shape}")
+    # Column-by-column accumulation matches sum() over each drift vector
+    # exactly (np.sum would switch to pairwise summation).
+    acc = np.zeros(n)
+    for j in range(delta_eta.shape[1]):
+        col = delta_eta[:, j]
+        acc += col * col
+    d_eta = np.sqrt(acc)
+    return d_eta * d_eta
+
+
+def compute_fleet_dynamics(
+    state: FleetState,
+    delta_eta: Optional[np.ndarray],
+    theta: Theta,
+    params: DynamicsParams,
+    dt: ArrayLike = 0.1,
+    noise_S: ArrayLike = 0.0,
+    complexity: ArrayLike = 0.5,
+    sensor_eisv: Optional[FleetState] = None,
+    *,
+    integrator: Optional[str] = None,
+    i_mode: Optional[str] = None,
+) -> FleetState:
+    """
+    One time step of UNITARES dynamics for every agent in ``state``.
+
+    Row i of the result equals ``compute_dynamics`` applied to row i of the
+    inputs (see module docstring for shapes). ``integrator`` ('rk4' or
+    'euler') and ``i_mode`` ('linear' or 'logistic') default to
+    UNITARES_INTEGRATOR / UNITARES_I_DYNAMICS.
+
+    Returns:
+        New FleetState after dt time evolution
+    """
+    n = len(state)
+    if sensor_eisv is not None and len(sensor_eisv) != n:
+        raise ValueError(f"sensor_eisv has {len(sensor_eisv)} rows for {n} agents")
+    complexity = np.maximum(0.0, np.minimum(1.0, np.asarray(complexity, dtype=np.float64)))
+    kernel = _Kernel(
+        fleet_drift_sq(delta_eta, n), theta, params, noise_S, complexity, sensor_eisv,
+        i_mode or get_i_dynamics_mode(),
+    )
+    return _step(kernel, state, dt, (integrator or get_integrator_mode()) == "euler")
+
+
+def _step(kernel: _Kernel, state: FleetState, dt, euler: bool) -> FleetState:
+    x = (state.E, state.I, state.S, state.V)
+    E, I, S, V = kernel.euler(x, dt) if euler else kernel.rk4(x, dt)
+    # Post-integration complexity-proportional entropy floor, as compute_dynamics.
+    S = np.maximum(S, kernel.p.S_min + 0.049 * kernel.complexity)
+    return FleetState(E, I, S, V)
+
+
+def simulate_fleet(
+    state: FleetState,
+    n_steps: int,
+    delta_eta: Optional[np.ndarray],
+    theta: Theta,
+    params: DynamicsParams,
+    dt: ArrayLike = 0.1,
+    noise_S: ArrayLike = 0.0,
+    complexity: ArrayLike = 0.5,
+    sensor_eisv: Optional[FleetState] = None,
+    *,
+    integrator: Optional[str] = None,
+    i_mode: Optional[str] = None,
+    record: bool = False,
+) -> Union[FleetState, np.ndarray]:
+    """
+    Advance every agent ``n_steps`` steps with constant inputs.
+
+    Equivalent to calling compute_fleet_dynamics in a loop, with the drift
+    norm, lambdas and modes resolved once. Returns the final FleetState, or
+    with ``record=True`` the (n_steps + 1, N, 4) trajectory including the
+    initial state.
+    """
+    n = len(state)
+    complexity = np.maximum(0.0, np.minimum(1.0, np.asarray(complexity, dtype=np.float64)))
+    kernel = _Kernel(
+        fleet_drift_sq(delta_eta, n), theta, params, noise_S, complexity, sensor_eisv,
+        i_mode or get_i_dynamics_mode(),
+    )
+    euler = (integrator or get_integrator_mode()) == "euler"
+    trajectory = np.empty((n_steps + 1, n, 4)) if record else None
+    if record:
+        trajectory[0] = state.to_array()
+    for step in range(n_steps):
+        state = _step(kernel, state, dt, euler)
+        if record:
+            trajectory[step + 1] = state.to_array()
+    return trajectory if record else state
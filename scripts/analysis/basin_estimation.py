@@ -24,6 +24,7 @@ sys.path.insert(0, str(project_root))
 from governance_core.dynamics import (
     compute_dynamics, compute_equilibrium, State, check_basin,
 )
+from governance_core.fleet import FleetState, simulate_fleet
 from governance_core.parameters import (
     Theta, get_active_params, DEFAULT_THETA, get_i_dynamics_mode,
 )
@@ -214,18 +215,22 @@ def run_basin_estimation(
 
     perturbations = generate_perturbations(eq, n_samples, seed=seed)
 
+    # All samples advance together: (n_steps + 1, n_samples, 4)
+    print(f"Integrating {n_samples} trajectories x {n_steps} steps...")
+    trajectories = simulate_fleet(
+        FleetState.from_array(perturbations), n_steps,
+        np.zeros((n_samples, len(delta_eta))), theta, params,
+        dt=dt, complexity=complexity, record=True,
+    )
+
     results_list = []
     n_convergent = 0
     n_divergent = 0
     n_stuck = 0
 
     for i in range(n_samples):
-        if (i + 1) % 1000 == 0 or i == 0:
-            print(f"  Integrating sample {i + 1}/{n_samples}...")
-
         initial = vec_to_state(perturbations[i])
-        traj = integrate_trajectory(initial, params, theta, delta_eta,
-                                    n_steps=n_steps, dt=dt, complexity=complexity)
+        traj = [vec_to_state(v) for v in trajectories[:, i]]
         result = classify_trajectory(traj, eq, epsilon=epsilon)
 
         mag = float(np.linalg.norm(perturbations[i] - eq_vec))
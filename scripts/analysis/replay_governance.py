@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Counterfactual governance replay — how would past verdicts have changed
+under candidate DynamicsParams / thresholds / GovernorConfig?
+
+Streams stored auto_attest check-ins (audit.events, or a JSONL export such
+as data/audit_log.jsonl) through UNITARESMonitor under the current
+configuration and each candidate, one worker process per agent shard, and
+prints proceed / guide / pause / reject transitions per agent plus
+throughput. See src/governance_replay.py for what is and isn't reproduced.
+
+Candidates file (JSON object or list):
+    [{"name": "beta-0.6", "governor": {"beta_default": 0.6}},
+     {"name": "stiffer-I", "params": {"gamma_I": 0.2},
+      "thresholds": {"coherence_critical_threshold": 0.42}}]
+
+Usage:
+    python3 scripts/analysis/replay_governance.py --candidates cands.json --jsonl data/audit_log.jsonl
+    python3 scripts/analysis/replay_governance.py --candidates cands.json --since 2026-09-01 \\
+        --workers 8 --checkpoint-dir /tmp/replay-ckpt --json > replay.json
+
+Re-running with the same --checkpoint-dir resumes: finished agents are
+read back from the shard checkpoints instead of being replayed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--candidates", required=True, help="JSON file with one or more candidates")
+    src = parser.add_mutually_exclusive_group()
+    src.add_argument("--jsonl", help="replay a JSONL export instead of Postgres")
+    src.add_argument("--dsn", help="Postgres DSN (default: DB_POSTGRES_URL)")
+    parser.add_argument("--since", help="ISO timestamp lower bound (Postgres)")
+    parser.add_argument("--until", help="ISO timestamp upper bound, exclusive (Postgres)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes; 0 runs in-process")
+    parser.add_argument("--shards", type=int, help="agent shards (default: --workers)")
+    parser.add_argument("--checkpoint-dir", help="directory for resumable shard checkpoints")
+    parser.add_argument("--checkpoint-every", type=int, default=50, help="agents per checkpoint write")
+    parser.add_argument("--top", type=int, default=20, help="changed agents listed per candidate")
+    parser.add_argument("--json", action="store_true", help="print the full report as JSON")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)  # one "Initialized monitor" line per replayed agent otherwise
+
+    from src.governance_replay import Candidate, JsonlSource, PostgresSource, run_replay
+
+    candidates = Candidate.load(args.candidates)
+    source = JsonlSource(args.jsonl) if args.jsonl else PostgresSource(args.dsn, args.since, args.until)
+
+    def on_shard(result):
+        print(
+            f"shard {result['shard']}: {len(result['agents'])} agents "
+            f"({result['resumed_agents']} from checkpoint), {result['checkins']} check-ins "
+            f"in {result['elapsed_s']:.1f}s",
+            file=sys.stderr,
+        )
+
+    report = run_replay(
+        source, candidates, workers=args.workers, shards=args.shards,
+        checkpoint_dir=args.checkpoint_dir, checkpoint_every=args.checkpoint_every,
+        on_shard=on_shard,
+    )
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    tp = report["throughput"]
+    agreement = report["agreement"]
+    print(f"agents={report['agents']} checkins={report['checkins']} resumed_agents={report['resumed_agents']}")
+    print(f"baseline agreement with recorded actions: {agreement:.1%}" if agreement is not None
+          else "baseline agreement with recorded actions: n/a")
+    print(f"baseline verdicts: {report['baseline']}")
+    print(f"throughput: {tp['replayed_checkins']} check-ins in {tp['elapsed_s']}s "
+          f"= {tp['checkins_per_s']} check-ins/s ({tp['replays_per_s']} monitor updates/s)")
+    for name, v in report["variants"].items():
+        print(f"\n== {name}: {v['changed']} verdicts changed across {v['agents_changed']} agents")
+        print(f"   verdicts: {v['counts']}")
+        for transition, count in v["transitions"].items():
+            print(f"   {transition:<18} {count:>7}")
+        for row in v["agents"][:args.top]:
+            print(f"   {row['agent_id'][:36]:<36} {row['changed']:>5}/{row['checkins']:<6} {row['transitions']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
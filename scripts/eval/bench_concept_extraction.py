@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Concept extraction benchmark — pairwise Python loops vs array phases.
+
+ConceptExtractor used to merge tags by scoring every tag pair in Python
+(two np.linalg.norm calls per pair) and count co-occurrence with nested
+loops into a dict. The merge/split/co-occurrence phases now run on arrays.
+This generates synthetic tag sets (default 1k, 10k, 50k tags; each
+discovery carries 1-6 Zipf-distributed tags; embeddings scattered around
+topic centers) and times each phase both ways.
+
+The legacy pairwise merge is O(tags²) Python iterations, so it only runs up
+to --legacy-max tags; the legacy split (scipy pdist over whole clusters) up
+to --legacy-split-max. "blockwise" is the all-pairs thresholded similarity
+matrix (what merge uses with merge_co_occurrence_min=0), up to
+--blockwise-max tags.
+
+Usage:
+    python scripts/eval/bench_concept_extraction.py
+    python scripts/eval/bench_concept_extraction.py --sizes 1000 5000 --legacy-max 5000 --json
+
+No server or Postgres needed.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src import concept_extraction as ce
+from src.concept_extraction import ConceptExtractor, UnionFind
+
+
+def make_corpus(n_tags: int, dim: int, seed: int):
+    """tag → discovery ids, plus discovery embeddings."""
+    rng = np.random.default_rng(seed)
+    n_discs = n_tags * 4
+    topics = rng.normal(size=(max(8, n_tags // 20), dim)).astype(np.float32)
+    tag_topic = rng.integers(0, len(topics), size=n_tags)
+    # Zipf-ish tag popularity, as in real tag usage.
+    popularity = 1.0 / np.arange(1, n_tags + 1) ** 0.8
+    popularity /= popularity.sum()
+
+    tag_discoveries = defaultdict(list)
+    matrix = np.empty((n_discs, dim), dtype=np.float32)
+    for i in range(n_discs):
+        tags = rng.choice(n_tags, size=rng.integers(1, 7), replace=False, p=popularity)
+        matrix[i] = topics[tag_topic[tags[0]]] + rng.normal(scale=0.4, size=dim)
+        for t in tags:
+            tag_discoveries[f"tag{t}"].append(f"d{i}")
+    disc_ids = [f"d{i}" for i in range(n_discs)]
+    return {t: ids for t, ids in tag_discoveries.items() if len(ids) >= ce.MIN_TAG_DISCOVERIES}, disc_ids, matrix
+
+
+# --- The pre-vectorization implementation, for comparison ---
+
+
+def legacy_co_occurrence(tag_discoveries):
+    disc_to_tags = defaultdict(set)
+    for tag, disc_ids in tag_discoveries.items():
+        for d in disc_ids:
+            disc_to_tags[d].add(tag)
+    co = defaultdict(int)
+    for tags in disc_to_tags.values():
+        tag_list = sorted(tags)
+        for i in range(len(tag_list)):
+            for j in range(i + 1, len(tag_list)):
+                co[(tag_list[i], tag_list[j])] += 1
+    return dict(co)
+
+
+def legacy_merge(extractor, tag_embeddings, co_occurrence):
+    def cosine(a, b):
+        na, nb = np.linalg.norm(a), np.linalg.norm(b)
+        return 0.0 if na == 0 or nb == 0 else float(np.dot(a, b) / (na * nb))
+
+    tags = list(tag_embeddings)
+    uf = UnionFind(tags)
+    for i in range(len(tags)):
+        for j in range(i + 1, len(tags)):
+            a, b = tags[i], tags[j]
+            pair = (min(a, b), max(a, b))
+            if (cosine(tag_embeddings[a], tag_embeddings[b]) > extractor.merge_cosine_threshold
+                    and co_occurrence.get(pair, 0) >= extractor.merge_co_occurrence_min):
+                uf.union(a, b)
+    return uf.groups()
+
+
+class LegacySplitExtractor(ConceptExtractor):
+    """Split with scipy pdist over the full cluster, as before."""
+
+    def _agglomerative_split(self, disc_ids, embeddings):
+        from scipy.cluster.hierarchy import fcluster, linkage
+        from scipy.spatial.distance import pdist
+
+        vecs = np.array([embeddings[d] for d in disc_ids])
+        labels = fcluster(
+            linkage(pdist(vecs, metric="cosine"), method="average"),
+            t=self.split_distance_threshold, criterion="distance",
+        )
+        clusters = defaultdict(list)
+        for idx, label in enumerate(labels):
+            clusters[int(label)].append(disc_ids[idx])
+        return list(clusters.values())
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, round((time.perf_counter() - t0) * 1000, 1)
+
+
+def bench_size(n_tags: int, args) -> dict:
+    tag_discoveries, disc_ids, matrix = make_corpus(n_tags, args.dim, seed=n_tags)
+    extractor = ConceptExtractor(use_process_pool=False)
+    row = {"tags": len(tag_discoveries), "discoveries": len(disc_ids)}
+
+    tags, means = ce._tag_mean_matrix(tag_discoveries, disc_ids, matrix)
+    (left, right, counts), row["co_occurrence_ms"] = timed(ce._tag_co_occurrence, tag_discoveries, tags)
+    row["co_occurring_pairs"] = int(len(left))
+    clusters, row["merge_ms"] = timed(extractor._merge_pairs, tags, means, left, right, counts)
+    row["clusters"] = len(clusters)
+    embeddings = dict(zip(disc_ids, matrix))
+    _, row["split_ms"] = timed(extractor._split_broad_tags, clusters, tag_discoveries, embeddings)
+    _, row["total_ms"] = timed(extractor._cluster, tag_discoveries, disc_ids, matrix)
+
+    if len(tags) <= args.blockwise_max:
+        unit = ce._normalize_rows(means)
+        pairs, row["blockwise_similarity_ms"] = timed(ce._similar_pairs, unit, extractor.merge_cosine_threshold)
+        row["similar_pairs"] = int(len(pairs[0]))
+
+    co_dict, row["legacy_co_occurrence_ms"] = timed(legacy_co_occurrence, tag_discoveries)
+    if len(tags) <= args.legacy_max:
+        tag_embeddings = dict(zip(tags, means))
+        legacy_clusters, row["legacy_merge_ms"] = timed(legacy_merge, extractor, tag_embeddings, co_dict)
+        row["legacy_clusters_match"] = (
+            sorted(map(sorted, legacy_clusters.values())) == sorted(map(sorted, clusters.values()))
+        )
+    if len(tags) <= args.legacy_split_max:
+        legacy = LegacySplitExtractor(use_process_pool=False)
+        _, row["legacy_split_ms"] = timed(legacy._split_broad_tags, clusters, tag_discoveries, embeddings)
+    return row
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--legacy-max", type=int, default=2000, help="largest tag count for the pairwise merge")
+    parser.add_argument("--legacy-split-max", type=int, default=10000,
+                        help="largest tag count for the pdist split (needs scipy)")
+    parser.add_argument("--blockwise-max", type=int, default=10000, help="largest tag count for all-pairs similarity")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    # Untimed pass so scipy imports and BLAS thread start-up don't land on the first size.
+    bench_size(200, argparse.Namespace(**{**vars(args), "legacy_max": 0, "blockwise_max": 0}))
+    rows = [bench_size(n, args) for n in args.sizes]
+    if args.json:
+        print(json.dumps({"config": vars(args), "results": rows}, indent=2))
+        return 0
+
+    def ms(row, key):
+        return f"{row[key]:>9.1f}" if key in row else f"{'—':>9}"
+
+    print(f"{'tags':>7} {'discs':>7} {'co-occ':>9} {'merge':>9} {'split':>9} {'total':>9} "
+          f"{'blockwise':>9} {'old co-occ':>10} {'old merge':>9} {'old split':>9}   (ms)")
+    for r in rows:
+        print(
+            f"{r['tags']:>7} {r['discoveries']:>7} {ms(r, 'co_occurrence_ms')} {ms(r, 'merge_ms')} "
+            f"{ms(r, 'split_ms')} {ms(r, 'total_ms')} {ms(r, 'blockwise_similarity_ms')} "
+            f"{r['legacy_co_occurrence_ms']:>10.1f} {ms(r, 'legacy_merge_ms')} {ms(r, 'legacy_split_ms')}"
+            + ("" if r.get("legacy_clusters_match", True) else "   MISMATCH")
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Edge index benchmark — build time, memory and expansion latency.
+
+Graph expansion used to read neighbors off the seed documents, and every
+neighbor that was not already in the candidate pool cost a get_discovery
+round trip. TypedEdgeIndex (src/edge_index.py) holds every typed edge in
+CSR arrays so the neighborhood of the top seeds is a local lookup. This
+builds the index over synthetic graphs (default 10k / 100k / 1M edges;
+Zipf-distributed in-degree, mixed edge types), reports its size next to a
+plain dict-of-sets adjacency, and times expand() for 10 seeds at 1-3 hops
+plus incremental add() throughput.
+
+Usage:
+    python scripts/eval/bench_edge_index.py
+    python scripts/eval/bench_edge_index.py --edges 100000 --json
+
+No server or Postgres needed.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.edge_index import EDGE_TYPES, TypedEdgeIndex
+from src.retrieval import DEFAULT_EDGE_TYPE_WEIGHTS
+
+
+def make_edges(n_edges: int, seed: int):
+    """(src, dst, type) triples over n_edges // 3 discoveries."""
+    rng = np.random.default_rng(seed)
+    n_nodes = max(10, n_edges // 3)
+    ids = [f"2026-{i:09d}" for i in range(n_nodes)]
+    popularity = 1.0 / np.arange(1, n_nodes + 1) ** 0.9
+    popularity /= popularity.sum()
+    src = rng.integers(0, n_nodes, size=n_edges)
+    dst = rng.choice(n_nodes, size=n_edges, p=popularity)
+    types = rng.choice(len(EDGE_TYPES), size=n_edges, p=[0.7, 0.25, 0.05])
+    return [(ids[s], ids[d], EDGE_TYPES[t]) for s, d, t in zip(src, dst, types) if s != d], ids
+
+
+def dict_of_sets_bytes(edges) -> int:
+    adj = defaultdict(set)
+    for s, d, t in edges:
+        adj[s].add((d, t))
+        adj[d].add((s, t))
+    return sys.getsizeof(adj) + sum(sys.getsizeof(v) + sys.getsizeof(k) for k, v in adj.items()) + \
+        len(edges) * 2 * sys.getsizeof(("", ""))
+
+
+def bench_size(n_edges: int, args) -> dict:
+    edges, ids = make_edges(n_edges, seed=n_edges)
+    t0 = time.perf_counter()
+    index = TypedEdgeIndex(edges)
+    row = {"edges": len(index), "discoveries": len(ids), "build_ms": round((time.perf_counter() - t0) * 1000, 1)}
+    row["bytes"] = index.memory_bytes()["total"]
+    row["dict_of_sets_bytes"] = dict_of_sets_bytes(edges)
+
+    rng = np.random.default_rng(1)
+    seed_sets = [[ids[i] for i in rng.integers(0, len(ids), size=10)] for _ in range(args.queries)]
+    for hops in (1, 2, 3):
+        times = []
+        for seeds in seed_sets:
+            t0 = time.perf_counter()
+            index.expand(seeds, DEFAULT_EDGE_TYPE_WEIGHTS, hops=hops, limit=50)
+            times.append((time.perf_counter() - t0) * 1000)
+        row[f"expand_{hops}hop_p50_ms"] = round(float(np.percentile(times, 50)), 3)
+        row[f"expand_{hops}hop_p99_ms"] = round(float(np.percentile(times, 99)), 3)
+
+    new = [(ids[i], ids[j], "related") for i, j in rng.integers(0, len(ids), size=(args.adds, 2)) if i != j]
+    t0 = time.perf_counter()
+    index.add_many(new)
+    row["adds_per_s"] = round(len(new) / (time.perf_counter() - t0))
+    return row
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--edges", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=200, help="seed sets timed per hop count")
+    parser.add_argument("--adds", type=int, default=5000, help="incremental edges added after the build")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    rows = [bench_size(n, args) for n in args.edges]
+    if args.json:
+        print(json.dumps({"config": vars(args), "results": rows}, indent=2))
+        return 0
+
+    print(f"{'edges':>9} {'build':>9} {'index MB':>9} {'dict MB':>9} "
+          f"{'1-hop':>8} {'2-hop':>8} {'3-hop':>8} {'adds/s':>9}   (build ms, expand p50 ms)")
+    for r in rows:
+        print(
+            f"{r['edges']:>9} {r['build_ms']:>9.1f} {r['bytes'] / 2**20:>9.1f} {r['dict_of_sets_bytes'] / 2**20:>9.1f} "
+            f"{r['expand_1hop_p50_ms']:>8.3f} {r['expand_2hop_p50_ms']:>8.3f} {r['expand_3hop_p50_ms']:>8.3f} "
+            f"{r['adds_per_s']:>9}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
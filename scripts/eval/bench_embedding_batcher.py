@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Query embedding benchmark — one encode per call vs the coalescing micro-batcher.
+
+Before, EmbeddingsService.embed ran one model.encode per call in the default
+thread pool, so concurrent searches each paid the full per-call encode
+overhead and competed for the CPU. embed() now collects requests arriving
+within a short window into one encode batch on a dedicated executor and
+caches query embeddings. This drives both paths with N concurrent callers
+issuing queries drawn from a pool (so some text repeats, as it does for
+check-in driven searches) and reports embeddings/sec and p50/p99 latency.
+
+By default the model is a stand-in whose encode costs a fixed overhead plus a
+per-text cost (roughly MiniLM on CPU); --real loads the configured
+sentence-transformers model instead.
+
+Usage:
+    python scripts/eval/bench_embedding_batcher.py
+    python scripts/eval/bench_embedding_batcher.py --concurrency 32 --distinct 500 --json
+    python scripts/eval/bench_embedding_batcher.py --real
+
+No server or Postgres needed.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src import embeddings as emb
+
+
+class _Vector(list):
+    def tolist(self):
+        return list(self)
+
+
+class _FakeModel:
+    """encode() takes call_ms + per_text_ms * len(texts).
+
+    Calls are serialized on a lock: a real encode saturates the CPU (torch
+    uses every core), so concurrent encodes queue rather than overlap.
+    """
+
+    def __init__(self, dim: int, call_ms: float, per_text_ms: float):
+        self.dim = dim
+        self.call_ms = call_ms
+        self.per_text_ms = per_text_ms
+        self._cpu = threading.Lock()
+
+    def encode(self, texts, batch_size=None, normalize_embeddings=True, show_progress_bar=False):
+        single = isinstance(texts, str)
+        n = 1 if single else len(texts)
+        with self._cpu:
+            time.sleep((self.call_ms + self.per_text_ms * n) / 1000.0)
+        if single:
+            return _Vector([0.0] * self.dim)
+        return [_Vector([0.0] * self.dim) for _ in range(n)]
+
+
+async def legacy_embed(model, text: str):
+    """The pre-batcher embed(): one encode per call in the default executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, lambda: model.encode(text, normalize_embeddings=True).tolist()
+    )
+
+
+async def time_path(embed_fn, queries, requests: int, concurrency: int) -> dict:
+    per_caller = max(1, requests // concurrency)
+    samples = [[] for _ in range(concurrency)]
+    rng = random.Random(7)
+
+    async def caller(n: int) -> None:
+        out = samples[n]
+        for _ in range(per_caller):
+            text = rng.choice(queries)
+            t0 = time.perf_counter()
+            await embed_fn(text)
+            out.append((time.perf_counter() - t0) * 1000)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(caller(n) for n in range(concurrency)))
+    elapsed = time.perf_counter() - t0
+    ordered = sorted(x for s in samples for x in s)
+    return {
+        "embeddings_per_sec": round(len(ordered) / elapsed),
+        "p50_ms": round(statistics.median(ordered), 2),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 2),
+    }
+
+
+async def run_all(args) -> dict:
+    queries = [f"query {i} about circuit breaker drift" for i in range(args.distinct)]
+
+    def service(cache_size: int) -> emb.EmbeddingsService:
+        svc = emb.EmbeddingsService(
+            batch_window_ms=args.window_ms, batch_max=args.batch_max, cache_size=cache_size,
+        )
+        if not args.real:
+            svc._model = model
+        return svc
+
+    if args.real:
+        model = await service(0)._ensure_model()
+    else:
+        model = _FakeModel(emb.EMBEDDING_DIM, args.call_ms, args.per_text_ms)
+        # The stand-in needs no sentence-transformers; let _ensure_model return it.
+        emb.SENTENCE_TRANSFORMERS_AVAILABLE = True
+
+    batched, cached = service(0), service(emb.EMBED_CACHE_SIZE)
+    result = {"config": vars(args), "paths": {}}
+    for name, fn in (
+        ("per_call", lambda text: legacy_embed(model, text)),
+        ("batched", batched.embed),
+        ("batched_cached", cached.embed),
+    ):
+        result["paths"][name] = await time_path(fn, queries, args.requests, args.concurrency)
+    result["paths"]["batched"]["mean_batch_size"] = batched.stats()["mean_batch_size"]
+    result["paths"]["batched_cached"]["cache_hit_rate"] = cached.stats()["cache"]["hit_rate"]
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--distinct", type=int, default=1000, help="size of the query pool")
+    parser.add_argument("--window-ms", type=float, default=emb.EMBED_BATCH_WINDOW_MS)
+    parser.add_argument("--batch-max", type=int, default=emb.EMBED_BATCH_MAX)
+    parser.add_argument("--call-ms", type=float, default=4.0, help="stand-in per-encode overhead")
+    parser.add_argument("--per-text-ms", type=float, default=0.4, help="stand-in per-text cost")
+    parser.add_argument("--real", action="store_true", help="use the configured sentence-transformers model")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    result = asyncio.run(run_all(args))
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(
+            f"{args.requests} requests, {args.concurrency} concurrent caller(s), "
+            f"{args.distinct} distinct queries"
+        )
+        for name, r in result["paths"].items():
+            extra = ""
+            if "mean_batch_size" in r:
+                extra = f"  mean batch={r['mean_batch_size']}"
+            if "cache_hit_rate" in r:
+                extra = f"  cache hit rate={r['cache_hit_rate']}"
+            print(
+                f"  {name:<15} {r['embeddings_per_sec']:>7} emb/s  "
+                f"p50={r['p50_ms']:.2f} ms  p99={r['p99_ms']:.2f} ms{extra}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+ExecutorPool hop benchmark — per-step round trips vs one run() closure.
+
+ExecutorPool runs asyncpg on a dedicated executor loop. Through acquire() every
+step of a unit of work (acquire, each statement, release) is a separate
+cross-thread round trip; ExecutorPool.run(work) ships the whole unit as one
+closure. This times both against a fake asyncpg pool whose operations are real
+coroutines (so only the hop cost differs), for units of 1..N statements and
+with several concurrent callers.
+
+Usage:
+    python scripts/eval/bench_executor_pool_hops.py
+    python scripts/eval/bench_executor_pool_hops.py --iterations 5000 --concurrency 8 --json
+
+No server, Postgres or Redis needed.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.db.executor_pool import ExecutorPool
+
+
+class _FakeConnection:
+    async def fetchval(self, query, *args):
+        await asyncio.sleep(0)
+        return 1
+
+
+class _FakeAcquire:
+    def __init__(self, conn):
+        self._conn = conn
+
+    async def __aenter__(self):
+        await asyncio.sleep(0)
+        return self._conn
+
+    async def __aexit__(self, *exc):
+        await asyncio.sleep(0)
+
+
+class _FakePool:
+    """Stands in for asyncpg.Pool; every operation yields to its loop once."""
+
+    def __init__(self):
+        self._conn = _FakeConnection()
+
+    def acquire(self, timeout=None):
+        return _FakeAcquire(self._conn)
+
+    async def close(self):
+        pass
+
+    def get_size(self):
+        return 1
+
+    def get_idle_size(self):
+        return 1
+
+    def get_max_size(self):
+        return 1
+
+
+async def per_step(pool: ExecutorPool, statements: int) -> None:
+    async with pool.acquire() as conn:
+        for _ in range(statements):
+            await conn.fetchval("SELECT 1")
+
+
+async def coalesced(pool: ExecutorPool, statements: int) -> None:
+    async def work(conn):
+        for _ in range(statements):
+            await conn.fetchval("SELECT 1")
+
+    await pool.run(work)
+
+
+async def time_path(fn, pool: ExecutorPool, statements: int, iterations: int, concurrency: int) -> dict:
+    per_caller = max(1, iterations // concurrency)
+    samples = [[] for _ in range(concurrency)]
+
+    async def caller(n: int) -> None:
+        out = samples[n]
+        for _ in range(per_caller):
+            t0 = time.perf_counter()
+            await fn(pool, statements)
+            out.append((time.perf_counter() - t0) * 1000)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(caller(n) for n in range(concurrency)))
+    elapsed = time.perf_counter() - t0
+    return {"elapsed": elapsed, "samples": [x for s in samples for x in s]}
+
+
+def summarize(result: dict) -> dict:
+    ordered = sorted(result["samples"])
+    return {
+        "units_per_sec": round(len(ordered) / result["elapsed"]),
+        "p50_ms": round(statistics.median(ordered), 4),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 4),
+    }
+
+
+async def run_all(args) -> dict:
+    pool = ExecutorPool(_FakePool())
+    result = {"config": vars(args), "units": {}}
+    try:
+        # Warm the executor loop before timing.
+        await time_path(coalesced, pool, 1, 100, 1)
+        for statements in args.statements:
+            row = {
+                "per_step": summarize(await time_path(per_step, pool, statements, args.iterations, args.concurrency)),
+                "run": summarize(await time_path(coalesced, pool, statements, args.iterations, args.concurrency)),
+                "hops_per_step": statements + 2,
+                "hops_run": 1,
+            }
+            row["speedup_p50"] = round(row["per_step"]["p50_ms"] / max(row["run"]["p50_ms"], 1e-6), 1)
+            result["units"][str(statements)] = row
+    finally:
+        await pool.close()
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--statements", type=int, nargs="+", default=[1, 3])
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    result = asyncio.run(run_all(args))
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"{args.iterations} units, {args.concurrency} concurrent caller(s)")
+        for statements, row in result["units"].items():
+            print(f"{statements} statement(s) per unit")
+            for name, hops in (("per_step", row["hops_per_step"]), ("run", row["hops_run"])):
+                r = row[name]
+                print(
+                    f"  {name:<9} {hops} hop(s)  {r['units_per_sec']:>8} units/s  "
+                    f"p50={r['p50_ms']:.4f} ms  p99={r['p99_ms']:.4f} ms"
+                )
+            print(f"  speedup p50: {row['speedup_p50']}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
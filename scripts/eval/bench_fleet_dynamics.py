@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Fleet dynamics benchmark — one compute_dynamics call per agent vs the
+vectorized fleet kernel.
+
+compute_dynamics advances a single State: RK4 builds four intermediate
+States and every derivative evaluation recomputes coherence and the
+lambdas and reads UNITARES_I_DYNAMICS. compute_fleet_dynamics
+(governance_core/fleet.py) steps N agents' E/I/S/V arrays at once. This
+times one step for N random agents (default 1k / 10k / 100k; per-agent
+theta, dt, complexity, drift and half of them sensor-anchored) with both,
+reports agent-steps per second and the largest per-row difference.
+
+Usage:
+    python scripts/eval/bench_fleet_dynamics.py
+    python scripts/eval/bench_fleet_dynamics.py --agents 100000 --integrator euler --json
+
+The scalar loop is sampled on at most --scalar-cap agents and extrapolated.
+No server or Postgres needed.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from governance_core import DEFAULT_PARAMS, FleetState, Theta, compute_dynamics, compute_fleet_dynamics
+
+
+def make_fleet(n: int, seed: int) -> dict:
+    rng = np.random.default_rng(seed)
+    sensors = rng.uniform(0, 1, (n, 4))
+    sensors[rng.random(n) < 0.5] = np.nan
+    return {
+        "state": FleetState.from_array(np.column_stack([
+            rng.uniform(0, 1, n), rng.uniform(0, 1, n), rng.uniform(0.001, 1, n), rng.uniform(-1, 1, n),
+        ])),
+        "delta_eta": rng.normal(0, 0.2, (n, 5)),
+        "theta": Theta(C1=rng.uniform(0.5, 1.5, n), eta1=rng.uniform(0.1, 0.5, n), eta2=rng.uniform(0.1, 0.5, n)),
+        "dt": rng.uniform(0.05, 1.0, n),
+        "complexity": rng.uniform(0, 1, n),
+        "sensor_eisv": FleetState.from_array(sensors),
+    }
+
+
+def scalar_rows(fleet: dict, rows: range) -> list:
+    th, sensor = fleet["theta"], fleet["sensor_eisv"]
+    out = []
+    for i in rows:
+        s = sensor[i]
+        out.append(compute_dynamics(
+            fleet["state"][i], list(fleet["delta_eta"][i]),
+            Theta(C1=float(th.C1[i]), eta1=float(th.eta1[i]), eta2=float(th.eta2[i])),
+            DEFAULT_PARAMS, dt=float(fleet["dt"][i]), complexity=float(fleet["complexity"][i]),
+            sensor_eisv=None if np.isnan(s.E) else s,
+        ))
+    return out
+
+
+def bench(n: int, args) -> dict:
+    fleet = make_fleet(n, seed=n)
+    sample = range(min(n, args.scalar_cap))
+
+    t0 = time.perf_counter()
+    scalar = scalar_rows(fleet, sample)
+    scalar_s = (time.perf_counter() - t0) * n / len(sample)
+
+    times = []
+    for _ in range(args.repeats):
+        t0 = time.perf_counter()
+        batch = compute_fleet_dynamics(**fleet, params=DEFAULT_PARAMS)
+        times.append(time.perf_counter() - t0)
+    batch_s = float(np.median(times))
+
+    diff = np.abs(batch.to_array()[:len(sample)] - FleetState.from_states(scalar).to_array()).max()
+    return {
+        "agents": n,
+        "scalar_ms": round(scalar_s * 1000, 2),
+        "batch_ms": round(batch_s * 1000, 3),
+        "scalar_steps_per_s": round(n / scalar_s),
+        "batch_steps_per_s": round(n / batch_s),
+        "speedup": round(scalar_s / batch_s, 1),
+        "max_abs_diff": float(diff),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--agents", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--integrator", choices=["rk4", "euler"], default="rk4")
+    parser.add_argument("--repeats", type=int, default=5, help="batch steps timed per size (median)")
+    parser.add_argument("--scalar-cap", type=int, default=20_000, help="agents timed on the scalar path")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+    os.environ["UNITARES_INTEGRATOR"] = args.integrator
+
+    rows = [bench(n, args) for n in args.agents]
+    if args.json:
+        print(json.dumps({"config": vars(args), "results": rows}, indent=2))
+        return 0
+
+    print(f"integrator={args.integrator}")
+    print(f"{'agents':>8} {'scalar ms':>11} {'batch ms':>10} {'scalar/s':>11} {'batch/s':>12} {'speedup':>8} {'max diff':>10}")
+    for r in rows:
+        print(
+            f"{r['agents']:>8} {r['scalar_ms']:>11.1f} {r['batch_ms']:>10.2f} {r['scalar_steps_per_s']:>11} "
+            f"{r['batch_steps_per_s']:>12} {r['speedup']:>7.1f}x {r['max_abs_diff']:>10.1e}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
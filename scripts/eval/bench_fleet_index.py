@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Fleet index benchmark — per-agent monitor reads vs the columnar FleetIndex
+behind compare_me_to_similar, compare_agents and aggregate_metrics.
+
+Those handlers used to call get_metrics() on a monitor for every agent they
+looked at (compare_me_to_similar: every active agent, every call). They now
+read src/fleet_index.py, which keeps each agent's latest metrics as NumPy
+columns and is refreshed once per committed update. This times, at 100 / 1k
+/ 10k agents:
+
+  monitor     one warm get_metrics() per agent, the old per-call cost
+              (sampled on --monitor-cap real monitors and scaled linearly)
+  similar     range_query over E/I/S (+ coherence in the score)
+  knn         the 3 nearest agents in (E, I, S, coherence)
+  aggregate   fleet totals over every agent
+  record      one row refresh (the added cost of each committed update)
+
+No server or Postgres needed.
+
+Usage:
+    python scripts/eval/bench_fleet_index.py
+    python scripts/eval/bench_fleet_index.py --agents 1000 10000 --json
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def build_monitors(count: int, updates: int = 3) -> list:
+    from src.governance_monitor import UNITARESMonitor
+
+    monitors = []
+    for i in range(count):
+        monitor = UNITARESMonitor(f"bench-{i}", load_state=False)
+        for _ in range(updates):
+            monitor.process_update({"response_text": "ok", "complexity": 0.3 + 0.4 * (i % 5) / 4})
+        monitor.get_metrics()  # warm the per-agent stability cache
+        monitors.append(monitor)
+    return monitors
+
+
+def timed(fn, repeats: int) -> tuple:
+    times, result = [], None
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - t0)
+    return result, float(np.median(times))
+
+
+def bench(n: int, monitors: list, args) -> dict:
+    from src.fleet_index import FleetIndex
+    from src.monitor_metrics import get_summary_metrics
+
+    rng = np.random.default_rng(n)
+    index = FleetIndex()
+    templates = [(get_summary_metrics(m), m.state) for m in monitors]
+    ids = [f"agent-{i}" for i in range(n)]
+    for i, agent_id in enumerate(ids):
+        metrics, state = templates[i % len(templates)]
+        jittered = dict(metrics, **{d: metrics[d] + rng.normal(0, 0.05) for d in "EIS"})
+        index.record(agent_id, jittered, state)
+
+    _, monitor_s = timed(lambda: [m.get_metrics() for m in monitors], 1)
+    monitor_s *= n / len(monitors)
+
+    me = index.get(ids[0])
+    center = {d: me[d] for d in ("E", "I", "S", "coherence")}
+    bound = {d: 0.15 for d in "EIS"}
+    similar, similar_s = timed(lambda: index.range_query(center, bound, exclude=[ids[0]]), args.repeats)
+    _, knn_s = timed(lambda: index.knn(center, k=3, exclude=[ids[0]]), args.repeats)
+    _, aggregate_s = timed(lambda: index.aggregate(ids), args.repeats)
+    metrics, state = templates[0]
+    _, record_s = timed(lambda: index.record(ids[-1], metrics, state), args.repeats * 20)
+
+    return {
+        "agents": n,
+        "monitor_ms": round(monitor_s * 1000, 1),
+        "similar_ms": round(similar_s * 1000, 3),
+        "knn_ms": round(knn_s * 1000, 3),
+        "aggregate_ms": round(aggregate_s * 1000, 3),
+        "record_us": round(record_s * 1e6, 1),
+        "similar_matches": len(similar),
+        "index_kb": round(index.memory_bytes() / 1024, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--agents", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--monitor-cap", type=int, default=100, help="real monitors timed on the old path")
+    parser.add_argument("--repeats", type=int, default=20, help="timed calls per query (median)")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    monitors = build_monitors(args.monitor_cap)
+    rows = [bench(n, monitors, args) for n in args.agents]
+    if args.json:
+        print(json.dumps({"config": vars(args), "results": rows}, indent=2))
+        return 0
+
+    print(f"{'agents':>7} {'monitor ms':>11} {'similar ms':>11} {'knn ms':>8} {'aggregate ms':>13} "
+          f"{'record us':>10} {'index kB':>9}")
+    for r in rows:
+        print(
+            f"{r['agents']:>7} {r['monitor_ms']:>11.1f} {r['similar_ms']:>11.3f} {r['knn_ms']:>8.3f} "
+            f"{r['aggregate_ms']:>13.3f} {r['record_us']:>10.1f} {r['index_kb']:>9.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Inference backend benchmark — torch vs ONNX Runtime vs int8-quantized ONNX.
+
+Loads the configured embedding model and cross-encoder reranker on each
+backend (see src/inference_backend.py; the first onnx/onnx-int8 run exports
+and caches the graphs under UNITARES_MODEL_CACHE_DIR, which is not timed)
+and reports, per backend:
+  - embed:  single-query latency p50/p99 and bulk texts/sec (embed_batch)
+  - rerank: one query x --pool candidates per call, latency p50/p99 and
+            pairs/sec
+  - fidelity vs torch: mean cosine of query embeddings, and top-10 overlap
+    of the rerank order
+
+Retrieval quality on the labeled corpus is checked separately against a
+live Postgres: scripts/eval/retrieval_eval.py --backend-parity onnx-int8.
+
+Usage:
+    python scripts/eval/bench_inference_backends.py
+    python scripts/eval/bench_inference_backends.py --backends torch onnx-int8 --json
+    python scripts/eval/bench_inference_backends.py --skip-rerank --queries 200
+
+Needs sentence-transformers (plus onnxruntime/optimum for the ONNX
+backends) and the model weights; no server or Postgres.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src import embeddings as emb
+from src import reranker as rr
+from src.inference_backend import BACKENDS
+
+_WORDS = (
+    "circuit breaker drift agent governance coherence entropy checkin lineage "
+    "embedding retrieval latency postgres graph discovery calibration verdict "
+    "trajectory identity stability dialectic pause resume threshold void"
+).split()
+
+
+def make_texts(n: int, words: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(_WORDS) for _ in range(words)) for _ in range(n)]
+
+
+def _summary(samples_ms: list) -> dict:
+    ordered = sorted(samples_ms)
+    return {
+        "p50_ms": round(statistics.median(ordered), 2),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 2),
+    }
+
+
+async def bench_backend(backend: str, args, queries: list, passages: list) -> dict:
+    out: dict = {}
+
+    svc = emb.EmbeddingsService(backend=backend, cache_size=0)
+    await svc._ensure_model()
+    out["embed_backend"] = svc.backend
+    await svc.embed(queries[0], cache=False)  # warm-up
+
+    lat, vectors = [], []
+    for q in queries:
+        t0 = time.perf_counter()
+        vectors.append(await svc.embed(q, cache=False))
+        lat.append((time.perf_counter() - t0) * 1000)
+    t0 = time.perf_counter()
+    await svc.embed_batch(passages, batch_size=args.batch_size)
+    elapsed = time.perf_counter() - t0
+    out["embed"] = {**_summary(lat), "texts_per_sec": round(len(passages) / elapsed, 1)}
+    out["_vectors"] = vectors
+
+    if not args.skip_rerank:
+        reranker = rr.CrossEncoderReranker(backend=backend, cache_size=0)
+        await reranker._ensure_model()
+        out["rerank_backend"] = reranker.backend
+        pool = passages[:args.pool]
+        await reranker.score_pairs(queries[0], pool)  # warm-up
+        lat, orders = [], []
+        t0 = time.perf_counter()
+        for q in queries[:args.rerank_queries]:
+            t1 = time.perf_counter()
+            scores = await reranker.score_pairs(q, pool)
+            lat.append((time.perf_counter() - t1) * 1000)
+            orders.append(sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:10])
+        elapsed = time.perf_counter() - t0
+        out["rerank"] = {
+            **_summary(lat),
+            "pairs_per_sec": round(len(lat) * len(pool) / elapsed, 1),
+        }
+        out["_orders"] = orders
+    return out
+
+
+async def run_all(args) -> dict:
+    queries = make_texts(args.queries, 8, seed=1)
+    passages = make_texts(args.passages, 60, seed=2)
+    results = {}
+    for backend in args.backends:
+        results[backend] = await bench_backend(backend, args, queries, passages)
+
+    ref_vectors = results["torch"]["_vectors"] if "torch" in results else None
+    ref_orders = results["torch"].get("_orders") if "torch" in results else None
+    for backend, r in results.items():
+        vectors = r.pop("_vectors")
+        orders = r.pop("_orders", None)
+        if backend == "torch" or ref_vectors is None:
+            continue
+        # Embeddings are L2-normalized, so the dot product is the cosine.
+        cosines = [sum(a * b for a, b in zip(u, v)) for u, v in zip(ref_vectors, vectors)]
+        r["fidelity"] = {"mean_cosine_vs_torch": round(statistics.fmean(cosines), 4)}
+        if orders is not None and ref_orders is not None:
+            overlaps = [len(set(a) & set(b)) / 10 for a, b in zip(ref_orders, orders)]
+            r["fidelity"]["rerank_top10_overlap_vs_torch"] = round(statistics.fmean(overlaps), 3)
+    return {"config": vars(args), "backends": results}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument("--queries", type=int, default=100, help="single-query embeds timed")
+    parser.add_argument("--passages", type=int, default=512, help="texts in the bulk embed_batch run")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--pool", type=int, default=50, help="candidates per rerank call")
+    parser.add_argument("--rerank-queries", type=int, default=20)
+    parser.add_argument("--skip-rerank", action="store_true")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    if not emb.embeddings_available():
+        print("sentence-transformers is not installed", file=sys.stderr)
+        return 2
+    result = asyncio.run(run_all(args))
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+    print(f"model={emb.DEFAULT_MODEL}  reranker={rr.KNOWN_RERANKERS[rr.DEFAULT_RERANKER_KEY]['hf_name']}")
+    for backend, r in result["backends"].items():
+        e = r["embed"]
+        print(
+            f"  {backend:<10} embed  ({r['embed_backend']:<9}) {e['texts_per_sec']:>8} texts/s  "
+            f"query p50={e['p50_ms']:.2f} ms  p99={e['p99_ms']:.2f} ms"
+        )
+        if "rerank" in r:
+            k = r["rerank"]
+            print(
+                f"  {'':<10} rerank ({r['rerank_backend']:<9}) {k['pairs_per_sec']:>8} pairs/s  "
+                f"call p50={k['p50_ms']:.2f} ms  p99={k['p99_ms']:.2f} ms"
+            )
+        for name, value in r.get("fidelity", {}).items():
+            print(f"  {'':<10} {name}={value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+JSONL append benchmark — inline open/flock/fsync vs group-commit writer.
+
+Each tool call appends one record to tool_usage.jsonl (and usually one or more
+to audit_log.jsonl). This measures sustained records/sec and per-call caller
+latency for N concurrent submitters on both paths, against a real file so the
+fsync cost of the host's filesystem is included.
+
+Usage:
+    python scripts/eval/bench_jsonl_writer.py
+    python scripts/eval/bench_jsonl_writer.py --records 20000 --threads 8
+    python scripts/eval/bench_jsonl_writer.py --dir /path/on/target/disk --json
+
+No server, Postgres or Redis needed.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.jsonl_writer import GroupCommitWriter, append_jsonl_lines
+
+
+def _record(i: int) -> dict:
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "tool_name": "process_agent_update",
+        "agent_id": f"agent-{i % 50}",
+        "success": True,
+        "error_type": None,
+    }
+
+
+def run(path: Path, records: int, threads: int, submit) -> dict:
+    per_thread = records // threads
+    latencies = [[] for _ in range(threads)]
+
+    def worker(n: int) -> None:
+        out = latencies[n]
+        for i in range(per_thread):
+            t0 = time.perf_counter()
+            submit(_record(i))
+            out.append((time.perf_counter() - t0) * 1000)
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    t0 = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return {"elapsed": time.perf_counter() - t0, "latencies": [x for lat in latencies for x in lat]}
+
+
+def summarize(result: dict, records: int) -> dict:
+    ordered = sorted(result["latencies"])
+    return {
+        "records_per_sec": round(records / result["elapsed"]),
+        "caller_p50_ms": round(statistics.median(ordered), 4),
+        "caller_p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 4),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--records", type=int, default=5000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--max-batch", type=int, default=256)
+    parser.add_argument("--max-delay-ms", type=float, default=50.0)
+    parser.add_argument("--dir", type=str, default=None, help="directory for the scratch log (default: tmp)")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+    records = (args.records // args.threads) * args.threads
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        inline_path = Path(tmp) / "inline.jsonl"
+        inline = run(
+            inline_path, records, args.threads,
+            lambda rec: append_jsonl_lines(inline_path, [json.dumps(rec) + "\n"]),
+        )
+
+        group_path = Path(tmp) / "group.jsonl"
+        writer = GroupCommitWriter(group_path, max_batch=args.max_batch, max_delay=args.max_delay_ms / 1000.0)
+        group = run(group_path, records, args.threads, writer.submit)
+        t0 = time.perf_counter()
+        writer.flush(timeout=60)
+        group["elapsed"] += time.perf_counter() - t0  # durable throughput, not just enqueue
+        writer_stats = writer.stats()
+        writer.close()
+
+    result = {
+        "config": vars(args) | {"records": records},
+        "inline": summarize(inline, records),
+        "group_commit": summarize(group, records) | {
+            "batches": writer_stats["batches"],
+            "fsyncs": writer_stats["fsyncs"],
+        },
+    }
+    result["throughput_speedup"] = round(
+        result["group_commit"]["records_per_sec"] / max(result["inline"]["records_per_sec"], 1), 1
+    )
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"{records} records, {args.threads} submitter thread(s)")
+        for name in ("inline", "group_commit"):
+            r = result[name]
+            print(
+                f"  {name:<13} {r['records_per_sec']:>9} rec/s  "
+                f"caller p50={r['caller_p50_ms']:.4f} ms  p99={r['caller_p99_ms']:.4f} ms"
+            )
+        print(f"  group commit: {writer_stats['batches']} batch(es), {writer_stats['fsyncs']} fsync(s)")
+        print(f"throughput speedup: {result['throughput_speedup']}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
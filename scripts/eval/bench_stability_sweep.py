@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Stability sweep benchmark — per-point contraction loop vs the batched,
+pooled sweep_stability.
+
+The original sweep relaxed one compute_equilibrium per (C1, eta1) point,
+then built a 4x4 Jacobian and ran eigvalsh on it, all in a double Python
+loop. sweep_stability (governance_core/stability.py) now relaxes every grid
+point at once with the fleet kernel, builds a Jacobian tensor, runs one
+batched eigvalsh and splits large grids across a process pool. This times
+an n x n grid (default 50 / 100 / 200) per-point, batched in one process,
+batched on --workers processes and from the memo cache, and reports the
+largest rate difference against the per-point loop.
+
+Usage:
+    python scripts/eval/bench_stability_sweep.py
+    python scripts/eval/bench_stability_sweep.py --grid 200 400 --workers 8 --json
+
+The per-point loop is sampled on at most --scalar-cap points and
+extrapolated. No server or Postgres needed.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from governance_core import DEFAULT_THETA, Theta, clear_sweep_cache, sweep_stability
+from governance_core.dynamics import compute_equilibrium
+from governance_core.parameters import get_active_params
+from governance_core.stability import _analytical_jacobian, _check_contraction
+
+
+def scalar_rates(params, points: list) -> np.ndarray:
+    out = []
+    for c1, eta1 in points:
+        theta = Theta(C1=c1, eta1=eta1, eta2=DEFAULT_THETA.eta2)
+        eq = compute_equilibrium(params, theta, complexity=0.5)
+        out.append(_check_contraction(_analytical_jacobian(eq, params, theta, 0.5))["contraction_rate"])
+    return np.array(out)
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def bench(n: int, args) -> dict:
+    params = get_active_params()
+    C1 = np.linspace(params.C1_min, params.C1_max, n)
+    eta1 = np.linspace(params.eta1_min, params.eta1_max, n)
+    grid = [(c, e) for c in C1 for e in eta1]
+    step = max(1, len(grid) // args.scalar_cap)
+    sample = list(range(0, len(grid), step))[:args.scalar_cap]
+
+    scalar, scalar_s = timed(lambda: scalar_rates(params, [grid[i] for i in sample]))
+    scalar_s *= len(grid) / len(sample)
+
+    clear_sweep_cache()
+    single, single_s = timed(lambda: sweep_stability(params, n_points=n, workers=1, use_cache=False))
+    _, pool_s = timed(lambda: sweep_stability(params, n_points=n, workers=args.workers, use_cache=False))
+    sweep_stability(params, n_points=n, workers=1)
+    _, cached_s = timed(lambda: sweep_stability(params, n_points=n, workers=1))
+
+    rates = np.array(single["contraction_rates"]).ravel()[sample]
+    return {
+        "grid": f"{n}x{n}",
+        "points": n * n,
+        "scalar_s": round(scalar_s, 2),
+        "batch_s": round(single_s, 2),
+        "pool_s": round(pool_s, 2),
+        "cached_ms": round(cached_s * 1000, 2),
+        "speedup": round(scalar_s / min(single_s, pool_s), 1),
+        "max_abs_diff": float(np.abs(rates - scalar).max()),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--grid", type=int, nargs="+", default=[50, 100, 200], help="points per axis")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="pool size for the pooled run")
+    parser.add_argument("--scalar-cap", type=int, default=400, help="grid points timed on the per-point loop")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    rows = [bench(n, args) for n in args.grid]
+    if args.json:
+        print(json.dumps({"config": vars(args), "results": rows}, indent=2))
+        return 0
+
+    print(f"workers={args.workers}")
+    print(f"{'grid':>9} {'scalar s':>9} {'batch s':>8} {'pool s':>7} {'cached ms':>10} {'speedup':>8} {'max diff':>9}")
+    for r in rows:
+        print(
+            f"{r['grid']:>9} {r['scalar_s']:>9.1f} {r['batch_s']:>8.2f} {r['pool_s']:>7.2f} "
+            f"{r['cached_ms']:>10.2f} {r['speedup']:>7.1f}x {r['max_abs_diff']:>9.1e}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+REST tool-response benchmark — encode/parse/re-encode vs single serialization.
+
+A REST /v1/tools/call used to encode the handler's response dict into a
+TextContent, json.loads it back in the HTTP layer and encode it again in
+JSONResponse. The structured result path encodes once and splices the text
+into the envelope. This times both on synthetic payloads shaped like
+search_knowledge_graph, list_agents and get_governance_metrics (with history),
+under the stdlib and orjson encoders.
+
+Usage:
+    python scripts/eval/bench_tool_response_serialization.py
+    python scripts/eval/bench_tool_response_serialization.py --iterations 500 --json
+
+No server, Postgres or Redis needed.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from mcp.types import TextContent
+from starlette.responses import JSONResponse
+
+from src.http_api import _build_http_tool_response, _http_tool_response
+from src.mcp_handlers.serialization import StructuredTextContent, dumps_json
+
+
+def _iso(rng: random.Random) -> str:
+    return (datetime(2026, 1, 1) + timedelta(seconds=rng.randrange(10_000_000))).isoformat()
+
+
+def search_knowledge_graph(rng: random.Random) -> dict:
+    return {
+        "success": True,
+        "query": "calibration drift after restart",
+        "search_mode": "hybrid",
+        "total_count": 50,
+        "discoveries": [
+            {
+                "id": f"disc-{i:05d}",
+                "agent_id": f"agent-{rng.randrange(200)}",
+                "type": rng.choice(["insight", "bug_found", "pattern", "question"]),
+                "summary": "Observed " + " ".join(f"token{rng.randrange(5000)}" for _ in range(20)),
+                "details": " ".join(f"word{rng.randrange(5000)}" for _ in range(120)),
+                "tags": [f"tag{rng.randrange(80)}" for _ in range(6)],
+                "severity": rng.choice(["low", "medium", "high"]),
+                "status": "open",
+                "timestamp": _iso(rng),
+                "score": round(rng.random(), 6),
+                "related_discoveries": [f"disc-{rng.randrange(5000):05d}" for _ in range(3)],
+            }
+            for i in range(50)
+        ],
+    }
+
+
+def list_agents(rng: random.Random) -> dict:
+    return {
+        "success": True,
+        "total": 100,
+        "agents": [
+            {
+                "agent_id": f"agent-{i}",
+                "uuid": f"{rng.getrandbits(128):032x}",
+                "label": f"Agent {i}",
+                "status": rng.choice(["active", "waiting_input", "archived"]),
+                "created_at": _iso(rng),
+                "last_update": _iso(rng),
+                "total_updates": rng.randrange(5000),
+                "tags": [f"tag{rng.randrange(30)}" for _ in range(3)],
+                "metrics": {k: round(rng.random(), 6) for k in ("E", "I", "S", "V", "coherence", "risk_score")},
+                "trust_tier": rng.choice(["unknown", "emerging", "established"]),
+            }
+            for i in range(100)
+        ],
+    }
+
+
+def governance_metrics_with_history(rng: random.Random) -> dict:
+    history_keys = (
+        "E_history", "I_history", "S_history", "V_history", "coherence_history",
+        "risk_history", "lambda1_history", "phi_history", "decision_history",
+        "timestamp_history", "regime_history", "confidence_history",
+    )
+    history = {}
+    for key in history_keys:
+        if key == "timestamp_history":
+            history[key] = [_iso(rng) for _ in range(100)]
+        elif key in ("decision_history", "regime_history"):
+            history[key] = [rng.choice(["proceed", "pause", "exploration", "convergence"]) for _ in range(100)]
+        else:
+            history[key] = [round(rng.random(), 6) for _ in range(100)]
+    return {
+        "success": True,
+        "agent_id": "agent-7",
+        "E": 0.71, "I": 0.82, "S": 0.19, "V": -0.02,
+        "coherence": 0.49, "risk_score": 0.31, "verdict": "proceed",
+        "history": history,
+    }
+
+
+PAYLOADS = {
+    "search_knowledge_graph": search_knowledge_graph,
+    "list_agents": list_agents,
+    "get_governance_metrics": governance_metrics_with_history,
+}
+
+
+def legacy_path(tool_name: str, payload: dict) -> bytes:
+    result = [TextContent(type="text", text=json.dumps(payload, ensure_ascii=False))]
+    return JSONResponse(_build_http_tool_response(tool_name, result)).body
+
+
+def structured_path(tool_name: str, payload: dict) -> bytes:
+    result = [StructuredTextContent.from_payload(payload, dumps_json(payload))]
+    return _http_tool_response(tool_name, result).body
+
+
+def time_path(fn, tool_name: str, payload: dict, iterations: int) -> list:
+    samples = []
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        fn(tool_name, payload)
+        samples.append((time.perf_counter() - t0) * 1000)
+    return samples
+
+
+def summarize(samples: list) -> dict:
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered), 4),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 4),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    result = {"config": vars(args), "payloads": {}}
+    for tool_name, build in PAYLOADS.items():
+        payload = build(rng)
+        os.environ["UNITARES_JSON_ENCODER"] = "stdlib"
+        row = {
+            "bytes": len(legacy_path(tool_name, payload)),
+            "legacy": summarize(time_path(legacy_path, tool_name, payload, args.iterations)),
+            "structured_stdlib": summarize(time_path(structured_path, tool_name, payload, args.iterations)),
+        }
+        os.environ["UNITARES_JSON_ENCODER"] = "orjson"
+        row["structured_orjson"] = summarize(time_path(structured_path, tool_name, payload, args.iterations))
+        for name in ("structured_stdlib", "structured_orjson"):
+            row[name]["speedup_p50"] = round(row["legacy"]["p50_ms"] / max(row[name]["p50_ms"], 1e-6), 1)
+        result["payloads"][tool_name] = row
+    os.environ.pop("UNITARES_JSON_ENCODER", None)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for tool_name, row in result["payloads"].items():
+            print(f"{tool_name} ({row['bytes']} bytes)")
+            for name in ("legacy", "structured_stdlib", "structured_orjson"):
+                r = row[name]
+                speedup = f"  {r['speedup_p50']}x" if "speedup_p50" in r else ""
+                print(f"  {name:<18} p50={r['p50_ms']:>8.4f} ms  p99={r['p99_ms']:>8.4f} ms{speedup}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tool-usage stats benchmark — JSONL tail scan vs in-memory window counters.
+
+Every check-in asks ToolUsageTracker.get_usage_stats(agent_id=..., window_hours=1)
+several times (monitor grounding, calibration, confidence, behavioral sensor,
+baseline). This writes a synthetic fleet-wide tool_usage.jsonl and times one
+check-in's worth of those calls on both paths.
+
+Usage:
+    python scripts/eval/bench_tool_usage_stats.py
+    python scripts/eval/bench_tool_usage_stats.py --calls-per-hour 50000 --agents 200
+    python scripts/eval/bench_tool_usage_stats.py --json
+
+No server, Postgres or Redis needed.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.tool_usage_tracker import ToolUsageTracker
+
+TOOLS = [
+    "process_agent_update", "get_governance_metrics", "search_knowledge_graph",
+    "knowledge", "onboard", "identity", "list_agents", "health_check",
+    "dialectic", "leave_note",
+]
+
+# get_usage_stats(window_hours=1, agent_id=...) calls made per process_agent_update.
+STATS_CALLS_PER_CHECKIN = 5
+
+
+def write_corpus(path: Path, calls_per_hour: int, agents: int, hours: float, seed: int) -> None:
+    rng = random.Random(seed)
+    now = datetime.now()
+    total = int(calls_per_hour * hours)
+    step = timedelta(seconds=hours * 3600 / max(total, 1))
+    ts = now - timedelta(hours=hours)
+    with open(path, "w") as f:
+        for _ in range(total):
+            ts += step
+            f.write(json.dumps({
+                "timestamp": ts.isoformat(),
+                "tool_name": rng.choice(TOOLS),
+                "agent_id": f"agent-{rng.randrange(agents)}",
+                "success": rng.random() > 0.05,
+                "error_type": None,
+            }))
+            f.write("\n")
+
+
+def time_checkins(tracker: ToolUsageTracker, agents: int, iterations: int, seed: int) -> list:
+    rng = random.Random(seed)
+    samples = []
+    for _ in range(iterations):
+        agent_id = f"agent-{rng.randrange(agents)}"
+        t0 = time.perf_counter()
+        for _ in range(STATS_CALLS_PER_CHECKIN):
+            tracker.get_usage_stats(agent_id=agent_id, window_hours=1)
+        samples.append((time.perf_counter() - t0) * 1000)
+    return samples
+
+
+def summarize(samples: list) -> dict:
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 3),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls-per-hour", type=int, default=20000)
+    parser.add_argument("--agents", type=int, default=100)
+    parser.add_argument("--hours", type=float, default=2.0, help="history written to the JSONL")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = Path(tmp) / "tool_usage.jsonl"
+        write_corpus(log_file, args.calls_per_hour, args.agents, args.hours, args.seed)
+
+        os.environ["UNITARES_TOOL_USAGE_AGGREGATOR"] = "0"
+        scan = ToolUsageTracker(log_file=log_file)
+        os.environ["UNITARES_TOOL_USAGE_AGGREGATOR"] = "1"
+        agg = ToolUsageTracker(log_file=log_file)
+
+        t0 = time.perf_counter()
+        loaded = agg.rebuild_aggregator()
+        rebuild_ms = (time.perf_counter() - t0) * 1000
+
+        scan_samples = time_checkins(scan, args.agents, args.iterations, args.seed)
+        agg_samples = time_checkins(agg, args.agents, args.iterations, args.seed)
+
+    result = {
+        "config": vars(args) | {"stats_calls_per_checkin": STATS_CALLS_PER_CHECKIN},
+        "aggregator_rebuild": {"entries": loaded, "ms": round(rebuild_ms, 1)},
+        "scan": summarize(scan_samples),
+        "aggregator": summarize(agg_samples),
+    }
+    result["speedup_p50"] = round(result["scan"]["p50_ms"] / max(result["aggregator"]["p50_ms"], 1e-6), 1)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"corpus: {args.calls_per_hour} calls/h x {args.hours}h across {args.agents} agents")
+        print(f"aggregator rebuild: {loaded} entries in {rebuild_ms:.1f} ms")
+        print(f"per check-in ({STATS_CALLS_PER_CHECKIN} stats calls):")
+        for name in ("scan", "aggregator"):
+            r = result[name]
+            print(f"  {name:<11} p50={r['p50_ms']:>9.3f} ms  p99={r['p99_ms']:>9.3f} ms")
+        print(f"speedup (p50): {result['speedup_p50']}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Trajectory similarity benchmark — the pure-Python per-dimension DTW table vs
+the banded, row-vectorized 4-D DTW in src/trajectory_identity.py.
+
+trajectory_shape_similarity used to fill a full n x m table in Python for
+each of E, I, S and V. It now aligns the four series as one (n, 4) series
+inside a Sakoe-Chiba band (UNITARES_DTW_BAND), one NumPy row at a time, and
+can abandon an alignment early against a cutoff (LB_Keogh, then row minima).
+This times one signature comparison at 100 / 1k / 10k samples with:
+
+  legacy    four full O(n^2) Python tables (sampled at --legacy-cap samples
+            and extrapolated by n^2 above it)
+  per-dim   four banded NumPy alignments (the ragged-length fallback)
+  4-D       one banded multivariate alignment
+  pruned    4-D with a similarity floor the pair fails (min_similarity)
+
+plus Bhattacharyya on 4x4 covariances, nested-list LU/Gauss-Jordan vs
+Cholesky. No server or Postgres needed.
+
+Usage:
+    python scripts/eval/bench_trajectory_similarity.py
+    python scripts/eval/bench_trajectory_similarity.py --samples 100 1000 --band 0.05 --json
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def legacy_dtw(s1, s2):
+    n, m = len(s1), len(s2)
+    dtw = [[float("inf")] * (m + 1) for _ in range(n + 1)]
+    dtw[0][0] = 0.0
+    for i in range(1, n + 1):
+        for j in range(1, m + 1):
+            cost = abs(s1[i - 1] - s2[j - 1])
+            dtw[i][j] = cost + min(dtw[i - 1][j], dtw[i][j - 1], dtw[i - 1][j - 1])
+    return dtw[n][m] / max(n, m)
+
+
+def legacy_det(m):
+    n = len(m)
+    mat = [row[:] for row in m]
+    det = 1.0
+    for i in range(n):
+        if abs(mat[i][i]) < 1e-12:
+            for j in range(i + 1, n):
+                if abs(mat[j][i]) > 1e-12:
+                    mat[i], mat[j] = mat[j], mat[i]
+                    det *= -1
+                    break
+            else:
+                return 0.0
+        det *= mat[i][i]
+        for j in range(i + 1, n):
+            factor = mat[j][i] / mat[i][i]
+            for k in range(i, n):
+                mat[j][k] -= factor * mat[i][k]
+    return det
+
+
+def legacy_inv(m):
+    n = len(m)
+    aug = [m[i][:] + [1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+    for col in range(n):
+        max_row = max(range(col, n), key=lambda r: abs(aug[r][col]))
+        aug[col], aug[max_row] = aug[max_row], aug[col]
+        pivot = aug[col][col]
+        for j in range(2 * n):
+            aug[col][j] /= pivot
+        for row in range(n):
+            if row != col:
+                factor = aug[row][col]
+                for j in range(2 * n):
+                    aug[row][j] -= factor * aug[col][j]
+    return [[aug[i][j + n] for j in range(n)] for i in range(n)]
+
+
+def legacy_bhattacharyya(mu1, cov1, mu2, cov2):
+    n, eps = len(mu1), 1e-6
+    s_avg = [[(cov1[i][j] + cov2[i][j]) / 2.0 + (eps if i == j else 0.0) for j in range(n)] for i in range(n)]
+    s1 = [[cov1[i][j] + (eps if i == j else 0.0) for j in range(n)] for i in range(n)]
+    s2 = [[cov2[i][j] + (eps if i == j else 0.0) for j in range(n)] for i in range(n)]
+    inv_avg = legacy_inv(s_avg)
+    diff = [a - b for a, b in zip(mu1, mu2)]
+    mahal = sum(diff[i] * inv_avg[i][j] * diff[j] for i in range(n) for j in range(n)) / 8.0
+    d_b = mahal + 0.5 * math.log(legacy_det(s_avg) / math.sqrt(legacy_det(s1) * legacy_det(s2)))
+    return max(0.0, min(1.0, math.exp(-d_b)))
+
+
+def make_signature(n: int, phase: float, seed: int):
+    from src.trajectory_identity import TrajectorySignature
+
+    rng = np.random.default_rng(seed)
+    t = np.arange(n)
+    attractor = {
+        f"{dim}_trajectory": (0.5 + 0.1 * np.sin(t / 25 + phase + k) + rng.normal(0, 0.01, n)).tolist()
+        for k, dim in enumerate("EISV")
+    }
+    return TrajectorySignature(attractor=attractor)
+
+
+def timed(fn, repeats: int) -> tuple:
+    times, result = [], None
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - t0)
+    return result, float(np.median(times))
+
+
+def bench(n: int, args) -> dict:
+    from src.trajectory_identity import TrajectorySignature, _dtw_similarity
+
+    a, b = make_signature(n, 0.0, n), make_signature(n, 0.3, n + 1)
+    dims = [f"{d}_trajectory" for d in "EISV"]
+
+    ln = min(n, args.legacy_cap)
+    _, legacy_s = timed(lambda: [legacy_dtw(a.attractor[k][:ln], b.attractor[k][:ln]) for k in dims], 1)
+    legacy_s *= (n / ln) ** 2
+
+    per_dim, per_dim_s = timed(
+        lambda: sum(_dtw_similarity(a.attractor[k], b.attractor[k]) for k in dims) / 4, args.repeats,
+    )
+
+    def fresh_pair():
+        # Parse from dicts each time so the (n, 4) matrix build is included
+        return TrajectorySignature.from_dict(a.to_dict()), TrajectorySignature.from_dict(b.to_dict())
+
+    def multi():
+        x, y = fresh_pair()
+        return x.trajectory_shape_similarity(y)
+
+    multi_sim, multi_s = timed(multi, args.repeats)
+    x, y = a._eisv_matrix(), b._eisv_matrix()
+    floor = min(1.0, multi_sim + 0.05)
+    _, pruned_s = timed(lambda: _dtw_similarity(x, y, min_similarity=floor), args.repeats)
+
+    return {
+        "samples": n,
+        "legacy_ms": round(legacy_s * 1000, 2),
+        "per_dim_ms": round(per_dim_s * 1000, 3),
+        "multi_ms": round(multi_s * 1000, 3),
+        "pruned_ms": round(pruned_s * 1000, 3),
+        "speedup": round(legacy_s / multi_s, 1),
+        "per_dim_similarity": round(per_dim, 6),
+        "multi_similarity": round(multi_sim, 6),
+    }
+
+
+def bench_bhattacharyya(repeats: int) -> dict:
+    from src.trajectory_identity import bhattacharyya_similarity
+
+    rng = np.random.default_rng(0)
+    a, b = rng.normal(size=(4, 4)), rng.normal(size=(4, 4))
+    cov1, cov2 = (a @ a.T).tolist(), (b @ b.T).tolist()
+    mu1, mu2 = rng.random(4).tolist(), rng.random(4).tolist()
+    legacy, legacy_s = timed(lambda: legacy_bhattacharyya(mu1, cov1, mu2, cov2), repeats)
+    new, new_s = timed(lambda: bhattacharyya_similarity(mu1, cov1, mu2, cov2), repeats)
+    return {"legacy_us": round(legacy_s * 1e6, 1), "cholesky_us": round(new_s * 1e6, 1), "abs_diff": abs(legacy - new)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--samples", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--band", type=float, help="override UNITARES_DTW_BAND for this run")
+    parser.add_argument("--repeats", type=int, default=5, help="timed calls per size (median)")
+    parser.add_argument("--legacy-cap", type=int, default=1_000, help="largest n run on the legacy table")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+    if args.band is not None:
+        os.environ["UNITARES_DTW_BAND"] = str(args.band)
+
+    rows = [bench(n, args) for n in args.samples]
+    bhatt = bench_bhattacharyya(max(args.repeats, 200))
+    from src.trajectory_identity import DTW_BAND
+
+    if args.json:
+        print(json.dumps({"config": vars(args), "dtw_band": DTW_BAND, "results": rows, "bhattacharyya": bhatt}, indent=2))
+        return 0
+
+    print(f"dtw_band={DTW_BAND}")
+    print(f"{'samples':>8} {'legacy ms':>11} {'per-dim ms':>11} {'4-D ms':>9} {'pruned ms':>10} {'speedup':>8}")
+    for r in rows:
+        print(
+            f"{r['samples']:>8} {r['legacy_ms']:>11.1f} {r['per_dim_ms']:>11.2f} {r['multi_ms']:>9.2f} "
+            f"{r['pruned_ms']:>10.2f} {r['speedup']:>7.1f}x"
+        )
+    print(f"bhattacharyya 4x4: legacy {bhatt['legacy_us']}us, cholesky {bhatt['cholesky_us']}us, "
+          f"|diff| {bhatt['abs_diff']:.1e}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,8 @@ Usage:
     python scripts/eval/retrieval_eval.py --labels tests/retrieval_eval/labels.json
     python scripts/eval/retrieval_eval.py --json > /tmp/baseline.json
     python scripts/eval/retrieval_eval.py --k 10 --recall-k 20 --limit-queries 5
+    python scripts/eval/retrieval_eval.py --compare-hydration   # + pgvector stage latency, before/after
+    python scripts/eval/retrieval_eval.py --rerank --backend-parity onnx-int8 --parity-tolerance 0.02
 
 Requires live Postgres + embeddings backend.
 """
@@ -81,7 +83,7 @@ async def run_query(
 
     # First-stage retrieval
     if hybrid:
-        from src.retrieval import rrf_fuse, expand_with_neighbors
+        from src.retrieval import collect_seed_neighbors, expand_with_neighbors, rrf_fuse
         fetch = max(top_k, rerank_pool_size if rerank else 50)
         sem_task = graph.semantic_search(query, limit=fetch, min_similarity=0.0)
         fts_task = graph.full_text_search(query, limit=fetch)
@@ -93,18 +95,10 @@ async def run_query(
         for d in fts_res:
             pool.setdefault(d.id, d)
         if graph_expand:
-            seed_neighbors: Dict[str, set] = {}
-            for seed_id, _ in fused[:10]:
-                seed_doc = pool.get(seed_id)
-                if seed_doc is None:
-                    continue
-                nbrs: set = set()
-                nbrs.update(seed_doc.related_to or [])
-                nbrs.update(getattr(seed_doc, "responses_from", None) or [])
-                if seed_doc.response_to:
-                    nbrs.add(seed_doc.response_to.discovery_id)
-                nbrs.discard(seed_id)
-                seed_neighbors[seed_id] = nbrs
+            seed_neighbors = collect_seed_neighbors(
+                [seed_id for seed_id, _ in fused[:10]], pool,
+                edge_index=getattr(graph, "edge_index", None),
+            )
             fused = expand_with_neighbors(
                 fused, seed_neighbors, edge_weight=0.5, max_seeds=10,
             )
@@ -133,6 +127,74 @@ async def run_query(
     return ranked_ids, scores, dt_ms
 
 
+async def _legacy_pgvector_stage(graph, embedding_str: str, limit: int) -> int:
+    """Pre-hydration pgvector stage: ids-only index query, then get_discovery per hit."""
+    from src.embeddings import get_active_table_name
+    db = await graph._get_db()
+    async with db.acquire() as conn:
+        rows = await conn.fetch(
+            f"""
+            SELECT discovery_id, (1 - (embedding <=> $1::vector)) AS similarity
+            FROM {get_active_table_name()}
+            WHERE embedding IS NOT NULL
+              AND (1 - (embedding <=> $1::vector)) >= $2
+            ORDER BY embedding <=> $1::vector
+            LIMIT $3
+            """,
+            embedding_str, 0.0, limit,
+        )
+    hydrated = 0
+    for row in rows:
+        if await graph.get_discovery(row["discovery_id"]):
+            hydrated += 1
+    return hydrated
+
+
+async def compare_hydration(graph, queries: List[str], limit: int, repeats: int = 3) -> Dict[str, Any]:
+    """Time the pgvector first stage before/after batched hydration.
+
+    Each query is embedded once up front so only the DB work is timed:
+    `legacy` is the ids-only query plus one get_discovery per hit,
+    `hydrated` is graph._pgvector_search (one joined query).
+    """
+    from src.embeddings import get_embeddings_service
+    embeddings = await get_embeddings_service()
+    legacy_ms: List[float] = []
+    hydrated_ms: List[float] = []
+    for query in queries:
+        vec = await embeddings.embed(query)
+        embedding_str = '[' + ','.join(str(x) for x in vec) + ']'
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            await _legacy_pgvector_stage(graph, embedding_str, limit)
+            legacy_ms.append((time.perf_counter() - t0) * 1000.0)
+            t0 = time.perf_counter()
+            await graph._pgvector_search(vec, limit=limit, min_similarity=0.0)
+            hydrated_ms.append((time.perf_counter() - t0) * 1000.0)
+    legacy, hydrated = _percentiles(legacy_ms), _percentiles(hydrated_ms)
+    return {
+        "limit": limit,
+        "samples": len(legacy_ms),
+        "legacy_ms": legacy,
+        "hydrated_ms": hydrated,
+        "speedup_p50": round(legacy["p50"] / max(hydrated["p50"], 1e-6), 1) if legacy else None,
+    }
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {}
+    s = sorted(values)
+    def pct(p: float) -> float:
+        idx = min(int(p * len(s)), len(s) - 1)
+        return s[idx]
+    return {
+        "p50": round(pct(0.50), 1),
+        "p95": round(pct(0.95), 1),
+        "max": round(max(s), 1),
+    }
+
+
 async def evaluate(
     labels_path: Path,
     ndcg_k: int = 10,
@@ -143,6 +205,7 @@ async def evaluate(
     rerank_pool_size: int = 50,
     hybrid: bool = False,
     graph_expand: bool = False,
+    hydration: bool = False,
 ) -> Dict[str, Any]:
     with labels_path.open() as f:
         corpus = json.load(f)
@@ -202,19 +265,6 @@ async def evaluate(
             "max": round(max(values), 3),
         }
 
-    def percentiles(values: List[float]) -> Dict[str, float]:
-        if not values:
-            return {}
-        s = sorted(values)
-        def pct(p: float) -> float:
-            idx = min(int(p * len(s)), len(s) - 1)
-            return s[idx]
-        return {
-            "p50": round(pct(0.50), 1),
-            "p95": round(pct(0.95), 1),
-            "max": round(max(s), 1),
-        }
-
     # Report the path relative to the repo root so pinned baselines don't
     # capture worktree-specific absolute paths.
     repo_root = Path(__file__).resolve().parents[2]
@@ -223,7 +273,7 @@ async def evaluate(
     except ValueError:
         corpus_rel_path = str(labels_path)
 
-    return {
+    result = {
         "corpus": {
             "path": corpus_rel_path,
             "pair_count": len(pairs),
@@ -242,10 +292,76 @@ async def evaluate(
             f"ndcg@{ndcg_k}": agg(ndcgs),
             f"recall@{recall_k}": agg(recalls),
             "mrr": agg(mrrs),
-            "latency_ms": percentiles(latencies),
+            "latency_ms": _percentiles(latencies),
         },
         "per_query": per_query,
     }
+    if hydration:
+        result["hydration"] = await compare_hydration(
+            graph, [p["query"] for p in pairs], max(top_k_fetch, recall_k),
+        )
+    return result
+
+
+def use_backend(backend: str) -> None:
+    """Point the embeddings/reranker singletons at fresh services on `backend`."""
+    from src import embeddings, reranker
+
+    embeddings._embeddings_service = embeddings.EmbeddingsService(backend=backend)
+    reranker._reranker = reranker.CrossEncoderReranker(backend=backend)
+
+
+async def backend_parity(
+    backend: str, tolerance: float, baseline_backend: str = "torch", **eval_kwargs: Any,
+) -> Dict[str, Any]:
+    """Evaluate on the baseline backend and on `backend`; compare nDCG.
+
+    Stored passage embeddings stay as they are, so this measures what
+    switching the query-side encoder (and the reranker) does to retrieval.
+    """
+    from src import embeddings, reranker
+
+    runs: Dict[str, Dict[str, Any]] = {}
+    for name in (baseline_backend, backend):
+        use_backend(name)
+        runs[name] = await evaluate(**eval_kwargs)
+        runs[name]["config"]["backend"] = {
+            "embeddings": embeddings._embeddings_service.backend,
+            "reranker": reranker._reranker.backend,
+        }
+    ndcg_key = f"ndcg@{eval_kwargs.get('ndcg_k', 10)}"
+    base = runs[baseline_backend]["aggregate"][ndcg_key]["mean"]
+    cand = runs[backend]["aggregate"][ndcg_key]["mean"]
+    delta = round(cand - base, 3)
+    return {
+        "baseline": runs[baseline_backend],
+        "candidate": runs[backend],
+        "parity": {
+            "metric": ndcg_key,
+            "baseline_backend": runs[baseline_backend]["config"]["backend"],
+            "candidate_backend": runs[backend]["config"]["backend"],
+            "baseline": base,
+            "candidate": cand,
+            "delta": delta,
+            "tolerance": tolerance,
+            "ok": delta >= -tolerance,
+            "baseline_latency_ms": runs[baseline_backend]["aggregate"]["latency_ms"],
+            "candidate_latency_ms": runs[backend]["aggregate"]["latency_ms"],
+        },
+    }
+
+
+def print_parity(parity: Dict[str, Any]) -> None:
+    print(f"\nBackend parity — {parity['metric']}")
+    for side in ("baseline", "candidate"):
+        b = parity[f"{side}_backend"]
+        lat = parity[f"{side}_latency_ms"]
+        print(
+            f"  {side:<9} emb={b['embeddings']:<9} rerank={b['reranker']:<9} "
+            f"{parity[side]:.3f}  p50 {lat['p50']}ms  p95 {lat['p95']}ms"
+        )
+    verdict = "OK" if parity["ok"] else "FAIL"
+    print(f"  delta {parity['delta']:+.3f} (tolerance {parity['tolerance']}) — {verdict}\n")
 
 
 def print_human(result: Dict[str, Any]) -> None:
@@ -278,6 +394,14 @@ def print_human(result: Dict[str, Any]) -> None:
             f"{q['latency_ms']}ms"
         )
 
+    hyd = result.get("hydration")
+    if hyd and hyd["legacy_ms"]:
+        print(f"\npgvector stage (limit {hyd['limit']}, {hyd['samples']} samples):")
+        for name in ("legacy_ms", "hydrated_ms"):
+            h = hyd[name]
+            print(f"  {name[:-3]:<9} p50 {h['p50']}ms  p95 {h['p95']}ms  max {h['max']}ms")
+        print(f"  speedup p50: {hyd['speedup_p50']}x")
+
 
 def main():
     parser = argparse.ArgumentParser(description="KG retrieval quality eval")
@@ -294,10 +418,15 @@ def main():
                         help="Run hybrid RRF fusion (semantic + FTS)")
     parser.add_argument("--graph-expand", action="store_true",
                         help="After RRF, pull 1-hop typed-edge neighbors into the pool (requires --hybrid)")
+    parser.add_argument("--compare-hydration", action="store_true",
+                        help="Also time the pgvector stage: ids + get_discovery per hit vs one hydrated query")
+    parser.add_argument("--backend-parity", choices=["onnx", "onnx-int8"], default=None,
+                        help="Run on torch and on this inference backend; exit 1 if nDCG drops by more than --parity-tolerance")
+    parser.add_argument("--parity-tolerance", type=float, default=0.02)
     parser.add_argument("--json", action="store_true", help="emit JSON instead of human-readable output")
     args = parser.parse_args()
 
-    result = asyncio.run(evaluate(
+    eval_kwargs = dict(
         labels_path=args.labels,
         ndcg_k=args.ndcg_k,
         recall_k=args.recall_k,
@@ -307,7 +436,20 @@ def main():
         rerank_pool_size=args.rerank_pool_size,
         hybrid=args.hybrid,
         graph_expand=args.graph_expand,
-    ))
+        hydration=args.compare_hydration,
+    )
+
+    if args.backend_parity:
+        result = asyncio.run(backend_parity(args.backend_parity, args.parity_tolerance, **eval_kwargs))
+        if args.json:
+            json.dump(result, sys.stdout, indent=2)
+            sys.stdout.write("\n")
+        else:
+            print_human(result["candidate"])
+            print_parity(result["parity"])
+        sys.exit(0 if result["parity"]["ok"] else 1)
+
+    result = asyncio.run(evaluate(**eval_kwargs))
 
     if args.json:
         json.dump(result, sys.stdout, indent=2)
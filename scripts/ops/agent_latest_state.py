@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Check / backfill core.agent_latest_state (migration 038).
+
+The table is kept current by an INSERT trigger on core.agent_state. This
+compares it against the latest measured row per identity in the base table
+and, with --backfill, repairs any drift (idempotent).
+
+Usage:
+    python3 scripts/ops/agent_latest_state.py                 # check current epoch
+    python3 scripts/ops/agent_latest_state.py --epoch 2       # check another epoch
+    python3 scripts/ops/agent_latest_state.py --backfill      # repair, then re-check
+
+Exits non-zero when the table is inconsistent after the run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+
+async def run(backfill: bool = False, epoch: int | None = None) -> dict:
+    from src.db import get_db
+
+    db = get_db()
+    await db.init()
+    result = {"written": None}
+    if backfill:
+        result["written"] = await db.backfill_agent_latest_state()
+    result["check"] = await db.check_agent_latest_state(epoch=epoch)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check / backfill core.agent_latest_state")
+    parser.add_argument("--backfill", action="store_true", help="Upsert the latest measured row per identity first")
+    parser.add_argument("--epoch", type=int, default=None, help="Epoch to check (default: current)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="List drifting identity_ids")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(backfill=args.backfill, epoch=args.epoch))
+    check = result["check"]
+
+    if result["written"] is not None:
+        print(f"Backfill wrote {result['written']} row(s)\n")
+    print(f"core.agent_latest_state, epoch {check['epoch']}:")
+    print(f"  Expected entries: {check['expected']}")
+    print(f"  Actual entries:   {check['actual']}")
+    for key in ("missing", "stale", "extra"):
+        ids = check[key]
+        print(f"  {key.capitalize() + ':':<17} {len(ids)}")
+        if args.verbose and ids:
+            print(f"    {', '.join(str(i) for i in ids)}")
+    print(f"\n{'CONSISTENT' if check['consistent'] else 'INCONSISTENT — run with --backfill'}")
+
+    return 0 if check["consistent"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Report the server's named DB statements, most expensive first.
+
+The backend mixins run their hot queries through registered statements
+(src/db/statements.py), which keep per-statement call counts, errors,
+rows and latency in the server process. This fetches that table from
+GET /debug/db/statements and prints it ranked by total time. The same
+series are on /metrics as unitares_db_statement_*.
+
+Usage:
+    python3 scripts/ops/db_statements.py
+    python3 scripts/ops/db_statements.py --top 10 --url http://127.0.0.1:8767
+    python3 scripts/ops/db_statements.py --json
+
+Sends UNITARES_HTTP_API_TOKEN as a bearer token when it is set.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import urllib.request
+
+
+def fetch_report(url: str, top: int) -> dict:
+    request = urllib.request.Request(f"{url.rstrip('/')}/debug/db/statements?top={top}")
+    token = os.getenv("UNITARES_HTTP_API_TOKEN")
+    if token:
+        request.add_header("Authorization", f"Bearer {token}")
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return json.load(response)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank the server's named DB statements by total time")
+    parser.add_argument("--url", default=os.getenv("UNITARES_URL", "http://127.0.0.1:8767"), help="Governance server base URL")
+    parser.add_argument("--top", type=int, default=25, help="Statements to list")
+    parser.add_argument("--json", action="store_true", help="Print the raw report")
+    args = parser.parse_args()
+
+    try:
+        report = fetch_report(args.url, args.top)
+    except OSError as e:
+        print(f"ERROR: could not fetch {args.url}/debug/db/statements: {e}")
+        return 2
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    total = report["total_ms"] or 1.0
+    print(f"{report['registered']} registered statements, {report['total_ms'] / 1000:.1f}s total\n")
+    print(f"{'statement':<36} {'calls':>9} {'total ms':>11} {'share':>6} {'mean ms':>9} "
+          f"{'max ms':>9} {'rows':>9} {'errors':>6} {'prep':>5}")
+    for r in report["statements"]:
+        print(
+            f"{r['statement']:<36} {r['calls']:>9} {r['total_ms']:>11.1f} {100 * r['total_ms'] / total:>5.1f}% "
+            f"{r['mean_ms']:>9.3f} {r['max_ms']:>9.1f} {r['rows']:>9} {r['errors']:>6} "
+            f"{'-' if r['dynamic'] else r['prepares']:>5}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Check / repair knowledge.discovery_connectivity (migration 039) against AGE.
+
+The in-degree counters used for search ranking are kept current by a
+trigger on knowledge.discovery_edges. Graph edges that never got an edge
+row (links made before migration 039, writes that bypassed the table) are
+invisible to it. This compares the counters with a count of inbound
+RELATED_TO / RESPONDS_TO / SUPERSEDES edges in the graph and, with
+--repair, overwrites drifted rows with the graph counts. Safe to run from
+cron.
+
+Usage:
+    python3 scripts/ops/kg_connectivity.py              # check only
+    python3 scripts/ops/kg_connectivity.py --repair     # repair, then re-check
+    python3 scripts/ops/kg_connectivity.py -v           # list drifting ids
+
+Exits non-zero when the table is inconsistent after the run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+
+async def run(repair: bool = False) -> dict:
+    from src.storage.knowledge_graph_age import KnowledgeGraphAGE
+
+    graph = KnowledgeGraphAGE()
+    result = {"repair": None}
+    if repair:
+        result["repair"] = await graph.reconcile_connectivity(repair=True)
+    result["check"] = await graph.reconcile_connectivity()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check / repair knowledge.discovery_connectivity")
+    parser.add_argument("--repair", action="store_true", help="Overwrite drifted rows with graph counts first")
+    parser.add_argument("-v", "--verbose", action="store_true", help="List drifting discovery ids")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(repair=args.repair))
+    check = result["check"]
+    if not check.get("success"):
+        print(f"ERROR: {check.get('error')}")
+        return 2
+
+    if result["repair"] is not None:
+        print(f"Repair rewrote {result['repair']['repaired']} row(s)\n")
+    print("knowledge.discovery_connectivity vs AGE:")
+    print(f"  Discoveries checked: {check['checked']}")
+    print(f"  Drifted:             {check['drifted']}")
+    if args.verbose:
+        for d in check["drift"]:
+            print(f"    {d['id']}: table={d['table']} graph={d['graph']}")
+    print(f"\n{'CONSISTENT' if check['consistent'] else 'INCONSISTENT — run with --repair'}")
+
+    return 0 if check["consistent"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,6 +19,7 @@ from functools import partial
 from src.logging_utils import get_logger
 from src.agent_metadata_model import agent_metadata
 from src.agent_monitor_state import monitors, save_monitor_state, save_monitor_state_async
+from src.fleet_index import record_monitor
 from src.agent_identity_auth import verify_agent_ownership
 from src.agent_metadata_persistence import load_metadata_async
 
@@ -331,6 +332,7 @@ def process_update_authenticated(
 
     monitor = get_or_create_monitor(agent_id)
     result = monitor.process_update(agent_state)
+    record_monitor(agent_id, monitor)
 
     if auto_save:
         save_monitor_state(agent_id, monitor)
@@ -483,6 +485,7 @@ async def process_update_authenticated_async(
         None,
         partial(monitor.process_update, agent_state, confidence=confidence, task_type=task_type)
     )
+    record_monitor(agent_id, monitor)
 
     if auto_save:
         decision_action = result.get('decision', {}).get('action', 'unknown')
@@ -7,8 +7,6 @@ Monitor instances, state file I/O (save/load), per-agent state persistence.
 from __future__ import annotations
 
 import os
-import json
-import tempfile
 import time
 import fcntl
 import asyncio
@@ -17,6 +15,7 @@ from pathlib import Path
 from src.logging_utils import get_logger
 from src.agent_metadata_model import project_root
 from src.governance_monitor import UNITARESMonitor
+from src.monitor_state_log import read_state_file, write_state
 
 logger = get_logger(__name__)
 
@@ -55,31 +54,15 @@ def get_state_file(agent_id: str) -> Path:
 
 
 def _write_state_file(state_file: Path, state_data: dict) -> None:
-    """Atomically write the state file.
+    """Persist the state file.
 
-    Write to a tempfile in the same directory, fsync, then os.replace onto
-    the final path. Prevents zero-byte / truncated files if the process is
-    killed mid-write (which would leave loaders seeing a corrupt JSON and
-    silently falling back to None).
+    Snapshot mode (default) writes to a tempfile in the same directory,
+    fsyncs, then os.replace-s onto the final path, so a kill mid-write can't
+    leave a zero-byte / truncated file for loaders to choke on. Delta mode
+    appends only what changed since the last save to the agent's delta log
+    and compacts periodically — see src/monitor_state_log.py.
     """
-    state_file.parent.mkdir(parents=True, exist_ok=True)
-    tmp_fd, tmp_path = tempfile.mkstemp(
-        dir=state_file.parent,
-        prefix=f".{state_file.stem}.",
-        suffix=".tmp",
-    )
-    try:
-        with os.fdopen(tmp_fd, 'w') as f:
-            json.dump(state_data, f, indent=2)
-            f.flush()
-            os.fsync(f.fileno())
-        os.replace(tmp_path, state_file)
-    except Exception:
-        try:
-            os.unlink(tmp_path)
-        except OSError:
-            pass
-        raise
+    write_state(state_file, state_data)
 
 
 def _snapshot_governor_state(monitor: UNITARESMonitor) -> None:
@@ -224,10 +207,10 @@ def load_monitor_state(agent_id: str) -> 'GovernanceState | None':
         return None
 
     try:
-        with open(state_file, 'r') as f:
-            data = json.load(f)
-            state = GovernanceState.from_dict(data)
-            return state
+        data, _ = read_state_file(state_file)
+        if data is None:
+            return None
+        return GovernanceState.from_dict(data)
     except Exception as e:
         logger.warning(f"Could not load state for {agent_id}: {e}", exc_info=True)
         return None
@@ -362,7 +345,11 @@ async def ensure_hydrated(monitor: UNITARESMonitor, agent_id: str) -> bool:
     if getattr(monitor, "_needs_hydration", False) is not True:
         return False
     try:
-        return await hydrate_from_db_if_fresh(monitor, agent_id)
+        hydrated = await hydrate_from_db_if_fresh(monitor, agent_id)
+        if hydrated:
+            from src.fleet_index import record_monitor
+            record_monitor(agent_id, monitor)
+        return hydrated
     finally:
         # Single-shot: drain the mark even on hydrate failure (DB unreachable
         # etc.) so we don't retry on every subsequent read. Behavior degrades
@@ -38,7 +38,7 @@ from __future__ import annotations
 import hashlib
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence
 
 from src.db import get_db
 from src.db.base import IdentityRecord, AgentStateRecord
@@ -521,8 +521,8 @@ async def list_agents(
     return agents
 
 
-async def record_agent_state(
-    agent_id: str,
+def _agent_state_row(
+    identity_id: int,
     *,
     E: float,
     I: float,
@@ -536,27 +536,8 @@ async def record_agent_state(
     verdict: Optional[str] = None,
     action: Optional[str] = None,
     provenance_context: Optional[Mapping[str, Any]] = None,
-) -> int:
-    """
-    Record agent EISV state to PostgreSQL.
-
-    `action` is the governance decision sub_action / action vocabulary
-    ('proceed' | 'pause' | 'approve' | 'reflect' | 'revise' | 'reject') —
-    distinct from `verdict` ('safe' | 'caution' | 'high-risk') which is the
-    EISV verdict tier. Both are persisted into state_json; hydrate_from_db
-    uses `action` to reconstruct decision_history so observe summary's
-    decision_distribution survives a JSON-snapshot loss.
-
-    Returns the state_id of the created record.
-    """
-    await _ensure_db_ready()
-    db = get_db()
-
-    # Get identity_id
-    identity = await db.get_identity(agent_id)
-    if not identity:
-        raise ValueError(f"Agent '{agent_id}' not found")
-
+) -> Dict[str, Any]:
+    """Map record_agent_state arguments onto the backend's agent_state columns."""
     # Map regime to allowed DB values
     allowed_regimes = {
         'nominal', 'warning', 'critical', 'recovery',
@@ -580,8 +561,8 @@ async def record_agent_state(
     if provenance_context:
         state_json["provenance_context"] = dict(provenance_context)
 
-    state_id = await db.record_agent_state(
-        identity_id=identity.identity_id,
+    return dict(
+        identity_id=identity_id,
         entropy=S,
         integrity=I,
         stability_index=0.0,  # Dead field — no longer computed
@@ -591,9 +572,95 @@ async def record_agent_state(
         state_json=state_json,
     )
 
+
+async def record_agent_state(
+    agent_id: str,
+    *,
+    E: float,
+    I: float,
+    S: float,
+    V: float,
+    regime: str,
+    coherence: float,
+    health_status: str = "unknown",
+    risk_score: Optional[float] = None,
+    phi: Optional[float] = None,
+    verdict: Optional[str] = None,
+    action: Optional[str] = None,
+    provenance_context: Optional[Mapping[str, Any]] = None,
+) -> int:
+    """
+    Record agent EISV state to PostgreSQL.
+
+    `action` is the governance decision sub_action / action vocabulary
+    ('proceed' | 'pause' | 'approve' | 'reflect' | 'revise' | 'reject') —
+    distinct from `verdict` ('safe' | 'caution' | 'high-risk') which is the
+    EISV verdict tier. Both are persisted into state_json; hydrate_from_db
+    uses `action` to reconstruct decision_history so observe summary's
+    decision_distribution survives a JSON-snapshot loss.
+
+    Returns the state_id of the created record.
+    """
+    await _ensure_db_ready()
+    db = get_db()
+
+    # Get identity_id
+    identity = await db.get_identity(agent_id)
+    if not identity:
+        raise ValueError(f"Agent '{agent_id}' not found")
+
+    state_id = await db.record_agent_state(**_agent_state_row(
+        identity.identity_id,
+        E=E, I=I, S=S, V=V,
+        regime=regime,
+        coherence=coherence,
+        health_status=health_status,
+        risk_score=risk_score,
+        phi=phi,
+        verdict=verdict,
+        action=action,
+        provenance_context=provenance_context,
+    ))
+
     return state_id
 
 
+async def record_agent_states(records: Sequence[Mapping[str, Any]]) -> List[str]:
+    """
+    Record several EISV states with one backend executemany.
+
+    Each record holds record_agent_state's keyword arguments (agent_id
+    included). Identities are looked up once per distinct agent. Records for
+    agents with no identity row are not written; their agent_ids are returned
+    so the caller can take the per-record recovery path.
+    """
+    if not records:
+        return []
+    await _ensure_db_ready()
+    db = get_db()
+
+    identity_ids: Dict[str, Optional[int]] = {}
+    for record in records:
+        agent_id = record["agent_id"]
+        if agent_id not in identity_ids:
+            identity = await db.get_identity(agent_id)
+            identity_ids[agent_id] = identity.identity_id if identity else None
+
+    rows = []
+    missing: List[str] = []
+    for record in records:
+        fields = dict(record)
+        agent_id = fields.pop("agent_id")
+        identity_id = identity_ids[agent_id]
+        if identity_id is None:
+            missing.append(agent_id)
+            continue
+        rows.append(_agent_state_row(identity_id, **fields))
+    if rows:
+        await db.record_agent_states(rows)
+    return missing
+
+
 async def get_agent_state_history(
     agent_id: str,
     limit: int = 100,
@@ -11,11 +11,11 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, Iterator, List, Optional
 from dataclasses import dataclass, asdict
-import fcntl
 import os
 
 # Import structured logging
 from src.logging_utils import get_logger
+from src.jsonl_writer import append_jsonl_lines
 logger = get_logger(__name__)
 
 
@@ -109,6 +109,26 @@ class AuditLogger:
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
 
         self._jsonl_enabled = os.getenv("UNITARES_AUDIT_WRITE_JSONL", "1").strip().lower() not in ("0", "false", "no")
+        # Set by enable_group_commit() at server startup; None = write inline.
+        self._writer = None
+
+    def enable_group_commit(self, writer=None):
+        """Route JSONL appends through a background group-commit writer.
+
+        Takes the per-call open/flock/fsync off tool handlers. Readers in
+        this class flush the writer first, so they still see every entry
+        logged before the read.
+        """
+        if self._writer is None:
+            from src.jsonl_writer import make_group_commit_writer
+            self._writer = writer or make_group_commit_writer(self.log_file)
+        return self._writer
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until every entry logged so far is on disk. No-op when writing inline."""
+        if self._writer is None:
+            return True
+        return self._writer.flush(timeout)
     
     def log_lambda1_skip(self, agent_id: str, confidence: float, threshold: float, 
                          update_count: int, reason: str = None):
@@ -639,16 +659,10 @@ class AuditLogger:
         try:
             # Raw truth: JSONL append
             if self._jsonl_enabled:
-                with open(self.log_file, 'a') as f:
-                    # Acquire exclusive lock
-                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                    try:
-                        json.dump(entry_dict, f)
-                        f.write('\n')
-                        f.flush()
-                        os.fsync(f.fileno())
-                    finally:
-                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                if self._writer is not None:
+                    self._writer.submit(entry_dict)
+                else:
+                    append_jsonl_lines(self.log_file, [json.dumps(entry_dict) + '\n'])
         except Exception as e:
             # Don't crash on audit log failures
             logger.warning(f"Could not write audit log: {e}", exc_info=True)
@@ -687,6 +701,7 @@ class AuditLogger:
         Args:
             max_age_days: Keep entries newer than this many days
         """
+        self.flush()
         if not self.log_file.exists():
             return
         
@@ -699,8 +714,14 @@ class AuditLogger:
         
         # Archive old entries
         archived_file = archive_dir / f"audit_log_{datetime.now().strftime('%Y%m%d')}.jsonl"
+
+        if self._writer is not None:
+            with self._writer.exclusive():
+                return self._rotate_locked(cutoff_time, archived_file)
+        return self._rotate_locked(cutoff_time, archived_file)
+
+    def _rotate_locked(self, cutoff_time: datetime, archived_file: Path):
         recent_entries = []
-        
         try:
             with open(self.log_file, 'r') as f:
                 for line in f:
@@ -742,6 +763,7 @@ class AuditLogger:
             end_time: ISO format timestamp (inclusive)
             limit: Maximum number of entries to return
         """
+        self.flush()
         if not self.log_file.exists():
             return []
         
@@ -784,6 +806,7 @@ class AuditLogger:
         from datetime import timedelta
         cutoff_time = datetime.now() - timedelta(hours=window_hours)
 
+        self.flush()
         if not self.log_file.exists():
             return {
                 "total_skips": 0,
@@ -9,7 +9,7 @@ import asyncio
 import gzip
 import os
 import shutil
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from src.logging_utils import get_logger
@@ -179,6 +179,46 @@ async def concept_extraction_background_task(interval_hours: float = 24.0):
             break
 
 
+# ---------------------------------------------------------------------------
+# Edge index check
+# ---------------------------------------------------------------------------
+
+async def edge_index_check_task(interval_seconds: float = 900.0):
+    """Check the in-memory edge index against the AGE graph; rebuild on drift.
+
+    The index loads from knowledge.discovery_edges and then only grows, so
+    graph edges the table never had (pre-039 links) and edges that left the
+    graph are reconciled here. Opt-in (UNITARES_EDGE_INDEX_CHECK_INTERVAL_S,
+    default 0) and only started when graph expansion keeps an index: each
+    check is an AGE MATCH over every edge label, the query shape that got
+    kg_lifecycle disabled. The diff and rebuild run in the executor. Startup
+    delay 120s; each check is time-boxed like the KG lifecycle startup
+    cleanup.
+    """
+    await asyncio.sleep(120.0)
+    while True:
+        try:
+            from src.knowledge_graph import get_knowledge_graph
+            graph = await get_knowledge_graph()
+            if getattr(graph, "edge_index", None) is not None:
+                result = await asyncio.wait_for(graph.check_edge_index(repair=True), timeout=60.0)
+                if result.get("success") and not result["consistent"]:
+                    logger.info(
+                        f"[EDGE_INDEX] Rebuilt from graph: {result['missing']} missing, "
+                        f"{result['extra']} extra of {result['edges']} edges"
+                    )
+        except asyncio.CancelledError:
+            break
+        except asyncio.TimeoutError:
+            logger.warning("[EDGE_INDEX] Check timed out (will retry)")
+        except Exception as e:
+            logger.warning(f"[EDGE_INDEX] Check failed (will retry): {e}")
+        try:
+            await asyncio.sleep(interval_seconds)
+        except asyncio.CancelledError:
+            break
+
+
 # ---------------------------------------------------------------------------
 # S8a Phase-2 class promotion sweep
 # ---------------------------------------------------------------------------
@@ -297,26 +337,6 @@ async def lineage_eval_sweeper_task(interval_minutes: float = 30.0):
             break
 
 
-# ---------------------------------------------------------------------------
-# Materialized view refresh (moved from per-insert to periodic)
-# ---------------------------------------------------------------------------
-
-async def periodic_matview_refresh():
-    """Refresh mv_latest_agent_states periodically instead of per-insert."""
-    await asyncio.sleep(30.0)
-    while True:
-        try:
-            from src.db import get_db
-            db = get_db()
-            async with db.acquire() as conn:
-                await conn.execute(
-                    "REFRESH MATERIALIZED VIEW CONCURRENTLY core.mv_latest_agent_states"
-                )
-        except Exception as e:
-            logger.debug(f"Matview refresh skipped: {e}")
-        await asyncio.sleep(60)
-
-
 # ---------------------------------------------------------------------------
 # Partition maintenance
 # ---------------------------------------------------------------------------
@@ -1305,6 +1325,37 @@ async def identity_cache_warmup():
         logger.warning(f"[WARMUP] Identity cache warmup failed (non-fatal): {e}")
 
 
+async def tool_usage_aggregator_warmup():
+    """Build the in-memory tool-usage window counters before check-ins need them.
+
+    Reads the JSONL tail off the event loop. When there is no JSONL (fresh
+    data dir, or the file was moved aside) the counters are seeded from
+    ``audit.tool_usage`` instead so the first check-ins still see history.
+    """
+    await asyncio.sleep(1)
+    try:
+        from src.tool_usage_tracker import get_tool_usage_tracker
+        tracker = get_tool_usage_tracker()
+        if tracker.aggregator is None:
+            return
+
+        if tracker.log_file.exists():
+            loaded = await asyncio.get_running_loop().run_in_executor(None, tracker.rebuild_aggregator)
+            logger.info(f"[WARMUP] Tool usage aggregator loaded {loaded} call(s) from JSONL")
+            return
+
+        from src.db import get_db
+        db = get_db()
+        rows = await db.query_tool_usage(
+            start_time=datetime.now(timezone.utc) - timedelta(hours=tracker.aggregator.horizon_hours),
+            limit=200_000,
+        )
+        loaded = tracker.rebuild_aggregator_from_records(rows)
+        logger.info(f"[WARMUP] Tool usage aggregator loaded {loaded} call(s) from audit.tool_usage")
+    except Exception as e:
+        logger.warning(f"[WARMUP] Tool usage aggregator warmup failed (non-fatal): {e}")
+
+
 def _supervised_create_task(coro, *, name: str | None = None) -> asyncio.Task:
     """Create a background task with crash logging."""
     task = asyncio.create_task(coro, name=name)
@@ -1437,6 +1488,12 @@ def start_all_background_tasks(connection_tracker, set_ready):
     # _supervised_create_task(startup_kg_lifecycle(), name="kg_lifecycle")
     logger.info("[KG_LIFECYCLE] Disabled — AGE query deadlock under investigation")
     _supervised_create_task(concept_extraction_background_task(), name="concept_extraction")
+    from src.edge_index import edge_index_check_interval_s, edge_index_enabled
+    if edge_index_enabled() and edge_index_check_interval_s() > 0:
+        _supervised_create_task(
+            edge_index_check_task(interval_seconds=edge_index_check_interval_s()),
+            name="edge_index_check",
+        )
     _supervised_create_task(class_promotion_sweeper_task(), name="class_promotion_sweeper")
     logger.info("[CLASS_PROMOTION] Started ephemeral → engaged_ephemeral sweep (every 30m)")
     _supervised_create_task(
@@ -1444,7 +1501,8 @@ def start_all_background_tasks(connection_tracker, set_ready):
         name="r2_lineage_eval_sweeper",
     )
     logger.info("[R2_SWEEPER] Started lineage-eval sweep (every 30m, 6h re-eval guard)")
-    _supervised_create_task(periodic_matview_refresh(), name="matview_refresh")
+    # periodic_matview_refresh removed — core.agent_latest_state is kept
+    # current by an INSERT trigger on core.agent_state (migration 038).
     _supervised_create_task(periodic_partition_maintenance(), name="partition_maintenance")
     # Concurrent identity binding sweeper (#123): marks bindings stale once
     # they fall outside the live window so the diagnose view and v2
@@ -1483,4 +1541,5 @@ def start_all_background_tasks(connection_tracker, set_ready):
     logger.info("[SILENCE] Started agent silence detection (every 10m)")
 
     _supervised_create_task(identity_cache_warmup(), name="identity_cache_warmup")
+    _supervised_create_task(tool_usage_aggregator_warmup(), name="tool_usage_aggregator_warmup")
     _supervised_create_task(transport_binding_cache_warmup(), name="transport_binding_cache_warmup")
@@ -6,12 +6,23 @@ core.discovery_embeddings, and produces Concept nodes by:
   1. Merging similar tags (co-occurrence + embedding cosine > threshold)
   2. Splitting broad tags into sub-Concepts (agglomerative clustering)
   3. Writing Concept vertices and ABOUT/RELATES_TO edges to AGE
+
+Phases 3-5 run on arrays: per-tag means via segment sums, co-occurrence from
+the sorted discovery×tag incidence (no tag×tag dict), merge candidates scored
+with row-wise dot products or a blockwise-thresholded similarity matrix. They
+run in a worker process (UNITARES_CONCEPT_PROCESS_POOL, default on) so the
+daily job keeps its CPU off the server's event loop and GIL.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import multiprocessing
+import os
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Any, Dict, List, Optional, Set
 
 import numpy as np
@@ -32,8 +43,137 @@ MERGE_COSINE_THRESHOLD = 0.75
 MERGE_CO_OCCURRENCE_MIN = 2
 SPLIT_MIN_DISCOVERIES = 10
 SPLIT_DISTANCE_THRESHOLD = 0.5
+# Larger clusters are split on an evenly spaced sample of this many
+# discoveries; the rest join the nearest sub-cluster centroid.
+SPLIT_MAX_SAMPLE = 2000
 MIN_TAG_DISCOVERIES = 2
 
+# Upper bound on similarity-matrix elements held at once (64 MB float32).
+SIMILARITY_BLOCK_ELEMENTS = 1 << 24
+
+CONCEPT_PROCESS_POOL = os.getenv("UNITARES_CONCEPT_PROCESS_POOL", "1").strip().lower() in {
+    "1", "true", "yes", "on",
+}
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Unit-length rows; all-zero rows stay zero (cosine 0 with everything)."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def _pair_counts(
+    groups: np.ndarray, members: np.ndarray, n_members: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """How many groups each member pair shares, from (group, member) incidence.
+
+    Returns (left, right, count) with left < right, for pairs sharing at
+    least one group. Duplicate incidence entries count once. Work is
+    proportional to the sum over groups of size², not to n_members².
+    """
+    if len(groups) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty
+    codes = np.unique(np.asarray(groups, dtype=np.int64) * n_members + members)
+    g, m = codes // n_members, codes % n_members  # sorted by group, then member
+    starts = np.flatnonzero(np.r_[True, g[1:] != g[:-1]])
+    sizes = np.diff(np.r_[starts, len(g)])
+    # For each entry, the number of later entries in its group = its partners.
+    pos = np.arange(len(g)) - np.repeat(starts, sizes)
+    after = np.repeat(sizes, sizes) - pos - 1
+    left_idx = np.repeat(np.arange(len(g)), after)
+    first = np.cumsum(after) - after
+    right_idx = left_idx + np.arange(len(left_idx)) - np.repeat(first, after) + 1
+    pairs, counts = np.unique(m[left_idx] * n_members + m[right_idx], return_counts=True)
+    return pairs // n_members, pairs % n_members, counts
+
+
+def _tag_co_occurrence(
+    tag_discoveries: Dict[str, List[str]], tags: List[str]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Shared-discovery counts between `tags` as (left, right, count) index arrays."""
+    disc_index: Dict[str, int] = {}
+    groups: List[int] = []
+    members: List[int] = []
+    for k, tag in enumerate(tags):
+        for d in tag_discoveries.get(tag, []):
+            groups.append(disc_index.setdefault(d, len(disc_index)))
+            members.append(k)
+    return _pair_counts(np.array(groups, dtype=np.int64), np.array(members, dtype=np.int64), len(tags))
+
+
+def _tag_mean_matrix(
+    tag_discoveries: Dict[str, List[str]],
+    disc_ids: List[str],
+    matrix: np.ndarray,
+) -> tuple[List[str], np.ndarray]:
+    """Tags with >= MIN_TAG_DISCOVERIES embedded discoveries, and their means."""
+    index = {d: k for k, d in enumerate(disc_ids)}
+    tags: List[str] = []
+    rows: List[int] = []
+    sizes: List[int] = []
+    for tag in sorted(tag_discoveries):
+        hits = [index[d] for d in tag_discoveries[tag] if d in index]
+        if len(hits) >= MIN_TAG_DISCOVERIES:
+            tags.append(tag)
+            rows.extend(hits)
+            sizes.append(len(hits))
+    if not tags:
+        return [], np.empty((0, matrix.shape[1] if matrix.ndim == 2 else 0), dtype=np.float32)
+    starts = np.r_[0, np.cumsum(sizes)[:-1]]
+    sums = np.add.reduceat(matrix[np.array(rows)], starts, axis=0)
+    return tags, sums / np.array(sizes, dtype=sums.dtype)[:, None]
+
+
+def _similar_pairs(unit: np.ndarray, threshold: float) -> tuple[np.ndarray, np.ndarray]:
+    """All (i, j), i < j, with unit[i]·unit[j] > threshold.
+
+    The upper triangle of the similarity matrix is computed one row block at
+    a time, at most SIMILARITY_BLOCK_ELEMENTS entries per block.
+    """
+    n = len(unit)
+    block = max(1, min(n, SIMILARITY_BLOCK_ELEMENTS // max(n, 1)))
+    lefts, rights = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+    for start in range(0, n, block):
+        stop = min(n, start + block)
+        sims = unit[start:stop] @ unit[start:].T
+        r, c = np.nonzero(sims > threshold)
+        r, c = r + start, c + start
+        keep = c > r
+        lefts.append(r[keep])
+        rights.append(c[keep])
+    return np.concatenate(lefts), np.concatenate(rights)
+
+
+def _assign_to_centroids(
+    unit: np.ndarray, sample: np.ndarray, sample_labels: np.ndarray
+) -> np.ndarray:
+    """Labels for every row: sampled rows keep theirs, the rest get the
+    label of the most similar sub-cluster centroid."""
+    if len(sample) == len(unit):
+        return sample_labels
+    uniq, inverse = np.unique(sample_labels, return_inverse=True)
+    centroids = np.zeros((len(uniq), unit.shape[1]), dtype=np.float32)
+    np.add.at(centroids, inverse, unit[sample])
+    centroids = _normalize_rows(centroids)
+    labels = np.empty(len(unit), dtype=sample_labels.dtype)
+    block = max(1, SIMILARITY_BLOCK_ELEMENTS // max(len(uniq), 1))
+    for start in range(0, len(unit), block):
+        labels[start:start + block] = uniq[np.argmax(unit[start:start + block] @ centroids.T, axis=1)]
+    labels[sample] = sample_labels
+    return labels
+
+
+def _cluster_job(
+    settings: Dict[str, Any],
+    tag_discoveries: Dict[str, List[str]],
+    disc_ids: List[str],
+    matrix: np.ndarray,
+) -> tuple[int, List[List[str]]]:
+    """Process-pool entry point for ConceptExtractor._cluster."""
+    return ConceptExtractor(**settings)._cluster(tag_discoveries, disc_ids, matrix)
+
 
 class UnionFind:
     """Simple union-find for tag merging."""
@@ -74,11 +214,15 @@ class ConceptExtractor:
         merge_co_occurrence_min: int = MERGE_CO_OCCURRENCE_MIN,
         split_min_discoveries: int = SPLIT_MIN_DISCOVERIES,
         split_distance_threshold: float = SPLIT_DISTANCE_THRESHOLD,
+        split_max_sample: int = SPLIT_MAX_SAMPLE,
+        use_process_pool: bool = CONCEPT_PROCESS_POOL,
     ):
         self.merge_cosine_threshold = merge_cosine_threshold
         self.merge_co_occurrence_min = merge_co_occurrence_min
         self.split_min_discoveries = split_min_discoveries
         self.split_distance_threshold = split_distance_threshold
+        self.split_max_sample = max(2, split_max_sample)
+        self.use_process_pool = use_process_pool
 
     async def run(self) -> Dict[str, Any]:
         """Full pipeline. Returns summary stats."""
@@ -95,19 +239,15 @@ class ConceptExtractor:
         if not embeddings:
             return {"status": "skipped", "reason": "no embeddings found"}
 
-        # Phase 3: Compute per-tag mean embeddings
-        tag_embeddings = self._compute_tag_embeddings(tag_discoveries, embeddings)
-        if not tag_embeddings:
-            return {"status": "skipped", "reason": "no tags with sufficient embeddings"}
-
-        # Phase 4: Merge similar tags (Union-Find)
-        co_occurrence = self._compute_co_occurrence(tag_discoveries)
-        clusters = self._merge_similar_tags(tag_embeddings, co_occurrence)
-
-        # Phase 5: Split broad tags/clusters
-        split_clusters = self._split_broad_tags(
-            clusters, tag_discoveries, embeddings
+        # Phases 3-5: per-tag mean embeddings, merge similar tags
+        # (Union-Find), split broad clusters — off the event loop.
+        disc_ids = list(embeddings)
+        matrix = np.stack([embeddings[d] for d in disc_ids])
+        tags_processed, split_clusters = await self._run_clustering(
+            tag_discoveries, disc_ids, matrix
         )
+        if not tags_processed:
+            return {"status": "skipped", "reason": "no tags with sufficient embeddings"}
 
         # Phase 6: Build concept definitions
         concepts = self._build_concepts(split_clusters, tag_discoveries)
@@ -117,12 +257,47 @@ class ConceptExtractor:
 
         return {
             "status": "completed",
-            "tags_processed": len(tag_embeddings),
+            "tags_processed": tags_processed,
             "concepts_created": written["concepts"],
             "about_edges_created": written["about_edges"],
             "relates_to_edges_created": written["relates_to_edges"],
         }
 
+    async def _run_clustering(
+        self,
+        tag_discoveries: Dict[str, List[str]],
+        disc_ids: List[str],
+        matrix: np.ndarray,
+    ) -> tuple[int, List[List[str]]]:
+        """Run _cluster in a spawned worker process (or a thread if disabled/unavailable)."""
+        loop = asyncio.get_running_loop()
+        settings = {
+            "merge_cosine_threshold": self.merge_cosine_threshold,
+            "merge_co_occurrence_min": self.merge_co_occurrence_min,
+            "split_min_discoveries": self.split_min_discoveries,
+            "split_distance_threshold": self.split_distance_threshold,
+            "split_max_sample": self.split_max_sample,
+            "use_process_pool": False,
+        }
+        args = (settings, tag_discoveries, disc_ids, matrix)
+        if self.use_process_pool:
+            pool = None
+            try:
+                # spawn, not fork: the server process has threads and an event loop.
+                pool = ProcessPoolExecutor(
+                    max_workers=1, mp_context=multiprocessing.get_context("spawn"),
+                )
+                return await loop.run_in_executor(pool, _cluster_job, *args)
+            except (OSError, BrokenProcessPool) as e:
+                # e.g. no /dev/shm, fd limits, worker killed by the OOM killer.
+                logger.warning(f"Concept clustering process pool unavailable, using a thread: {e}")
+            finally:
+                # Never wait on the worker here: on cancellation that would
+                # block the event loop until the clustering finished.
+                if pool is not None:
+                    pool.shutdown(wait=False, cancel_futures=True)
+        return await loop.run_in_executor(None, _cluster_job, *args)
+
     async def _fetch_tags_with_discoveries(self) -> Dict[str, List[str]]:
         """Phase 1: Get {tag_name: [discovery_id, ...]} from AGE."""
         db = get_db()
@@ -181,39 +356,23 @@ class ConceptExtractor:
         embeddings: Dict[str, np.ndarray],
     ) -> Dict[str, np.ndarray]:
         """Phase 3: Mean embedding per tag."""
-        tag_embs: Dict[str, np.ndarray] = {}
-        for tag, disc_ids in tag_discoveries.items():
-            vecs = [embeddings[d] for d in disc_ids if d in embeddings]
-            if len(vecs) >= MIN_TAG_DISCOVERIES:
-                tag_embs[tag] = np.mean(vecs, axis=0)
-        return tag_embs
+        disc_ids = list(embeddings)
+        if not disc_ids:
+            return {}
+        matrix = np.stack([embeddings[d] for d in disc_ids])
+        tags, means = _tag_mean_matrix(tag_discoveries, disc_ids, matrix)
+        return dict(zip(tags, means))
 
     def _compute_co_occurrence(
         self, tag_discoveries: Dict[str, List[str]]
     ) -> Dict[tuple[str, str], int]:
         """Compute co-occurrence: number of discoveries shared between tag pairs."""
-        # Build reverse index: discovery -> set of tags
-        disc_to_tags: Dict[str, Set[str]] = defaultdict(set)
-        for tag, disc_ids in tag_discoveries.items():
-            for d in disc_ids:
-                disc_to_tags[d].add(tag)
-
-        co: Dict[tuple[str, str], int] = defaultdict(int)
-        for tags in disc_to_tags.values():
-            tag_list = sorted(tags)
-            for i in range(len(tag_list)):
-                for j in range(i + 1, len(tag_list)):
-                    co[(tag_list[i], tag_list[j])] += 1
-
-        return dict(co)
-
-    def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
-        """Cosine similarity between two vectors."""
-        norm_a = np.linalg.norm(a)
-        norm_b = np.linalg.norm(b)
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        return float(np.dot(a, b) / (norm_a * norm_b))
+        tags = sorted(tag_discoveries)
+        left, right, counts = _tag_co_occurrence(tag_discoveries, tags)
+        return {
+            (tags[i], tags[j]): int(c)
+            for i, j, c in zip(left.tolist(), right.tolist(), counts.tolist())
+        }
 
     def _merge_similar_tags(
         self,
@@ -221,18 +380,50 @@ class ConceptExtractor:
         co_occurrence: Dict[tuple[str, str], int],
     ) -> Dict[str, List[str]]:
         """Phase 4: Merge tags via Union-Find based on cosine + co-occurrence."""
-        tags = list(tag_embeddings.keys())
-        uf = UnionFind(tags)
+        tags = sorted(tag_embeddings)
+        index = {t: k for k, t in enumerate(tags)}
+        pairs = [
+            (index[a], index[b], c)
+            for (a, b), c in co_occurrence.items()
+            if a in index and b in index
+        ]
+        left, right, counts = (
+            np.array([pair[k] for pair in pairs], dtype=np.int64) for k in range(3)
+        )
+        matrix = np.stack([tag_embeddings[t] for t in tags]) if tags else np.empty((0, 0))
+        return self._merge_pairs(tags, matrix, left, right, counts)
 
-        for i in range(len(tags)):
-            for j in range(i + 1, len(tags)):
-                a, b = tags[i], tags[j]
-                pair = (min(a, b), max(a, b))
-                cos = self._cosine_similarity(tag_embeddings[a], tag_embeddings[b])
-                co = co_occurrence.get(pair, 0)
-                if cos > self.merge_cosine_threshold and co >= self.merge_co_occurrence_min:
-                    uf.union(a, b)
+    def _merge_pairs(
+        self,
+        tags: List[str],
+        matrix: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        counts: np.ndarray,
+    ) -> Dict[str, List[str]]:
+        """Union tags whose cosine and co-occurrence both clear the thresholds.
 
+        Co-occurrence is sparse, so with merge_co_occurrence_min >= 1 only
+        co-occurring pairs are scored (row-wise dot products). Otherwise
+        every pair is a candidate and the similarity matrix is thresholded
+        blockwise.
+        """
+        uf = UnionFind(tags)
+        if len(tags) < 2:
+            return uf.groups()
+        unit = _normalize_rows(matrix)
+
+        if self.merge_co_occurrence_min >= 1:
+            keep = counts >= self.merge_co_occurrence_min
+            left, right = left[keep], right[keep]
+            cos = np.einsum("ij,ij->i", unit[left], unit[right])
+            hits = cos > self.merge_cosine_threshold
+            left, right = left[hits], right[hits]
+        else:
+            left, right = _similar_pairs(unit, self.merge_cosine_threshold)
+
+        for i, j in zip(left.tolist(), right.tolist()):
+            uf.union(tags[i], tags[j])
         return uf.groups()
 
     def _split_broad_tags(
@@ -255,7 +446,9 @@ class ConceptExtractor:
                 continue
 
             # Get embeddings for these discoveries
-            disc_list = [d for d in disc_ids if d in embeddings]
+            # Sorted so the split doesn't depend on set order, which differs
+            # between processes (string hash randomization).
+            disc_list = [d for d in sorted(disc_ids) if d in embeddings]
             if len(disc_list) < self.split_min_discoveries:
                 result.append(tag_group)
                 continue
@@ -266,16 +459,15 @@ class ConceptExtractor:
                 result.append(tag_group)
                 continue
 
-            # Map sub-clusters back to tags
-            # Each sub-cluster gets the tags whose discoveries overlap most
-            for sc_disc_ids in sub_clusters:
-                sc_set = set(sc_disc_ids)
-                sub_tags = []
-                for tag in tag_group:
-                    tag_set = set(tag_discoveries.get(tag, []))
-                    overlap = len(tag_set & sc_set)
-                    if overlap > 0:
-                        sub_tags.append(tag)
+            # Map sub-clusters back to tags: each sub-cluster gets the tags
+            # with at least one discovery in it.
+            label_of = {d: k for k, sc in enumerate(sub_clusters) for d in sc}
+            tag_labels = {
+                tag: {label_of[d] for d in tag_discoveries.get(tag, []) if d in label_of}
+                for tag in tag_group
+            }
+            for k in range(len(sub_clusters)):
+                sub_tags = [tag for tag in tag_group if k in tag_labels[tag]]
                 if sub_tags:
                     result.append(sub_tags)
                 else:
@@ -290,50 +482,88 @@ class ConceptExtractor:
         disc_ids: List[str],
         embeddings: Dict[str, np.ndarray],
     ) -> List[List[str]]:
-        """Agglomerative clustering using scipy if available, else simple threshold."""
-        vecs = np.array([embeddings[d] for d in disc_ids])
+        """Agglomerative clustering using scipy if available, else simple threshold.
+
+        Cosine distances come from one matrix product over unit vectors
+        rather than pdist's per-pair loop. Clusters larger than
+        split_max_sample are clustered on an evenly spaced sample, which
+        bounds the O(n²) distance matrix; the remaining discoveries join
+        the sub-cluster with the nearest centroid.
+        """
+        vecs = np.array([embeddings[d] for d in disc_ids], dtype=np.float32)
+        unit = _normalize_rows(vecs)
+        n = len(disc_ids)
+        sample = np.arange(n) if n <= self.split_max_sample else (
+            np.linspace(0, n - 1, self.split_max_sample).astype(np.int64)
+        )
 
         try:
             from scipy.cluster.hierarchy import fcluster, linkage
-            from scipy.spatial.distance import pdist
-
-            distances = pdist(vecs, metric="cosine")
-            Z = linkage(distances, method="average")
-            labels = fcluster(Z, t=self.split_distance_threshold, criterion="distance")
-
-            clusters: Dict[int, List[str]] = defaultdict(list)
-            for idx, label in enumerate(labels):
-                clusters[int(label)].append(disc_ids[idx])
-            return list(clusters.values())
 
+            sims = unit[sample] @ unit[sample].T
+            distances = np.clip(1.0 - sims[np.triu_indices(len(sample), 1)], 0.0, 2.0)
+            Z = linkage(distances.astype(np.float64), method="average")
+            sample_labels = fcluster(Z, t=self.split_distance_threshold, criterion="distance")
         except ImportError:
             # Fallback: simple pairwise threshold-based clustering
-            return self._simple_threshold_split(disc_ids, vecs)
+            if n <= self.split_max_sample:
+                return self._simple_threshold_split(disc_ids, vecs)
+            sample_labels = np.empty(len(sample), dtype=np.int64)
+            sample_ids = [disc_ids[i] for i in sample]
+            position = {d: k for k, d in enumerate(sample_ids)}
+            for label, members in enumerate(self._simple_threshold_split(sample_ids, vecs[sample])):
+                sample_labels[[position[d] for d in members]] = label
+
+        labels = _assign_to_centroids(unit, sample, np.asarray(sample_labels))
+        clusters: Dict[int, List[str]] = defaultdict(list)
+        for idx, label in enumerate(labels.tolist()):
+            clusters[label].append(disc_ids[idx])
+        return list(clusters.values())
 
     def _simple_threshold_split(
         self, disc_ids: List[str], vecs: np.ndarray
     ) -> List[List[str]]:
-        """Fallback clustering when scipy is unavailable."""
-        n = len(disc_ids)
-        assigned = [False] * n
+        """Fallback clustering when scipy is unavailable.
+
+        Greedy: each unassigned discovery seeds a cluster and takes every
+        later unassigned discovery whose cosine to it clears the threshold.
+        """
+        unit = _normalize_rows(vecs)
+        threshold = 1.0 - self.split_distance_threshold
+        unassigned = np.ones(len(disc_ids), dtype=bool)
         clusters: List[List[str]] = []
 
-        for i in range(n):
-            if assigned[i]:
+        for i in range(len(disc_ids)):
+            if not unassigned[i]:
                 continue
-            cluster = [disc_ids[i]]
-            assigned[i] = True
-            for j in range(i + 1, n):
-                if assigned[j]:
-                    continue
-                cos = self._cosine_similarity(vecs[i], vecs[j])
-                if cos > (1.0 - self.split_distance_threshold):
-                    cluster.append(disc_ids[j])
-                    assigned[j] = True
-            clusters.append(cluster)
+            unassigned[i] = False
+            rest = np.flatnonzero(unassigned[i + 1:]) + i + 1
+            members = rest[unit[rest] @ unit[i] > threshold]
+            unassigned[members] = False
+            clusters.append([disc_ids[i]] + [disc_ids[j] for j in members])
 
         return clusters
 
+    def _cluster(
+        self,
+        tag_discoveries: Dict[str, List[str]],
+        disc_ids: List[str],
+        matrix: np.ndarray,
+    ) -> tuple[int, List[List[str]]]:
+        """Phases 3-5 on arrays: (tags with embeddings, split tag clusters).
+
+        Pure CPU and picklable in and out, so run() ships it to a worker
+        process.
+        """
+        tags, means = _tag_mean_matrix(tag_discoveries, disc_ids, matrix)
+        if not tags:
+            return 0, []
+        scoped = {t: tag_discoveries[t] for t in tags}
+        left, right, counts = _tag_co_occurrence(scoped, tags)
+        clusters = self._merge_pairs(tags, means, left, right, counts)
+        embeddings = dict(zip(disc_ids, matrix))
+        return len(tags), self._split_broad_tags(clusters, tag_discoveries, embeddings)
+
     def _build_concepts(
         self,
         tag_clusters: List[List[str]],
@@ -403,29 +633,39 @@ class ConceptExtractor:
                 logger.debug(f"Concept node failed for {concept['concept_id']}: {e}")
 
         # RELATES_TO edges between concepts sharing discoveries
-        for i in range(len(concepts)):
-            for j in range(i + 1, len(concepts)):
-                shared = set(concepts[i]["discovery_ids"]) & set(
-                    concepts[j]["discovery_ids"]
+        for i, j, shared in _concept_overlaps(concepts):
+            strength = shared / min(
+                len(concepts[i]["discovery_ids"]),
+                len(concepts[j]["discovery_ids"]),
+            )
+            try:
+                q, p = create_concept_relates_to_edge(
+                    concepts[i]["concept_id"],
+                    concepts[j]["concept_id"],
+                    strength=round(strength, 3),
                 )
-                if shared:
-                    strength = len(shared) / min(
-                        len(concepts[i]["discovery_ids"]),
-                        len(concepts[j]["discovery_ids"]),
-                    )
-                    try:
-                        q, p = create_concept_relates_to_edge(
-                            concepts[i]["concept_id"],
-                            concepts[j]["concept_id"],
-                            strength=round(strength, 3),
-                        )
-                        await db.graph_query(q, p)
-                        relates_count += 1
-                    except Exception as e:
-                        logger.debug(f"RELATES_TO edge failed: {e}")
+                await db.graph_query(q, p)
+                relates_count += 1
+            except Exception as e:
+                logger.debug(f"RELATES_TO edge failed: {e}")
 
         return {
             "concepts": concept_count,
             "about_edges": about_count,
             "relates_to_edges": relates_count,
         }
+
+
+def _concept_overlaps(concepts: List[Dict[str, Any]]) -> List[tuple[int, int, int]]:
+    """(i, j, shared discoveries) for concept pairs i < j sharing any."""
+    disc_index: Dict[str, int] = {}
+    groups: List[int] = []
+    members: List[int] = []
+    for k, concept in enumerate(concepts):
+        for d in concept["discovery_ids"]:
+            groups.append(disc_index.setdefault(d, len(disc_index)))
+            members.append(k)
+    left, right, counts = _pair_counts(
+        np.array(groups, dtype=np.int64), np.array(members, dtype=np.int64), len(concepts)
+    )
+    return list(zip(left.tolist(), right.tolist(), counts.tolist()))
@@ -308,6 +308,13 @@ class DatabaseBackend(ABC):
         """Record a new state snapshot. Returns state_id."""
         pass
 
+    async def record_agent_states(self, rows: List[Dict[str, Any]]) -> int:
+        """Record several state snapshots; each row holds record_agent_state's
+        keyword arguments. Returns the number of rows written."""
+        for row in rows:
+            await self.record_agent_state(**row)
+        return len(rows)
+
     @abstractmethod
     async def get_latest_agent_state(
         self,
@@ -11,6 +11,12 @@ caller's loop, which anyio handles cleanly.
 Caller surface is unchanged: handlers still write
     async with db.acquire() as conn:
         await conn.fetchval(...)
+
+That costs one cross-thread round trip per step (acquire, each statement,
+transaction start/commit, release). Hot paths instead ship the whole unit of
+work as one closure with ``ExecutorPool.run(work)``: acquire, statements,
+optional transaction and release all happen on the executor loop, and the
+caller awaits a single future.
 """
 
 from __future__ import annotations
@@ -18,7 +24,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import threading
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +103,14 @@ async def _await_on_loop(target: Any, loop: asyncio.AbstractEventLoop) -> Any:
     return await asyncio.wrap_future(future)
 
 
+class AcquireTimeoutError(asyncio.TimeoutError):
+    """``ExecutorPool.run`` could not get a connection within its timeout.
+
+    Distinct from a statement timeout raised by the unit of work itself, so
+    callers can map only pool exhaustion onto their exhaustion handling.
+    """
+
+
 class _Transaction:
     """
     Wraps an asyncpg transaction so __aenter__/__aexit__ both round-trip
@@ -280,6 +294,40 @@ class ExecutorPool:
     def acquire(self, timeout: Any = None) -> _AcquireContext:
         return _AcquireContext(self._raw_pool, self._loop, timeout=timeout)
 
+    async def run(
+        self,
+        work: Callable[[Any], Awaitable[Any]],
+        *,
+        timeout: Any = None,
+        transaction: bool = False,
+    ) -> Any:
+        """Run ``work(conn)`` as one unit on the executor loop; one round trip.
+
+        ``work`` receives the raw asyncpg connection and runs on the executor
+        loop, so it may only await that connection (no futures or locks from
+        the caller's loop). The connection is acquired before and released
+        after it, inside ``conn.transaction()`` when ``transaction`` is set.
+        Raises AcquireTimeoutError when no connection frees up in ``timeout``.
+        """
+        raw_pool = self._raw_pool
+
+        async def _unit():
+            kwargs = {} if timeout is None else {"timeout": timeout}
+            acquired = False
+            try:
+                async with raw_pool.acquire(**kwargs) as conn:
+                    acquired = True
+                    if transaction:
+                        async with conn.transaction():
+                            return await work(conn)
+                    return await work(conn)
+            except asyncio.TimeoutError as exc:
+                if acquired:
+                    raise
+                raise AcquireTimeoutError(str(exc)) from exc
+
+        return await _await_on_loop(_unit, self._loop)
+
     async def release(self, conn: _Connection) -> Any:
         # Pair to `await pool.acquire()`. Forwards to raw pool with the
         # underlying asyncpg connection (postgres_backend.py:206).
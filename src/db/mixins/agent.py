@@ -4,10 +4,19 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
+from ..statements import statement
 from src.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+GET_AGENT = statement("agent.get", """
+    SELECT id, api_key, status, purpose, notes, tags,
+           created_at, updated_at, archived_at, parent_agent_id,
+           spawn_reason, label
+    FROM core.agents
+    WHERE id = $1
+""")
+
 
 class AgentMixin:
     """Agent CRUD operations (core.agents table)."""
@@ -130,16 +139,7 @@ class AgentMixin:
         """
         async with self.acquire() as conn:
             try:
-                row = await conn.fetchrow(
-                    """
-                    SELECT id, api_key, status, purpose, notes, tags,
-                           created_at, updated_at, archived_at, parent_agent_id,
-                           spawn_reason, label
-                    FROM core.agents
-                    WHERE id = $1
-                    """,
-                    agent_id
-                )
+                row = await GET_AGENT.fetchrow(conn, agent_id)
                 if row:
                     return dict(row)
                 return None
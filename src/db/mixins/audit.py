@@ -8,10 +8,17 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from ..base import AuditEvent
+from ..statements import statement
 from src.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+INSERT_AUDIT_EVENT = statement("audit.insert_event", """
+    INSERT INTO audit.events (ts, event_id, agent_id, session_id, event_type, confidence, payload, raw_hash)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+    ON CONFLICT DO NOTHING
+""")
+
 
 class AuditMixin:
     """Audit event operations."""
@@ -65,23 +72,19 @@ class AuditMixin:
                 return False
 
     async def append_audit_event(self, event: AuditEvent) -> bool:
-        async with self.acquire() as conn:
+        event_id_uuid: uuid.UUID
+        if event.event_id:
             try:
-                event_id_uuid: uuid.UUID
-                if event.event_id:
-                    try:
-                        event_id_uuid = uuid.UUID(event.event_id)
-                    except (ValueError, AttributeError):
-                        event_id_uuid = uuid.uuid4()
-                else:
-                    event_id_uuid = uuid.uuid4()
+                event_id_uuid = uuid.UUID(event.event_id)
+            except (ValueError, AttributeError):
+                event_id_uuid = uuid.uuid4()
+        else:
+            event_id_uuid = uuid.uuid4()
 
-                await conn.execute(
-                    """
-                    INSERT INTO audit.events (ts, event_id, agent_id, session_id, event_type, confidence, payload, raw_hash)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                    ON CONFLICT DO NOTHING
-                    """,
+        async def _insert(conn):
+            try:
+                await INSERT_AUDIT_EVENT.execute(
+                    conn,
                     event.ts or datetime.now(timezone.utc),
                     event_id_uuid,
                     event.agent_id,
@@ -96,6 +99,8 @@ class AuditMixin:
                 logger.error(f"append_audit_event failed for agent={event.agent_id} type={event.event_type}: {e}")
                 return False
 
+        return await self.run_unit(_insert)
+
     async def query_audit_events(
         self,
         agent_id: Optional[str] = None,
@@ -6,10 +6,21 @@ import json
 import re
 from typing import Any, Dict, List, Optional
 
+from ..statements import statement
 from src.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+LOAD_AGE = statement("age.load", "LOAD 'age'")
+SET_AGE_SEARCH_PATH = statement("age.search_path", "SET search_path = ag_catalog, core, audit, public")
+AGE_GRAPH_EXISTS = statement(
+    "age.graph_exists", "SELECT EXISTS(SELECT 1 FROM ag_catalog.ag_graph WHERE name = $1)"
+)
+# AGE takes no bind parameters: the graph name and the interpolated Cypher
+# body are part of the SQL text, so these are timed but not cached.
+AGE_PROBE = statement("age.probe", dynamic=True)
+CYPHER = statement("age.cypher", dynamic=True)
+
 
 class GraphMixin:
     """Apache AGE graph query operations."""
@@ -27,23 +38,20 @@ class GraphMixin:
 
     async def _prepare_age_connection(self, conn) -> None:
         """Load AGE and configure the required search path on a connection."""
-        await conn.execute("LOAD 'age'")
-        await conn.execute("SET search_path = ag_catalog, core, audit, public")
+        await LOAD_AGE.execute(conn)
+        await SET_AGE_SEARCH_PATH.execute(conn)
 
     async def _ensure_age_graph_exists(self, conn) -> None:
         """Ensure the configured AGE graph exists, creating it when absent."""
-        graph_exists = await conn.fetchval(
-            "SELECT EXISTS(SELECT 1 FROM ag_catalog.ag_graph WHERE name = $1)",
-            self._age_graph,
-        )
+        graph_exists = await AGE_GRAPH_EXISTS.fetchval(conn, self._age_graph)
         if not graph_exists:
             logger.warning(f"AGE graph '{self._age_graph}' missing, creating it")
             await conn.execute("SELECT * FROM ag_catalog.create_graph($1)", self._age_graph)
 
     async def _probe_age_graph(self, conn) -> None:
         """Verify the configured AGE graph can execute a trivial Cypher query."""
-        await conn.fetch(
-            f"SELECT * FROM cypher('{self._age_graph}', $$ RETURN 1 $$) as (result agtype)"
+        await AGE_PROBE.fetch(
+            conn, sql=f"SELECT * FROM cypher('{self._age_graph}', $$ RETURN 1 $$) as (result agtype)"
         )
 
     @staticmethod
@@ -132,8 +140,8 @@ class GraphMixin:
                         safe_cypher,
                     )
 
-            rows = await conn.fetch(
-                f"SELECT * FROM cypher('{self._age_graph}', $$ {safe_cypher} $$) as (result agtype)"
+            rows = await CYPHER.fetch(
+                conn, sql=f"SELECT * FROM cypher('{self._age_graph}', $$ {safe_cypher} $$) as (result agtype)"
             )
 
             results = []
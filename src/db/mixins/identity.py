@@ -6,10 +6,77 @@ import json
 from typing import Any, Dict, List, Optional
 
 from ..base import IdentityRecord
+from ..statements import statement
 from src.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+UPSERT_IDENTITY = statement("identity.upsert", """
+    INSERT INTO core.identities (
+        agent_id, api_key_hash, parent_agent_id, spawn_reason, metadata, created_at
+    )
+    VALUES ($1, $2, $3, $4, $5, COALESCE($6, now()))
+    ON CONFLICT (agent_id) DO UPDATE SET
+        parent_agent_id = COALESCE(EXCLUDED.parent_agent_id, core.identities.parent_agent_id),
+        spawn_reason = COALESCE(EXCLUDED.spawn_reason, core.identities.spawn_reason),
+        metadata = core.identities.metadata || COALESCE($5, '{}'::jsonb),
+        updated_at = now()
+    RETURNING identity_id
+""")
+
+GET_IDENTITY = statement("identity.get", """
+    SELECT identity_id, agent_id, api_key_hash, created_at, updated_at,
+           status, parent_agent_id, spawn_reason, disabled_at, last_activity_at, metadata
+    FROM core.identities
+    WHERE agent_id = $1
+""")
+
+GET_IDENTITIES = statement("identity.get_many", """
+    SELECT identity_id, agent_id, api_key_hash, created_at, updated_at,
+           status, parent_agent_id, spawn_reason, disabled_at, last_activity_at, metadata
+    FROM core.identities
+    WHERE agent_id = ANY($1::text[])
+""")
+
+GET_IDENTITY_BY_ID = statement("identity.get_by_id", """
+    SELECT identity_id, agent_id, api_key_hash, created_at, updated_at,
+           status, parent_agent_id, spawn_reason, disabled_at, last_activity_at, metadata
+    FROM core.identities
+    WHERE identity_id = $1
+""")
+
+INCREMENT_UPDATES_MERGE = statement("identity.increment_updates_merge", """
+    UPDATE core.identities
+    SET metadata = jsonb_set(
+            metadata || $2::jsonb,
+            '{total_updates}',
+            (COALESCE((metadata->>'total_updates')::int, 0) + 1)::text::jsonb
+        ),
+        updated_at = now(),
+        last_activity_at = now()
+    WHERE agent_id = $1
+    RETURNING (metadata->>'total_updates')::int
+""")
+
+INCREMENT_UPDATES = statement("identity.increment_updates", """
+    UPDATE core.identities
+    SET metadata = jsonb_set(
+            metadata,
+            '{total_updates}',
+            (COALESCE((metadata->>'total_updates')::int, 0) + 1)::text::jsonb
+        ),
+        updated_at = now(),
+        last_activity_at = now()
+    WHERE agent_id = $1
+    RETURNING (metadata->>'total_updates')::int
+""")
+
+VERIFY_API_KEY = statement("identity.verify_api_key", """
+    SELECT core.verify_api_key($2, api_key_hash)
+    FROM core.identities
+    WHERE agent_id = $1
+""")
+
 
 class IdentityMixin:
     """Identity CRUD operations."""
@@ -24,19 +91,8 @@ class IdentityMixin:
         created_at=None,
     ) -> int:
         async with self.acquire() as conn:
-            identity_id = await conn.fetchval(
-                """
-                INSERT INTO core.identities (
-                    agent_id, api_key_hash, parent_agent_id, spawn_reason, metadata, created_at
-                )
-                VALUES ($1, $2, $3, $4, $5, COALESCE($6, now()))
-                ON CONFLICT (agent_id) DO UPDATE SET
-                    parent_agent_id = COALESCE(EXCLUDED.parent_agent_id, core.identities.parent_agent_id),
-                    spawn_reason = COALESCE(EXCLUDED.spawn_reason, core.identities.spawn_reason),
-                    metadata = core.identities.metadata || COALESCE($5, '{}'::jsonb),
-                    updated_at = now()
-                RETURNING identity_id
-                """,
+            identity_id = await UPSERT_IDENTITY.fetchval(
+                conn,
                 agent_id,
                 api_key_hash,
                 parent_agent_id,
@@ -47,34 +103,20 @@ class IdentityMixin:
             return identity_id
 
     async def get_identity(self, agent_id: str) -> Optional[IdentityRecord]:
-        async with self.acquire() as conn:
-            row = await conn.fetchrow(
-                """
-                SELECT identity_id, agent_id, api_key_hash, created_at, updated_at,
-                       status, parent_agent_id, spawn_reason, disabled_at, last_activity_at, metadata
-                FROM core.identities
-                WHERE agent_id = $1
-                """,
-                agent_id,
-            )
-            if not row:
-                return None
-            return self._row_to_identity(row)
+        async def _fetch(conn):
+            return await GET_IDENTITY.fetchrow(conn, agent_id)
+
+        row = await self.run_unit(_fetch)
+        if not row:
+            return None
+        return self._row_to_identity(row)
 
     async def get_identities_batch(self, agent_ids: list[str]) -> dict[str, Optional[IdentityRecord]]:
         """Load identities for multiple agent IDs in a single query."""
         if not agent_ids:
             return {}
         async with self.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT identity_id, agent_id, api_key_hash, created_at, updated_at,
-                       status, parent_agent_id, spawn_reason, disabled_at, last_activity_at, metadata
-                FROM core.identities
-                WHERE agent_id = ANY($1::text[])
-                """,
-                agent_ids,
-            )
+            rows = await GET_IDENTITIES.fetch(conn, agent_ids)
             result = {}
             for row in rows:
                 identity = self._row_to_identity(row)
@@ -83,15 +125,7 @@ class IdentityMixin:
 
     async def get_identity_by_id(self, identity_id: int) -> Optional[IdentityRecord]:
         async with self.acquire() as conn:
-            row = await conn.fetchrow(
-                """
-                SELECT identity_id, agent_id, api_key_hash, created_at, updated_at,
-                       status, parent_agent_id, spawn_reason, disabled_at, last_activity_at, metadata
-                FROM core.identities
-                WHERE identity_id = $1
-                """,
-                identity_id,
-            )
+            row = await GET_IDENTITY_BY_ID.fetchrow(conn, identity_id)
             if not row:
                 return None
             return self._row_to_identity(row)
@@ -199,49 +233,14 @@ class IdentityMixin:
         """Atomically increment total_updates in PostgreSQL and return the new value."""
         async with self.acquire() as conn:
             if extra_metadata:
-                new_count = await conn.fetchval(
-                    """
-                    UPDATE core.identities
-                    SET metadata = jsonb_set(
-                            metadata || $2::jsonb,
-                            '{total_updates}',
-                            (COALESCE((metadata->>'total_updates')::int, 0) + 1)::text::jsonb
-                        ),
-                        updated_at = now(),
-                        last_activity_at = now()
-                    WHERE agent_id = $1
-                    RETURNING (metadata->>'total_updates')::int
-                    """,
-                    agent_id, json.dumps(extra_metadata),
-                )
+                new_count = await INCREMENT_UPDATES_MERGE.fetchval(conn, agent_id, json.dumps(extra_metadata))
             else:
-                new_count = await conn.fetchval(
-                    """
-                    UPDATE core.identities
-                    SET metadata = jsonb_set(
-                            metadata,
-                            '{total_updates}',
-                            (COALESCE((metadata->>'total_updates')::int, 0) + 1)::text::jsonb
-                        ),
-                        updated_at = now(),
-                        last_activity_at = now()
-                    WHERE agent_id = $1
-                    RETURNING (metadata->>'total_updates')::int
-                    """,
-                    agent_id,
-                )
+                new_count = await INCREMENT_UPDATES.fetchval(conn, agent_id)
             return new_count or 0
 
     async def verify_api_key(self, agent_id: str, api_key: str) -> bool:
         async with self.acquire() as conn:
-            result = await conn.fetchval(
-                """
-                SELECT core.verify_api_key($2, api_key_hash)
-                FROM core.identities
-                WHERE agent_id = $1
-                """,
-                agent_id, api_key,
-            )
+            result = await VERIFY_API_KEY.fetchval(conn, agent_id, api_key)
             return bool(result)
 
     # ------------------------------------------------------------------
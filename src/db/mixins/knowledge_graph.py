@@ -6,10 +6,45 @@ import json
 import re
 from typing import Any, Dict, List, Optional
 
+from ..statements import statement
 from src.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+UPSERT_DISCOVERY = statement("knowledge.upsert_discovery", """
+    INSERT INTO knowledge.discoveries (
+        id, agent_id, type, summary, details, tags, severity, status,
+        references_files, related_to, response_to_id, response_type,
+        provenance, provenance_chain, created_at, epoch
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16)
+    ON CONFLICT (id) DO UPDATE SET
+        summary = EXCLUDED.summary,
+        details = EXCLUDED.details,
+        tags = EXCLUDED.tags,
+        status = EXCLUDED.status,
+        provenance_chain = EXCLUDED.provenance_chain,
+        updated_at = now()
+""")
+
+FULL_TEXT_SEARCH = statement("knowledge.full_text_search", """
+    SELECT *, ts_rank_cd(search_vector, websearch_to_tsquery('english', $1)) as rank
+    FROM knowledge.discoveries
+    WHERE search_vector @@ websearch_to_tsquery('english', $1)
+    ORDER BY rank DESC, created_at DESC
+    LIMIT $2
+""")
+
+GET_DISCOVERY = statement("knowledge.get_discovery", "SELECT * FROM knowledge.discoveries WHERE id = $1")
+
+DISCOVERY_BACKLINKS = statement("knowledge.backlinks", """
+    SELECT id FROM knowledge.discoveries
+    WHERE response_to_id = $1
+    ORDER BY created_at
+""")
+
+# One SQL text per (embedding table, filter set): timed under one name.
+VECTOR_SEARCH = statement("knowledge.vector_search", dynamic=True)
+
 
 def _apply_operator(query: str, operator: str = "AND") -> str:
     """Join multi-term queries with the given operator for websearch_to_tsquery.
@@ -34,6 +69,23 @@ def _apply_operator(query: str, operator: str = "AND") -> str:
     return f' {op} '.join(tokens)
 
 
+# pgvector's HNSW scan returns at most hnsw.ef_search candidates (default 40)
+# before WHERE filters apply, so a filtered query can come back short. Filtered
+# searches raise ef_search to limit * this factor (pgvector caps it at 1000)
+# and, on pgvector >= 0.8, enable iterative index scans so the scan keeps going
+# until `limit` rows pass the filters.
+FILTERED_EF_SEARCH_FACTOR = 10
+MAX_EF_SEARCH = 1000
+
+
+def _pgvector_version_at_least(version: Optional[str], major: int, minor: int) -> bool:
+    try:
+        parts = [int(p) for p in str(version).split(".")[:2]]
+    except ValueError:
+        return False
+    return len(parts) == 2 and tuple(parts) >= (major, minor)
+
+
 # Backwards-compat shim. Older imports expect _or_default_query; route them
 # through the new operator-aware helper with operator="OR" so behavior is
 # identical to the pre-#165 implementation.
@@ -73,20 +125,8 @@ class KnowledgeGraphMixin:
                     created_at = dt.now()
 
             from config.governance_config import GovernanceConfig
-            await conn.execute("""
-                INSERT INTO knowledge.discoveries (
-                    id, agent_id, type, summary, details, tags, severity, status,
-                    references_files, related_to, response_to_id, response_type,
-                    provenance, provenance_chain, created_at, epoch
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16)
-                ON CONFLICT (id) DO UPDATE SET
-                    summary = EXCLUDED.summary,
-                    details = EXCLUDED.details,
-                    tags = EXCLUDED.tags,
-                    status = EXCLUDED.status,
-                    provenance_chain = EXCLUDED.provenance_chain,
-                    updated_at = now()
-            """,
+            await UPSERT_DISCOVERY.execute(
+                conn,
                 discovery.id,
                 discovery.agent_id,
                 discovery.type,
@@ -194,16 +234,100 @@ class KnowledgeGraphMixin:
         # generally better than vanilla ts_rank on short structured docs.
         ts_query = _apply_operator(query, operator=operator)
         async with self.acquire() as conn:
-            rows = await conn.fetch("""
-                SELECT *, ts_rank_cd(search_vector, websearch_to_tsquery('english', $1)) as rank
-                FROM knowledge.discoveries
-                WHERE search_vector @@ websearch_to_tsquery('english', $1)
-                ORDER BY rank DESC, created_at DESC
-                LIMIT $2
-            """, ts_query, limit)
+            rows = await FULL_TEXT_SEARCH.fetch(conn, ts_query, limit)
 
             return [self._row_to_discovery_dict(row) for row in rows]
 
+    async def kg_vector_search(
+        self,
+        table: str,
+        embedding: str,
+        limit: int,
+        min_similarity: float,
+        agent_id: Optional[str] = None,
+        type: Optional[str] = None,
+        status: Optional[str] = None,
+        severity: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        exclude_archived: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Nearest discoveries to ``embedding`` in the pgvector ``table``, hydrated.
+
+        One query joins the embedding table to knowledge.discoveries, applies
+        the metadata filters inside the index scan and returns discovery dicts
+        (as kg_get_discovery, with ``responses_from`` backlinks) plus a
+        ``similarity`` key, ordered by similarity descending. ``embedding`` is
+        the pgvector literal ('[0.1,0.2,...]'); ``table`` comes from
+        get_active_table_name(), never from callers.
+        """
+        conditions = ["de.embedding IS NOT NULL"]
+        params: List[Any] = [embedding, min_similarity, limit]
+        for column, value in (("agent_id", agent_id), ("type", type),
+                              ("status", status), ("severity", severity)):
+            if value:
+                params.append(value)
+                conditions.append(f"d.{column} = ${len(params)}")
+        if tags:
+            from src.knowledge_graph import normalize_tags
+            params.append(normalize_tags(tags))
+            conditions.append(f"d.tags && ${len(params)}::text[]")
+        if exclude_archived:
+            conditions.append("d.status <> 'archived'")
+        filtered = len(conditions) > 1
+
+        # hits is MATERIALIZED so the HNSW-ordered LIMIT runs first; with
+        # iterative scans (relaxed_order) results may be slightly out of order,
+        # hence the re-sort outside. The similarity floor is applied after the
+        # LIMIT — rows arrive in distance order, so the result is the same and
+        # the index scan stays filter-light.
+        sql = f"""
+            WITH hits AS MATERIALIZED (
+                SELECT d.*, 1 - (de.embedding <=> $1::vector) AS similarity
+                FROM {table} de
+                JOIN knowledge.discoveries d ON d.id = de.discovery_id
+                WHERE {" AND ".join(conditions)}
+                ORDER BY de.embedding <=> $1::vector
+                LIMIT $3
+            )
+            SELECT h.*,
+                   ARRAY(
+                       SELECT r.id FROM knowledge.discoveries r
+                       WHERE r.response_to_id = h.id
+                       ORDER BY r.created_at
+                   ) AS responses_from
+            FROM hits h
+            WHERE h.similarity >= $2
+            ORDER BY h.similarity DESC
+        """
+        iterative = getattr(self, "_pgvector_iterative_scan", None)
+
+        async def _search(conn):
+            nonlocal iterative
+            if filtered:
+                if iterative is None:
+                    version = await conn.fetchval(
+                        "SELECT extversion FROM pg_extension WHERE extname = 'vector'"
+                    )
+                    iterative = _pgvector_version_at_least(version, 0, 8)
+                ef_search = min(MAX_EF_SEARCH, max(40, limit * FILTERED_EF_SEARCH_FACTOR))
+                settings = f"SET LOCAL hnsw.ef_search = {ef_search}"
+                if iterative:
+                    settings += "; SET LOCAL hnsw.iterative_scan = relaxed_order"
+                await conn.execute(settings)
+            return await VECTOR_SEARCH.fetch(conn, *params, sql=sql)
+
+        # SET LOCAL needs a transaction; unfiltered searches skip it.
+        rows = await self.run_unit(_search, transaction=filtered)
+        self._pgvector_iterative_scan = iterative
+
+        results = []
+        for row in rows:
+            d = self._row_to_discovery_dict(row)
+            d["similarity"] = float(d["similarity"])
+            d["responses_from"] = list(d.get("responses_from") or [])
+            results.append(d)
+        return results
+
     async def kg_find_similar(
         self,
         discovery_id: str,
@@ -235,20 +359,14 @@ class KnowledgeGraphMixin:
     async def kg_get_discovery(self, discovery_id: str) -> Optional[Dict[str, Any]]:
         """Get a single discovery by ID, including backlinks."""
         async with self.acquire() as conn:
-            row = await conn.fetchrow("""
-                SELECT * FROM knowledge.discoveries WHERE id = $1
-            """, discovery_id)
+            row = await GET_DISCOVERY.fetchrow(conn, discovery_id)
 
             if not row:
                 return None
 
             d = self._row_to_discovery_dict(row)
 
-            backlinks = await conn.fetch("""
-                SELECT id FROM knowledge.discoveries
-                WHERE response_to_id = $1
-                ORDER BY created_at
-            """, discovery_id)
+            backlinks = await DISCOVERY_BACKLINKS.fetch(conn, discovery_id)
             if backlinks:
                 d["responses_from"] = [r["id"] for r in backlinks]
 
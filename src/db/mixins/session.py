@@ -6,10 +6,26 @@ import json
 from typing import Any, Dict, List, Optional
 
 from ..base import SessionRecord
+from ..statements import statement
 from src.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+GET_SESSION = statement("session.get", """
+    SELECT s.session_id, s.identity_id, i.agent_id, s.created_at, s.last_active,
+           s.expires_at, s.is_active, s.client_type, s.client_info, s.metadata
+    FROM core.sessions s
+    JOIN core.identities i ON i.identity_id = s.identity_id
+    WHERE s.session_id = $1
+""")
+
+TOUCH_SESSION = statement("session.touch", """
+    UPDATE core.sessions
+    SET last_active = now(),
+        expires_at = now() + ($2 * interval '1 hour')
+    WHERE session_id = $1 AND is_active = TRUE
+""")
+
 
 class SessionMixin:
     """Session CRUD operations."""
@@ -45,16 +61,7 @@ class SessionMixin:
 
     async def get_session(self, session_id: str) -> Optional[SessionRecord]:
         async with self.acquire() as conn:
-            row = await conn.fetchrow(
-                """
-                SELECT s.session_id, s.identity_id, i.agent_id, s.created_at, s.last_active,
-                       s.expires_at, s.is_active, s.client_type, s.client_info, s.metadata
-                FROM core.sessions s
-                JOIN core.identities i ON i.identity_id = s.identity_id
-                WHERE s.session_id = $1
-                """,
-                session_id,
-            )
+            row = await GET_SESSION.fetchrow(conn, session_id)
             if not row:
                 return None
             return self._row_to_session(row)
@@ -63,16 +70,7 @@ class SessionMixin:
         from config.governance_config import GovernanceConfig
         ttl_hours = int(GovernanceConfig.SESSION_TTL_HOURS)
         async with self.acquire() as conn:
-            result = await conn.execute(
-                """
-                UPDATE core.sessions
-                SET last_active = now(),
-                    expires_at = now() + ($2 * interval '1 hour')
-                WHERE session_id = $1 AND is_active = TRUE
-                """,
-                session_id,
-                ttl_hours,
-            )
+            result = await TOUCH_SESSION.execute(conn, session_id, ttl_hours)
             return "UPDATE 1" in result
 
     async def end_session(self, session_id: str) -> bool:
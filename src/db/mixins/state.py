@@ -7,10 +7,77 @@ from datetime import timedelta
 from typing import Any, Dict, List, Optional
 
 from ..base import AgentStateRecord
+from ..statements import statement
 from src.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+INSERT_STATE = statement("state.insert", """
+    INSERT INTO core.agent_state
+        (identity_id, entropy, integrity, stability_index, volatility, regime, coherence, state_json, epoch)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+    RETURNING state_id
+""")
+
+INSERT_STATES = statement("state.insert_many", """
+    INSERT INTO core.agent_state
+        (identity_id, entropy, integrity, stability_index, volatility, regime, coherence, state_json, epoch,
+         recorded_at)
+    SELECT r.identity_id, r.entropy, r.integrity, r.stability_index, r.volatility, r.regime, r.coherence,
+           r.state_json::jsonb, $9, now() + r.ord * interval '1 microsecond'
+    FROM unnest($1::bigint[], $2::real[], $3::real[], $4::real[], $5::real[], $6::text[], $7::real[], $8::text[])
+         WITH ORDINALITY AS r(identity_id, entropy, integrity, stability_index, volatility, regime, coherence,
+                              state_json, ord)
+""")
+
+LATEST_STATE = statement("state.latest", """
+    SELECT s.state_id, s.identity_id, i.agent_id, s.recorded_at,
+           s.entropy, s.integrity, s.stability_index, s.volatility,
+           s.regime, s.coherence, s.state_json
+    FROM core.agent_state s
+    JOIN core.identities i ON i.identity_id = s.identity_id
+    WHERE s.identity_id = $1 AND s.epoch = $2
+      AND s.synthetic = false
+    ORDER BY s.recorded_at DESC, s.state_id DESC
+    LIMIT 1
+""")
+
+LATEST_STATES_ALL = statement("state.latest_all", """
+    SELECT l.state_id, l.identity_id, i.agent_id, l.recorded_at,
+           l.entropy, l.integrity, l.stability_index, l.volatility,
+           l.regime, l.coherence, l.state_json
+    FROM core.agent_latest_state l
+    JOIN core.identities i ON i.identity_id = l.identity_id
+    WHERE l.epoch = $1
+""")
+
+EISV_SERIES = statement("state.eisv_series", """
+    SELECT s.entropy, s.integrity, s.stability_index, s.volatility,
+           s.recorded_at
+    FROM core.agent_state s
+    JOIN core.identities i ON i.identity_id = s.identity_id
+    WHERE i.agent_id = $1
+      AND s.epoch = $2
+      AND s.synthetic = false
+      AND s.recorded_at >= NOW() - $3::interval
+    ORDER BY s.recorded_at ASC
+""")
+
+CROSS_AGENT_ACTIVITY = statement("state.cross_agent_activity", """
+    SELECT i.agent_id,
+           MAX(s.recorded_at) as recorded_at,
+           COUNT(*) as count
+    FROM core.agent_state s
+    JOIN core.identities i ON i.identity_id = s.identity_id
+    WHERE s.identity_id != $1
+      AND s.recorded_at > now() - ($2 * interval '1 minute')
+      AND s.epoch = $3
+      AND s.synthetic = false
+    GROUP BY i.agent_id
+    ORDER BY MAX(s.recorded_at) DESC
+    LIMIT 5
+""")
+
 
 class StateMixin:
     """Agent state (EISV) snapshot operations."""
@@ -27,20 +94,47 @@ class StateMixin:
         state_json: Optional[Dict[str, Any]] = None,
     ) -> int:
         from config.governance_config import GovernanceConfig
-        async with self.acquire() as conn:
-            state_id = await conn.fetchval(
-                """
-                INSERT INTO core.agent_state
-                    (identity_id, entropy, integrity, stability_index, volatility, regime, coherence, state_json, epoch)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-                RETURNING state_id
-                """,
-                identity_id, entropy, integrity, stability_index, void,  # void maps to volatility column
-                regime, coherence, json.dumps(state_json or {}),
-                GovernanceConfig.CURRENT_EPOCH,
-            )
-            # Matview refresh moved to periodic_matview_refresh() in background_tasks.py
-            return state_id
+        args = (
+            identity_id, entropy, integrity, stability_index, void,  # void maps to volatility column
+            regime, coherence, json.dumps(state_json or {}),
+            GovernanceConfig.CURRENT_EPOCH,
+        )
+
+        async def _insert(conn):
+            return await INSERT_STATE.fetchval(conn, *args)
+
+        # core.agent_latest_state is upserted by trigger (migration 038)
+        return await self.run_unit(_insert)
+
+    async def record_agent_states(self, rows: List[Dict[str, Any]]) -> int:
+        """Insert several agent_state rows with one statement (batched check-ins).
+
+        The rows share one transaction, so the column's DEFAULT now() would
+        give them all the same recorded_at and two check-ins of one agent
+        would collide on UNIQUE (identity_id, recorded_at). recorded_at is
+        now() plus the row's 1-based position in microseconds: strictly
+        increasing in list (submission) order, and taken from the database
+        clock like single inserts.
+        """
+        if not rows:
+            return 0
+        from config.governance_config import GovernanceConfig
+        columns = (
+            [row["identity_id"] for row in rows],
+            [row["entropy"] for row in rows],
+            [row["integrity"] for row in rows],
+            [row["stability_index"] for row in rows],
+            [row["void"] for row in rows],
+            [row["regime"] for row in rows],
+            [row["coherence"] for row in rows],
+            [json.dumps(row.get("state_json") or {}) for row in rows],
+        )
+
+        async def _insert(conn):
+            await INSERT_STATES.execute(conn, *columns, GovernanceConfig.CURRENT_EPOCH)
+
+        await self.run_unit(_insert)
+        return len(rows)
 
     async def record_bootstrap_state(
         self,
@@ -213,20 +307,7 @@ class StateMixin:
         a synthetic anchor is not the answer."""
         from config.governance_config import GovernanceConfig
         async with self.acquire() as conn:
-            row = await conn.fetchrow(
-                """
-                SELECT s.state_id, s.identity_id, i.agent_id, s.recorded_at,
-                       s.entropy, s.integrity, s.stability_index, s.volatility,
-                       s.regime, s.coherence, s.state_json
-                FROM core.agent_state s
-                JOIN core.identities i ON i.identity_id = s.identity_id
-                WHERE s.identity_id = $1 AND s.epoch = $2
-                  AND s.synthetic = false
-                ORDER BY s.recorded_at DESC
-                LIMIT 1
-                """,
-                identity_id, GovernanceConfig.CURRENT_EPOCH,
-            )
+            row = await LATEST_STATE.fetchrow(conn, identity_id, GovernanceConfig.CURRENT_EPOCH)
             if not row:
                 return None
             return self._row_to_agent_state(row)
@@ -266,7 +347,7 @@ class StateMixin:
             """
             if exclude_synthetic:
                 base_sql += " AND s.synthetic = false"
-            base_sql += " ORDER BY s.recorded_at DESC LIMIT $3"
+            base_sql += " ORDER BY s.recorded_at DESC, s.state_id DESC LIMIT $3"
             rows = await conn.fetch(
                 base_sql,
                 identity_id, GovernanceConfig.CURRENT_EPOCH, limit,
@@ -274,31 +355,24 @@ class StateMixin:
             return [self._row_to_agent_state(r) for r in rows]
 
     async def get_all_latest_agent_states(self) -> list[AgentStateRecord]:
-        """Get latest measured state per identity, using matview with base-table fallback.
-
-        The matview is measured-only by definition (migration 019 bakes
-        `WHERE synthetic = false` into the matview SELECT), so the matview
-        path needs no query-time filter. The base-table fallback queries
-        agent_state directly and adds the filter explicitly. Both paths
-        agree: bootstrap rows never appear here. Per onboard-bootstrap-
-        checkin §4.1.
+        """Get latest measured state per identity in the current epoch.
+
+        Reads core.agent_latest_state, which an AFTER INSERT trigger on
+        core.agent_state keeps current (migration 038) — no refresh lag.
+        The trigger only fires for `synthetic = false`, so the table is
+        measured-only by construction. The base-table fallback (table not
+        migrated yet) adds the filter explicitly. Both paths agree:
+        bootstrap rows never appear here. Per onboard-bootstrap-checkin §4.1.
         """
+        from config.governance_config import GovernanceConfig
         async with self.acquire() as conn:
             try:
-                rows = await conn.fetch(
-                    """
-                    SELECT state_id, identity_id, agent_id, recorded_at,
-                           entropy, integrity, stability_index, volatility,
-                           regime, coherence, state_json
-                    FROM core.mv_latest_agent_states
-                    """,
-                )
+                rows = await LATEST_STATES_ALL.fetch(conn, GovernanceConfig.CURRENT_EPOCH)
             except Exception:
-                # Matview may not exist yet — fall back to base table.
+                # Migration 038 not applied yet — fall back to base table.
                 # Filter `synthetic = false` here because the base table
                 # contains both measured and synthetic rows.
-                from config.governance_config import GovernanceConfig
-                logger.debug("Matview unavailable, falling back to base table")
+                logger.debug("agent_latest_state unavailable, falling back to base table")
                 rows = await conn.fetch(
                     """
                     SELECT DISTINCT ON (s.identity_id)
@@ -309,12 +383,110 @@ class StateMixin:
                     JOIN core.identities i ON i.identity_id = s.identity_id
                     WHERE s.epoch = $1
                       AND s.synthetic = false
-                    ORDER BY s.identity_id, s.recorded_at DESC
+                    ORDER BY s.identity_id, s.recorded_at DESC, s.state_id DESC
                     """,
                     GovernanceConfig.CURRENT_EPOCH,
                 )
             return [self._row_to_agent_state(r) for r in rows]
 
+    async def backfill_agent_latest_state(self) -> int:
+        """Rebuild core.agent_latest_state from core.agent_state history.
+
+        Idempotent: upserts the latest measured row per (identity, epoch) and
+        only overwrites an entry with a newer one. Returns rows written.
+        """
+        async with self.acquire() as conn:
+            result = await conn.execute(
+                """
+                INSERT INTO core.agent_latest_state AS l (
+                    identity_id, epoch, state_id, recorded_at,
+                    entropy, integrity, stability_index, volatility,
+                    regime, coherence, state_json
+                )
+                SELECT DISTINCT ON (s.identity_id, s.epoch)
+                       s.identity_id, s.epoch, s.state_id, s.recorded_at,
+                       s.entropy, s.integrity, s.stability_index, s.volatility,
+                       s.regime, s.coherence, s.state_json
+                FROM core.agent_state s
+                WHERE s.synthetic = false
+                ORDER BY s.identity_id, s.epoch, s.recorded_at DESC, s.state_id DESC
+                ON CONFLICT (identity_id, epoch) DO UPDATE SET
+                    state_id = EXCLUDED.state_id,
+                    recorded_at = EXCLUDED.recorded_at,
+                    entropy = EXCLUDED.entropy,
+                    integrity = EXCLUDED.integrity,
+                    stability_index = EXCLUDED.stability_index,
+                    volatility = EXCLUDED.volatility,
+                    regime = EXCLUDED.regime,
+                    coherence = EXCLUDED.coherence,
+                    state_json = EXCLUDED.state_json
+                WHERE l.state_id IS DISTINCT FROM EXCLUDED.state_id
+                  AND EXCLUDED.recorded_at >= l.recorded_at
+                """,
+            )
+        # asyncpg status string: "INSERT 0 <n>"
+        try:
+            return int(str(result).rsplit(" ", 1)[-1])
+        except ValueError:
+            return 0
+
+    async def check_agent_latest_state(self, epoch: Optional[int] = None) -> Dict[str, Any]:
+        """Compare core.agent_latest_state against the base table for one epoch.
+
+        Returns ``{"epoch", "expected", "actual", "missing", "stale",
+        "extra", "consistent"}``; ``missing``/``stale``/``extra`` list
+        identity_ids (no entry / entry is not the latest measured row /
+        entry with no measured history). Defaults to the current epoch.
+        """
+        if epoch is None:
+            from config.governance_config import GovernanceConfig
+            epoch = GovernanceConfig.CURRENT_EPOCH
+        async with self.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                WITH expected AS (
+                    SELECT DISTINCT ON (s.identity_id) s.identity_id, s.state_id
+                    FROM core.agent_state s
+                    WHERE s.epoch = $1 AND s.synthetic = false
+                    ORDER BY s.identity_id, s.recorded_at DESC, s.state_id DESC
+                ),
+                actual AS (
+                    SELECT identity_id, state_id
+                    FROM core.agent_latest_state
+                    WHERE epoch = $1
+                )
+                SELECT COALESCE(e.identity_id, a.identity_id) AS identity_id,
+                       e.state_id AS expected_state_id,
+                       a.state_id AS actual_state_id
+                FROM expected e
+                FULL OUTER JOIN actual a ON a.identity_id = e.identity_id
+                """,
+                epoch,
+            )
+        missing: List[int] = []
+        stale: List[int] = []
+        extra: List[int] = []
+        expected = actual = 0
+        for row in rows:
+            want, have = row["expected_state_id"], row["actual_state_id"]
+            expected += want is not None
+            actual += have is not None
+            if have is None:
+                missing.append(row["identity_id"])
+            elif want is None:
+                extra.append(row["identity_id"])
+            elif want != have:
+                stale.append(row["identity_id"])
+        return {
+            "epoch": epoch,
+            "expected": expected,
+            "actual": actual,
+            "missing": missing,
+            "stale": stale,
+            "extra": extra,
+            "consistent": not (missing or stale or extra),
+        }
+
     async def reconstruct_eisv_series(
         self,
         agent_id: str,
@@ -353,20 +525,7 @@ class StateMixin:
             epoch = GovernanceConfig.CURRENT_EPOCH
 
         async with self.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT s.entropy, s.integrity, s.stability_index, s.volatility,
-                       s.recorded_at
-                FROM core.agent_state s
-                JOIN core.identities i ON i.identity_id = s.identity_id
-                WHERE i.agent_id = $1
-                  AND s.epoch = $2
-                  AND s.synthetic = false
-                  AND s.recorded_at >= NOW() - $3::interval
-                ORDER BY s.recorded_at ASC
-                """,
-                agent_id, epoch, window,
-            )
+            rows = await EISV_SERIES.fetch(conn, agent_id, epoch, window)
 
         series: Dict[str, List[float]] = {"E": [], "I": [], "S": [], "V": []}
         for row in rows:
@@ -391,22 +550,8 @@ class StateMixin:
         from config.governance_config import GovernanceConfig
         window = minutes or GovernanceConfig.TEMPORAL_CROSS_AGENT_MINUTES
         async with self.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT i.agent_id,
-                       MAX(s.recorded_at) as recorded_at,
-                       COUNT(*) as count
-                FROM core.agent_state s
-                JOIN core.identities i ON i.identity_id = s.identity_id
-                WHERE s.identity_id != $1
-                  AND s.recorded_at > now() - ($2 * interval '1 minute')
-                  AND s.epoch = $3
-                  AND s.synthetic = false
-                GROUP BY i.agent_id
-                ORDER BY MAX(s.recorded_at) DESC
-                LIMIT 5
-                """,
-                exclude_identity_id, window, GovernanceConfig.CURRENT_EPOCH,
+            rows = await CROSS_AGENT_ACTIVITY.fetch(
+                conn, exclude_identity_id, window, GovernanceConfig.CURRENT_EPOCH,
             )
             return [dict(r) for r in rows]
 
@@ -6,10 +6,28 @@ import json
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
+from ..statements import statement
 from src.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+INSERT_TOOL_USAGE = statement("tool_usage.insert", """
+    INSERT INTO audit.tool_usage
+        (ts, agent_id, session_id, tool_name, latency_ms, success, error_type, payload)
+    VALUES (now(), $1, $2, $3, $4, $5, $6, $7)
+""")
+
+LATEST_EISV = statement("tool_usage.latest_eisv", """
+    SELECT s.state_json, s.entropy, s.integrity, s.volatility,
+           s.coherence, s.regime
+    FROM core.agent_state s
+    JOIN core.identities i ON i.identity_id = s.identity_id
+    WHERE i.agent_id = $1 AND s.epoch = $2
+      AND s.synthetic = false
+    ORDER BY s.recorded_at DESC
+    LIMIT 1
+""")
+
 
 class ToolUsageMixin:
     """Tool usage recording, outcome events, and EISV queries."""
@@ -26,13 +44,8 @@ class ToolUsageMixin:
     ) -> bool:
         async with self.acquire() as conn:
             try:
-                await conn.execute(
-                    """
-                    INSERT INTO audit.tool_usage
-                        (ts, agent_id, session_id, tool_name, latency_ms, success, error_type, payload)
-                    VALUES (now(), $1, $2, $3, $4, $5, $6, $7)
-                    """,
-                    agent_id, session_id, tool_name, latency_ms, success, error_type,
+                await INSERT_TOOL_USAGE.execute(
+                    conn, agent_id, session_id, tool_name, latency_ms, success, error_type,
                     json.dumps(payload or {}),
                 )
                 return True
@@ -115,19 +128,7 @@ class ToolUsageMixin:
         from config.governance_config import GovernanceConfig
         async with self.acquire() as conn:
             try:
-                row = await conn.fetchrow(
-                    """
-                    SELECT s.state_json, s.entropy, s.integrity, s.volatility,
-                           s.coherence, s.regime
-                    FROM core.agent_state s
-                    JOIN core.identities i ON i.identity_id = s.identity_id
-                    WHERE i.agent_id = $1 AND s.epoch = $2
-                      AND s.synthetic = false
-                    ORDER BY s.recorded_at DESC
-                    LIMIT 1
-                    """,
-                    agent_id, GovernanceConfig.CURRENT_EPOCH,
-                )
+                row = await LATEST_EISV.fetchrow(conn, agent_id, GovernanceConfig.CURRENT_EPOCH)
                 if not row:
                     return None
                 state_json = json.loads(row["state_json"]) if isinstance(row["state_json"], str) else row["state_json"]
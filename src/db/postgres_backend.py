@@ -19,7 +19,7 @@ except ImportError:
     asyncpg = None  # type: ignore
 
 from .base import DatabaseBackend
-from .executor_pool import ExecutorPool
+from .executor_pool import AcquireTimeoutError, ExecutorPool
 from .mixins import (
     IdentityMixin,
     AgentMixin,
@@ -153,6 +153,28 @@ def _emit_runtime_coord_failure(
         )
 
 
+def _pool_exhausted_error(pool: Any, acquire_timeout: float) -> ConnectionError:
+    """Log and emit an acquire timeout; return the ConnectionError to raise."""
+    logger.error(f"Connection pool timeout after {acquire_timeout}s. Pool size: {pool.get_size()}, free: {pool.get_idle_size()}")
+    _emit_runtime_coord_failure(
+        error_class="TimeoutError",
+        pool_size=pool.get_size(),
+        pool_max=pool.get_max_size(),
+        pool_idle=pool.get_idle_size(),
+        timeout_s=acquire_timeout,
+    )
+    return ConnectionError(
+        f"PostgreSQL connection pool exhausted. "
+        f"Current pool: {pool.get_size()}/{pool.get_max_size()}. "
+        f"Try increasing DB_POSTGRES_MAX_CONN or check for connection leaks."
+    )
+
+
+def _coalesce_hops_enabled() -> bool:
+    """``UNITARES_DB_COALESCE_HOPS`` — run_unit ships the unit of work in one hop."""
+    return os.getenv("UNITARES_DB_COALESCE_HOPS", "1").strip().lower() not in ("0", "false", "no")
+
+
 class PostgresBackend(
     IdentityMixin,
     AgentMixin,
@@ -191,6 +213,12 @@ class PostgresBackend(
         self._min_conn = int(os.environ.get("DB_POSTGRES_MIN_CONN", "5"))
         self._max_conn = int(os.environ.get("DB_POSTGRES_MAX_CONN", "25"))
         self._age_graph = os.environ.get("DB_AGE_GRAPH", "governance_graph")
+        # asyncpg's per-connection statement cache is where the named
+        # statements in src/db/statements.py stay prepared. Interpolated AGE
+        # Cypher also lands in it, so it is sized well above the ~30 hot
+        # statements to keep those from being evicted.
+        self._statement_cache_size = int(os.environ.get("UNITARES_DB_STATEMENT_CACHE_SIZE", "512"))
+        self._statement_cache_lifetime = float(os.environ.get("UNITARES_DB_STATEMENT_CACHE_LIFETIME_S", "0"))
         self._init_lock = asyncio.Lock()
         self._last_pool_check = time.time()  # Avoid immediate health check on first request
 
@@ -304,6 +332,8 @@ class PostgresBackend(
                         command_timeout=30,
                         max_inactive_connection_lifetime=300,  # Close idle connections after 5 minutes
                         max_queries=50000,  # Recycle connections after 50k queries
+                        statement_cache_size=self._statement_cache_size,
+                        max_cached_statement_lifetime=self._statement_cache_lifetime,
                     ),
                     timeout=5.0  # Fail fast if PostgreSQL isn't available
                 )
@@ -348,19 +378,7 @@ class PostgresBackend(
                     ctx_self.conn = await pool.acquire(timeout=acquire_timeout)
                     return ctx_self.conn
                 except asyncio.TimeoutError:
-                    logger.error(f"Connection pool timeout after {acquire_timeout}s. Pool size: {pool.get_size()}, free: {pool.get_idle_size()}")
-                    _emit_runtime_coord_failure(
-                        error_class="TimeoutError",
-                        pool_size=pool.get_size(),
-                        pool_max=pool.get_max_size(),
-                        pool_idle=pool.get_idle_size(),
-                        timeout_s=acquire_timeout,
-                    )
-                    raise ConnectionError(
-                        f"PostgreSQL connection pool exhausted. "
-                        f"Current pool: {pool.get_size()}/{pool.get_max_size()}. "
-                        f"Try increasing DB_POSTGRES_MAX_CONN or check for connection leaks."
-                    )
+                    raise _pool_exhausted_error(pool, acquire_timeout)
                 except BaseException:
                     # Cancellation (anyio task-group teardown) or any other
                     # exception after asyncpg has internally registered a
@@ -401,6 +419,33 @@ class PostgresBackend(
 
         return _AcquireContext(self, timeout)
 
+    async def run_unit(self, work, *, timeout: float = None, transaction: bool = False):
+        """
+        Run ``work(conn)`` as one unit of DB work and return its result.
+
+        Usage:
+            async def _work(conn):
+                return await conn.fetchval("SELECT 1")
+            value = await self.run_unit(_work)
+
+        On an ExecutorPool the acquire, every statement in ``work``, the
+        optional transaction and the release happen in a single round trip to
+        the executor loop, instead of one per step as with acquire(). ``work``
+        then runs on the executor loop: it may only await ``conn``. Falls back
+        to acquire()/transaction() for other pools or when
+        UNITARES_DB_COALESCE_HOPS=0.
+        """
+        pool = await self._ensure_pool()
+        if not isinstance(pool, ExecutorPool) or not _coalesce_hops_enabled():
+            ctx = self.transaction(timeout=timeout) if transaction else self.acquire(timeout=timeout)
+            async with ctx as conn:
+                return await work(conn)
+        acquire_timeout = timeout or 10.0
+        try:
+            return await pool.run(work, timeout=acquire_timeout, transaction=transaction)
+        except AcquireTimeoutError:
+            raise _pool_exhausted_error(pool, acquire_timeout)
+
     def transaction(self, timeout: float = None):
         """
         Get a connection from the pool wrapped in an explicit transaction.
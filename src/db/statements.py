@@ -0,0 +1,233 @@
+"""
+Named SQL statements for the PostgresBackend mixins.
+
+Hot-path queries are registered once at import time under a stable name
+(``"identity.get"``, ``"state.insert"``) and executed through the Statement
+handle instead of passing raw SQL to the connection:
+
+    GET_IDENTITY = statement("identity.get", "SELECT ... WHERE agent_id = $1")
+
+    async def _fetch(conn):
+        return await GET_IDENTITY.fetchrow(conn, agent_id)
+
+The SQL text of a registered statement never changes, so asyncpg's
+per-connection statement cache prepares it once per connection (on the DB
+executor loop, where the connection lives) and every later call reuses the
+server-side plan. PreparedStatement objects from conn.prepare() are not kept
+across calls: they are bound to a pooled connection proxy that is detached on
+release, so the statement cache is the per-connection handle.
+
+Each call records calls, errors, latency and rows returned/affected per
+statement name, both in the registry (report() ranks statements by total
+time) and in Prometheus (DB_STATEMENT_* in metrics_registry, served at
+/metrics). Statements whose text has to be built per call (AGE Cypher, which
+takes no bind parameters) are registered with ``dynamic=True`` and pass the
+text with ``sql=``; they are timed but not counted as prepared.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.db.executor_pool import _Connection
+from src.metrics_registry import (
+    DB_STATEMENT_DURATION,
+    DB_STATEMENT_ERRORS,
+    DB_STATEMENT_PREPARES,
+    DB_STATEMENT_ROWS,
+)
+
+
+def _rows_from_status(status: Any) -> int:
+    """Row count from an asyncpg command tag ("UPDATE 3", "INSERT 0 1")."""
+    if isinstance(status, str):
+        tail = status.rsplit(" ", 1)[-1]
+        if tail.isdigit():
+            return int(tail)
+    return 0
+
+
+class Statement:
+    """A named SQL statement; call it with a connection and bind arguments."""
+
+    __slots__ = ("name", "sql", "dynamic", "_registry")
+
+    def __init__(self, name: str, sql: Optional[str], registry: "StatementRegistry", dynamic: bool = False):
+        self.name = name
+        self.sql = sql
+        self.dynamic = dynamic
+        self._registry = registry
+
+    def __repr__(self) -> str:
+        return f"Statement({self.name!r})"
+
+    async def fetch(self, conn, *args, sql: Optional[str] = None, timeout: Optional[float] = None):
+        return await self._call(conn, "fetch", args, sql, timeout, len)
+
+    async def fetchrow(self, conn, *args, sql: Optional[str] = None, timeout: Optional[float] = None):
+        return await self._call(conn, "fetchrow", args, sql, timeout, lambda r: int(r is not None))
+
+    async def fetchval(self, conn, *args, sql: Optional[str] = None, timeout: Optional[float] = None):
+        return await self._call(conn, "fetchval", args, sql, timeout, lambda r: int(r is not None))
+
+    async def execute(self, conn, *args, sql: Optional[str] = None, timeout: Optional[float] = None):
+        return await self._call(conn, "execute", args, sql, timeout, _rows_from_status)
+
+    async def executemany(self, conn, args: Iterable[tuple], *, sql: Optional[str] = None,
+                          timeout: Optional[float] = None):
+        args = list(args)
+        await self._call(conn, "executemany", (args,), sql, timeout, lambda _r: len(args))
+
+    async def _call(self, conn, method: str, args: tuple, sql: Optional[str], timeout, count_rows):
+        if self.dynamic:
+            if sql is None:
+                raise ValueError(f"dynamic statement {self.name!r} needs sql=")
+        elif sql is not None:
+            raise ValueError(f"statement {self.name!r} has fixed SQL; sql= is only for dynamic statements")
+        else:
+            sql = self.sql
+            self._registry._note_connection(self.name, conn)
+
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+        start = time.perf_counter()
+        try:
+            result = await getattr(conn, method)(sql, *args, **kwargs)
+        except BaseException:
+            self._registry._record(self.name, time.perf_counter() - start, 0, error=True)
+            raise
+        self._registry._record(self.name, time.perf_counter() - start, count_rows(result))
+        return result
+
+
+class StatementRegistry:
+    """Named statements plus per-statement call statistics (thread-safe).
+
+    Calls arrive from the event loop and from the DB executor loop thread,
+    so the counters sit behind a lock.
+    """
+
+    def __init__(self):
+        self._statements: Dict[str, Statement] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._seen: "weakref.WeakKeyDictionary[Any, set]" = weakref.WeakKeyDictionary()
+        self._seen_pids: Dict[int, set] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, sql: Optional[str] = None, *, dynamic: bool = False) -> Statement:
+        """Register ``sql`` under ``name``; re-registering the same text is a no-op."""
+        if dynamic == (sql is not None):
+            raise ValueError("pass sql for a fixed statement, or dynamic=True without sql")
+        sql = _normalize(sql) if sql is not None else None
+        with self._lock:
+            existing = self._statements.get(name)
+            if existing is not None:
+                if existing.sql != sql or existing.dynamic != dynamic:
+                    raise ValueError(f"statement {name!r} already registered with different SQL")
+                return existing
+            stmt = Statement(name, sql, self, dynamic=dynamic)
+            self._statements[name] = stmt
+            self._stats[name] = _empty_stats()
+            return stmt
+
+    def get(self, name: str) -> Statement:
+        return self._statements[name]
+
+    def names(self) -> List[str]:
+        return sorted(self._statements)
+
+    def _note_connection(self, name: str, conn) -> None:
+        """Count the first use of a fixed statement on each server connection.
+
+        That first use is when asyncpg's statement cache prepares it. asyncpg
+        connections and pool proxies are keyed by get_server_pid(): the
+        backend PID names the server session that owns the plan, so a
+        reacquired pooled connection is not recounted. Anything else is keyed
+        by identity.
+        """
+        raw = conn._raw if isinstance(conn, _Connection) else conn
+        pid = None
+        get_pid = getattr(raw, "get_server_pid", None)
+        if callable(get_pid):
+            try:
+                pid = get_pid()
+            except Exception:
+                pid = None
+        try:
+            with self._lock:
+                if pid is not None:
+                    seen = self._seen_pids.setdefault(pid, set())
+                else:
+                    seen = self._seen.get(raw)
+                    if seen is None:
+                        seen = self._seen[raw] = set()
+                if name in seen:
+                    return
+                seen.add(name)
+                self._stats[name]["prepares"] += 1
+        except TypeError:  # not weak-referenceable (plain test doubles)
+            return
+        DB_STATEMENT_PREPARES.labels(statement=name).inc()
+
+    def _record(self, name: str, seconds: float, rows: int, error: bool = False) -> None:
+        with self._lock:
+            s = self._stats[name]
+            s["calls"] += 1
+            s["total_ms"] += seconds * 1000.0
+            s["max_ms"] = max(s["max_ms"], seconds * 1000.0)
+            s["rows"] += rows
+            if error:
+                s["errors"] += 1
+        DB_STATEMENT_DURATION.labels(statement=name).observe(seconds)
+        if rows:
+            DB_STATEMENT_ROWS.labels(statement=name).inc(rows)
+        if error:
+            DB_STATEMENT_ERRORS.labels(statement=name).inc()
+
+    def report(self, limit: Optional[int] = None, include_idle: bool = False) -> List[Dict[str, Any]]:
+        """Statements ranked by total time spent, most expensive first."""
+        with self._lock:
+            rows = [
+                {
+                    "statement": name,
+                    "calls": int(s["calls"]),
+                    "errors": int(s["errors"]),
+                    "rows": int(s["rows"]),
+                    "prepares": int(s["prepares"]),
+                    "total_ms": round(s["total_ms"], 3),
+                    "mean_ms": round(s["total_ms"] / s["calls"], 3) if s["calls"] else 0.0,
+                    "max_ms": round(s["max_ms"], 3),
+                    "dynamic": self._statements[name].dynamic,
+                }
+                for name, s in self._stats.items()
+                if include_idle or s["calls"]
+            ]
+        rows.sort(key=lambda r: (-r["total_ms"], r["statement"]))
+        return rows[:limit] if limit is not None else rows
+
+    def reset(self) -> None:
+        """Zero the registry's counters (Prometheus series are cumulative and untouched)."""
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = _empty_stats()
+            self._seen = weakref.WeakKeyDictionary()
+            self._seen_pids = {}
+
+
+def _empty_stats() -> Dict[str, float]:
+    return {"calls": 0, "errors": 0, "rows": 0, "prepares": 0, "total_ms": 0.0, "max_ms": 0.0}
+
+
+def _normalize(sql: str) -> str:
+    """Strip the surrounding indentation of a triple-quoted statement."""
+    return "\n".join(line.strip() for line in sql.strip().splitlines())
+
+
+REGISTRY = StatementRegistry()
+
+
+def statement(name: str, sql: Optional[str] = None, *, dynamic: bool = False) -> Statement:
+    """Register a statement in the process-wide REGISTRY."""
+    return REGISTRY.register(name, sql, dynamic=dynamic)
@@ -0,0 +1,353 @@
+"""
+In-memory typed-edge adjacency index for graph expansion.
+
+Hybrid search with UNITARES_ENABLE_GRAPH_EXPANSION pulls the typed-edge
+neighbors of its top seeds into the candidate pool. Reading those from the
+seed documents only sees the edges carried on the node (related_to,
+response_to, responses_from) — not links made with link_discoveries, not
+SUPERSEDES, and never more than one hop. TypedEdgeIndex keeps every
+RELATED_TO / RESPONDS_TO / SUPERSEDES edge in memory so expansion is a local
+operation:
+
+- discovery ids are interned to int32 slots;
+- edges are held twice in CSR form (outbound and inbound rows), as int32
+  neighbor slots plus int8 edge-type codes;
+- edges added since the last build (add_discovery, link_discoveries,
+  supersede_discovery) sit in a small per-slot overlay that is folded into
+  the arrays once it holds ``compact_threshold`` edges or 2% of the index,
+  whichever is more.
+
+The index is only kept while graph expansion is enabled, and only grows
+incrementally. Edges that disappear from the graph are dropped when
+KnowledgeGraphAGE.check_edge_index() finds the index has drifted from the
+graph and rebuilds it; the periodic check is opt-in, since it runs an AGE
+MATCH over every edge label.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+EDGE_TYPES: Tuple[str, ...] = ("related", "responds_to", "supersedes")
+_TYPE_CODE: Dict[str, int] = {t: i for i, t in enumerate(EDGE_TYPES)}
+
+# AGE edge label for each index edge type.
+EDGE_LABELS: Dict[str, str] = {
+    "RELATED_TO": "related",
+    "RESPONDS_TO": "responds_to",
+    "SUPERSEDES": "supersedes",
+}
+
+Edge = Tuple[str, str, str]
+
+
+def edge_index_enabled() -> bool:
+    """True when KnowledgeGraphAGE keeps a TypedEdgeIndex.
+
+    Only graph expansion reads the index, so it is kept only with
+    UNITARES_ENABLE_GRAPH_EXPANSION on; UNITARES_EDGE_INDEX=0 turns it off
+    even then.
+    """
+    from src.retrieval import graph_expansion_enabled
+
+    if not graph_expansion_enabled():
+        return False
+    return os.getenv("UNITARES_EDGE_INDEX", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def edge_index_check_interval_s() -> float:
+    """Seconds between graph checks of the index; 0 (default) disables. UNITARES_EDGE_INDEX_CHECK_INTERVAL_S."""
+    try:
+        return float(os.getenv("UNITARES_EDGE_INDEX_CHECK_INTERVAL_S", "0"))
+    except ValueError:
+        return 0.0
+
+
+class _CSR:
+    """Rows of (neighbor slot, edge-type code), one row per discovery slot."""
+
+    __slots__ = ("indptr", "nbr", "etype")
+
+    def __init__(self, rows: np.ndarray, nbr: np.ndarray, etype: np.ndarray, n_rows: int):
+        order = np.argsort(rows, kind="stable")
+        self.nbr = nbr[order].astype(np.int32, copy=False)
+        self.etype = etype[order].astype(np.int8, copy=False)
+        self.indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n_rows), out=self.indptr[1:])
+
+    @property
+    def nbytes(self) -> int:
+        return self.indptr.nbytes + self.nbr.nbytes + self.etype.nbytes
+
+    def gather(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Positions of every entry in *rows*, and the index into *rows* each came from."""
+        present = np.nonzero(rows < len(self.indptr) - 1)[0]
+        starts = self.indptr[rows[present]]
+        lengths = self.indptr[rows[present] + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        owner = np.repeat(np.arange(len(present)), lengths)
+        offsets = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        return starts[owner] + offsets, present[owner]
+
+
+class TypedEdgeIndex:
+    """Compact adjacency of typed discovery edges (see module docstring)."""
+
+    def __init__(self, edges: Iterable[Edge] = (), compact_threshold: int = 1024):
+        self.compact_threshold = compact_threshold
+        self.loaded_at: Optional[float] = None
+        self.checked_at: Optional[float] = None
+        self.last_check: Optional[Dict[str, int]] = None
+        self.rebuild(edges)
+
+    # --- Building -------------------------------------------------------
+
+    def rebuild(self, edges: Iterable[Edge]) -> None:
+        """Replace the whole index with *edges* (``(src_id, dst_id, edge_type)``)."""
+        kept = [
+            (src, dst, _TYPE_CODE[edge_type]) for src, dst, edge_type in edges
+            if edge_type in _TYPE_CODE and src and dst and src != dst
+        ]
+        slots: Dict[str, int] = {}
+        intern = slots.setdefault
+        flat = [
+            v for src, dst, code in kept
+            for v in (intern(src, len(slots)), intern(dst, len(slots)), code)
+        ]
+        ids = list(slots)
+        self._ids = ids
+        self._slots = slots
+        triples = np.array(flat, dtype=np.int64).reshape(-1, 3)
+        key = (triples[:, 0] * len(ids) + triples[:, 1]) * len(EDGE_TYPES) + triples[:, 2]
+        _, distinct = np.unique(key, return_index=True)
+        self._set_arrays(triples[distinct])
+        self.loaded_at = time.time()
+
+    def _set_arrays(self, triples: np.ndarray) -> None:
+        """Build both CSRs from distinct ``(src, dst, code)`` rows; clears the overlay."""
+        n = len(self._ids)
+        self._out = _CSR(triples[:, 0], triples[:, 1], triples[:, 2], n)
+        self._in = _CSR(triples[:, 1], triples[:, 0], triples[:, 2], n)
+        self._base_edges = len(triples)
+        self._pending: Set[Tuple[int, int, int]] = set()
+        self._pending_out: Dict[int, List[Tuple[int, int]]] = {}
+        self._pending_in: Dict[int, List[Tuple[int, int]]] = {}
+
+    @staticmethod
+    def _intern(discovery_id: str, ids: List[str], slots: Dict[str, int]) -> int:
+        slot = slots.get(discovery_id)
+        if slot is None:
+            slot = slots[discovery_id] = len(ids)
+            ids.append(discovery_id)
+        return slot
+
+    def _in_base(self, src: int, dst: int, code: int) -> bool:
+        if src >= len(self._out.indptr) - 1:
+            return False
+        a, b = self._out.indptr[src], self._out.indptr[src + 1]
+        return bool(np.any((self._out.nbr[a:b] == dst) & (self._out.etype[a:b] == code)))
+
+    def snapshot(self) -> "TypedEdgeIndex":
+        """A copy later add() calls do not touch, for reading off the event loop.
+
+        The CSR arrays are replaced, never modified in place, so they are
+        shared; the id table and overlay are copied.
+        """
+        snap = TypedEdgeIndex.__new__(TypedEdgeIndex)
+        snap.compact_threshold = self.compact_threshold
+        snap.loaded_at, snap.checked_at, snap.last_check = self.loaded_at, self.checked_at, self.last_check
+        snap._ids, snap._slots = list(self._ids), dict(self._slots)
+        snap._out, snap._in, snap._base_edges = self._out, self._in, self._base_edges
+        snap._pending = set(self._pending)
+        snap._pending_out = {row: list(v) for row, v in self._pending_out.items()}
+        snap._pending_in = {row: list(v) for row, v in self._pending_in.items()}
+        return snap
+
+    def add(self, src_id: str, dst_id: str, edge_type: str) -> bool:
+        """Record one edge. Returns False for unknown types, self-loops and duplicates."""
+        code = _TYPE_CODE.get(edge_type)
+        if code is None or not src_id or not dst_id or src_id == dst_id:
+            return False
+        src = self._intern(src_id, self._ids, self._slots)
+        dst = self._intern(dst_id, self._ids, self._slots)
+        key = (src, dst, code)
+        if key in self._pending or self._in_base(src, dst, code):
+            return False
+        self._pending.add(key)
+        self._pending_out.setdefault(src, []).append((dst, code))
+        self._pending_in.setdefault(dst, []).append((src, code))
+        if len(self._pending) >= max(self.compact_threshold, self._base_edges // 50):
+            self.compact()
+        return True
+
+    def add_many(self, edges: Iterable[Edge]) -> int:
+        return sum(self.add(src, dst, edge_type) for src, dst, edge_type in edges)
+
+    def compact(self) -> None:
+        """Fold the pending overlay into the CSR arrays."""
+        if self._pending:
+            # Pending edges were checked against the arrays on add, so the
+            # union is already distinct.
+            self._set_arrays(self._triples())
+
+    def _triples(self) -> np.ndarray:
+        """Every edge as an ``(n, 3)`` array of ``(src, dst, code)``."""
+        counts = np.diff(self._out.indptr)
+        base = np.column_stack([
+            np.repeat(np.arange(len(counts), dtype=np.int64), counts),
+            self._out.nbr.astype(np.int64),
+            self._out.etype.astype(np.int64),
+        ])
+        if not self._pending:
+            return base
+        return np.concatenate([base, np.array(list(self._pending), dtype=np.int64)])
+
+    # --- Reading --------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._base_edges + len(self._pending)
+
+    def __contains__(self, discovery_id: str) -> bool:
+        return discovery_id in self._slots
+
+    def edges(self) -> Set[Edge]:
+        """Every edge as ``(src_id, dst_id, edge_type)``."""
+        ids = self._ids
+        return {(ids[s], ids[d], EDGE_TYPES[c]) for s, d, c in self._triples().tolist()}
+
+    def expand(
+        self,
+        seed_ids: Sequence[str],
+        type_weights: Mapping[str, float],
+        hops: int = 1,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Dict[str, float]]:
+        """Weighted neighborhoods of *seed_ids*, following edges both ways.
+
+        A path's weight is the product of ``type_weights[edge_type]`` along
+        it; each neighbor keeps its best path within *hops* edges. Edge types
+        weighted 0 (or missing) are not followed. Returns ``{seed_id:
+        {neighbor_id: weight}}`` with at most *limit* neighbors per seed,
+        strongest first; seeds not in the index map to ``{}``.
+        """
+        weights = np.array([float(type_weights.get(t, 0.0)) for t in EDGE_TYPES], dtype=np.float64)
+        out: Dict[str, Dict[str, float]] = {seed_id: {} for seed_id in seed_ids}
+        known = [seed_id for seed_id in out if seed_id in self._slots]
+        if not known:
+            return out
+        # All seeds expand together; a reached node is keyed seed * n + slot.
+        n = len(self._ids)
+        seeds = np.array([self._slots[seed_id] for seed_id in known], dtype=np.int64)
+        frontier_s = np.arange(len(seeds), dtype=np.int64)
+        frontier_n, frontier_w = seeds.copy(), np.ones(len(seeds))
+        best_k, best_w = np.empty(0, dtype=np.int64), np.empty(0)
+        for _ in range(max(0, hops)):
+            owner, nbrs, w = self._step(frontier_n, frontier_w, weights)
+            seed_of = frontier_s[owner]
+            keep = nbrs != seeds[seed_of]
+            keys, w = seed_of[keep] * n + nbrs[keep], w[keep]
+            if not len(keys):
+                break
+            # Strongest path per (seed, node), then only those it improves.
+            order = np.lexsort((-w, keys))
+            keys, w = keys[order], w[order]
+            first = np.r_[True, keys[1:] != keys[:-1]]
+            keys, w = keys[first], w[first]
+            at = np.searchsorted(best_k, keys)
+            seen = at < len(best_k)
+            seen[seen] = best_k[at[seen]] == keys[seen]
+            prev = np.zeros(len(keys))
+            prev[seen] = best_w[at[seen]]
+            improved = w > prev
+            keys, w = keys[improved], w[improved]
+            if not len(keys):
+                break
+            stale = np.isin(best_k, keys, assume_unique=True)
+            best_k = np.concatenate([best_k[~stale], keys])
+            best_w = np.concatenate([best_w[~stale], w])
+            order = np.argsort(best_k, kind="stable")
+            best_k, best_w = best_k[order], best_w[order]
+            frontier_s, frontier_n, frontier_w = keys // n, keys % n, w
+
+        best_s, best_n = best_k // n, best_k % n
+        order = np.lexsort((-best_w, best_s))
+        ids = self._ids
+        for s_idx, slot, weight in zip(best_s[order].tolist(), best_n[order].tolist(), best_w[order].tolist()):
+            reached = out[known[s_idx]]
+            if limit is None or len(reached) < limit:
+                reached[ids[slot]] = weight
+        return out
+
+    def _step(
+        self, frontier: np.ndarray, frontier_w: np.ndarray, weights: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """One hop from *frontier*: (frontier index, neighbor slot, path weight), weight > 0."""
+        parts_o, parts_n, parts_w = [], [], []
+        for csr, pending in ((self._out, self._pending_out), (self._in, self._pending_in)):
+            pos, owner = csr.gather(frontier)
+            if len(pos):
+                parts_o.append(owner)
+                parts_n.append(csr.nbr[pos].astype(np.int64))
+                parts_w.append(frontier_w[owner] * weights[csr.etype[pos]])
+            if pending:
+                extra = [
+                    (i, nbr, w * weights[code])
+                    for i, (row, w) in enumerate(zip(frontier.tolist(), frontier_w.tolist()))
+                    for nbr, code in pending.get(row, ())
+                ]
+                if extra:
+                    o, nb, ew = zip(*extra)
+                    parts_o.append(np.array(o, dtype=np.int64))
+                    parts_n.append(np.array(nb, dtype=np.int64))
+                    parts_w.append(np.array(ew))
+        if not parts_n:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0)
+        owner, nbrs, w = np.concatenate(parts_o), np.concatenate(parts_n), np.concatenate(parts_w)
+        keep = w > 0
+        return owner[keep], nbrs[keep], w[keep]
+
+    # --- Bookkeeping ----------------------------------------------------
+
+    def diff(self, reference: Iterable[Edge]) -> Dict[str, object]:
+        """Compare against *reference* edges: what the index lacks or has extra."""
+        want = {e for e in reference if e[2] in _TYPE_CODE and e[0] != e[1]}
+        have = self.edges()
+        missing, extra = want - have, have - want
+        return {
+            "missing": len(missing),
+            "extra": len(extra),
+            "sample": sorted(missing)[:10] + sorted(extra)[:10],
+        }
+
+    def memory_bytes(self) -> Dict[str, int]:
+        """Approximate resident size: arrays exactly, ids and overlay estimated."""
+        arrays = self._out.nbytes + self._in.nbytes
+        ids = sys.getsizeof(self._ids) + sys.getsizeof(self._slots)
+        ids += sum(sys.getsizeof(s) for s in self._ids)
+        pending = sys.getsizeof(self._pending) + len(self._pending) * (
+            sys.getsizeof((0, 0, 0)) + 2 * sys.getsizeof((0, 0))
+        )
+        return {"arrays": arrays, "ids": ids, "pending": pending, "total": arrays + ids + pending}
+
+    def stats(self) -> Dict[str, object]:
+        by_type = np.bincount(self._out.etype, minlength=len(EDGE_TYPES))
+        counts = {t: int(by_type[i]) for i, t in enumerate(EDGE_TYPES)}
+        for _, _, code in self._pending:
+            counts[EDGE_TYPES[code]] += 1
+        return {
+            "discoveries": len(self._ids),
+            "edges": len(self),
+            "by_type": counts,
+            "pending": len(self._pending),
+            "bytes": self.memory_bytes(),
+            "loaded_at": self.loaded_at,
+            "checked_at": self.checked_at,
+            "last_check": self.last_check,
+        }
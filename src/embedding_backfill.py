@@ -0,0 +1,242 @@
+"""
+Bulk embedding backfill / re-embed for knowledge.discoveries.
+
+Streams discoveries whose embedding is missing or stale from Postgres in
+keyset-paginated chunks (ORDER BY id), encodes each chunk with
+EmbeddingsService.embed_batch, and writes it in one round trip: COPY into a
+temp table plus one INSERT ... SELECT ... ON CONFLICT, or a single
+executemany. Progress is reported as KnowledgeGraphLifecycle
+._embedding_coverage() snapshots, the same numbers kg lifecycle stats show.
+
+Modes:
+- `missing` — discoveries with no row in the active embeddings table
+- `stale`   — missing, or content_hash differs from the current text (rows
+              from before migration 040 have no hash and count as stale)
+- `all`     — every discovery, e.g. after changing the model behind a table
+
+Resumable: the missing/stale predicates are evaluated per chunk, so a
+restarted run skips what an earlier run wrote. `all` has no such predicate;
+resume it with start_after=<last_id> from the previous run's progress.
+
+Safe beside live traffic: a row is only written if the discovery's current
+text still hashes to what was encoded, so a concurrent edit (and its own
+_refresh_embedding) is never overwritten with an older vector. max_rate
+caps texts/sec and pause_s adds a gap between chunks.
+
+Usage (see scripts/migration/backfill_embeddings.py for the CLI):
+    job = EmbeddingBackfill(db, EmbeddingsService(), mode="stale", max_rate=50)
+    result = await job.run()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.logging_utils import get_logger
+from src.storage.knowledge_graph_age import discovery_embedding_text, embedding_content_hash
+
+logger = get_logger(__name__)
+
+
+BACKFILL_MODES = ("missing", "stale", "all")
+
+_MODE_PREDICATES = {
+    "missing": "e.discovery_id IS NULL",
+    "stale": (
+        "e.content_hash IS DISTINCT FROM "
+        "knowledge.discovery_embedding_hash(d.summary, d.details)"
+    ),
+    "all": "TRUE",
+}
+
+# Only write if the discovery still has the text that was encoded.
+_UPSERT_TAIL = """
+    ON CONFLICT (discovery_id) DO UPDATE SET
+        embedding = EXCLUDED.embedding,
+        model_name = EXCLUDED.model_name,
+        content_hash = EXCLUDED.content_hash,
+        updated_at = now()
+"""
+
+Row = Tuple[str, str, str, str]  # (discovery_id, embedding literal, model_name, content_hash)
+
+
+class EmbeddingBackfill:
+    """Chunked, rate-limited (re-)embedding of knowledge.discoveries."""
+
+    def __init__(
+        self,
+        db,
+        service,
+        mode: str = "stale",
+        chunk_size: int = 256,
+        batch_size: int = 32,
+        max_rate: Optional[float] = None,
+        pause_s: float = 0.0,
+        use_copy: bool = True,
+        report_every: int = 10,
+        on_progress: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        coverage: Optional[Callable[[], Awaitable[Optional[Dict[str, Any]]]]] = None,
+    ):
+        if mode not in BACKFILL_MODES:
+            raise ValueError(f"mode must be one of {BACKFILL_MODES}, got {mode!r}")
+        self.db = db
+        self.service = service
+        self.table = service.table_name
+        self.mode = mode
+        self.chunk_size = max(1, chunk_size)
+        self.batch_size = max(1, batch_size)
+        self.max_rate = max_rate if max_rate and max_rate > 0 else None
+        self.pause_s = max(0.0, pause_s)
+        self.use_copy = use_copy
+        self.report_every = max(1, report_every)
+        self.on_progress = on_progress
+        if coverage is None:
+            from src.knowledge_graph_lifecycle import KnowledgeGraphLifecycle
+            coverage = KnowledgeGraphLifecycle()._embedding_coverage
+        self._coverage = coverage
+
+    async def fetch_chunk(self, after_id: str, limit: int) -> List[Tuple[str, str, Optional[str]]]:
+        """Next `limit` discoveries with id > after_id needing (re-)embedding."""
+        async with self.db.acquire() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT d.id, d.summary, d.details
+                FROM knowledge.discoveries d
+                LEFT JOIN {self.table} e ON e.discovery_id = d.id
+                WHERE d.id > $1 AND ({_MODE_PREDICATES[self.mode]})
+                ORDER BY d.id
+                LIMIT $2
+                """,
+                after_id, limit,
+            )
+        return [(r["id"], r["summary"], r["details"]) for r in rows]
+
+    async def write_chunk(self, rows: List[Row]) -> int:
+        """Upsert encoded rows; returns how many were written."""
+        if not rows:
+            return 0
+        fresh = "s.content_hash = knowledge.discovery_embedding_hash(d.summary, d.details)"
+        async with self.db.acquire() as conn:
+            if self.use_copy:
+                async with conn.transaction():
+                    await conn.execute(
+                        "CREATE TEMP TABLE _embedding_backfill ("
+                        "discovery_id TEXT, embedding TEXT, model_name TEXT, content_hash TEXT"
+                        ") ON COMMIT DROP"
+                    )
+                    await conn.copy_records_to_table("_embedding_backfill", records=rows)
+                    status = await conn.execute(
+                        f"""
+                        INSERT INTO {self.table} (discovery_id, embedding, model_name, content_hash)
+                        SELECT s.discovery_id, s.embedding::vector, s.model_name, s.content_hash
+                        FROM _embedding_backfill s
+                        JOIN knowledge.discoveries d ON d.id = s.discovery_id
+                        WHERE {fresh}
+                        {_UPSERT_TAIL}
+                        """
+                    )
+                # "INSERT 0 <n>"
+                return int(str(status).rsplit(" ", 1)[-1])
+            await conn.executemany(
+                f"""
+                INSERT INTO {self.table} (discovery_id, embedding, model_name, content_hash)
+                SELECT s.discovery_id, s.embedding::vector, s.model_name, s.content_hash
+                FROM (SELECT $1::text AS discovery_id, $2::text AS embedding,
+                             $3::text AS model_name, $4::text AS content_hash) s
+                JOIN knowledge.discoveries d ON d.id = s.discovery_id
+                WHERE {fresh}
+                {_UPSERT_TAIL}
+                """,
+                rows,
+            )
+            # executemany reports no row counts.
+            return len(rows)
+
+    async def run(
+        self,
+        limit: Optional[int] = None,
+        start_after: str = "",
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """Work through the corpus; returns totals plus coverage before/after."""
+        started = time.perf_counter()
+        progress: Dict[str, Any] = {
+            "mode": self.mode,
+            "table": self.table,
+            "model": self.service.model_name,
+            "dry_run": dry_run,
+            "selected": 0,
+            "written": 0,
+            "skipped": 0,
+            "chunks": 0,
+            "last_id": start_after or None,
+            "elapsed_s": 0.0,
+            "rate_per_s": 0.0,
+            "coverage_before": await self._coverage(),
+            "coverage": None,
+        }
+        cursor = start_after
+        while limit is None or progress["selected"] < limit:
+            want = self.chunk_size if limit is None else min(self.chunk_size, limit - progress["selected"])
+            chunk = await self.fetch_chunk(cursor, want)
+            if not chunk:
+                break
+            cursor = chunk[-1][0]
+            texts = [discovery_embedding_text(summary, details) for _, summary, details in chunk]
+
+            if not dry_run:
+                vectors = await self.service.embed_batch(texts, batch_size=self.batch_size)
+                rows: List[Row] = [
+                    (
+                        discovery_id,
+                        "[" + ",".join(str(x) for x in vector) + "]",
+                        self.service.model_name,
+                        embedding_content_hash(text),
+                    )
+                    for (discovery_id, _, _), text, vector in zip(chunk, texts, vectors)
+                    if vector is not None
+                ]
+                written = await self.write_chunk(rows)
+                progress["written"] += written
+                progress["skipped"] += len(chunk) - written
+
+            progress["selected"] += len(chunk)
+            progress["chunks"] += 1
+            progress["last_id"] = cursor
+            elapsed = time.perf_counter() - started
+            progress["elapsed_s"] = round(elapsed, 2)
+            progress["rate_per_s"] = round(progress["selected"] / elapsed, 1) if elapsed else 0.0
+            if progress["chunks"] % self.report_every == 0:
+                progress["coverage"] = await self._coverage()
+            await self._report(progress)
+
+            if len(chunk) < want:
+                break
+            await self._throttle(progress["selected"], started)
+
+        progress["coverage"] = await self._coverage()
+        progress["elapsed_s"] = round(time.perf_counter() - started, 2)
+        await self._report(progress)
+        return progress
+
+    async def _throttle(self, selected: int, started: float) -> None:
+        delay = self.pause_s
+        if self.max_rate:
+            delay = max(delay, selected / self.max_rate - (time.perf_counter() - started))
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _report(self, progress: Dict[str, Any]) -> None:
+        cov = progress.get("coverage") or {}
+        logger.info(
+            f"embedding backfill [{self.mode}] {progress['selected']} selected, "
+            f"{progress['written']} written, last_id={progress['last_id']}, "
+            f"coverage={cov.get('ratio')}, stale={cov.get('stale')}"
+        )
+        if self.on_progress is not None:
+            result = self.on_progress(dict(progress))
+            if asyncio.iscoroutine(result):
+                await result
@@ -11,6 +11,15 @@ Model selection (UNITARES_EMBEDDING_MODEL env var):
 Both load via SentenceTransformer. BGE-M3 is symmetric (no query/passage
 asymmetry), so the same encode path is used for both sides.
 
+Inference runs on torch by default; UNITARES_EMBEDDING_BACKEND (or the global
+UNITARES_INFERENCE_BACKEND) selects `onnx` or `onnx-int8` instead — see
+src/inference_backend.py.
+
+Concurrent embed() calls are coalesced: requests arriving within a few
+milliseconds of each other go to the model as one encode batch on a
+dedicated executor, and query embeddings are kept in an LRU/TTL cache keyed
+by model and whitespace-normalized text (src/inference_batching.py).
+
 Usage:
     from src.embeddings import get_embeddings_service
 
@@ -22,9 +31,12 @@ from __future__ import annotations
 
 import asyncio
 import os
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+from src.inference_backend import configured_backend, load_model
+from src.inference_batching import MicroBatcher, TTLCache
 from src.logging_utils import get_logger
+from src.metrics_registry import EMBEDDING_BATCH_SIZE, EMBEDDING_QUERY_CACHE
 
 logger = get_logger(__name__)
 
@@ -72,15 +84,44 @@ except ImportError:
     )
 
 
+# Micro-batching and query cache (src/inference_batching.py).
+EMBED_BATCH_WINDOW_MS = float(os.getenv("UNITARES_EMBED_BATCH_WINDOW_MS", "3"))
+EMBED_BATCH_MAX = int(os.getenv("UNITARES_EMBED_BATCH_MAX", "32"))
+EMBED_WORKERS = int(os.getenv("UNITARES_EMBED_WORKERS", "1"))
+EMBED_CACHE_SIZE = int(os.getenv("UNITARES_EMBED_CACHE_SIZE", "2048"))
+EMBED_CACHE_TTL_S = float(os.getenv("UNITARES_EMBED_CACHE_TTL_S", "3600"))
+
+EMBEDDING_BACKEND = configured_backend("UNITARES_EMBEDDING_BACKEND")
+
+
+def normalize_query_text(text: str) -> str:
+    """Collapse whitespace; the tokenizers ignore it, so the vector is unchanged."""
+    return " ".join(str(text).split())
+
+
 class EmbeddingsService:
     """
     Embeddings service with lazy model loading.
 
     Thread-safe, async-compatible via run_in_executor.
     Model loaded on first use to avoid startup overhead.
+
+    Single-text embed() calls go through a MicroBatcher: they reach the
+    model as one encode batch of up to ``batch_max`` texts once
+    ``batch_window_ms`` has passed, with at most ``workers`` batches running
+    on the dedicated executor (src/inference_batching.py).
     """
 
-    def __init__(self, model_key: str = DEFAULT_MODEL_KEY):
+    def __init__(
+        self,
+        model_key: str = DEFAULT_MODEL_KEY,
+        batch_window_ms: float = EMBED_BATCH_WINDOW_MS,
+        batch_max: int = EMBED_BATCH_MAX,
+        workers: int = EMBED_WORKERS,
+        cache_size: int = EMBED_CACHE_SIZE,
+        cache_ttl_s: float = EMBED_CACHE_TTL_S,
+        backend: str = EMBEDDING_BACKEND,
+    ):
         if model_key not in KNOWN_MODELS:
             logger.warning(f"Unknown model_key={model_key!r}; using 'minilm'")
             model_key = "minilm"
@@ -89,9 +130,25 @@ class EmbeddingsService:
         self.model_name: str = str(entry["hf_name"])
         self.dim: int = int(entry["dim"])
         self.table_name: str = f"core.discovery_embeddings{entry['table_suffix']}"
+        # Requested backend until the model loads, then the one actually used.
+        self.backend = backend
         self._model: Optional[SentenceTransformer] = None
         self._load_lock: Optional[asyncio.Lock] = None
 
+        self.cache = TTLCache(cache_size, cache_ttl_s)
+        self._batcher = MicroBatcher(
+            self._encode_batch,
+            window_ms=batch_window_ms,
+            batch_max=batch_max,
+            workers=workers,
+            thread_name_prefix="embed",
+            cache=self.cache,
+            on_batch=EMBEDDING_BATCH_SIZE.observe,
+        )
+
+    def _encode_batch(self, texts: List[str]) -> List[List[float]]:
+        return _encode_texts(self._model, texts)
+
     async def _ensure_model(self) -> SentenceTransformer:
         """Lazy load model on first use."""
         if not SENTENCE_TRANSFORMERS_AVAILABLE:
@@ -116,24 +173,44 @@ class EmbeddingsService:
             loop = asyncio.get_running_loop()
 
             def _load_model():
-                logger.info(f"Loading embedding model: {self.model_name} (key={self.model_key}, dim={self.dim})")
-                model = SentenceTransformer(self.model_name)
-                logger.info(f"Embedding model loaded: {self.model_name}")
-                return model
-
-            self._model = await loop.run_in_executor(None, _load_model)
+                logger.info(
+                    f"Loading embedding model: {self.model_name} "
+                    f"(key={self.model_key}, dim={self.dim}, backend={self.backend})"
+                )
+                model, backend = load_model(SentenceTransformer, self.model_name, self.backend)
+                logger.info(f"Embedding model loaded: {self.model_name} ({backend})")
+                return model, backend
+
+            self._model, self.backend = await loop.run_in_executor(None, _load_model)
             return self._model
 
-    async def embed(self, text: str) -> List[float]:
-        """Generate embedding for a single text."""
-        model = await self._ensure_model()
-        loop = asyncio.get_running_loop()
-
-        def _encode():
-            embedding = model.encode(text, normalize_embeddings=True)
-            return embedding.tolist()
-
-        return await loop.run_in_executor(None, _encode)
+    async def embed(self, text: str, cache: bool = True) -> List[float]:
+        """Generate embedding for a single text.
+
+        Goes through the micro-batcher. With ``cache`` (the default, for
+        query text) the result is looked up in and stored to the query
+        cache, and concurrent requests for the same text share one encode.
+        Pass ``cache=False`` for one-off passage text such as discovery
+        bodies being indexed.
+        """
+        key = (self.model_key, normalize_query_text(text)) if cache and self.cache.enabled else None
+        if key is not None:
+            hit = self.cache.get(key)
+            EMBEDDING_QUERY_CACHE.labels(result="miss" if hit is None else "hit").inc()
+            if hit is not None:
+                # Copy so a caller mutating its vector can't poison the cache.
+                return list(hit)
+        await self._ensure_model()
+        fut = self._batcher.submit(text, key)
+        # shield: one cancelled caller must not cancel the shared result.
+        return list(await asyncio.shield(fut))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._batcher.stats(),
+            "backend": self.backend,
+            "cache": self.cache.stats(),
+        }
 
     async def embed_batch(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
         """Generate embeddings for multiple texts."""
@@ -152,7 +229,7 @@ class EmbeddingsService:
             )
             return [emb.tolist() for emb in embeddings]
 
-        return await loop.run_in_executor(None, _encode_batch)
+        return await loop.run_in_executor(self._batcher.executor, _encode_batch)
 
     async def similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
         """Cosine similarity via dot product on normalized vectors."""
@@ -198,6 +275,14 @@ class EmbeddingsService:
         return SENTENCE_TRANSFORMERS_AVAILABLE
 
 
+def _encode_texts(model, texts: List[str]) -> List[List[float]]:
+    """Encode one micro-batch on the embeddings executor."""
+    if len(texts) == 1:
+        return [model.encode(texts[0], normalize_embeddings=True).tolist()]
+    embeddings = model.encode(texts, batch_size=len(texts), normalize_embeddings=True)
+    return [emb.tolist() for emb in embeddings]
+
+
 # Global singleton
 _embeddings_service: Optional[EmbeddingsService] = None
 _service_lock: Optional[asyncio.Lock] = None
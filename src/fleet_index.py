@@ -0,0 +1,358 @@
+"""
+Columnar index of the latest governance metrics for every agent.
+
+compare_me_to_similar used to construct and hydrate a monitor for every
+active agent on each call, and compare_agents / aggregate_metrics called
+get_metrics() (stability check, basin classification) per agent. FleetIndex
+keeps one row per agent instead, refreshed whenever an update is committed:
+
+- float columns (primary and ODE EISV, coherence, phi, risk) live in one
+  (n_columns, capacity) array, so every column is contiguous and a query
+  over a handful of dimensions is a few vectorized passes;
+- verdict, status and regime are interned to int16 codes per field;
+- decision counts are an int64 (n_decisions, capacity) block;
+- agent ids map to row slots through a dict; removal moves the last row into
+  the hole so the live rows stay dense (``[:n]``).
+
+Queries (knn, range_query, aggregate) run under the index lock and return
+agent ids, never row slots, so a concurrent commit can't invalidate them.
+Agents the index hasn't seen since startup are filled in by the handlers
+from their monitors on first touch (see observability/handlers.py).
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+COLUMNS: Tuple[str, ...] = (
+    "E", "I", "S", "V",                       # primary (behavioral when confident)
+    "ode_E", "ode_I", "ode_S", "ode_V",
+    "coherence", "phi",
+    "risk_score", "current_risk", "mean_risk",
+    "gate_risk",                              # risk_score or current_risk (health / aggregate)
+    "history_risk_sum", "history_risk_n",     # last-10 risk_history, used when gate_risk is unset
+)
+_COL: Dict[str, int] = {name: i for i, name in enumerate(COLUMNS)}
+
+LABELS: Tuple[str, ...] = ("verdict", "status", "regime")
+_LABEL: Dict[str, int] = {name: i for i, name in enumerate(LABELS)}
+
+# Decision counts aggregate_metrics reads (two-tier plus the legacy names).
+DECISIONS: Tuple[str, ...] = ("proceed", "pause", "approve", "reflect", "revise", "reject")
+_DECISION: Dict[str, int] = {name: i for i, name in enumerate(DECISIONS)}
+
+SIMILARITY_DIMS: Tuple[str, ...] = ("E", "I", "S", "coherence")
+
+Radius = Union[float, Mapping[str, float]]
+
+
+def fleet_index_enabled() -> bool:
+    """True when committed updates feed the shared FleetIndex. UNITARES_FLEET_INDEX (default on)."""
+    return os.getenv("UNITARES_FLEET_INDEX", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _num(value: Any) -> float:
+    return float(value) if value is not None else math.nan
+
+
+def _opt(value: float) -> Optional[float]:
+    return None if math.isnan(value) else float(value)
+
+
+class FleetIndex:
+    """Latest per-agent metrics as NumPy columns (see module docstring)."""
+
+    def __init__(self, capacity: int = 1024):
+        self._lock = threading.Lock()
+        self._vocab: List[List[str]] = [[] for _ in LABELS]
+        self._codes: List[Dict[str, int]] = [{} for _ in LABELS]
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int) -> None:
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._values = np.full((len(COLUMNS), capacity), np.nan)
+        self._labels = np.full((len(LABELS), capacity), -1, dtype=np.int16)
+        self._decisions = np.zeros((len(DECISIONS), capacity), dtype=np.int64)
+        self._updates = np.zeros(capacity, dtype=np.int64)
+        self._initialized = np.zeros(capacity, dtype=bool)
+        self._void = np.zeros(capacity, dtype=bool)
+
+    def _grow(self) -> None:
+        capacity = self._values.shape[1] * 2
+        n = len(self._ids)
+
+        def widen(arr: np.ndarray, fill) -> np.ndarray:
+            out = np.full(arr.shape[:-1] + (capacity,), fill, dtype=arr.dtype)
+            out[..., :n] = arr[..., :n]
+            return out
+
+        self._values = widen(self._values, np.nan)
+        self._labels = widen(self._labels, -1)
+        self._decisions = widen(self._decisions, 0)
+        self._updates = widen(self._updates, 0)
+        self._initialized = widen(self._initialized, False)
+        self._void = widen(self._void, False)
+
+    def _code(self, field: int, label: Any) -> int:
+        if label is None:
+            return -1
+        label = str(label)
+        codes = self._codes[field]
+        code = codes.get(label)
+        if code is None:
+            code = codes[label] = len(self._vocab[field])
+            self._vocab[field].append(label)
+        return code
+
+    # --- Writing --------------------------------------------------------
+
+    def record(self, agent_id: str, metrics: Mapping[str, Any], state: Any = None) -> None:
+        """Store *agent_id*'s latest row.
+
+        *metrics* is get_metrics()/get_summary_metrics() output; *state* (the
+        monitor's GovernanceState) supplies the ODE values, raw coherence and
+        risk history those dicts don't carry.
+        """
+        ode = metrics.get("ode") or {}
+        primary = {}
+        for dim in "EISV":
+            raw = getattr(state, dim, None)
+            primary[f"ode_{dim}"] = _num(raw if raw is not None else ode.get(dim))
+            value = metrics.get(dim)
+            primary[dim] = _num(value) if value is not None else primary[f"ode_{dim}"]
+
+        coherence = getattr(state, "coherence", None)
+        if coherence is None:
+            coherence = metrics.get("coherence")
+        gate_risk = metrics.get("risk_score") or metrics.get("current_risk")
+        history = list(getattr(state, "risk_history", None) or [])[-10:]
+        row_values = {
+            **primary,
+            "coherence": _num(coherence),
+            "phi": _num(metrics.get("phi")),
+            "risk_score": _num(metrics.get("risk_score")),
+            "current_risk": _num(metrics.get("current_risk")),
+            "mean_risk": _num(metrics.get("mean_risk")),
+            "gate_risk": _num(gate_risk),
+            "history_risk_sum": float(sum(float(r) for r in history)),
+            "history_risk_n": float(len(history)),
+        }
+        decisions = metrics.get("decision_statistics") or {}
+        void_active = getattr(state, "void_active", None)
+        if void_active is None:
+            void_active = metrics.get("void_active", False)
+        update_count = getattr(state, "update_count", None)
+
+        with self._lock:
+            row = self._rows.get(agent_id)
+            if row is None:
+                if len(self._ids) == self._values.shape[1]:
+                    self._grow()
+                row = self._rows[agent_id] = len(self._ids)
+                self._ids.append(agent_id)
+            for name, value in row_values.items():
+                self._values[_COL[name], row] = value
+            for name, field in _LABEL.items():
+                self._labels[field, row] = self._code(field, metrics.get(name))
+            for name, i in _DECISION.items():
+                self._decisions[i, row] = int(decisions.get(name, 0) or 0)
+            self._updates[row] = int(update_count or 0)
+            self._initialized[row] = metrics.get("status") != "uninitialized"
+            self._void[row] = bool(void_active)
+
+    def remove(self, agent_id: str) -> bool:
+        """Drop *agent_id*'s row; the last row moves into its slot."""
+        with self._lock:
+            row = self._rows.pop(agent_id, None)
+            if row is None:
+                return False
+            last = len(self._ids) - 1
+            if row != last:
+                moved = self._ids[last]
+                self._ids[row] = moved
+                self._rows[moved] = row
+                for arr in (self._values, self._labels, self._decisions):
+                    arr[:, row] = arr[:, last]
+                for arr in (self._updates, self._initialized, self._void):
+                    arr[row] = arr[last]
+            self._ids.pop()
+            self._values[:, last] = np.nan
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._allocate(self._values.shape[1])
+
+    # --- Reading --------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, agent_id: str) -> bool:
+        return agent_id in self._rows
+
+    @property
+    def agent_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._ids)
+
+    def _row_dict(self, row: int) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"agent_id": self._ids[row]}
+        for name, i in _COL.items():
+            out[name] = _opt(self._values[i, row])
+        for name, field in _LABEL.items():
+            code = int(self._labels[field, row])
+            out[name] = self._vocab[field][code] if code >= 0 else None
+        out["decision_statistics"] = {name: int(self._decisions[i, row]) for name, i in _DECISION.items()}
+        out["update_count"] = int(self._updates[row])
+        out["initialized"] = bool(self._initialized[row])
+        out["void_active"] = bool(self._void[row])
+        return out
+
+    def get(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """*agent_id*'s row as a dict (unset floats are None), or None."""
+        with self._lock:
+            row = self._rows.get(agent_id)
+            return None if row is None else self._row_dict(row)
+
+    def rows(self, agent_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Row dicts for the indexed subset of *agent_ids*, in the given order."""
+        with self._lock:
+            return {aid: self._row_dict(self._rows[aid]) for aid in agent_ids if aid in self._rows}
+
+    def _candidates(self, dims: Sequence[str], exclude: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Initialized rows with every *dims* value set, and their (len(dims), m) values."""
+        n = len(self._ids)
+        block = self._values[[_COL[d] for d in dims], :n]
+        keep = self._initialized[:n] & ~np.isnan(block).any(axis=0)
+        for aid in exclude:
+            row = self._rows.get(aid)
+            if row is not None:
+                keep[row] = False
+        rows = np.flatnonzero(keep)
+        return rows, block[:, rows]
+
+    def knn(
+        self,
+        center: Mapping[str, float],
+        k: int = 5,
+        dims: Sequence[str] = SIMILARITY_DIMS,
+        exclude: Iterable[str] = (),
+    ) -> List[Tuple[str, float]]:
+        """The *k* initialized agents nearest *center* (Euclidean over *dims*), nearest first."""
+        point = np.array([float(center[d]) for d in dims])[:, None]
+        with self._lock:
+            rows, block = self._candidates(dims, exclude)
+            if not len(rows) or k <= 0:
+                return []
+            dist = np.sqrt(((block - point) ** 2).sum(axis=0))
+            k = min(k, len(rows))
+            top = np.argpartition(dist, k - 1)[:k]
+            top = top[np.argsort(dist[top], kind="stable")]
+            return [(self._ids[rows[i]], float(dist[i])) for i in top]
+
+    def range_query(
+        self,
+        center: Mapping[str, float],
+        radius: Radius,
+        dims: Sequence[str] = SIMILARITY_DIMS,
+        exclude: Iterable[str] = (),
+    ) -> List[Tuple[str, float]]:
+        """Initialized agents within *radius* of *center* on every dimension.
+
+        *radius* is one bound for all *dims* or a per-dimension mapping
+        (missing dimensions are unbounded, but still count toward the
+        distance). Returns ``(agent_id, mean |delta| over dims)``, closest
+        first.
+        """
+        point = np.array([float(center[d]) for d in dims])[:, None]
+        if isinstance(radius, Mapping):
+            bound = np.array([float(radius.get(d, math.inf)) for d in dims])[:, None]
+        else:
+            bound = np.full((len(dims), 1), float(radius))
+        with self._lock:
+            rows, block = self._candidates(dims, exclude)
+            delta = np.abs(block - point)
+            hit = np.flatnonzero((delta <= bound).all(axis=0))
+            dist = delta[:, hit].mean(axis=0)
+            order = np.argsort(dist, kind="stable")
+            return [(self._ids[rows[hit[i]]], float(dist[i])) for i in order]
+
+    def aggregate(self, agent_ids: Sequence[str]) -> Dict[str, Any]:
+        """Fleet totals over the indexed subset of *agent_ids* (aggregate_metrics).
+
+        ``risk_sum`` / ``risk_n`` count one gate_risk per agent, or that
+        agent's last ten risk_history entries when gate_risk is unset.
+        ``last_decisions`` are the counts of the last indexed id in
+        *agent_ids* order.
+        """
+        with self._lock:
+            rows = np.array([self._rows[aid] for aid in agent_ids if aid in self._rows], dtype=np.int64)
+            out: Dict[str, Any] = {"agents": len(rows), "indexed": [self._ids[r] for r in rows]}
+            values = self._values[:, rows]
+            gate = values[_COL["gate_risk"]]
+            has_gate = ~np.isnan(gate)
+            out["risk_sum"] = float(gate[has_gate].sum() + values[_COL["history_risk_sum"], ~has_gate].sum())
+            out["risk_n"] = int(has_gate.sum() + values[_COL["history_risk_n"], ~has_gate].sum())
+            coherence = values[_COL["coherence"]]
+            coherence = coherence[~np.isnan(coherence)]
+            out["coherence_mean"] = float(coherence.mean()) if len(coherence) else 0.0
+            for name, field in _LABEL.items():
+                codes = self._labels[field, rows]
+                counts = np.bincount(codes[codes >= 0], minlength=len(self._vocab[field]))
+                out[name] = {label: int(c) for label, c in zip(self._vocab[field], counts) if c}
+                out[f"{name}_unset"] = int((codes < 0).sum())
+            totals = self._decisions[:, rows].sum(axis=1)
+            out["decisions"] = {name: int(totals[i]) for name, i in _DECISION.items()}
+            out["last_decisions"] = (
+                {name: int(self._decisions[i, rows[-1]]) for name, i in _DECISION.items()} if len(rows) else {}
+            )
+            out["update_counts"] = {self._ids[r]: int(self._updates[r]) for r in rows}
+            return out
+
+    def memory_bytes(self) -> int:
+        return sum(a.nbytes for a in (
+            self._values, self._labels, self._decisions, self._updates, self._initialized, self._void,
+        ))
+
+
+# Shared index fed by committed updates (agent_loop_detection.py).
+fleet_index = FleetIndex()
+
+
+def record_monitor(agent_id: str, monitor: Any, metrics: Optional[Mapping[str, Any]] = None) -> None:
+    """Refresh *agent_id*'s row in the shared index from its monitor. Never raises."""
+    if not fleet_index_enabled():
+        return
+    try:
+        if metrics is None:
+            from src.monitor_metrics import get_summary_metrics
+            metrics = get_summary_metrics(monitor)
+        fleet_index.record(agent_id, metrics, monitor.state)
+        _publish()
+    except Exception as e:
+        logger.debug(f"Fleet index update failed for {agent_id[:8]}...: {e}")
+
+
+def forget_agent(agent_id: str) -> None:
+    """Drop *agent_id* from the shared index (monitor reset, archive, delete)."""
+    if fleet_index.remove(agent_id):
+        _publish()
+
+
+def _publish() -> None:
+    try:
+        from src.metrics_registry import FLEET_INDEX_AGENTS
+        FLEET_INDEX_AGENTS.set(len(fleet_index))
+    except Exception:
+        pass
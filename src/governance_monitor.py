@@ -10,7 +10,6 @@ Version History:
 - v2.0: Migrated to governance_core (single source of truth for dynamics)
 """
 
-import os
 import numpy as np
 from dataclasses import field
 from typing import Dict, Optional, Any
@@ -263,37 +262,39 @@ class UNITARESMonitor:
             return None
         
         try:
-            with open(state_file, 'r') as f:
-                data = json.load(f)
-                # Restore behavioral EISV if present (backward compatible)
-                beh_data = data.pop('behavioral_eisv', None)
-                if beh_data:
-                    self._behavioral_state = BehavioralEISV.from_dict(beh_data)
-                # Restore created_at if persisted; otherwise __init__ will fall
-                # back to now() for older state files that predate this field.
-                created_at_iso = data.pop('created_at_iso', None)
-                if created_at_iso:
-                    try:
-                        self.created_at = datetime.fromisoformat(created_at_iso)
-                    except (TypeError, ValueError) as e:
-                        logger.warning(
-                            f"Could not parse created_at_iso for {self.agent_id} "
-                            f"({created_at_iso!r}): {e}; falling back to now()",
-                        )
-                # Restore last_update if persisted; otherwise leave the in-memory
-                # value (set in __init__) intact. last_update lives on the monitor,
-                # not on GovernanceState, so it's handled here as a side effect —
-                # mirroring the behavioral_eisv pattern above.
-                last_update_iso = data.pop('last_update_iso', None)
-                if last_update_iso:
-                    try:
-                        self.last_update = datetime.fromisoformat(last_update_iso)
-                    except (TypeError, ValueError) as e:
-                        logger.warning(
-                            f"Could not parse last_update_iso for {self.agent_id} "
-                            f"({last_update_iso!r}): {e}; falling back to now()",
-                        )
-                return GovernanceState.from_dict(data)
+            from src.monitor_state_log import read_state_file
+            data, _ = read_state_file(state_file)
+            if data is None:
+                return None
+            # Restore behavioral EISV if present (backward compatible)
+            beh_data = data.pop('behavioral_eisv', None)
+            if beh_data:
+                self._behavioral_state = BehavioralEISV.from_dict(beh_data)
+            # Restore created_at if persisted; otherwise __init__ will fall
+            # back to now() for older state files that predate this field.
+            created_at_iso = data.pop('created_at_iso', None)
+            if created_at_iso:
+                try:
+                    self.created_at = datetime.fromisoformat(created_at_iso)
+                except (TypeError, ValueError) as e:
+                    logger.warning(
+                        f"Could not parse created_at_iso for {self.agent_id} "
+                        f"({created_at_iso!r}): {e}; falling back to now()",
+                    )
+            # Restore last_update if persisted; otherwise leave the in-memory
+            # value (set in __init__) intact. last_update lives on the monitor,
+            # not on GovernanceState, so it's handled here as a side effect —
+            # mirroring the behavioral_eisv pattern above.
+            last_update_iso = data.pop('last_update_iso', None)
+            if last_update_iso:
+                try:
+                    self.last_update = datetime.fromisoformat(last_update_iso)
+                except (TypeError, ValueError) as e:
+                    logger.warning(
+                        f"Could not parse last_update_iso for {self.agent_id} "
+                        f"({last_update_iso!r}): {e}; falling back to now()",
+                    )
+            return GovernanceState.from_dict(data)
         except Exception as e:
             logger.warning(f"Could not load persisted state for {self.agent_id}: {e}", exc_info=True)
             return None
@@ -307,7 +308,7 @@ class UNITARESMonitor:
         state_file.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            import tempfile
+            from src.monitor_state_log import write_state
             state_data = self.state.to_dict_with_history()
             # Include behavioral EISV state for persistence
             state_data['behavioral_eisv'] = self._behavioral_state.to_dict_with_history()
@@ -318,18 +319,8 @@ class UNITARESMonitor:
             # Persist last_update so cross-restart gaps integrate against the real
             # prior check-in time, not the lazy-init wall-clock.
             state_data['last_update_iso'] = self.last_update.isoformat()
-            # Atomic write: write to temp file, then rename to prevent corruption
-            tmp_fd, tmp_path = tempfile.mkstemp(dir=state_file.parent, suffix='.tmp')
-            try:
-                with os.fdopen(tmp_fd, 'w') as f:
-                    json.dump(state_data, f, indent=2)
-                os.replace(tmp_path, state_file)
-            except Exception:
-                try:
-                    os.unlink(tmp_path)
-                except OSError:
-                    pass
-                raise
+            # Atomic snapshot, or a delta-log append in delta mode
+            write_state(state_file, state_data)
         except Exception as e:
             logger.warning(f"Could not save state for {self.agent_id}: {e}", exc_info=True)
     
@@ -947,6 +938,9 @@ class UNITARESMonitor:
             beh_E_obs = float(sensor_eisv.get('E', 0.5))
             beh_I_obs = float(sensor_eisv.get('I', 0.5))
             beh_S_obs = float(sensor_eisv.get('S', 0.2))
+        elif agent_state.get('behavioral_obs') is not None:
+            # Recorded observation from the audit trail (src/governance_replay.py)
+            beh_E_obs, beh_I_obs, beh_S_obs = (float(x) for x in agent_state['behavioral_obs'])
         else:
             # Non-embodied agents: compute from behavioral_sensor
             beh_sensor = compute_behavioral_sensor_eisv(
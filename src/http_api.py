@@ -37,6 +37,7 @@ from src.metrics_registry import (
 from src.connection_tracker import CONNECTIONS_ACTIVE
 from src.broadcaster import broadcaster_instance
 from src.services.http_tool_service import execute_http_tool
+from src.mcp_handlers.serialization import dumps_json_bytes, strict_json_text, structured_payload
 
 if TYPE_CHECKING:
     from starlette.applications import Starlette
@@ -106,6 +107,9 @@ def _build_http_tool_response(tool_name: str, result) -> dict:
             }
 
         if len(result) == 1 and hasattr(result[0], "text"):
+            payload = structured_payload(result[0])
+            if payload is not None:
+                return {"name": tool_name, "result": payload, "success": True}
             try:
                 parsed = json.loads(result[0].text)
                 return {"name": tool_name, "result": parsed, "success": True}
@@ -126,6 +130,36 @@ def _build_http_tool_response(tool_name: str, result) -> dict:
     return {"name": tool_name, "result": result_str, "success": True}
 
 
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with the configured encoder (UNITARES_JSON_ENCODER).
+
+    Always strict JSON: non-finite floats are written as null with either
+    encoder.
+    """
+
+    def render(self, content) -> bytes:
+        return dumps_json_bytes(content, strict=True)
+
+
+def _http_tool_response(tool_name: str, result) -> Response:
+    """Build the /v1/tools/call response, serializing the payload at most once.
+
+    A single StructuredTextContent whose text is strict JSON already holds
+    the encoded payload, so that text is spliced into the envelope as-is
+    instead of being parsed and re-encoded. Everything else (including text
+    with NaN/Infinity literals) goes through _build_http_tool_response.
+    """
+    text = strict_json_text(result[0]) if isinstance(result, (list, tuple)) and len(result) == 1 else None
+    if text is not None:
+        body = b"".join((
+            b'{"name":', dumps_json_bytes(tool_name),
+            b',"result":', text.encode("utf-8"),
+            b',"success":true}',
+        ))
+        return Response(body, media_type="application/json")
+    return FastJSONResponse(_build_http_tool_response(tool_name, result))
+
+
 def _normalize_http_tool_name(body: dict, mcp_server_name: str) -> str:
     """Resolve HTTP tool aliases to the canonical dispatch name."""
     tool_name = body.get("name") or body.get("tool_name") or "unknown"
@@ -393,6 +427,21 @@ async def http_list_tools(request):
 
 async def http_call_tool(request):
     """Execute tool via HTTP - any model can call this"""
+    return await _handle_http_tool_call(request)
+
+
+async def http_checkins_batch(request):
+    """POST /v1/checkins:batch — the body is process_agent_updates_batch's arguments.
+
+    Shorthand for POST /v1/tools/call with name=process_agent_updates_batch,
+    for residents and brokers that submit several check-ins at once.
+    """
+    return await _handle_http_tool_call(request, fixed_tool_name="process_agent_updates_batch")
+
+
+async def _handle_http_tool_call(request, fixed_tool_name: Optional[str] = None):
+    """Shared body of the tool-call routes. fixed_tool_name: the whole body is
+    that tool's arguments instead of a {"name", "arguments"} envelope."""
     # CRITICAL FIX: Ensure all code paths return valid JSONResponse
     # Empty or malformed responses cause Starlette ASGI protocol violations
     # (AssertionError: Unexpected message: http.response.start vs http.response.body)
@@ -428,7 +477,7 @@ async def http_call_tool(request):
             return JSONResponse({"success": False, "error": "Request body must be a JSON object"}, status_code=400)
 
         # SECURITY: Limit arguments dictionary size (prevent DoS via large dicts)
-        arguments = body.get("arguments", {})
+        arguments = body if fixed_tool_name else body.get("arguments", {})
         if isinstance(arguments, dict) and len(arguments) > 100:
             return JSONResponse({
                 "success": False,
@@ -436,7 +485,7 @@ async def http_call_tool(request):
                 "max_arguments": 100
             }, status_code=400)
 
-        tool_name = _normalize_http_tool_name(body, mcp_server_name)
+        tool_name = fixed_tool_name or _normalize_http_tool_name(body, mcp_server_name)
         if not tool_name or tool_name == "unknown":
             return JSONResponse({"success": False, "error": "Missing 'name' field — pass the tool name as 'name', e.g. {\"name\": \"onboard\", \"arguments\": {...}}"}, status_code=400)
 
@@ -549,7 +598,7 @@ async def http_call_tool(request):
         finally:
             reset_session_context(context_token)
             reset_session_signals(signals_token)
-        return JSONResponse(_build_http_tool_response(tool_name, result))
+        return _http_tool_response(tool_name, result)
     except json.JSONDecodeError as e:
         # SECURITY: Sanitize JSON parsing errors
         logger.error(f"Invalid JSON in request: {e}", exc_info=True)
@@ -576,7 +625,7 @@ async def http_call_tool(request):
         }, status_code=400)
     except Exception as e:
         # SECURITY: Sanitize internal errors (don't expose stack traces, file paths, etc.)
-        tool_name_safe = body.get("name", "unknown") if body else "unknown"
+        tool_name_safe = fixed_tool_name or (body.get("name", "unknown") if body else "unknown")
         logger.error(f"Error calling tool '{tool_name_safe}': {e}", exc_info=True)
 
         # Only expose safe error information
@@ -659,6 +708,7 @@ async def http_health(request):
         "endpoints": {
             "list_tools": "GET /v1/tools",
             "call_tool": "POST /v1/tools/call",
+            "checkins_batch": "POST /v1/checkins:batch",
             "health": "GET /health",
             "metrics": "GET /metrics",
             "dashboard": "GET /dashboard"
@@ -2492,6 +2542,25 @@ async def http_debug_memory(request):
     return JSONResponse(result)
 
 
+async def http_debug_db_statements(request):
+    """Named DB statements ranked by total time (src/db/statements.py)."""
+    http_api_token = os.getenv("UNITARES_HTTP_API_TOKEN")
+    if not _check_http_auth(request, http_api_token=http_api_token):
+        return _http_unauthorized()
+    from src.db.statements import REGISTRY
+
+    try:
+        top_n = int(request.query_params.get("top", "25"))
+    except ValueError:
+        return JSONResponse({"error": "top must be an integer"}, status_code=400)
+    statements = REGISTRY.report()
+    return JSONResponse({
+        "registered": len(REGISTRY.names()),
+        "total_ms": round(sum(r["total_ms"] for r in statements), 3),
+        "statements": statements[:top_n],
+    })
+
+
 # ---------------------------------------------------------------------------
 # Route registration
 # ---------------------------------------------------------------------------
@@ -2544,6 +2613,7 @@ def register_http_routes(
     app.routes.append(Route("/", http_dashboard, methods=["GET"]))  # Root also serves dashboard
     app.routes.append(Route("/v1/tools", http_list_tools, methods=["GET"]))
     app.routes.append(Route("/v1/tools/call", http_call_tool, methods=["POST"]))
+    app.routes.append(Route("/v1/checkins:batch", http_checkins_batch, methods=["POST"]))
     app.routes.append(Route("/health", http_health, methods=["GET"]))
     app.routes.append(Route("/health/live", http_health_live, methods=["GET"]))
     app.routes.append(Route("/health/ready", http_health_ready, methods=["GET"]))
@@ -2569,3 +2639,4 @@ def register_http_routes(
     app.routes.append(Route("/v1/taxonomy", http_taxonomy, methods=["GET"]))
     app.routes.append(WebSocketRoute("/ws/eisv", websocket_eisv_stream))
     app.routes.append(Route("/debug/memory", http_debug_memory, methods=["GET"]))
+    app.routes.append(Route("/debug/db/statements", http_debug_db_statements, methods=["GET"]))
@@ -0,0 +1,144 @@
+"""
+Inference backend selection for the sentence-transformers models.
+
+The bi-encoder (src/embeddings.py) and the cross-encoder reranker
+(src/reranker.py) both default to PyTorch. On CPU-only hosts ONNX Runtime
+is typically faster, and int8 dynamic quantization of the exported graph
+faster still, at a small cost in score fidelity.
+
+Backends (UNITARES_INFERENCE_BACKEND, overridable per model with
+UNITARES_EMBEDDING_BACKEND / UNITARES_RERANKER_BACKEND):
+- `torch`     (default) — load the Hugging Face checkpoint as-is
+- `onnx`      — ONNX Runtime, fp32 graph exported on first load
+- `onnx-int8` — ONNX Runtime, int8 dynamically quantized graph
+
+Exported graphs are cached under UNITARES_MODEL_CACHE_DIR (default
+data/models) so the export cost is paid once per host. The quantization
+config follows the CPU (avx512_vnni / avx512 / avx2 / arm64). If the ONNX
+path can't be used (onnxruntime or optimum missing, a sentence-transformers
+without backend support, export failure) the model loads on torch with a
+warning, and the returned backend says so.
+
+Switching the embedding backend changes query vectors slightly relative to
+stored passage vectors; check retrieval quality with
+`scripts/eval/retrieval_eval.py --backend-parity onnx-int8` before enabling.
+"""
+
+from __future__ import annotations
+
+import os
+import platform
+import re
+import shutil
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from src.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+BACKENDS = ("torch", "onnx", "onnx-int8")
+
+MODEL_CACHE_DIR = Path(
+    os.getenv(
+        "UNITARES_MODEL_CACHE_DIR",
+        str(Path(__file__).resolve().parents[1] / "data" / "models"),
+    )
+)
+
+
+def normalize_backend(value: Optional[str]) -> str:
+    """Map a configured backend name to one of BACKENDS; unknown → torch."""
+    if value is None:
+        return "torch"
+    name = value.strip().lower().replace("_", "-")
+    if name in ("", "pytorch"):
+        return "torch"
+    if name in ("int8", "onnx-qint8", "onnx-quantized"):
+        return "onnx-int8"
+    if name not in BACKENDS:
+        logger.warning(f"Unknown inference backend {value!r}; using 'torch'. Known: {list(BACKENDS)}")
+        return "torch"
+    return name
+
+
+def configured_backend(service_env: Optional[str] = None) -> str:
+    """Backend for one model: its own env var if set, else the global one."""
+    if service_env:
+        override = os.getenv(service_env)
+        if override is not None and override.strip():
+            return normalize_backend(override)
+    return normalize_backend(os.getenv("UNITARES_INFERENCE_BACKEND", "torch"))
+
+
+def quantization_config() -> str:
+    """Pick the onnxruntime dynamic-quantization config for this CPU."""
+    machine = platform.machine().lower()
+    if machine in ("arm64", "aarch64"):
+        return "arm64"
+    flags: set = set()
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    flags = set(line.split(":", 1)[1].split())
+                    break
+    except OSError:
+        pass
+    if "avx512_vnni" in flags:
+        return "avx512_vnni"
+    if "avx512f" in flags:
+        return "avx512"
+    return "avx2"
+
+
+def export_dir(hf_name: str) -> Path:
+    """Per-model directory holding the exported ONNX graphs."""
+    return MODEL_CACHE_DIR / re.sub(r"[^A-Za-z0-9._-]+", "__", hf_name)
+
+
+def load_model(model_cls: Any, hf_name: str, backend: str) -> Tuple[Any, str]:
+    """Load `hf_name` with `model_cls` (SentenceTransformer or CrossEncoder).
+
+    Returns (model, backend actually used). Blocking — call from an executor.
+    """
+    backend = normalize_backend(backend)
+    if backend == "torch":
+        return model_cls(hf_name), "torch"
+    try:
+        return _load_onnx(model_cls, hf_name, quantized=backend == "onnx-int8"), backend
+    except Exception as e:
+        logger.warning(f"{backend} backend unavailable for {hf_name}, falling back to torch: {e}")
+        return model_cls(hf_name), "torch"
+
+
+def _load_onnx(model_cls: Any, hf_name: str, quantized: bool) -> Any:
+    target = export_dir(hf_name)
+    if not (target / "onnx" / "model.onnx").exists():
+        # Export next to the target and move into place, so a crashed or
+        # concurrent export never leaves a half-written model behind.
+        logger.info(f"Exporting {hf_name} to ONNX under {target}")
+        staging = target.with_name(f"{target.name}.tmp-{os.getpid()}")
+        shutil.rmtree(staging, ignore_errors=True)
+        model_cls(hf_name, backend="onnx").save_pretrained(str(staging))
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            staging.rename(target)
+        except OSError:
+            # Another process got there first; use its export.
+            shutil.rmtree(staging, ignore_errors=True)
+
+    if not quantized:
+        return model_cls(str(target), backend="onnx")
+
+    config = quantization_config()
+    file_name = f"onnx/model_qint8_{config}.onnx"
+    if not (target / file_name).exists():
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+
+        logger.info(f"Quantizing {hf_name} (int8, {config})")
+        export_dynamic_quantized_onnx_model(
+            model_cls(str(target), backend="onnx"), config, str(target),
+        )
+    return model_cls(str(target), backend="onnx", model_kwargs={"file_name": file_name})
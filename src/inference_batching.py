@@ -0,0 +1,240 @@
+"""
+Micro-batching and result caching for the inference services.
+
+EmbeddingsService (src/embeddings.py) and CrossEncoderReranker
+(src/reranker.py) both answer single-item requests — one text to embed, one
+(query, doc) pair to score — with a model that is far cheaper per item when
+called on a batch. Both are built on the two pieces here:
+
+- TTLCache: LRU cache with a per-entry TTL. An optional ``tag`` function
+  groups keys (the reranker tags scores by discovery id) so every entry of a
+  group can be dropped at once.
+- MicroBatcher: queues items and hands them to a batch function on a
+  dedicated executor, ``batch_max`` at a time, once ``window_ms`` has passed
+  since the first queued item. At most ``workers`` batches run at once;
+  items queued meanwhile form the next batch, so batches grow with load
+  instead of piling up. Items submitted with a key share one in-flight
+  result and fill the cache when their batch succeeds.
+
+Neither is thread-safe: both are only touched from the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+
+class TTLCache:
+    """LRU cache with a per-entry TTL; a max_size of 0 disables it."""
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_s: float,
+        tag: Optional[Callable[[Hashable], Optional[Hashable]]] = None,
+    ):
+        self.max_size = max_size
+        self.ttl_s = ttl_s
+        self._tag = tag
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._by_tag: Dict[Hashable, Set[Hashable]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        if entry is not None:
+            self._drop(key)
+        self.misses += 1
+        return None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_s, value)
+        self._entries.move_to_end(key)
+        tag = self._tag(key) if self._tag is not None else None
+        if tag is not None:
+            self._by_tag.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_size:
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+        tag = self._tag(key) if self._tag is not None else None
+        keys = self._by_tag.get(tag) if tag is not None else None
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_tag[tag]
+
+    def invalidate_tag(self, tag: Hashable) -> int:
+        """Drop every entry whose key carries ``tag``; returns how many."""
+        keys = self._by_tag.pop(tag, set())
+        for key in keys:
+            self._entries.pop(key, None)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_tag.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+        }
+
+
+class MicroBatcher:
+    """Coalesces single-item requests into bounded batches (see module docstring).
+
+    ``run_batch`` takes a list of items and returns one result per item, in
+    order; it runs on the batcher's executor. ``on_batch`` is called with
+    each batch size (metrics). A window of 0 still coalesces items submitted
+    in the same event-loop tick.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[List[Any]], List[Any]],
+        *,
+        window_ms: float,
+        batch_max: int,
+        workers: int,
+        thread_name_prefix: str,
+        cache: Optional[TTLCache] = None,
+        on_batch: Optional[Callable[[int], None]] = None,
+    ):
+        self._run = run_batch
+        self.window_s = max(0.0, window_ms) / 1000.0
+        self.batch_max = max(1, batch_max)
+        self.workers = max(1, workers)
+        self.cache = cache
+        self._on_batch = on_batch
+        self._thread_name_prefix = thread_name_prefix
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Bound to the loop that submitted the first item.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[Tuple[Any, Optional[Hashable], asyncio.Future]] = []
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._running = 0
+        self._stats = {"batches": 0, "batched_items": 0, "max_batch_size": 0}
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The batch executor; also used for the services' explicit batch calls."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix=self._thread_name_prefix,
+            )
+        return self._executor
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    def submit(self, item: Any, key: Optional[Hashable] = None) -> asyncio.Future:
+        """Queue ``item``; the future resolves to its result.
+
+        Items with the same ``key`` submitted before the first one finishes
+        share its future. Await it through asyncio.shield() when several
+        callers may share it, so one cancelled caller can't cancel the rest.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A new loop (tests, restarts) can't await futures of the old one.
+            self._loop = loop
+            self._pending, self._inflight = [], {}
+            self._flush_handle, self._running = None, 0
+
+        if key is not None and key in self._inflight:
+            return self._inflight[key]
+        fut = loop.create_future()
+        if key is not None:
+            self._inflight[key] = fut
+        self._pending.append((item, key, fut))
+        if len(self._pending) >= self.batch_max:
+            self._dispatch()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window_s, self._on_window)
+        return fut
+
+    def _on_window(self) -> None:
+        self._flush_handle = None
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._pending and self._running < self.workers:
+            batch = self._pending[:self.batch_max]
+            del self._pending[:self.batch_max]
+            self._running += 1
+            asyncio.ensure_future(self._run_batch(batch))
+        if not self._pending and self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+    async def _run_batch(self, batch) -> None:
+        loop = asyncio.get_running_loop()
+        items = [item for item, _, _ in batch]
+        self._stats["batches"] += 1
+        self._stats["batched_items"] += len(items)
+        self._stats["max_batch_size"] = max(self._stats["max_batch_size"], len(items))
+        try:
+            if self._on_batch is not None:
+                self._on_batch(len(items))
+            results = await loop.run_in_executor(self.executor, self._run, items)
+        except Exception as exc:
+            for _, key, fut in batch:
+                if key is not None:
+                    self._inflight.pop(key, None)
+                if not fut.done():
+                    fut.set_exception(exc)
+        else:
+            for (_, key, fut), result in zip(batch, results):
+                if key is not None:
+                    self._inflight.pop(key, None)
+                    if self.cache is not None:
+                        self.cache.put(key, result)
+                if not fut.done():
+                    fut.set_result(result)
+        finally:
+            # Cancellation (or any other BaseException) and short result
+            # lists must not leave callers waiting on futures nobody resolves.
+            for _, key, fut in batch:
+                if not fut.done():
+                    if key is not None and self._inflight.get(key) is fut:
+                        del self._inflight[key]
+                    fut.cancel()
+            if self._loop is loop:
+                self._running -= 1
+                # The next batch starts now rather than after another window.
+                self._dispatch()
+
+    def stats(self) -> Dict[str, Any]:
+        batches = self._stats["batches"]
+        return {
+            **self._stats,
+            "mean_batch_size": round(self._stats["batched_items"] / batches, 2) if batches else None,
+            "pending": len(self._pending),
+        }
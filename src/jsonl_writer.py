@@ -0,0 +1,264 @@
+"""
+Group-commit writer for append-only JSONL logs.
+
+``AuditLogger`` and ``ToolUsageTracker`` historically opened the log, took an
+``fcntl`` lock, wrote one record and ``fsync``-ed on every call, synchronously
+inside tool handlers. ``GroupCommitWriter`` moves that off the caller: records
+are serialized by the caller (so later mutation of the dict cannot leak into
+the log), pushed onto a bounded queue, and a single daemon thread drains the
+queue into one locked ``write`` + one ``fsync`` per batch.
+
+A batch closes when it reaches ``max_batch`` records or ``max_delay`` seconds
+after its first record, whichever comes first. Callers that need durability
+(readers that scan the file, rotation, shutdown) call :meth:`flush`, which
+blocks until everything submitted before it is on disk.
+
+If the queue is full, :meth:`submit` blocks until the writer thread makes
+room, so records land in submission order — audit records are never dropped
+for backpressure. Once the writer is closed (or its thread has died), records
+are written synchronously on the caller's thread, after anything still
+queued.
+"""
+
+from __future__ import annotations
+
+import atexit
+import fcntl
+import json
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def append_jsonl_lines(path: Path, lines: List[str], fsync: bool = True) -> None:
+    """Append pre-serialized JSONL lines under an exclusive ``flock``.
+
+    ``lines`` must already be newline-terminated. Raises on I/O failure; the
+    callers decide whether that is fatal.
+    """
+    with open(path, 'a') as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            f.write(''.join(lines))
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class _FlushMarker:
+    __slots__ = ("event",)
+
+    def __init__(self):
+        self.event = threading.Event()
+
+
+_STOP = object()
+
+
+class GroupCommitWriter:
+    """Batches JSONL appends for one file onto a background thread."""
+
+    def __init__(self, path: Path, *, max_batch: int = 256,
+                 max_delay: float = 0.05, max_queue: int = 10000,
+                 fsync: bool = True, name: Optional[str] = None):
+        self.path = Path(path)
+        self.max_batch = max(1, int(max_batch))
+        self.max_delay = max(0.0, float(max_delay))
+        self.fsync = fsync
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, int(max_queue)))
+        # Held by the writer thread for the duration of each batch write, and
+        # by callers (rotation) that rewrite the file in place.
+        self._io_lock = threading.Lock()
+        self._closed = False
+        # Counters are bumped from the writer thread and from submitters.
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "records": 0, "batches": 0, "fsyncs": 0, "sync_fallbacks": 0,
+            "backpressure_waits": 0, "write_errors": 0,
+        }
+        self._thread = threading.Thread(
+            target=self._run, name=name or f"jsonl-writer:{self.path.name}", daemon=True,
+        )
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Caller side
+    # ------------------------------------------------------------------
+
+    def submit(self, record: Dict[str, Any]) -> None:
+        """Queue one record. Blocks only while the queue is full.
+
+        With the writer closed or its thread gone, the record is written
+        inline instead, behind whatever is still queued.
+        """
+        line = json.dumps(record) + '\n'
+        waiting = False
+        while not self._closed and self._thread.is_alive():
+            try:
+                if waiting:
+                    # Wake periodically to notice a writer that stopped.
+                    self._queue.put(line, timeout=0.1)
+                else:
+                    self._queue.put_nowait(line)
+                return
+            except queue.Full:
+                if not waiting:
+                    waiting = True
+                    self._bump("backpressure_waits")
+        self._bump("sync_fallbacks")
+        self._write_inline([line])
+
+    def _write_inline(self, lines: List[str]) -> None:
+        """Write queued records, then *lines*, on the caller's thread."""
+        with self._io_lock:
+            pending: List[str] = []
+            markers: List[_FlushMarker] = []
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(item, _FlushMarker):
+                    markers.append(item)
+                elif item is not _STOP:
+                    pending.append(item)
+            pending.extend(lines)
+            try:
+                if pending:
+                    append_jsonl_lines(self.path, pending, fsync=self.fsync)
+            finally:
+                for marker in markers:
+                    marker.event.set()
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until all records submitted so far are written and fsynced.
+
+        Returns False on timeout. With the writer closed or its thread gone,
+        anything still queued is written inline.
+        """
+        if self._closed or not self._thread.is_alive():
+            self._write_inline([])
+            return True
+        marker = _FlushMarker()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.event.wait(timeout)
+
+    @contextmanager
+    def exclusive(self, timeout: Optional[float] = 5.0) -> Iterator[None]:
+        """Flush, then hold the file against the writer thread.
+
+        For callers that rewrite the log in place (rotation). Records
+        submitted meanwhile stay queued and land after the rewrite.
+        """
+        self.flush(timeout)
+        with self._io_lock:
+            yield
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Flush outstanding records and stop the writer thread."""
+        if self._closed:
+            return
+        self.flush(timeout)
+        self._closed = True
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            # Records queued after the stop marker.
+            self._write_inline([])
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        return {**stats, "queued": self._queue.qsize(), "path": str(self.path)}
+
+    def _bump(self, key: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += n
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            lines: List[str] = []
+            markers: List[_FlushMarker] = []
+            stop = False
+            deadline = time.monotonic() + self.max_delay
+            while True:
+                if item is _STOP:
+                    stop = True
+                    break
+                if isinstance(item, _FlushMarker):
+                    # A flush closes the batch immediately so the waiter is
+                    # not held for the rest of max_delay.
+                    markers.append(item)
+                    break
+                lines.append(item)
+                if len(lines) >= self.max_batch:
+                    break
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if lines:
+                self._write_batch(lines)
+            for marker in markers:
+                marker.event.set()
+            if stop:
+                return
+
+    def _write_batch(self, lines: List[str]) -> None:
+        with self._io_lock:
+            for attempt in (1, 2):
+                try:
+                    append_jsonl_lines(self.path, lines, fsync=self.fsync)
+                    with self._stats_lock:
+                        self._stats["records"] += len(lines)
+                        self._stats["batches"] += 1
+                        if self.fsync:
+                            self._stats["fsyncs"] += 1
+                    return
+                except Exception as e:
+                    if attempt == 2:
+                        self._bump("write_errors")
+                        logger.warning(
+                            f"Group-commit write to {self.path} failed, dropped {len(lines)} record(s): {e}"
+                        )
+
+
+def group_commit_enabled() -> bool:
+    """``UNITARES_JSONL_GROUP_COMMIT`` — on by default for the server process."""
+    return os.getenv("UNITARES_JSONL_GROUP_COMMIT", "1").strip().lower() not in ("0", "false", "no")
+
+
+def make_group_commit_writer(path: Path) -> GroupCommitWriter:
+    """Build a writer using the env-configured batch size and delay."""
+    writer = GroupCommitWriter(
+        path,
+        max_batch=int(os.getenv("UNITARES_JSONL_GROUP_COMMIT_MAX_BATCH", "256")),
+        max_delay=float(os.getenv("UNITARES_JSONL_GROUP_COMMIT_MAX_DELAY_MS", "50")) / 1000.0,
+        max_queue=int(os.getenv("UNITARES_JSONL_GROUP_COMMIT_MAX_QUEUE", "10000")),
+    )
+    atexit.register(writer.close)
+    return writer
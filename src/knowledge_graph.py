@@ -14,6 +14,7 @@ from typing import Dict, List, Optional, Literal, Any
 from datetime import datetime, timezone
 import os
 import re
+import sys
 import asyncio
 
 # Import structured logging
@@ -256,6 +257,17 @@ async def get_knowledge_graph() -> Any:
         )
 
 
+def invalidate_rerank_scores(discovery_id: str) -> None:
+    """Drop cached cross-encoder scores for a discovery after a text edit.
+
+    No-op until something has imported src.reranker (no scores cached yet),
+    so storage writes never pay for loading it.
+    """
+    reranker = sys.modules.get("src.reranker")
+    if reranker is not None:
+        reranker.invalidate_discovery(discovery_id)
+
+
 def tag_provenance_source(
     provenance: Optional[Dict[str, Any]],
     source: str,
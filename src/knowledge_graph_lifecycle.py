@@ -289,11 +289,15 @@ class KnowledgeGraphLifecycle:
         coverage here is the cross-corpus answer (compare with list which
         scopes to current epoch by default). Returns None on failure so the
         caller can decide whether to surface or omit.
+
+        ``stale`` counts embeddings whose content_hash no longer matches the
+        discovery text (migration 040); None when the column isn't there.
+        This is also the progress report of src/embedding_backfill.py.
         """
         try:
             from src.db import get_db
             from src.embeddings import get_active_table_name
-            db = await get_db()
+            db = get_db()
             table = get_active_table_name()
             total = await db._pool.fetchval(
                 "SELECT COUNT(*) FROM knowledge.discoveries"
@@ -304,15 +308,26 @@ class KnowledgeGraphLifecycle:
             ) or 0
             without = max(0, total - with_embeddings)
             ratio = round(with_embeddings / total, 4) if total else 0.0
-            return {
-                "with_embeddings": with_embeddings,
-                "without_embeddings": without,
-                "ratio": ratio,
-                "active_table": table,
-            }
         except Exception as exc:
             logger.debug(f"lifecycle embedding coverage probe failed: {exc}")
             return None
+        try:
+            stale = await db._pool.fetchval(
+                f"SELECT COUNT(*) FROM knowledge.discoveries d "
+                f"JOIN {table} e ON e.discovery_id = d.id "
+                f"WHERE e.content_hash IS DISTINCT FROM "
+                f"knowledge.discovery_embedding_hash(d.summary, d.details)"
+            ) or 0
+        except Exception as exc:
+            logger.debug(f"lifecycle stale-embedding probe failed: {exc}")
+            stale = None
+        return {
+            "with_embeddings": with_embeddings,
+            "without_embeddings": without,
+            "stale": stale,
+            "ratio": ratio,
+            "active_table": table,
+        }
 
     async def get_lifecycle_stats(self) -> Dict[str, Any]:
         """Get statistics about discovery lifecycle."""
@@ -13,6 +13,7 @@ from ..utils import success_response, error_response, require_agent_id, require_
 from ..decorators import mcp_tool
 from ..validators import validate_file_path_policy
 from src.logging_utils import get_logger
+from src.fleet_index import forget_agent
 from src.mcp_handlers.shared import lazy_mcp_server as mcp_server
 
 logger = get_logger(__name__)
@@ -423,6 +424,7 @@ async def handle_reset_monitor(arguments: Dict[str, Any]) -> Sequence[TextConten
     
     if agent_id in mcp_server.monitors:
         del mcp_server.monitors[agent_id]
+        forget_agent(agent_id)
         message = f"Monitor reset for agent: {agent_id}"
     else:
         message = f"Monitor not found for agent: {agent_id} (may not be loaded)"
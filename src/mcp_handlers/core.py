@@ -9,6 +9,7 @@ See docs/guides/EISV_COMPLETENESS.md for usage.
 from typing import Dict, Any, Optional, Sequence
 from mcp.types import TextContent
 import json
+import os
 from .types import ToolArgumentsDict
 from .utils import success_response, error_response, require_agent_id
 from .decorators import mcp_tool
@@ -293,6 +294,53 @@ async def handle_simulate_update(arguments: ToolArgumentsDict) -> Sequence[TextC
 
     return success_response(response)
 
+
+def _process_update_error(e: Exception) -> Sequence[TextContent]:
+    """Map an exception escaping the update workflow onto its error response."""
+    if isinstance(e, PermissionError):
+        return [error_response(
+            f"Authentication failed: {str(e)}",
+            details={"error_type": "authentication_error"},
+            recovery={
+                "action": "Provide a valid API key for this agent",
+                "related_tools": ["get_agent_api_key"],
+                "workflow": "1. Use get_agent_api_key to retrieve your key 2. Include api_key in your request"
+            }
+        )]
+    if isinstance(e, ValueError):
+        error_msg = str(e)
+        if "Self-monitoring loop detected" in error_msg:
+            return [error_response(
+                error_msg,
+                details={"error_type": "loop_detected"},
+                recovery={
+                    "action": "Wait for cooldown period to expire before retrying",
+                    "related_tools": ["get_governance_metrics"],
+                    "workflow": "1. Check current agent status 2. Wait for cooldown to expire 3. Retry with different parameters"
+                }
+            )]
+        else:
+            return [error_response(
+                f"Validation error: {error_msg}",
+                details={"error_type": "validation_error"},
+                recovery={
+                    "action": "Check your parameters and try again",
+                    "related_tools": ["health_check"],
+                    "workflow": "1. Verify all parameters are valid 2. Check system health 3. Retry"
+                }
+            )]
+    logger.error(f"Unexpected error in process_agent_update: {e}", exc_info=e)
+    return [error_response(
+        f"An unexpected error occurred: {str(e)}",
+        details={"error_type": "unexpected_error"},
+        recovery={
+            "action": "Check server logs for details. If this persists, try restarting the MCP server",
+            "related_tools": ["health_check", "get_server_info"],
+            "workflow": "1. Check system health 2. Review server logs 3. Restart MCP server if needed"
+        }
+    )]
+
+
 @mcp_tool("process_agent_update", timeout=60.0)
 async def handle_process_agent_update(arguments: ToolArgumentsDict) -> Sequence[TextContent]:
     """Share your work and get feedback. Auto-binds identity on first call.
@@ -326,46 +374,156 @@ async def handle_process_agent_update(arguments: ToolArgumentsDict) -> Sequence[
 
     try:
         return await run_process_update_workflow(ctx, serializer=success_response)
-    except PermissionError as e:
-        return [error_response(
-            f"Authentication failed: {str(e)}",
-            details={"error_type": "authentication_error"},
+    except Exception as e:
+        return _process_update_error(e)
+
+
+DEFAULT_CHECKIN_BATCH_MAX = 100
+
+
+def _checkin_batch_max() -> int:
+    try:
+        return max(1, int(os.getenv("UNITARES_CHECKIN_BATCH_MAX", DEFAULT_CHECKIN_BATCH_MAX)))
+    except ValueError:
+        return DEFAULT_CHECKIN_BATCH_MAX
+
+
+def _batch_item_payload(result: Sequence[TextContent]) -> Dict[str, Any]:
+    """One item's result as a dict for the batch envelope."""
+    from .serialization import structured_payload
+
+    item = result[0]
+    payload = structured_payload(item)
+    if payload is not None:
+        return payload
+    try:
+        return json.loads(item.text)
+    except (TypeError, ValueError):
+        return {"success": False, "error": item.text}
+
+
+async def _prepare_batch_item(item: Any, shared: Dict[str, Any], caller_uuid: Optional[str]):
+    """Validate one check-in and resolve its target agent.
+
+    Returns ``(arguments, agent_uuid, None)`` or ``(None, None, error)``.
+    """
+    from .validators import apply_param_aliases
+    from .middleware.params_step import _bound_identity_aliases, validate_params
+    from .identity.session import extract_token_agent_uuid
+
+    if not isinstance(item, dict):
+        return None, None, error_response(
+            "Each check-in must be an object of process_agent_update arguments",
+            details={"error_type": "validation_error"},
+        )
+    arguments = {**{k: v for k, v in shared.items() if k not in item}, **item}
+    arguments = apply_param_aliases("process_agent_update", arguments)
+    if arguments.get("lite") in (True, "true", "1", 1) and not item.get("response_mode"):
+        arguments["response_mode"] = "minimal"
+    validated = await validate_params("process_agent_update", arguments, None)
+    if isinstance(validated, list):
+        return None, None, validated[0]
+    _, arguments, _ = validated
+
+    # An item for another agent proves that identity with its own token.
+    token = item.get("continuity_token")
+    if token and token != shared.get("continuity_token"):
+        agent_uuid = extract_token_agent_uuid(token)
+        if not agent_uuid:
+            return None, None, error_response(
+                "Invalid continuity_token for batched check-in",
+                details={"error_type": "invalid_continuity_token"},
+                recovery={
+                    "action": "Use the continuity_token returned by that agent's onboard()/identity()",
+                    "related_tools": ["identity", "onboard"],
+                },
+            )
+    else:
+        agent_uuid = caller_uuid
+    if not agent_uuid:
+        return None, None, error_response("Identity not resolved. Try calling identity() first.")
+
+    requested = item.get("agent_id")
+    if requested and str(requested) not in _bound_identity_aliases(agent_uuid):
+        return None, None, error_response(
+            f"Session mismatch: check-in targets '{agent_uuid}' but requested '{requested}'",
+            details={
+                "error_type": "identity_mismatch",
+                "bound_agent_id": agent_uuid,
+                "requested_agent_id": requested,
+            },
             recovery={
-                "action": "Provide a valid API key for this agent",
-                "related_tools": ["get_agent_api_key"],
-                "workflow": "1. Use get_agent_api_key to retrieve your key 2. Include api_key in your request"
-            }
+                "action": "Drop agent_id, or pass the target agent's continuity_token",
+                "related_tools": ["identity"],
+            },
+        )
+    return arguments, agent_uuid, None
+
+
+@mcp_tool("process_agent_updates_batch", timeout=120.0)
+async def handle_process_agent_updates_batch(arguments: ToolArgumentsDict) -> Sequence[TextContent]:
+    """Submit several check-ins at once, for one agent or several.
+
+    Args:
+        checkins: List of process_agent_update argument objects. Items for
+            another agent carry that agent's continuity_token.
+        response_mode: Default response mode for items that omit one
+
+    Top-level arguments other than checkins/agent_id apply to every item
+    that does not set them. Check-ins for one agent are applied in list order
+    under a single lock; results come back in submission order.
+    """
+    from .updates.context import UpdateContext
+    from .context import get_context_agent_id
+    from src.services.update_workflow_service import run_process_update_batch
+    import src.mcp_handlers.updates.enrichments  # noqa: F401 — triggers registration
+
+    checkins = arguments.get("checkins")
+    if not isinstance(checkins, list) or not checkins:
+        return [error_response(
+            "checkins must be a non-empty list of check-in objects",
+            details={"error_type": "validation_error"},
         )]
-    except ValueError as e:
-        error_msg = str(e)
-        if "Self-monitoring loop detected" in error_msg:
-            return [error_response(
-                error_msg,
-                details={"error_type": "loop_detected"},
-                recovery={
-                    "action": "Wait for cooldown period to expire before retrying",
-                    "related_tools": ["get_governance_metrics"],
-                    "workflow": "1. Check current agent status 2. Wait for cooldown to expire 3. Retry with different parameters"
-                }
-            )]
-        else:
-            return [error_response(
-                f"Validation error: {error_msg}",
-                details={"error_type": "validation_error"},
-                recovery={
-                    "action": "Check your parameters and try again",
-                    "related_tools": ["health_check"],
-                    "workflow": "1. Verify all parameters are valid 2. Check system health 3. Retry"
-                }
-            )]
-    except Exception as e:
-        logger.error(f"Unexpected error in process_agent_update: {e}", exc_info=True)
+    batch_max = _checkin_batch_max()
+    if len(checkins) > batch_max:
         return [error_response(
-            f"An unexpected error occurred: {str(e)}",
-            details={"error_type": "unexpected_error"},
-            recovery={
-                "action": "Check server logs for details. If this persists, try restarting the MCP server",
-                "related_tools": ["health_check", "get_server_info"],
-                "workflow": "1. Check system health 2. Review server logs 3. Restart MCP server if needed"
-            }
+            f"Too many check-ins in one batch ({len(checkins)} > {batch_max})",
+            details={"error_type": "validation_error", "max_checkins": batch_max},
+            recovery={"action": f"Split the batch into chunks of at most {batch_max}"},
         )]
+
+    shared = {
+        k: v for k, v in arguments.items()
+        if k not in ("checkins", "agent_id") and v is not None
+    }
+    caller_uuid = get_context_agent_id()
+
+    items: list = [None] * len(checkins)
+    contexts = []
+    positions = []
+    for i, item in enumerate(checkins):
+        item_args, agent_uuid, error = await _prepare_batch_item(item, shared, caller_uuid)
+        if error is not None:
+            items[i] = _batch_item_payload([error])
+            continue
+        ctx = UpdateContext(arguments=item_args, mcp_server=mcp_server)
+        ctx.agent_uuid = agent_uuid
+        contexts.append(ctx)
+        positions.append(i)
+
+    if contexts:
+        results = await run_process_update_batch(
+            contexts,
+            serializer=success_response,
+            on_error=_process_update_error,
+        )
+        for i, result in zip(positions, results):
+            items[i] = _batch_item_payload(result)
+
+    succeeded = sum(1 for item in items if item.get("success"))
+    return success_response({
+        "results": items,
+        "count": len(items),
+        "succeeded": succeeded,
+        "failed": len(items) - succeeded,
+    }, arguments=arguments)
@@ -897,6 +897,7 @@ async def handle_search_knowledge_graph(arguments: Dict[str, Any]) -> Sequence[T
             graph_expansion_enabled as _graph_expansion_enabled,
             rrf_fuse,
             apply_tag_boost,
+            collect_seed_neighbors,
             expand_with_neighbors,
         )
         hybrid_on = _hybrid_enabled()
@@ -980,8 +981,12 @@ async def handle_search_knowledge_graph(arguments: Dict[str, Any]) -> Sequence[T
                 import asyncio as _asyncio
                 min_similarity = arguments.get("min_similarity", 0.3)
                 hybrid_fetch_limit = max(first_stage_limit, 50)
+                # Metadata filters are pushed into the vector query; tags stay
+                # out — in hybrid mode they are an RRF boost, not a filter.
                 sem_task = graph.semantic_search(
-                    str(query_text), limit=hybrid_fetch_limit, min_similarity=min_similarity
+                    str(query_text), limit=hybrid_fetch_limit, min_similarity=min_similarity,
+                    agent_id=agent_id, discovery_type=dtype, severity=severity, status=status,
+                    exclude_archived=not status and not include_archived,
                 )
                 # Hybrid uses the caller's operator if forced, else AND. We
                 # don't AND→OR fallback inside hybrid because semantic+FTS
@@ -1015,23 +1020,15 @@ async def handle_search_knowledge_graph(arguments: Dict[str, Any]) -> Sequence[T
                     doc_tags_map = {doc_id: (doc.tags or []) for doc_id, doc in pool.items()}
                     fused = apply_tag_boost(fused, doc_tags_map, tags)
 
-                # Phase 5: 1-hop graph expansion. Top seeds pull their typed-edge
-                # neighbors (related_to / responses_from / response_to) into the
-                # pool at a discounted score.
+                # Phase 5: graph expansion. Top seeds pull their typed-edge
+                # neighbors into the pool at a discounted score — from the
+                # in-memory edge index when the backend has one loaded, else
+                # from the seed docs' related_to / responses_from / response_to.
                 if graph_expand_on:
-                    seed_neighbors: Dict[str, set] = {}
-                    for seed_id, _ in fused[:10]:
-                        seed_doc = pool.get(seed_id)
-                        if seed_doc is None:
-                            continue
-                        nbrs: set = set()
-                        nbrs.update(seed_doc.related_to or [])
-                        nbrs.update(getattr(seed_doc, "responses_from", None) or [])
-                        if seed_doc.response_to:
-                            nbrs.add(seed_doc.response_to.discovery_id)
-                        nbrs.discard(seed_id)
-                        seed_neighbors[seed_id] = nbrs
-
+                    seed_neighbors = collect_seed_neighbors(
+                        [seed_id for seed_id, _ in fused[:10]], pool,
+                        edge_index=getattr(graph, "edge_index", None),
+                    )
                     fused = expand_with_neighbors(
                         fused, seed_neighbors, edge_weight=0.5, max_seeds=10,
                     )
@@ -1071,7 +1068,13 @@ async def handle_search_knowledge_graph(arguments: Dict[str, Any]) -> Sequence[T
                 semantic_results = await graph.semantic_search(
                     str(query_text),
                     limit=first_stage_limit,  # wider pool when reranker is on
-                    min_similarity=min_similarity
+                    min_similarity=min_similarity,
+                    agent_id=agent_id,
+                    discovery_type=dtype,
+                    severity=severity,
+                    status=status,
+                    tags=tags,
+                    exclude_archived=not status and not include_archived,
                 )
                 # Check for degraded response: ([], error_info_dict)
                 if (isinstance(semantic_results, tuple) and len(semantic_results) == 2
@@ -14,6 +14,7 @@ from src import agent_storage
 from src.logging_utils import get_logger
 from src.cache import get_metadata_cache
 from src.agent_metadata_model import AgentMetadata
+from src.fleet_index import forget_agent
 from ..utils import error_response
 
 logger = get_logger(__name__)
@@ -115,6 +116,7 @@ async def _archive_one_agent(
     meta.add_lifecycle_event("archived", reason)
     if monitors is not None and agent_id in monitors:
         del monitors[agent_id]
+    forget_agent(agent_id)
     return True
 
 
@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 
 from src import agent_storage
 from src.mcp_handlers.shared import lazy_mcp_server as mcp_server
+from src.fleet_index import forget_agent
 from ..utils import (
     require_registered_agent,
     success_response,
@@ -344,6 +345,7 @@ async def handle_delete_agent(arguments: Dict[str, Any]) -> Sequence[TextContent
     # Remove from monitors
     if agent_id in mcp_server.monitors:
         del mcp_server.monitors[agent_id]
+    forget_agent(agent_id)
 
     # PostgreSQL: Delete agent (single source of truth)
     try:
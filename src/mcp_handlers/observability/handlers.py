@@ -11,11 +11,39 @@ from ..decorators import mcp_tool
 from src.logging_utils import get_logger
 from src.mcp_handlers.shared import lazy_mcp_server as mcp_server
 from src.agent_monitor_state import ensure_hydrated
+from src.fleet_index import FleetIndex, fleet_index, fleet_index_enabled
 logger = get_logger(__name__)
 
 # Import from mcp_server_std module (using shared utility)
 
 
+def _metrics_index() -> FleetIndex:
+    """The shared fleet index, or a per-call one when UNITARES_FLEET_INDEX is off."""
+    return fleet_index if fleet_index_enabled() else FleetIndex(capacity=64)
+
+
+async def _index_missing(index: FleetIndex, agent_ids) -> None:
+    """Add rows for agents the index hasn't seen since startup, from their monitors.
+
+    Only agents with no committed update (or hydration) since the server
+    started take this path, once each; everyone else is read from the index.
+    """
+    from src.governance_monitor import UNITARESMonitor
+    loop = asyncio.get_running_loop()
+    for agent_id in agent_ids:
+        if agent_id in index:
+            continue
+        monitor = mcp_server.monitors.get(agent_id)
+        if monitor is None:
+            # Load monitor state (non-blocking)
+            persisted_state = await loop.run_in_executor(None, mcp_server.load_monitor_state, agent_id)
+            if persisted_state:
+                monitor = UNITARESMonitor(agent_id, load_state=False)
+                monitor.state = persisted_state
+        if monitor:
+            index.record(agent_id, monitor.get_metrics(include_state=False), monitor.state)
+
+
 def _agent_display_name(agent_id: str) -> str | None:
     """Best-effort display label for event payloads."""
     meta = mcp_server.agent_metadata.get(agent_id)
@@ -169,7 +197,6 @@ async def handle_observe_agent(arguments: Dict[str, Any]) -> Sequence[TextConten
 @mcp_tool("compare_agents", timeout=15.0, register=False)
 async def handle_compare_agents(arguments: Dict[str, Any]) -> Sequence[TextContent]:
     """Compare governance patterns across multiple agents"""
-    from src.governance_monitor import UNITARESMonitor
     # Was force=True with a "non-blocking" comment that was wrong — the
     # implementation does 3221 sequential per-agent cache.set awaits
     # (~16s per call). Drop force; in-memory cache is fresh enough for
@@ -190,8 +217,7 @@ async def handle_compare_agents(arguments: Dict[str, Any]) -> Sequence[TextConte
     
     compare_metrics = arguments.get("compare_metrics") or ["risk_score", "coherence", "E", "I", "S", "V"]
     
-    # Get metrics for all agents
-    agents_data = []
+    resolved_ids = []
     for agent_id in agent_ids:
         # Resolve label to UUID if needed (consistent with observe_agent)
         try:
@@ -202,49 +228,45 @@ async def handle_compare_agents(arguments: Dict[str, Any]) -> Sequence[TextConte
                     agent_id = resolved
         except Exception:
             pass  # Use agent_id as-is
+        resolved_ids.append(agent_id)
 
-        monitor = mcp_server.monitors.get(agent_id)
-        if monitor is None:
-            # Load monitor state (non-blocking)
-            loop = asyncio.get_running_loop()
-            persisted_state = await loop.run_in_executor(None, mcp_server.load_monitor_state, agent_id)
-            if persisted_state:
-                monitor = UNITARESMonitor(agent_id, load_state=False)
-                monitor.state = persisted_state
-        
-        if monitor:
-            metrics = monitor.get_metrics()
-            
-            # Calculate health_status consistently with process_agent_update
-            # Use health_checker.get_health_status() instead of metrics.get("status")
-            risk_score = metrics.get("risk_score") or metrics.get("current_risk")
-            coherence = float(monitor.state.coherence) if monitor.state else None
-            void_active = bool(monitor.state.void_active) if monitor.state else False
-            
-            health_status_obj, _ = mcp_server.health_checker.get_health_status(
-                risk_score=risk_score,
-                coherence=coherence,
-                void_active=void_active
-            )
-            
-            # Guard against None values for agents with 0 updates
-            # dict.get default is only used when key is ABSENT; if key exists with value=None, it returns None
-            _risk = metrics.get("risk_score") or metrics.get("current_risk") or metrics.get("mean_risk") or 0.0
-            _state = monitor.state
-            agents_data.append({
-                "agent_id": agent_id,
-                "current_risk": metrics.get("current_risk"),  # Recent trend (last 10) - USED FOR HEALTH STATUS
-                "risk_score": float(_risk),  # Governance/operational risk
-                "phi": metrics.get("phi"),  # Primary physics signal
-                "verdict": metrics.get("verdict"),  # Primary governance signal
-                "mean_risk": metrics.get("mean_risk") or 0.0,  # Overall mean (all-time average) - for historical context
-                "coherence": float(_state.coherence if _state and _state.coherence is not None else 0.5),
-                "E": float(_state.E if _state and _state.E is not None else 0.5),
-                "I": float(_state.I if _state and _state.I is not None else 0.5),
-                "S": float(_state.S if _state and _state.S is not None else 0.5),
-                "V": float(_state.V if _state and _state.V is not None else 0.0),
-                "health_status": health_status_obj.value  # Use consistent calculation
-            })
+    # Get metrics for all agents from the fleet index
+    index = _metrics_index()
+    await _index_missing(index, resolved_ids)
+    rows = index.rows(resolved_ids)
+
+    agents_data = []
+    for agent_id in resolved_ids:
+        row = rows.get(agent_id)
+        if row is None:
+            continue
+
+        # Calculate health_status consistently with process_agent_update
+        # Use health_checker.get_health_status() instead of metrics.get("status")
+        # gate_risk is risk_score, falling back to current_risk
+        health_status_obj, _ = mcp_server.health_checker.get_health_status(
+            risk_score=row["gate_risk"],
+            coherence=row["coherence"],
+            void_active=row["void_active"]
+        )
+
+        # Guard against None values for agents with 0 updates
+        _risk = row["gate_risk"] or row["mean_risk"] or 0.0
+        _ode = {dim: row[f"ode_{dim}"] for dim in "EISV"}
+        agents_data.append({
+            "agent_id": agent_id,
+            "current_risk": row["current_risk"],  # Recent trend (last 10) - USED FOR HEALTH STATUS
+            "risk_score": float(_risk),  # Governance/operational risk
+            "phi": row["phi"],  # Primary physics signal
+            "verdict": row["verdict"],  # Primary governance signal
+            "mean_risk": row["mean_risk"] or 0.0,  # Overall mean (all-time average) - for historical context
+            "coherence": float(row["coherence"] if row["coherence"] is not None else 0.5),
+            "E": float(_ode["E"] if _ode["E"] is not None else 0.5),
+            "I": float(_ode["I"] if _ode["I"] is not None else 0.5),
+            "S": float(_ode["S"] if _ode["S"] is not None else 0.5),
+            "V": float(_ode["V"] if _ode["V"] is not None else 0.0),
+            "health_status": health_status_obj.value  # Use consistent calculation
+        })
     
     if len(agents_data) < 2:
         return [error_response(
@@ -342,64 +364,63 @@ async def handle_compare_me_to_similar(arguments: Dict[str, Any]) -> Sequence[Te
     my_regime = my_metrics.get('regime', 'nominal')
     my_total_updates = my_meta.total_updates if my_meta else 0
     
-    # Find similar agents (similar EISV values)
-    similar_agents = []
-    similarity_threshold = arguments.get("similarity_threshold", 0.15)  # Within 15% on each metric
-    
+    # Find similar agents (similar EISV values). Cohort rows come from the
+    # fleet index; only agents it hasn't seen since startup are hydrated here.
+    index = _metrics_index()
     for other_id, other_meta in mcp_server.agent_metadata.items():
-        if other_id == agent_id or other_meta.status not in ["active", "waiting_input"]:
+        if other_id == agent_id or other_id in index or other_meta.status not in ["active", "waiting_input"]:
             continue
-        
         try:
             other_monitor = mcp_server.get_or_create_monitor(other_id)
             await ensure_hydrated(other_monitor, other_id)
-            other_metrics = other_monitor.get_metrics()
-
-            other_E = float(other_metrics.get('E', 0.7))
-            other_I = float(other_metrics.get('I', 0.8))
-            other_S = float(other_metrics.get('S', 0.2))
-            other_coherence = float(other_metrics.get('coherence', 0.5))
-            
-            # Calculate similarity (Euclidean distance in EISV space)
-            E_diff = abs(my_E - other_E)
-            I_diff = abs(my_I - other_I)
-            S_diff = abs(my_S - other_S)
-            coherence_diff = abs(my_coherence - other_coherence)
-            
-            # Similar if within threshold on all metrics
-            if (E_diff <= similarity_threshold and 
-                I_diff <= similarity_threshold and 
-                S_diff <= similarity_threshold):
-                
-                similarity_score = 1.0 - ((E_diff + I_diff + S_diff + coherence_diff) / 4.0)
-                similar_agents.append({
-                    "agent_id": other_id,
-                    "similarity_score": similarity_score,
-                    "metrics": {
-                        "E": other_E,
-                        "I": other_I,
-                        "S": other_S,
-                        "coherence": other_coherence,
-                        "phi": other_metrics.get('phi', 0.0),
-                        "verdict": other_metrics.get('verdict', 'caution'),
-                        "risk_score": other_metrics.get('risk_score', 0.4)
-                    },
-                    "differences": {
-                        "E": other_E - my_E,
-                        "I": other_I - my_I,
-                        "S": other_S - my_S,
-                        "coherence": other_coherence - my_coherence
-                    },
-                    "total_updates": other_meta.total_updates,
-                    "status": other_meta.status
-                })
+            index.record(other_id, other_monitor.get_metrics(include_state=False), other_monitor.state)
         except Exception as e:
-            logger.debug(f"Could not compare with agent {other_id}: {e}")
+            logger.debug(f"Could not index agent {other_id}: {e}")
+
+    similar_agents = []
+    similar_regimes = {}
+    similarity_threshold = arguments.get("similarity_threshold", 0.15)  # Within 15% on each metric
+
+    # Similar if within threshold on E, I and S; the score also counts coherence
+    matches = index.range_query(
+        {"E": my_E, "I": my_I, "S": my_S, "coherence": my_coherence},
+        {"E": similarity_threshold, "I": similarity_threshold, "S": similarity_threshold},
+        dims=("E", "I", "S", "coherence"),
+        exclude=[agent_id],
+    )
+    for other_id, mean_diff in matches:
+        other_meta = mcp_server.agent_metadata.get(other_id)
+        if other_meta is None or other_meta.status not in ["active", "waiting_input"]:
             continue
-    
-    # Sort by similarity score (highest first)
-    similar_agents.sort(key=lambda x: x["similarity_score"], reverse=True)
-    
+        row = index.get(other_id)
+        if row is None:
+            continue
+        other_E, other_I, other_S, other_coherence = row["E"], row["I"], row["S"], row["coherence"]
+        similar_agents.append({
+            "agent_id": other_id,
+            "similarity_score": 1.0 - mean_diff,
+            "metrics": {
+                "E": other_E,
+                "I": other_I,
+                "S": other_S,
+                "coherence": other_coherence,
+                "phi": row["phi"] if row["phi"] is not None else 0.0,
+                "verdict": row["verdict"] or 'caution',
+                "risk_score": row["risk_score"] if row["risk_score"] is not None else 0.4
+            },
+            "differences": {
+                "E": other_E - my_E,
+                "I": other_I - my_I,
+                "S": other_S - my_S,
+                "coherence": other_coherence - my_coherence
+            },
+            "total_updates": other_meta.total_updates,
+            "status": other_meta.status
+        })
+        similar_regimes[other_id] = row["regime"] or 'nominal'
+        if len(similar_agents) == 3:
+            break
+
     # Take top 3 most similar
     top_similar = similar_agents[:3]
     
@@ -457,20 +478,8 @@ async def handle_compare_me_to_similar(arguments: Dict[str, Any]) -> Sequence[Te
     if most_common_verdict and verdict_counts[most_common_verdict] == len(all_verdicts):
         pattern_insights.append(f"All similar agents share '{most_common_verdict}' verdict - this is a common pattern")
     
-    # Check for regime patterns. The similarity loop above already
-    # hydrated each candidate's monitor via ensure_hydrated; reuse from
-    # mcp_server.monitors instead of re-hydrating.
-    all_regimes = []
-    for similar in top_similar:
-        try:
-            other_monitor = mcp_server.monitors.get(similar["agent_id"])
-            if other_monitor is None:
-                continue
-            other_metrics = other_monitor.get_metrics()
-            regime = other_metrics.get('regime', 'nominal')
-            all_regimes.append(regime)
-        except Exception:
-            pass
+    # Check for regime patterns
+    all_regimes = [similar_regimes[similar["agent_id"]] for similar in top_similar]
     all_regimes.append(my_regime)
     if all_regimes:
         regime_counts = {}
@@ -726,9 +735,6 @@ async def handle_detect_anomalies(arguments: Dict[str, Any]) -> Sequence[TextCon
 @mcp_tool("aggregate_metrics", timeout=15.0, register=False)
 async def handle_aggregate_metrics(arguments: Dict[str, Any]) -> Sequence[TextContent]:
     """Get fleet-level health overview"""
-    from src.governance_monitor import UNITARESMonitor
-    import numpy as np
-
     # Wave 0 follow-up: was force=True, comment claimed "non-blocking" but
     # the implementation blocks ~16s per call (3221 sequential awaits on
     # metadata_cache.set in the loader). Same anti-pattern as the prior
@@ -744,73 +750,57 @@ async def handle_aggregate_metrics(arguments: Dict[str, Any]) -> Sequence[TextCo
     if not agent_ids:
         agent_ids = [aid for aid, meta in mcp_server.agent_metadata.items() if meta.status == "active"]
     
-    # Aggregate metrics
+    # Aggregate metrics from the fleet index
+    index = _metrics_index()
+    await _index_missing(index, agent_ids)
+    fleet = index.aggregate(agent_ids)
+
     total_agents = len(agent_ids)
-    agents_with_data = 0
-    total_updates = 0
-    risk_scores = []  # Governance/operational risk scores
-    coherence_scores = []
+    agents_with_data = fleet["agents"]
+    # Governance/operational risk: one risk_score per agent, or its last 10
+    # risk_history entries when risk_score is not available
+    mean_risk_score = fleet["risk_sum"] / fleet["risk_n"] if fleet["risk_n"] else 0.0
+
+    # Aggregate health status
     health_statuses = {"healthy": 0, "moderate": 0, "critical": 0, "unknown": 0}
-    decision_counts = {"proceed": 0, "pause": 0}  # Two-tier system (backward compat: approve/reflect/reject mapped)
-    verdict_counts = {"safe": 0, "caution": 0, "high-risk": 0}  # Behavioral verdict distribution
-    
-    for agent_id in agent_ids:
-        monitor = mcp_server.monitors.get(agent_id)
-        if monitor is None:
-            # Load monitor state (non-blocking)
-            loop = asyncio.get_running_loop()
-            persisted_state = await loop.run_in_executor(None, mcp_server.load_monitor_state, agent_id)
-            if persisted_state:
-                monitor = UNITARESMonitor(agent_id, load_state=False)
-                monitor.state = persisted_state
-        
-        if monitor:
-            agents_with_data += 1
-            metrics = monitor.get_metrics()
-            
-            # Aggregate risk_score and coherence
-            risk_score = metrics.get("risk_score") or metrics.get("current_risk")
-            if risk_score is not None:
-                risk_scores.append(float(risk_score))
-            elif monitor.state.risk_history:
-                # Fallback to risk_history if risk_score not available
-                history_values = [float(r) for r in monitor.state.risk_history[-10:]]  # Last 10 updates
-                risk_scores.extend(history_values)
-            coherence_scores.append(float(monitor.state.coherence))
-            
-            # Aggregate health status
-            status = metrics.get("status", "unknown")
-            health_statuses[status] = health_statuses.get(status, 0) + 1
-            
-            # Aggregate decisions
-            decision_stats = metrics.get("decision_statistics", {})
-            # Map old decisions to new system
-            proceed_count = decision_stats.get("proceed", 0) + decision_stats.get("approve", 0) + decision_stats.get("reflect", 0) + decision_stats.get("revise", 0)
-            pause_count = decision_stats.get("pause", 0) + decision_stats.get("reject", 0)
-            decision_counts["proceed"] += proceed_count
-            decision_counts["pause"] += pause_count
-            # Backward compatibility (keep old keys for compatibility)
-            decision_counts["approve"] = decision_stats.get("approve", 0)
-            decision_counts["reflect"] = decision_stats.get("reflect", 0) + decision_stats.get("revise", 0)
-            decision_counts["reject"] = decision_stats.get("reject", 0)
-            
-            # Aggregate verdict distribution from metrics
-            verdict = metrics.get("verdict")
-            if verdict and verdict in verdict_counts:
-                verdict_counts[verdict] += 1
+    for status, count in fleet["status"].items():
+        health_statuses[status] = health_statuses.get(status, 0) + count
+    health_statuses["unknown"] += fleet["status_unset"]
+
+    # Aggregate decisions
+    # Two-tier system (backward compat: approve/reflect/reject mapped)
+    decision_stats = fleet["decisions"]
+    decision_counts = {
+        "proceed": decision_stats["proceed"] + decision_stats["approve"] + decision_stats["reflect"] + decision_stats["revise"],
+        "pause": decision_stats["pause"] + decision_stats["reject"],
+    }
+    last_stats = fleet["last_decisions"]
+    if last_stats:
+        # Backward compatibility (keep old keys for compatibility)
+        decision_counts["approve"] = last_stats["approve"]
+        decision_counts["reflect"] = last_stats["reflect"] + last_stats["revise"]
+        decision_counts["reject"] = last_stats["reject"]
+
+    # Behavioral verdict distribution
+    verdict_counts = {"safe": 0, "caution": 0, "high-risk": 0}
+    for verdict, count in fleet["verdict"].items():
+        if verdict in verdict_counts:
+            verdict_counts[verdict] += count
+
+    # Count total updates — prefer meta.total_updates (Postgres-backed)
+    total_updates = 0
+    for agent_id in fleet["indexed"]:
+        meta = mcp_server.agent_metadata.get(agent_id)
+        total_updates += meta.total_updates if meta else fleet["update_counts"][agent_id]
 
-            # Count total updates — prefer meta.total_updates (Postgres-backed)
-            meta = mcp_server.agent_metadata.get(agent_id)
-            total_updates += meta.total_updates if meta else monitor.state.update_count
-    
     # Compute aggregate statistics
     aggregate_data = {
         "total_agents": total_agents,
         "agents_with_data": agents_with_data,
         "total_updates": total_updates,
-        "mean_risk_score": float(np.mean(risk_scores)) if risk_scores else 0.0,  # Governance/operational risk (mean)
-        "mean_risk": float(np.mean(risk_scores)) if risk_scores else 0.0,  # DEPRECATED: Use mean_risk_score instead
-        "mean_coherence": float(np.mean(coherence_scores)) if coherence_scores else 0.0,
+        "mean_risk_score": float(mean_risk_score),  # Governance/operational risk (mean)
+        "mean_risk": float(mean_risk_score),  # DEPRECATED: Use mean_risk_score instead
+        "mean_coherence": fleet["coherence_mean"],
         "decision_distribution": {
             **decision_counts,
             "total": sum(decision_counts.values())
@@ -113,9 +113,11 @@ def success_response(data: Dict[str, Any], agent_id: str = None, arguments: Dict
             "note": "Your parameters were auto-corrected. Use native types (e.g., 0.5 not '0.5') to avoid coercion."
         }
 
+    payload = None
     try:
         serializable_response = _ser._make_json_serializable(response)
-        json_text = json.dumps(serializable_response, ensure_ascii=False)
+        json_text = _ser.dumps_json(serializable_response)
+        payload = serializable_response
     except (TypeError, ValueError) as e:
         logger.error(f"JSON serialization error: {e}", exc_info=True)
         try:
@@ -134,6 +136,9 @@ def success_response(data: Dict[str, Any], agent_id: str = None, arguments: Dict
                 logger.critical(f"Even minimal response failed: {e3}", exc_info=True)
                 json_text = '{"success":false,"error":"Serialization failed"}'
 
+    if payload is not None:
+        # Carries the payload so HTTP/FastMCP need not parse json_text back.
+        return [_ser.StructuredTextContent.from_payload(payload, json_text)]
     return [TextContent(
         type="text",
         text=json_text
@@ -23,6 +23,90 @@ def _copy_passthrough_fields(response_data: dict, result: dict, fields: tuple) -
         if value is not None:
             result[field] = value
 
+# Response keys each filtered mode reads from the enriched response_data.
+# None = the mode keeps everything. Used to plan which enrichments are worth
+# running before the pipeline starts (see run_enrichment_pipeline(fields=...)).
+_COMMON_FIELDS = frozenset({
+    "thread_context", "identity_assurance", "_identity_notifications",
+    "prediction_id", "warnings",
+})
+MODE_FIELDS: Dict[str, Optional[frozenset]] = {
+    "full": None,
+    "standard": _COMMON_FIELDS | {"agent_id", "status", "decision", "metrics", "history"},
+    "mirror": _COMMON_FIELDS | {
+        "decision", "metrics", "trajectory_identity", "_mirror_signals",
+        "_mirror_kg_results", "_mirror_question", "_mirror_reflection",
+        "confidence_reliability", "learning_context", "continuity",
+        "calibration_feedback", "restorative", "relevant_discoveries",
+    },
+    "minimal": _COMMON_FIELDS | {"decision", "metrics", "trajectory_identity"},
+    "compact": _COMMON_FIELDS | {
+        "agent_id", "status", "health_status", "health_message", "decision",
+        "metrics", "trajectory_identity",
+    },
+}
+MODE_FIELDS["interpreted"] = MODE_FIELDS["standard"]
+MODE_FIELDS["lite"] = MODE_FIELDS["compact"]
+
+
+def has_sensor_data(arguments: dict) -> bool:
+    """True if the check-in carries sensor_data (embodied agent)."""
+    if arguments.get("sensor_data"):
+        return True
+    params_raw = arguments.get("parameters", [])
+    if isinstance(params_raw, list):
+        for p in params_raw:
+            if isinstance(p, dict) and p.get("key") == "sensor_data":
+                return True
+    return False
+
+
+def resolve_response_mode(response_data: dict, arguments: dict, *, meta: Any = None) -> str:
+    """Resolve the concrete response mode (auto resolved against health_status).
+
+    Priority: per-call response_mode > agent preferences > env var > auto.
+    Only needs the pre-enrichment response (metrics/status) and arguments,
+    so it can run before the enrichment pipeline.
+    """
+    agent_verbosity_pref = None
+    if meta and hasattr(meta, 'preferences') and meta.preferences:
+        agent_verbosity_pref = meta.preferences.get("verbosity")
+
+    response_mode = (
+        arguments.get("response_mode") or
+        agent_verbosity_pref or
+        os.getenv("UNITARES_PROCESS_UPDATE_RESPONSE_MODE", "auto")
+    ).strip().lower()
+
+    # AUTO MODE: Adaptive verbosity based on health status
+    if response_mode == "auto":
+        metrics = response_data.get("metrics", {}) if isinstance(response_data.get("metrics"), dict) else {}
+        health_status = (
+            response_data.get("health_status") or
+            metrics.get("health_status") or
+            response_data.get("status") or
+            "healthy"
+        )
+        # Auto-select mirror for disembodied agents (no sensor_data)
+        sensor_data = response_data.get("_has_sensor_data")
+        if sensor_data is None:
+            sensor_data = has_sensor_data(arguments)
+        if health_status == "healthy" and not sensor_data:
+            response_mode = "mirror"
+        elif health_status == "healthy":
+            response_mode = "minimal"
+        elif health_status in ("at_risk", "critical"):
+            response_mode = "standard"
+        else:
+            response_mode = "compact"
+    return response_mode
+
+
+def fields_for_mode(response_mode: str) -> Optional[frozenset]:
+    """Response keys *response_mode* keeps, or None if it keeps everything."""
+    return MODE_FIELDS.get(response_mode)
+
+
 def format_response(
     response_data: dict,
     arguments: dict,
@@ -32,6 +116,7 @@ def format_response(
     key_was_generated: bool = False,
     api_key_auto_retrieved: bool = False,
     task_type: str = "mixed",
+    response_mode: Optional[str] = None,
 ) -> dict:
     """
     Apply response mode filtering to fully-built response_data.
@@ -53,6 +138,9 @@ def format_response(
         key_was_generated: Whether an API key was just generated
         api_key_auto_retrieved: Whether an API key was auto-retrieved
         task_type: Task type for state interpretation
+        response_mode: Mode already resolved by resolve_response_mode (the
+            workflow resolves it before enrichment planning); resolved here
+            when omitted
 
     Returns:
         Filtered response_data dict
@@ -69,12 +157,8 @@ def format_response(
     except Exception:
         pass
 
-    # Priority: per-call > agent pref > env var > auto
-    response_mode = (
-        arguments.get("response_mode") or
-        agent_verbosity_pref or
-        os.getenv("UNITARES_PROCESS_UPDATE_RESPONSE_MODE", "auto")
-    ).strip().lower()
+    if response_mode is None:
+        response_mode = resolve_response_mode(response_data, arguments, meta=meta)
 
     using_default_mode = not arguments.get("response_mode") and not agent_verbosity_pref
 
@@ -82,26 +166,6 @@ def format_response(
     if response_mode == "full":
         return response_data
 
-    # AUTO MODE: Adaptive verbosity based on health status
-    if response_mode == "auto":
-        metrics = response_data.get("metrics", {}) if isinstance(response_data.get("metrics"), dict) else {}
-        health_status = (
-            response_data.get("health_status") or
-            metrics.get("health_status") or
-            response_data.get("status") or
-            "healthy"
-        )
-        # Auto-select mirror for disembodied agents (no sensor_data)
-        has_sensor_data = response_data.get("_has_sensor_data", False)
-        if health_status == "healthy" and not has_sensor_data:
-            response_mode = "mirror"
-        elif health_status == "healthy":
-            response_mode = "minimal"
-        elif health_status in ("at_risk", "critical"):
-            response_mode = "standard"
-        else:
-            response_mode = "compact"
-
     # MIRROR MODE: Actionable self-awareness signals
     if response_mode == "mirror":
         response_data = _format_mirror(response_data, saved_trust_tier, meta=meta)
@@ -266,6 +266,26 @@ class ProcessAgentUpdateParams(AgentIdentityMixin):
         return self
 
 
+class ProcessAgentUpdatesBatchParams(AgentIdentityMixin):
+    """
+    Submit several check-ins in one call, for one agent or several. Returns per-item verdicts in order.
+    """
+    checkins: List[Dict[str, Any]] = Field(
+        ...,
+        min_length=1,
+        description=(
+            "Check-ins to apply, each with process_agent_update's arguments "
+            "(response_text, complexity, confidence, task_type, ...). An item for "
+            "another agent carries that agent's continuity_token. Check-ins for the "
+            "same agent are applied in list order."
+        ),
+    )
+    response_mode: Literal["minimal", "compact", "standard", "full", "mirror", "auto"] = Field(
+        default="compact",
+        description="Default response verbosity for items that do not set their own."
+    )
+
+
 class OutcomeEventParams(AgentIdentityMixin):
     """Parameters for outcome_event"""
     outcome_type: Literal["drawing_completed", "drawing_abandoned", "test_passed", "test_failed", "tool_rejected", "task_completed", "task_failed", "trajectory_validated", "dialectic_resolved"] = Field(..., description="Type of outcome event")
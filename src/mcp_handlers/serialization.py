@@ -1,8 +1,118 @@
-"""JSON serialization utilities for MCP responses."""
-from typing import Any
+"""JSON serialization utilities for MCP responses.
+
+Handlers return ``[TextContent]`` whose text is the JSON-encoded response.
+``success_response`` returns a :class:`StructuredTextContent` instead, which
+also carries the already-serializable payload, so transports that want the
+object (the REST ``/v1/tools/call`` route, FastMCP structured output) use it
+directly rather than ``json.loads``-ing the text they were just handed.
+
+``UNITARES_JSON_ENCODER`` selects the encoder behind :func:`dumps_json`:
+``stdlib`` (default) or ``orjson``. orjson output is compact (no spaces after
+separators) and emits NaN/Infinity as ``null``; anything it rejects falls back
+to the stdlib encoder. The stdlib MCP text keeps its ``NaN`` literals; HTTP
+bodies are always strict JSON (``dumps_json_bytes(..., strict=True)`` and
+:func:`strict_json_text`), with non-finite floats as ``null`` like orjson.
+"""
+import json
+import math
+import os
+from typing import Any, Optional
 from datetime import datetime, date
 from enum import Enum
 
+from mcp.types import TextContent
+from pydantic import PrivateAttr
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - orjson is a core dependency
+    _orjson = None
+
+
+def json_encoder() -> str:
+    """Configured encoder name: ``orjson`` (when importable) or ``stdlib``."""
+    name = os.getenv("UNITARES_JSON_ENCODER", "stdlib").strip().lower()
+    return "orjson" if name == "orjson" and _orjson is not None else "stdlib"
+
+
+def _finite(obj: Any) -> Any:
+    """``obj`` with NaN/Infinity floats replaced by None, as orjson encodes them."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(item) for item in obj]
+    return obj
+
+
+def dumps_json_bytes(obj: Any, *, strict: bool = False) -> bytes:
+    """Encode ``obj`` to UTF-8 JSON with the configured encoder.
+
+    ``strict`` guarantees standard JSON from the stdlib encoder too:
+    non-finite floats become ``null`` instead of ``NaN``/``Infinity``.
+    """
+    if json_encoder() == "orjson":
+        try:
+            return _orjson.dumps(obj, option=_orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; the stdlib handles them
+    if strict:
+        try:
+            return json.dumps(obj, ensure_ascii=False, allow_nan=False).encode("utf-8")
+        except ValueError:
+            obj = _finite(obj)
+    return json.dumps(obj, ensure_ascii=False, allow_nan=not strict).encode("utf-8")
+
+
+def dumps_json(obj: Any) -> str:
+    """Encode ``obj`` to a JSON string with the configured encoder."""
+    if json_encoder() == "orjson":
+        return dumps_json_bytes(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
+class StructuredTextContent(TextContent):
+    """TextContent that also carries the payload its ``text`` was encoded from."""
+
+    _payload: Any = PrivateAttr(default=None)
+    _encoded: Optional[str] = PrivateAttr(default=None)
+    _strict: bool = PrivateAttr(default=False)
+
+    @classmethod
+    def from_payload(cls, payload: Any, text: str) -> "StructuredTextContent":
+        item = cls(type="text", text=text)
+        item._payload = payload
+        item._encoded = text
+        # Non-finite floats always encode to one of these tokens, so their
+        # absence proves ``text`` is strict JSON. A match inside a string
+        # value only costs the HTTP route a re-encode.
+        item._strict = "NaN" not in text and "Infinity" not in text
+        return item
+
+
+def structured_payload(item: Any) -> Any:
+    """The payload behind a :class:`StructuredTextContent`, else None.
+
+    Returns None if ``text`` was reassigned after encoding — the payload no
+    longer describes it, so callers must parse the text as before.
+    """
+    if isinstance(item, StructuredTextContent) and item._encoded is not None and item.text is item._encoded:
+        return item._payload
+    return None
+
+
+def strict_json_text(item: Any) -> Optional[str]:
+    """``item.text`` when it is the strict-JSON encoding of a structured payload.
+
+    None when the text may hold ``NaN``/``Infinity`` literals (stdlib
+    encoder), which standard JSON parsers reject; callers re-encode the
+    payload with ``dumps_json_bytes(..., strict=True)`` instead.
+    """
+    if structured_payload(item) is not None and item._strict:
+        return item.text
+    return None
+
 
 def _make_json_serializable(obj: Any) -> Any:
     """
@@ -346,6 +346,7 @@ _TOOL_STABILITY: Dict[str, ToolStability] = {
     "archive_agent": ToolStability.BETA,
     "update_discovery_status_graph": ToolStability.BETA,
     "leave_note": ToolStability.BETA,
+    "process_agent_updates_batch": ToolStability.BETA,
     "operator_resume_agent": ToolStability.BETA,  # Operator tool
     
     "request_dialectic_review": ToolStability.BETA,  # Restored Feb 2026 - full protocol active
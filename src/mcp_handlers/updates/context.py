@@ -75,6 +75,7 @@ class UpdateContext:
     loop_info: Optional[Dict] = None
     warnings: List[str] = field(default_factory=list)
     previous_void_active: bool = False
+    defer_state_record: bool = False  # batched check-in writes agent_state rows in bulk
 
     # ── Runtime references (set by orchestrator) ─────────────────
     loop: Optional[Any] = None       # asyncio event loop
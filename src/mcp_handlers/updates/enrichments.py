@@ -25,7 +25,7 @@ logger = get_logger(__name__)
 
 # ─── Identity Reminder ─────────────────────────────────────────────────
 
-@enrichment(order=10)
+@enrichment(order=10, reads=(), writes=("identity_reminder",))
 def enrich_identity_reminder(ctx: UpdateContext) -> None:
     """Suggest agents set label/purpose during their first 3 updates."""
     try:
@@ -54,7 +54,7 @@ def enrich_identity_reminder(ctx: UpdateContext) -> None:
 
 # ─── Interpretation & Feedback ──────────────────────────────────────────
 
-@enrichment(order=20)
+@enrichment(order=20, reads=(), writes=("state", "summary"))
 async def enrich_state_interpretation(ctx: UpdateContext) -> None:
     """Map raw EISV to semantic state (health / mode / basin)."""
     try:
@@ -75,7 +75,7 @@ async def enrich_state_interpretation(ctx: UpdateContext) -> None:
     except Exception as e:
         logger.debug(f"Could not generate state interpretation: {e}")
 
-@enrichment(order=30)
+@enrichment(order=30, reads=("state", "metrics"), writes=("actionable_feedback",))
 def enrich_actionable_feedback(ctx: UpdateContext) -> None:
     """Generate context-aware actionable feedback."""
     try:
@@ -103,7 +103,12 @@ def enrich_actionable_feedback(ctx: UpdateContext) -> None:
     except Exception as e:
         logger.debug(f"Could not generate actionable feedback: {e}")
 
-@enrichment(order=40)
+@enrichment(
+    order=40,
+    reads=("actionable_feedback", "metrics.verdict", "metrics.E", "metrics.I", "metrics.S", "metrics.V"),
+    writes=("llm_coaching", "recovery_coaching"),
+    snapshot_reads=True,
+)
 async def enrich_llm_coaching(ctx: UpdateContext) -> None:
     """LLM-powered coaching on guide/pause/reject verdicts only."""
     try:
@@ -151,7 +156,7 @@ async def enrich_llm_coaching(ctx: UpdateContext) -> None:
         logger.debug(f"LLM coaching enrichment skipped: {e}")
 
 
-@enrichment(order=50)
+@enrichment(order=50, reads=("metrics.complexity",), writes=("calibration_feedback",))
 def enrich_calibration_feedback(ctx: UpdateContext) -> None:
     """Add calibration feedback (complexity + confidence)."""
     try:
@@ -193,7 +198,12 @@ def enrich_calibration_feedback(ctx: UpdateContext) -> None:
 
 # ─── Warnings & Loop Detection ─────────────────────────────────────────
 
-@enrichment(order=60)
+@enrichment(
+    order=60,
+    reads=(),
+    writes=("ctx.warnings", "ctx.loop_info", "loop_detection", "warning"),
+    side_effects=True,  # clears expired meta.loop_cooldown_until
+)
 def enrich_warnings(ctx: UpdateContext) -> None:
     """Collect warnings: loop cooldown, default agent_id, policy warnings."""
     try:
@@ -243,7 +253,7 @@ def enrich_warnings(ctx: UpdateContext) -> None:
 
 # ─── Metric Standardization ────────────────────────────────────────────
 
-@enrichment(order=70)
+@enrichment(order=70, reads=("metrics",), writes=("metrics", "agent_id"))
 def enrich_metric_standardization(ctx: UpdateContext) -> None:
     """Standardize metric reporting with agent_id and context."""
     try:
@@ -264,7 +274,7 @@ def enrich_metric_standardization(ctx: UpdateContext) -> None:
     except Exception as e:
         logger.debug(f"Could not standardize metrics: {e}")
 
-@enrichment(order=80)
+@enrichment(order=80, reads=("metrics", "status"), writes=("metrics", "health_status", "health_message"))
 def enrich_health_status_toplevel(ctx: UpdateContext) -> None:
     """Ensure health_status is at top level for easy access."""
     try:
@@ -313,7 +323,7 @@ def enrich_health_status_toplevel(ctx: UpdateContext) -> None:
 
 # ─── CIRS Response Fields ──────────────────────────────────────────────
 
-@enrichment(order=90)
+@enrichment(order=90, reads=(), writes=("cirs_void_alert", "outcome_event", "cirs_state_announce"))
 def enrich_cirs_response_fields(ctx: UpdateContext) -> None:
     """Include CIRS protocol info (void alert, state announce, outcome event)."""
     try:
@@ -343,7 +353,7 @@ def enrich_cirs_response_fields(ctx: UpdateContext) -> None:
     except Exception as e:
         logger.debug(f"Could not enrich CIRS fields: {e}")
 
-@enrichment(order=100)
+@enrichment(order=100, reads=("cirs",), writes=("advisories",))
 def enrich_cirs_dampening_advisory(ctx: UpdateContext) -> None:
     """Surface CIRS oscillation dampening as an advisory when resonance is active."""
     try:
@@ -365,7 +375,7 @@ def enrich_cirs_dampening_advisory(ctx: UpdateContext) -> None:
     except Exception as e:
         logger.debug(f"Could not enrich CIRS dampening advisory: {e}")
 
-@enrichment(order=110)
+@enrichment(order=110, reads=(), writes=("advisories",))
 def enrich_detected_patterns(ctx: UpdateContext) -> None:
     """Surface pattern tracker detections (loops, time-box, untested hypotheses) as advisories."""
     try:
@@ -416,7 +426,7 @@ def enrich_detected_patterns(ctx: UpdateContext) -> None:
 
 # ─── Knowledge Surfacing ───────────────────────────────────────────────
 
-@enrichment(order=130, lite_safe=True)
+@enrichment(order=130, lite_safe=True, reads=(), writes=("relevant_discoveries",))
 async def enrich_knowledge_surfacing(ctx: UpdateContext) -> None:
     """Surface top 3 relevant discoveries based on agent tags."""
     try:
@@ -449,7 +459,12 @@ async def enrich_knowledge_surfacing(ctx: UpdateContext) -> None:
 
 # ─── Onboarding Info ───────────────────────────────────────────────────
 
-@enrichment(order=120)
+@enrichment(
+    order=120,
+    reads=(),
+    writes=("onboarding", "api_key_hint", "_onboarding", "api_key",
+            "api_key_warning", "api_key_info", "welcome"),
+)
 def enrich_onboarding_info(ctx: UpdateContext) -> None:
     """Include onboarding guidance, API key hints, welcome message."""
     try:
@@ -503,7 +518,7 @@ def enrich_onboarding_info(ctx: UpdateContext) -> None:
 
 # ─── Convergence Guidance ──────────────────────────────────────────────
 
-@enrichment(order=140)
+@enrichment(order=140, reads=("metrics.E", "metrics.I", "metrics.S", "metrics.V"), writes=("convergence_guidance",))
 async def enrich_convergence_guidance(ctx: UpdateContext) -> None:
     """Behavioral EISV guidance for new agents based on safety thresholds."""
     try:
@@ -578,7 +593,7 @@ async def enrich_convergence_guidance(ctx: UpdateContext) -> None:
 
 # ─── Anti-Stasis Perturbation ──────────────────────────────────────────
 
-@enrichment(order=150)
+@enrichment(order=150, reads=("health_status", "metrics.S"), writes=("perturbation",))
 async def enrich_anti_stasis_perturbation(ctx: UpdateContext) -> None:
     """Surface an open question for stable agents to prevent stasis."""
     try:
@@ -624,7 +639,7 @@ async def enrich_anti_stasis_perturbation(ctx: UpdateContext) -> None:
 
 # ─── Basin Tracking ────────────────────────────────────────────────────
 
-@enrichment(order=160)
+@enrichment(order=160, reads=("metrics.unitares_v41",), writes=("unitares_v41",))
 def enrich_basin_tracking(ctx: UpdateContext) -> None:
     """Surface v4.1 basin/convergence tracking when available."""
     try:
@@ -637,7 +652,12 @@ def enrich_basin_tracking(ctx: UpdateContext) -> None:
 
 # ─── Trajectory Identity ───────────────────────────────────────────────
 
-@enrichment(order=170)
+@enrichment(
+    order=170,
+    reads=("metrics.risk_score",),
+    writes=("trajectory_identity", "metrics.risk_score", "metrics.trajectory_risk_adjustment"),
+    side_effects=True,  # persists the trajectory signature / genesis
+)
 async def enrich_trajectory_identity(ctx: UpdateContext) -> None:
     """Compare trajectory signature if provided, or compute behavioral trajectory."""
     trajectory_signature = ctx.arguments.get("trajectory_signature")
@@ -794,7 +814,7 @@ async def enrich_trajectory_identity(ctx: UpdateContext) -> None:
 
 # ─── Saturation Diagnostics ────────────────────────────────────────────
 
-@enrichment(order=180)
+@enrichment(order=180, reads=(), writes=("saturation_diagnostics",))
 def enrich_saturation_diagnostics(ctx: UpdateContext) -> None:
     """v4.2-P saturation diagnostics — pressure gauge for I-channel."""
     try:
@@ -827,7 +847,7 @@ def enrich_saturation_diagnostics(ctx: UpdateContext) -> None:
 
 # ─── Drift Forecast ────────────────────────────────────────────────────
 
-@enrichment(order=185)
+@enrichment(order=185, reads=("event_detector",), writes=("drift_forecast",))
 def enrich_drift_forecast(ctx: UpdateContext) -> None:
     """Predict drift threshold crossings and project EISV forward."""
     try:
@@ -876,7 +896,7 @@ def enrich_drift_forecast(ctx: UpdateContext) -> None:
 
 # ─── Pending Dialectic ─────────────────────────────────────────────────
 
-@enrichment(order=190)
+@enrichment(order=190, reads=(), writes=("pending_dialectic",))
 async def enrich_pending_dialectic(ctx: UpdateContext) -> None:
     """Notify agent of pending dialectic sessions where they owe a response."""
     try:
@@ -917,7 +937,12 @@ async def enrich_pending_dialectic(ctx: UpdateContext) -> None:
 
 # ─── EISV Validation ───────────────────────────────────────────────────
 
-@enrichment(order=200)
+@enrichment(
+    order=200,
+    reads=("metrics.E", "metrics.I", "metrics.S", "metrics.V", "eisv_labels"),
+    writes=("_eisv_validation_warning",),
+    side_effects=True,  # logs incomplete EISV regardless of response mode
+)
 def enrich_eisv_validation(ctx: UpdateContext) -> None:
     """Ensure all four EISV metrics are present (prevents selection bias)."""
     try:
@@ -931,7 +956,7 @@ def enrich_eisv_validation(ctx: UpdateContext) -> None:
 
 # ─── Learning Context ──────────────────────────────────────────────────
 
-@enrichment(order=210, lite_safe=True)
+@enrichment(order=210, lite_safe=True, reads=("metrics.E", "metrics.coherence"), writes=("learning_context",))
 async def enrich_learning_context(ctx: UpdateContext) -> None:
     """Surface agent's own history for in-context learning."""
     try:
@@ -1086,7 +1111,7 @@ async def enrich_learning_context(ctx: UpdateContext) -> None:
 
 # ─── WebSocket Broadcast ───────────────────────────────────────────────
 
-@enrichment(order=220)
+@enrichment(order=220, reads=("metrics", "decision"), writes=("event_detector",), side_effects=True)
 async def enrich_websocket_broadcast(ctx: UpdateContext) -> None:
     """Broadcast EISV update to dashboard via WebSocket."""
     try:
@@ -1204,7 +1229,13 @@ async def enrich_websocket_broadcast(ctx: UpdateContext) -> None:
 
 # ─── Mirror Signals ───────────────────────────────────────────────────
 
-@enrichment(order=240, lite_safe=True)
+@enrichment(
+    order=240,
+    lite_safe=True,
+    reads=("decision", "state", "restorative", "confidence_reliability",
+           "continuity", "calibration_feedback", "metrics.verdict"),
+    writes=("_has_sensor_data", "_mirror_question", "_mirror_kg_results", "_mirror_signals"),
+)
 async def enrich_mirror_signals(ctx: UpdateContext) -> None:
     """Build actionable self-awareness signals for mirror response mode.
 
@@ -1216,15 +1247,8 @@ async def enrich_mirror_signals(ctx: UpdateContext) -> None:
     """
     try:
         # Detect embodiment (sensor_data presence) for auto-mode routing
-        has_sensor_data = bool(ctx.arguments.get("sensor_data"))
-        if not has_sensor_data:
-            params_raw = ctx.arguments.get("parameters", [])
-            if isinstance(params_raw, list):
-                for p in params_raw:
-                    if isinstance(p, dict) and p.get("key") == "sensor_data":
-                        has_sensor_data = True
-                        break
-        ctx.response_data["_has_sensor_data"] = has_sensor_data
+        from src.mcp_handlers.response_formatter import has_sensor_data
+        ctx.response_data["_has_sensor_data"] = has_sensor_data(ctx.arguments)
 
         signals = []
 
@@ -1490,7 +1514,7 @@ def _should_search_kg_by_checkin_text(ctx: UpdateContext, signals: list, questio
 
 # ─── Identity Notifications ──────────────────────────────────────────
 
-@enrichment(order=250)
+@enrichment(order=250, reads=(), writes=("_identity_notifications",))
 async def enrich_identity_notifications(ctx: UpdateContext) -> None:
     """Surface pending identity notifications (e.g., session accessed from elsewhere)."""
     try:
@@ -1556,7 +1580,7 @@ def _fork_honest_message(
     """Build the thin process_agent_update fork message from R6 v2."""
     return fork_honest_message(episode_fork_kind, parent_uuid, spawn_reason)
 
-@enrichment(order=230)
+@enrichment(order=230, reads=(), writes=("thread_context",))
 def enrich_thread_identity(ctx: UpdateContext) -> None:
     """Provide thread continuity context across sessions (honest forking)."""
     try:
@@ -1594,7 +1618,7 @@ def enrich_thread_identity(ctx: UpdateContext) -> None:
 
 from src.temporal import build_temporal_context
 
-@enrichment(order=215)
+@enrichment(order=215, reads=(), writes=("temporal_context",))
 async def enrich_temporal_context(ctx: UpdateContext) -> None:
     """Inject temporal awareness when time is telling the agent something."""
     try:
@@ -1606,7 +1630,7 @@ async def enrich_temporal_context(ctx: UpdateContext) -> None:
         logger.debug(f"Could not enrich temporal context: {e}")
 
 
-@enrichment(order=260)
+@enrichment(order=260, reads=(), writes=("agent_profile",))
 async def enrich_agent_profile(ctx: UpdateContext) -> None:
     """Add differentiated agent profile metrics to the response."""
     try:
@@ -1633,7 +1657,7 @@ from src.grounding.coherence import compute_coherence
 from src.grounding.class_indicator import classify_agent
 
 
-@enrichment(order=75)
+@enrichment(order=75, reads=("metrics",), writes=("metrics", "ctx.agent_class"))
 async def enrich_grounding(ctx: UpdateContext) -> None:
     """Swap grounded E/I/S/coherence into canonical metrics slots.
 
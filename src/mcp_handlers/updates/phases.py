@@ -7,6 +7,7 @@ Phases 1-5 of the process_agent_update pipeline:
   3. transform_inputs             — Extract & transform params (fail-fast before lock)
   4. execute_locked_update        — Policy, agent creation, ODE update
   5. execute_post_update_effects  — Health, CIRS, PG record, outcomes
+     (execute_recorded_effects: the part that follows the PG record)
 """
 
 import asyncio
@@ -15,7 +16,7 @@ import re
 import secrets
 import time
 from datetime import datetime
-from typing import Optional, Sequence
+from typing import List, Optional, Sequence
 
 from mcp.types import TextContent
 
@@ -1130,6 +1131,136 @@ async def _r2_post_update_hook(ctx: UpdateContext) -> None:
         )
 
 
+def agent_state_record(ctx: UpdateContext) -> dict:
+    """Keyword arguments for agent_storage.record_agent_state from a finished update."""
+    decision = ctx.result.get('decision') or {}
+    return dict(
+        agent_id=ctx.agent_id,
+        E=ctx.metrics_dict.get('E', 0.7),
+        I=ctx.metrics_dict.get('I', 0.8),
+        S=ctx.metrics_dict.get('S', 0.1),
+        V=ctx.metrics_dict.get('V', 0.0),
+        regime=ctx.metrics_dict.get('regime', 'EXPLORATION'),
+        coherence=ctx.metrics_dict.get('coherence', 0.5),
+        health_status=ctx.health_status.value,
+        risk_score=ctx.risk_score,
+        phi=ctx.metrics_dict.get('phi', 0.0),
+        verdict=ctx.metrics_dict.get('verdict', 'continue'),
+        action=decision.get('sub_action') or decision.get('action'),
+        provenance_context=ctx.agent_state.get("provenance_context"),
+    )
+
+
+async def persist_agent_state(ctx: UpdateContext) -> bool:
+    """Record the EISV state row, creating the agent row if it is missing.
+
+    Returns False when the row was skipped under STRICT_IDENTITY_REQUIRED;
+    the caller skips the rest of the post-update effects in that case.
+    """
+    mcp_server = ctx.mcp_server
+    agent_id = ctx.agent_id
+    try:
+        await agent_storage.record_agent_state(**agent_state_record(ctx))
+        logger.debug(f"PostgreSQL: Recorded state for {agent_id}")
+    except ValueError:
+        # #425 Path D: when STRICT_IDENTITY_REQUIRED is on, do NOT auto-
+        # create on the recovery path. The agent should have onboarded
+        # explicitly; missing-row at this layer means something went
+        # wrong upstream (orphan agent, race, or upstream auto-mint that
+        # was correctly refused). Fail loud rather than silently mint.
+        # Default off; gated by env flag for staged rollout.
+        from src.mcp_handlers.identity_bootstrap import is_strict_identity_required
+        if is_strict_identity_required():
+            logger.warning(
+                "[PROCESS_UPDATE] STRICT_IDENTITY_REQUIRED=true and "
+                "agent %s... missing from PG at record_agent_state — "
+                "skipping self-create (#425 Path D); state for this "
+                "update will not be recorded.",
+                (agent_id or "")[:12],
+            )
+            return False
+        logger.debug(f"Agent {agent_id} not found, creating...")
+        try:
+            await agent_storage.create_agent(
+                agent_id=agent_id,
+                api_key=ctx.api_key or "",
+                status='active',
+            )
+            # S21-b §1: hydrate dict so require_registered_agent sees the new
+            # row immediately (axiom-#3 H14). Self-healing path: this branch
+            # fires when record_agent_state finds no PG row for this agent_id.
+            try:
+                from src.agent_metadata_persistence import register_minted_agent_in_dict
+                register_minted_agent_in_dict(agent_id, status='active')
+            except Exception as hyd_err:
+                logger.debug(f"Phase eager hydration failed for {agent_id}: {hyd_err}")
+            # S8a Phase-2: stamp default class tag on the recovery-create path.
+            # Same rationale as the is_new_agent branch above; this branch
+            # fires when record_agent_state hits a missing-row ValueError.
+            # See docs/ontology/s8a-phase2-prep.md.
+            try:
+                from src.grounding.onboard_classifier import stamp_default_class_tags
+                recovery_meta = mcp_server.agent_metadata.get(agent_id)
+                # Resolve a name explicitly: prefer ctx.label (always set
+                # at phase 1), fall back to meta.label. Without this, a
+                # known resident hitting the recovery path would land as
+                # ``ephemeral`` (council finding 2026-04-30 HIGH#4).
+                recovery_label = (
+                    getattr(ctx, "label", None)
+                    or (recovery_meta.label if recovery_meta else None)
+                )
+                stamped = await stamp_default_class_tags(
+                    agent_id, recovery_label, meta=recovery_meta
+                )
+                if stamped is not None:
+                    logger.info(
+                        f"[PROCESS_UPDATE] S8a default-stamp (recovery): "
+                        f"{agent_id[:8]}... tagged {stamped} (label={recovery_label!r})"
+                    )
+            except Exception as stamp_err:
+                # Recovery path is exactly the case where stamping matters
+                # most — the agent was found missing from PG. Log at
+                # warning so a silently-failed stamp here is visible.
+                logger.warning(
+                    f"[PROCESS_UPDATE] recovery default-stamp failed for "
+                    f"{agent_id[:8]}... (agent will be misclassified until "
+                    f"next stamp): {stamp_err}"
+                )
+            await agent_storage.record_agent_state(**agent_state_record(ctx))
+            logger.debug(f"PostgreSQL: Created agent and recorded state for {agent_id}")
+        except Exception as create_error:
+            logger.warning(f"PostgreSQL create+record failed: {create_error}", exc_info=True)
+    except Exception as e:
+        logger.warning(f"PostgreSQL record_agent_state failed: {e}", exc_info=True)
+    return True
+
+
+async def persist_agent_states(contexts: Sequence[UpdateContext]) -> List[UpdateContext]:
+    """Record the EISV state rows of several finished updates in one executemany.
+
+    Updates whose agent has no identity row (or all of them, if the bulk
+    write fails) fall back to persist_agent_state one at a time. Returns the
+    contexts that passed persist_agent_state's gate, in order; the others
+    (STRICT_IDENTITY_REQUIRED skips) must not run execute_recorded_effects.
+    """
+    if not contexts:
+        return []
+    fallback = list(contexts)
+    try:
+        missing = set(await agent_storage.record_agent_states(
+            [agent_state_record(ctx) for ctx in contexts]
+        ))
+        fallback = [ctx for ctx in contexts if ctx.agent_id in missing]
+        logger.debug(f"PostgreSQL: Recorded {len(contexts) - len(fallback)} states in bulk")
+    except Exception as e:
+        logger.warning(f"PostgreSQL record_agent_states failed, recording per update: {e}")
+    skipped = set()
+    for ctx in fallback:
+        if not await persist_agent_state(ctx):
+            skipped.add(id(ctx))
+    return [ctx for ctx in contexts if id(ctx) not in skipped]
+
+
 async def execute_post_update_effects(ctx: UpdateContext) -> None:
     """Health check, CIRS emissions, PG record, outcome events. All fail-safe."""
     mcp_server = ctx.mcp_server
@@ -1331,110 +1462,19 @@ async def execute_post_update_effects(ctx: UpdateContext) -> None:
     except Exception as e:
         logger.debug(f"Drift dialectic trigger skipped: {e}")
 
-    # PostgreSQL: Record EISV state
-    try:
-        await agent_storage.record_agent_state(
-            agent_id=agent_id,
-            E=ctx.metrics_dict.get('E', 0.7),
-            I=ctx.metrics_dict.get('I', 0.8),
-            S=ctx.metrics_dict.get('S', 0.1),
-            V=ctx.metrics_dict.get('V', 0.0),
-            regime=ctx.metrics_dict.get('regime', 'EXPLORATION'),
-            coherence=ctx.metrics_dict.get('coherence', 0.5),
-            health_status=ctx.health_status.value,
-            risk_score=ctx.risk_score,
-            phi=ctx.metrics_dict.get('phi', 0.0),
-            verdict=ctx.metrics_dict.get('verdict', 'continue'),
-            action=(ctx.result.get('decision') or {}).get('sub_action')
-                or (ctx.result.get('decision') or {}).get('action'),
-            provenance_context=ctx.agent_state.get("provenance_context"),
-        )
-        logger.debug(f"PostgreSQL: Recorded state for {agent_id}")
-    except ValueError:
-        # #425 Path D: when STRICT_IDENTITY_REQUIRED is on, do NOT auto-
-        # create on the recovery path. The agent should have onboarded
-        # explicitly; missing-row at this layer means something went
-        # wrong upstream (orphan agent, race, or upstream auto-mint that
-        # was correctly refused). Fail loud rather than silently mint.
-        # Default off; gated by env flag for staged rollout.
-        from src.mcp_handlers.identity_bootstrap import is_strict_identity_required
-        if is_strict_identity_required():
-            logger.warning(
-                "[PROCESS_UPDATE] STRICT_IDENTITY_REQUIRED=true and "
-                "agent %s... missing from PG at record_agent_state — "
-                "skipping self-create (#425 Path D); state for this "
-                "update will not be recorded.",
-                (agent_id or "")[:12],
-            )
-            return
-        logger.debug(f"Agent {agent_id} not found, creating...")
-        try:
-            await agent_storage.create_agent(
-                agent_id=agent_id,
-                api_key=ctx.api_key or "",
-                status='active',
-            )
-            # S21-b §1: hydrate dict so require_registered_agent sees the new
-            # row immediately (axiom-#3 H14). Self-healing path: this branch
-            # fires when record_agent_state finds no PG row for this agent_id.
-            try:
-                from src.agent_metadata_persistence import register_minted_agent_in_dict
-                register_minted_agent_in_dict(agent_id, status='active')
-            except Exception as hyd_err:
-                logger.debug(f"Phase eager hydration failed for {agent_id}: {hyd_err}")
-            # S8a Phase-2: stamp default class tag on the recovery-create path.
-            # Same rationale as the is_new_agent branch above; this branch
-            # fires when record_agent_state hits a missing-row ValueError.
-            # See docs/ontology/s8a-phase2-prep.md.
-            try:
-                from src.grounding.onboard_classifier import stamp_default_class_tags
-                recovery_meta = mcp_server.agent_metadata.get(agent_id)
-                # Resolve a name explicitly: prefer ctx.label (always set
-                # at phase 1), fall back to meta.label. Without this, a
-                # known resident hitting the recovery path would land as
-                # ``ephemeral`` (council finding 2026-04-30 HIGH#4).
-                recovery_label = (
-                    getattr(ctx, "label", None)
-                    or (recovery_meta.label if recovery_meta else None)
-                )
-                stamped = await stamp_default_class_tags(
-                    agent_id, recovery_label, meta=recovery_meta
-                )
-                if stamped is not None:
-                    logger.info(
-                        f"[PROCESS_UPDATE] S8a default-stamp (recovery): "
-                        f"{agent_id[:8]}... tagged {stamped} (label={recovery_label!r})"
-                    )
-            except Exception as stamp_err:
-                # Recovery path is exactly the case where stamping matters
-                # most — the agent was found missing from PG. Log at
-                # warning so a silently-failed stamp here is visible.
-                logger.warning(
-                    f"[PROCESS_UPDATE] recovery default-stamp failed for "
-                    f"{agent_id[:8]}... (agent will be misclassified until "
-                    f"next stamp): {stamp_err}"
-                )
-            await agent_storage.record_agent_state(
-                agent_id=agent_id,
-                E=ctx.metrics_dict.get('E', 0.7),
-                I=ctx.metrics_dict.get('I', 0.8),
-                S=ctx.metrics_dict.get('S', 0.1),
-                V=ctx.metrics_dict.get('V', 0.0),
-                regime=ctx.metrics_dict.get('regime', 'EXPLORATION'),
-                coherence=ctx.metrics_dict.get('coherence', 0.5),
-                health_status=ctx.health_status.value,
-                risk_score=ctx.risk_score,
-                phi=ctx.metrics_dict.get('phi', 0.0),
-                verdict=ctx.metrics_dict.get('verdict', 'continue'),
-                action=(ctx.result.get('decision') or {}).get('sub_action')
-                    or (ctx.result.get('decision') or {}).get('action'),
-                provenance_context=ctx.agent_state.get("provenance_context"),
-            )
-            logger.debug(f"PostgreSQL: Created agent and recorded state for {agent_id}")
-        except Exception as create_error:
-            logger.warning(f"PostgreSQL create+record failed: {create_error}", exc_info=True)
-    except Exception as e:
-        logger.warning(f"PostgreSQL record_agent_state failed: {e}", exc_info=True)
+    # PostgreSQL: Record EISV state. A batched check-in stops here:
+    # run_process_update_batch writes the whole batch in one executemany, then
+    # runs execute_recorded_effects for each update whose row was recorded.
+    if ctx.defer_state_record:
+        return
+    if not await persist_agent_state(ctx):
+        return
+    await execute_recorded_effects(ctx)
+
+
+async def execute_recorded_effects(ctx: UpdateContext) -> None:
+    """Effects that follow the agent_state row: baseline, outcome events, evidence, lineage."""
+    agent_id = ctx.agent_id
 
     # PostgreSQL: Save agent baseline (fire-and-forget, matches record_agent_state pattern)
     try:
@@ -7,20 +7,49 @@ Usage:
     @enrichment(order=10)
     def enrich_foo(ctx): ...
 
-    @enrichment(order=20)
+    @enrichment(order=20, reads=("state",), writes=("bar",))
     async def enrich_bar(ctx): ...
 
     await run_enrichment_pipeline(ctx)
+
+Scheduling: an enrichment that declares ``reads``/``writes`` (keys of
+``ctx.response_data``; ``"metrics.E"`` names one field of the metrics dict,
+``"ctx.<attr>"`` a context attribute it mutates, any other name a piece of
+shared state such as ``"event_detector"``) only waits for earlier
+enrichments it conflicts with — read-after-write, write-after-write or
+write-after-read on an overlapping key. Non-conflicting enrichments run
+concurrently. An enrichment with no declaration conflicts with everything,
+so undeclared steps keep the strict ``order`` semantics.
+
+``snapshot_reads=True`` declares that every read happens before the
+function's first ``await``; later writers of those keys then only wait for it
+to start rather than finish (used by the LLM coaching step so its network
+call does not hold back the metric rewrites after it).
+
+Every async step runs under its own timeout budget (``timeout=`` or
+``UNITARES_ENRICHMENT_STEP_TIMEOUT_MS``). A ``side_effects=True`` step is not
+cancelled when its budget runs out: the pipeline stops waiting for it and it
+finishes in the background, so its writes are never cut off halfway. Set
+``UNITARES_ENRICHMENT_CONCURRENT=0`` to run strictly in order.
+
+Planning: when the caller passes ``fields`` (the response keys the resolved
+response mode keeps), only enrichments whose ``writes`` reach one of those
+keys — directly or by feeding another planned step — run, plus every
+``side_effects=True`` and every undeclared enrichment.
 """
 
+import asyncio
 import inspect
+import os
 import time
-from typing import Callable, List, NamedTuple
+from typing import Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
 
 from src.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_STEP_TIMEOUT_MS = 5000
+
 
 class _EnrichmentEntry(NamedTuple):
     fn: Callable
@@ -28,12 +57,30 @@ class _EnrichmentEntry(NamedTuple):
     name: str
     is_async: bool
     lite_safe: bool = False
+    # None = undeclared (conflicts with every other enrichment)
+    reads: Optional[FrozenSet[str]] = None
+    writes: Optional[FrozenSet[str]] = None
+    snapshot_reads: bool = False
+    timeout: Optional[float] = None
+    side_effects: bool = False
 
 
 _ENRICHMENTS: List[_EnrichmentEntry] = []
 
+# Side-effect steps that overran their budget and are finishing unawaited.
+_DETACHED: Set["asyncio.Future"] = set()
+
 
-def enrichment(order: int, *, lite_safe: bool = False):
+def enrichment(
+    order: int,
+    *,
+    lite_safe: bool = False,
+    reads: Optional[Iterable[str]] = None,
+    writes: Optional[Iterable[str]] = None,
+    snapshot_reads: bool = False,
+    timeout: Optional[float] = None,
+    side_effects: bool = False,
+):
     """Register a function in the enrichment pipeline at *order*.
 
     lite_safe=True marks the enrichment as response-shaping only — safe to
@@ -41,7 +88,19 @@ def enrichment(order: int, *, lite_safe: bool = False):
     used by embedded brokers like anima-broker that read action+margin and
     discard the rest). Default False keeps existing behavior for callers
     that use non-lite modes.
+
+    reads/writes declare the response keys the enrichment touches so the
+    runner may overlap it with non-conflicting enrichments; declaring either
+    one declares both (the other defaults to empty). timeout overrides the
+    per-step budget in seconds.
+
+    side_effects=True marks an enrichment that must run even when the
+    response mode discards everything it writes (broadcasts, DB writes).
+    Such a step is left to finish, not cancelled, when it overruns its
+    budget.
     """
+    declared = reads is not None or writes is not None
+
     def decorator(fn: Callable) -> Callable:
         _ENRICHMENTS.append(_EnrichmentEntry(
             fn=fn,
@@ -49,41 +108,229 @@ def enrichment(order: int, *, lite_safe: bool = False):
             name=fn.__name__,
             is_async=inspect.iscoroutinefunction(fn),
             lite_safe=lite_safe,
+            reads=frozenset(reads or ()) if declared else None,
+            writes=frozenset(writes or ()) if declared else None,
+            snapshot_reads=snapshot_reads,
+            timeout=timeout,
+            side_effects=side_effects,
         ))
         _ENRICHMENTS.sort(key=lambda e: e.order)
         return fn
     return decorator
 
 
-async def run_enrichment_pipeline(ctx) -> None:
-    """Run every registered enrichment in order. Each is fail-safe.
+# ─── Dependency graph ──────────────────────────────────────────────────
+
+def _keys_overlap(a: FrozenSet[str], b: FrozenSet[str]) -> bool:
+    """True if any key in *a* equals or is a dotted prefix of one in *b*."""
+    if a & b:
+        return True
+    for x in a:
+        for y in b:
+            if y.startswith(x + ".") or x.startswith(y + "."):
+                return True
+    return False
+
+
+def _dependency(earlier: _EnrichmentEntry, later: _EnrichmentEntry) -> Optional[str]:
+    """How *later* must wait for *earlier*: "done", "started" or None."""
+    if earlier.reads is None or later.reads is None:
+        return "done"
+    if _keys_overlap(earlier.writes, later.reads) or _keys_overlap(earlier.writes, later.writes):
+        return "done"
+    if _keys_overlap(earlier.reads, later.writes):
+        return "started" if earlier.snapshot_reads else "done"
+    return None
+
+
+_graph_cache: Tuple[Tuple[_EnrichmentEntry, ...], List[List[Tuple[int, str]]]] = ((), [])
+
+
+def _dependency_graph(entries: List[_EnrichmentEntry]) -> List[List[Tuple[int, str]]]:
+    """Per entry, the (index, "done"|"started") edges it waits on. Cached."""
+    global _graph_cache
+    key = tuple(entries)
+    if _graph_cache[0] == key:
+        return _graph_cache[1]
+    graph: List[List[Tuple[int, str]]] = []
+    for j, later in enumerate(entries):
+        edges = []
+        for i in range(j):
+            kind = _dependency(entries[i], later)
+            if kind:
+                edges.append((i, kind))
+        graph.append(edges)
+    _graph_cache = (key, graph)
+    return graph
+
+
+def plan_enrichments(entries: List[_EnrichmentEntry], fields: Optional[Iterable[str]]) -> List[bool]:
+    """Which *entries* must run for a response that keeps *fields*.
+
+    ``fields=None`` means the full response: everything runs. Otherwise a
+    step runs if it is undeclared, has side effects, writes a kept field, or
+    writes something an already-planned later step reads.
+    """
+    if fields is None:
+        return [True] * len(entries)
+    kept = frozenset(fields)
+    needed = [
+        e.reads is None or e.side_effects or _keys_overlap(e.writes, kept)
+        for e in entries
+    ]
+    # Producers always precede their readers, so one backwards pass closes
+    # the set over read-after-write dependencies. An undeclared step may read
+    # anything, so everything before it is kept.
+    for j in range(len(entries) - 1, -1, -1):
+        if not needed[j]:
+            continue
+        reads = entries[j].reads
+        for i in range(j):
+            if not needed[i] and (reads is None or _keys_overlap(entries[i].writes, reads)):
+                needed[i] = True
+    return needed
+
+
+# ─── Runner ────────────────────────────────────────────────────────────
+
+def _concurrency_enabled() -> bool:
+    return os.getenv("UNITARES_ENRICHMENT_CONCURRENT", "1").strip().lower() not in ("0", "false", "no")
+
+
+def _default_step_timeout() -> float:
+    try:
+        return float(os.getenv("UNITARES_ENRICHMENT_STEP_TIMEOUT_MS", DEFAULT_STEP_TIMEOUT_MS)) / 1000.0
+    except ValueError:
+        return DEFAULT_STEP_TIMEOUT_MS / 1000.0
+
+
+def _detach(entry: _EnrichmentEntry, step: "asyncio.Future") -> None:
+    """Keep an overrunning side-effect step alive and log how it ends."""
+    _DETACHED.add(step)
+
+    def _done(fut: "asyncio.Future") -> None:
+        _DETACHED.discard(fut)
+        if not fut.cancelled() and fut.exception() is not None:
+            logger.debug(f"Enrichment {entry.name} failed after its budget: {fut.exception()}")
+
+    step.add_done_callback(_done)
+
+
+async def _run_step(entry: _EnrichmentEntry, ctx, budget: float, started: Optional[asyncio.Event] = None) -> str:
+    """Run one enrichment fail-safe. Returns "" or "timeout"."""
+    try:
+        if entry.is_async:
+            step_budget = entry.timeout if entry.timeout is not None else budget
+            step = asyncio.ensure_future(entry.fn(ctx))
+            if started is not None:
+                # Let the step run up to its first await before releasing
+                # "started" waiters, so a snapshot_reads step has done its reads.
+                await asyncio.sleep(0)
+                started.set()
+            if step_budget <= 0:
+                await step
+            elif entry.side_effects:
+                try:
+                    await asyncio.wait_for(asyncio.shield(step), step_budget)
+                except asyncio.TimeoutError:
+                    _detach(entry, step)
+                    logger.warning(
+                        f"Enrichment {entry.name} exceeded its timeout budget; "
+                        f"no longer waiting, left to finish"
+                    )
+                    return "timeout"
+            else:
+                await asyncio.wait_for(step, step_budget)
+        else:
+            entry.fn(ctx)
+    except asyncio.TimeoutError:
+        logger.warning(f"Enrichment {entry.name} exceeded its timeout budget; skipped")
+        return "timeout"
+    except Exception as exc:
+        logger.debug(f"Enrichment {entry.name} failed: {exc}")
+    finally:
+        if started is not None:
+            started.set()
+    return ""
+
+
+async def run_enrichment_pipeline(ctx, fields: Optional[Iterable[str]] = None) -> None:
+    """Run the registered enrichments. Each is fail-safe and time-boxed.
+
+    fields: response keys the resolved response mode will keep; enrichments
+    that cannot affect them are skipped (see plan_enrichments). None runs
+    everything.
 
     Per-step wall-clock is recorded so the [enrichment_phases] log line
-    can attribute slow check-ins to a specific enrichment. The pipeline
-    runs serially today; this instrumentation is the prerequisite for
-    deciding which enrichments are safe to parallelize.
+    can attribute slow check-ins to a specific enrichment. The line also
+    carries wall= (pipeline elapsed) and critical_path= (longest chain of
+    dependent steps); with concurrency on, wall tracks critical_path
+    rather than the sum of the steps.
     """
     is_lite = (getattr(ctx, "arguments", None) or {}).get("response_mode") == "minimal"
-    timings: List[tuple[str, int]] = []
-    for entry in _ENRICHMENTS:
-        if is_lite and entry.lite_safe:
-            timings.append((entry.name, -1))  # -1 sentinel = skipped (lite)
-            continue
+    entries = list(_ENRICHMENTS)
+    budget = _default_step_timeout()
+    graph = _dependency_graph(entries)
+    n = len(entries)
+    durations: List[float] = [0.0] * n
+    outcome: List[str] = [""] * n
+    planned = plan_enrichments(entries, fields)
+    skipped = [(is_lite and e.lite_safe) or not planned[i] for i, e in enumerate(entries)]
+
+    pipeline_start = time.perf_counter()
+
+    async def timed(i: int, started: Optional[asyncio.Event] = None) -> None:
         start = time.perf_counter()
-        try:
-            if entry.is_async:
-                await entry.fn(ctx)
-            else:
-                entry.fn(ctx)
-        except Exception as exc:
-            logger.debug(f"Enrichment {entry.name} failed: {exc}")
-        timings.append((entry.name, int((time.perf_counter() - start) * 1000)))
-
-    if timings:
-        rendered = " ".join(
-            f"{name}={'skip' if ms < 0 else f'{ms}ms'}" for name, ms in timings
+        outcome[i] = await _run_step(entries[i], ctx, budget, started)
+        durations[i] = time.perf_counter() - start
+
+    if _concurrency_enabled() and n > 1:
+        started_events = [asyncio.Event() for _ in range(n)]
+        tasks: Dict[int, asyncio.Task] = {}
+
+        async def scheduled(i: int) -> None:
+            for dep, kind in graph[i]:
+                if kind == "started":
+                    await started_events[dep].wait()
+                else:
+                    await tasks[dep]
+            if skipped[i]:
+                started_events[i].set()
+                return
+            await timed(i, started_events[i])
+
+        for i in range(n):
+            tasks[i] = asyncio.ensure_future(scheduled(i))
+        await asyncio.gather(*tasks.values())
+    else:
+        for i in range(n):
+            if not skipped[i]:
+                await timed(i)
+
+    wall = time.perf_counter() - pipeline_start
+
+    # Longest chain through the dependency graph ("started" edges add nothing).
+    finish: List[float] = [0.0] * n
+    for i in range(n):
+        ready = 0.0
+        for dep, kind in graph[i]:
+            ready = max(ready, finish[dep] if kind == "done" else finish[dep] - durations[dep])
+        finish[i] = ready + durations[i]
+    critical_path = max(finish, default=0.0)
+
+    if entries:
+        def render(i: int) -> str:
+            if skipped[i]:
+                return f"{entries[i].name}=skip"
+            if outcome[i]:
+                return f"{entries[i].name}={outcome[i]}"
+            return f"{entries[i].name}={int(durations[i] * 1000)}ms"
+
+        rendered = " ".join(render(i) for i in range(n))
+        logger.info(
+            f"[enrichment_phases] wall={int(wall * 1000)}ms "
+            f"critical_path={int(critical_path * 1000)}ms {rendered}"
         )
-        logger.info(f"[enrichment_phases] {rendered}")
 
 
 def get_enrichment_count() -> int:
@@ -98,6 +98,7 @@ except ImportError as e:
 
 # Import dispatch_tool from handlers (reuse all existing tool logic)
 from src.mcp_handlers import dispatch_tool, TOOL_HANDLERS
+from src.mcp_handlers.serialization import structured_payload
 
 # Tool schemas are now in src/tool_schemas.py (shared module)
 
@@ -282,6 +283,9 @@ def get_tool_wrapper(tool_name: str):
                 # Our handlers return JSON in TextContent.text; parse it and return an object.
                 if isinstance(result, (list, tuple)) and len(result) > 0:
                     first_result = result[0]
+                    payload = structured_payload(first_result)
+                    if payload is not None:
+                        return payload
                     if hasattr(first_result, 'text'):
                         text = first_result.text
                         try:
@@ -326,6 +330,7 @@ TOOLS_NEEDING_SESSION_INJECTION = {
     "onboard",
     "identity",
     "process_agent_update",
+    "process_agent_updates_batch",
     "get_governance_metrics",
     "store_knowledge_graph",
     "search_knowledge_graph",
@@ -706,6 +711,16 @@ async def main():
     from src.audit_log import AuditLogger
     AuditLogger._event_loop = asyncio.get_running_loop()
 
+    # Batch audit/tool-usage JSONL appends on a writer thread instead of an
+    # open+flock+fsync per call inside handlers (UNITARES_JSONL_GROUP_COMMIT=0
+    # restores inline writes).
+    from src.jsonl_writer import group_commit_enabled
+    if group_commit_enabled():
+        from src.audit_log import audit_logger
+        from src.tool_usage_tracker import get_tool_usage_tracker
+        audit_logger.enable_group_commit()
+        get_tool_usage_tracker().enable_group_commit()
+
     endpoint = f"http://{args.host}:{args.port}/mcp"
     config_json = f'{{"url": "{endpoint}"}}'
 
@@ -1032,6 +1047,13 @@ async def main():
             await stop_all_background_tasks()
         except Exception as e:
             logger.debug(f"Error stopping background tasks: {e}")
+        try:
+            from src.audit_log import audit_logger
+            from src.tool_usage_tracker import get_tool_usage_tracker
+            audit_logger.flush()
+            get_tool_usage_tracker().flush()
+        except Exception as e:
+            logger.debug(f"Error flushing JSONL writers: {e}")
         try:
             await close_db()
         except Exception as e:
@@ -21,6 +21,91 @@ TOOL_CALL_DURATION = Histogram(
     buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
 )
 
+# Parsed trajectory signatures (src/trajectory_identity.py SignatureCache)
+TRAJECTORY_SIGNATURE_CACHE = Counter(
+    'unitares_trajectory_signature_cache_total',
+    'Trajectory signature cache lookups',
+    ['result']
+)
+
+# Columnar fleet metrics index (src/fleet_index.py)
+FLEET_INDEX_AGENTS = Gauge(
+    'unitares_fleet_index_agents',
+    'Agents held in the in-memory fleet metrics index'
+)
+
+# Per-agent state lock wait (process_agent_update critical section)
+AGENT_LOCK_WAIT = Histogram(
+    'unitares_agent_lock_wait_seconds',
+    'Time spent waiting to acquire a per-agent state lock',
+    ['fence'],
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0)
+)
+
+# Query embeddings (EmbeddingsService micro-batcher and cache)
+EMBEDDING_QUERY_CACHE = Counter(
+    'unitares_embedding_query_cache_total',
+    'Query embedding cache lookups',
+    ['result']
+)
+
+EMBEDDING_BATCH_SIZE = Histogram(
+    'unitares_embedding_batch_size',
+    'Texts per coalesced embedding encode batch',
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128)
+)
+
+# Cross-encoder reranker (score cache and batcher)
+RERANK_SCORE_CACHE = Counter(
+    'unitares_rerank_score_cache_total',
+    'Rerank (query, discovery) score cache lookups',
+    ['result']
+)
+
+RERANK_BATCH_SIZE = Histogram(
+    'unitares_rerank_batch_size',
+    'Pairs per coalesced cross-encoder predict batch',
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128)
+)
+
+# In-memory typed-edge index (src/edge_index.py)
+KNOWLEDGE_EDGE_INDEX_EDGES = Gauge(
+    'unitares_knowledge_edge_index_edges',
+    'Edges held in the in-memory edge index',
+    ['edge_type']
+)
+
+KNOWLEDGE_EDGE_INDEX_BYTES = Gauge(
+    'unitares_knowledge_edge_index_bytes',
+    'Approximate memory held by the in-memory edge index'
+)
+
+# Named DB statements (src/db/statements.py)
+DB_STATEMENT_DURATION = Histogram(
+    'unitares_db_statement_duration_seconds',
+    'Registered DB statement latency in seconds',
+    ['statement'],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+)
+
+DB_STATEMENT_ROWS = Counter(
+    'unitares_db_statement_rows_total',
+    'Rows returned or affected by registered DB statements',
+    ['statement']
+)
+
+DB_STATEMENT_ERRORS = Counter(
+    'unitares_db_statement_errors_total',
+    'Registered DB statement calls that raised',
+    ['statement']
+)
+
+DB_STATEMENT_PREPARES = Counter(
+    'unitares_db_statement_prepares_total',
+    'First uses of a registered DB statement on a server connection',
+    ['statement']
+)
+
 # Agent metrics
 AGENTS_TOTAL = Gauge(
     'unitares_agents_total',
@@ -31,15 +31,14 @@ _STABILITY_CACHE_TTL = 300  # 5 minutes
 _STABILITY_CACHE_MAX = 256  # max entries before eviction
 
 
-def get_monitor_metrics(monitor: Any, include_state: bool = True) -> Dict:
+def get_summary_metrics(monitor: Any) -> Dict:
     """
-    Returns current governance metrics for a monitor instance.
+    The point-in-time subset of get_monitor_metrics(): primary and ODE EISV,
+    risk, status, phi/verdict, regime and decision counts.
 
-    Args:
-        monitor: UNITARESMonitor instance (needs .agent_id, .state, ._last_oscillation_state)
-        include_state: If False, excludes the nested 'state' dict to reduce response size.
-                      All state values (E, I, S, V, coherence, lambda1) are still included at top level.
-                      Default True for backward compatibility.
+    Skips the stability check, basin classification and history scans, so it
+    is cheap enough to run on every committed update (src/fleet_index.py).
+    Values match the same keys in get_monitor_metrics().
     """
     state = monitor.state
 
@@ -51,23 +50,6 @@ def get_monitor_metrics(monitor: Any, include_state: bool = True) -> Dict:
         decision_counts = dict(counts)
         decision_counts['total'] = len(decision_history)
 
-    # Check stability (Lyapunov eigenvalue analysis, cached 5 min per agent)
-    now = _time.monotonic()
-    cached = _stability_cache.get(monitor.agent_id)
-    if cached and (now - cached["_ts"]) < _STABILITY_CACHE_TTL:
-        stability_result = cached
-    else:
-        stability_result = approximate_stability_check(
-            theta=state.unitaires_theta,
-            dt=config.DT,
-        )
-        stability_result["_ts"] = now
-        _stability_cache[monitor.agent_id] = stability_result
-        # Evict oldest entries if cache exceeds max size
-        if len(_stability_cache) > _STABILITY_CACHE_MAX:
-            oldest_key = min(_stability_cache, key=lambda k: _stability_cache[k].get("_ts", 0))
-            del _stability_cache[oldest_key]
-
     # Calculate status consistently with process_update()
     # Health status uses RECENT TREND (mean of last 10 risk scores), not overall mean
     if len(state.risk_history) >= 10:
@@ -80,9 +62,6 @@ def get_monitor_metrics(monitor: Any, include_state: bool = True) -> Dict:
     # Use LATEST (point-in-time) risk_score for consistency with process_update
     latest_risk_score = float(state.risk_history[-1]) if state.risk_history else None
 
-    # Smoothed trend (for historical context)
-    smoothed_risk_score = current_risk
-
     # Overall mean risk (for display/comparison)
     mean_risk = float(np.mean(state.risk_history)) if state.risk_history else 0.0
 
@@ -124,18 +103,16 @@ def get_monitor_metrics(monitor: Any, include_state: bool = True) -> Dict:
     else:
         pE, pI, pS, pV = float(state.E), float(state.I), float(state.S), float(state.V)
 
-    result = {
+    return {
         'agent_id': monitor.agent_id,
         'E': pE,
         'I': pI,
         'S': pS,
         'V': pV,
         'coherence': None if is_uninitialized else float(state.coherence),
-        'lambda1': float(state.lambda1),
         'regime': str(regime),
         'status': 'uninitialized' if is_uninitialized else status,
         'initialized': not is_uninitialized,
-        'history_size': len(state.V_history),
         'current_risk': None if is_uninitialized else current_risk,
         'mean_risk': None if is_uninitialized else mean_risk,
         'risk_score': None if is_uninitialized else risk_score_value,
@@ -143,21 +120,77 @@ def get_monitor_metrics(monitor: Any, include_state: bool = True) -> Dict:
         'phi': float(phi),
         'verdict': 'uninitialized' if is_uninitialized else verdict,
         'void_active': bool(state.void_active),
+        'decision_statistics': decision_counts,
+        'ode': {
+            'E': float(state.E),
+            'I': float(state.I),
+            'S': float(state.S),
+            'V': float(state.V),
+        }
+    }
+
+
+def get_monitor_metrics(monitor: Any, include_state: bool = True) -> Dict:
+    """
+    Returns current governance metrics for a monitor instance.
+
+    Args:
+        monitor: UNITARESMonitor instance (needs .agent_id, .state, ._last_oscillation_state)
+        include_state: If False, excludes the nested 'state' dict to reduce response size.
+                      All state values (E, I, S, V, coherence, lambda1) are still included at top level.
+                      Default True for backward compatibility.
+    """
+    state = monitor.state
+    summary = get_summary_metrics(monitor)
+
+    # Check stability (Lyapunov eigenvalue analysis, cached 5 min per agent)
+    now = _time.monotonic()
+    cached = _stability_cache.get(monitor.agent_id)
+    if cached and (now - cached["_ts"]) < _STABILITY_CACHE_TTL:
+        stability_result = cached
+    else:
+        stability_result = approximate_stability_check(
+            theta=state.unitaires_theta,
+            dt=config.DT,
+        )
+        stability_result["_ts"] = now
+        _stability_cache[monitor.agent_id] = stability_result
+        # Evict oldest entries if cache exceeds max size
+        if len(_stability_cache) > _STABILITY_CACHE_MAX:
+            oldest_key = min(_stability_cache, key=lambda k: _stability_cache[k].get("_ts", 0))
+            del _stability_cache[oldest_key]
+
+    pE, pI, pS = summary['E'], summary['I'], summary['S']
+
+    result = {
+        'agent_id': monitor.agent_id,
+        'E': pE,
+        'I': pI,
+        'S': pS,
+        'V': summary['V'],
+        'coherence': summary['coherence'],
+        'lambda1': float(state.lambda1),
+        'regime': summary['regime'],
+        'status': summary['status'],
+        'initialized': summary['initialized'],
+        'history_size': len(state.V_history),
+        'current_risk': summary['current_risk'],
+        'mean_risk': summary['mean_risk'],
+        'risk_score': summary['risk_score'],
+        'latest_risk_score': summary['latest_risk_score'],
+        'phi': summary['phi'],
+        'verdict': summary['verdict'],
+        'void_active': summary['void_active'],
         'void_frequency': float(np.mean([float(abs(v) > config.VOID_THRESHOLD_INITIAL)
                                         for v in state.V_history])) if state.V_history else 0.0,
-        'decision_statistics': decision_counts,
+        'decision_statistics': summary['decision_statistics'],
         'stability': {
             'stable': stability_result['stable'],
             'alpha_estimate': stability_result['alpha_estimate'],
             'violations': stability_result['violations'],
             'notes': stability_result['notes']
         },
-        'ode': {
-            'E': float(state.E),
-            'I': float(state.I),
-            'S': float(state.S),
-            'V': float(state.V),
-        }
+        'ode': summary['ode'],
     }
 
     # Basin classification — unified across all profiles via classify_basin()
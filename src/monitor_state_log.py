@@ -0,0 +1,277 @@
+"""
+Append-only delta persistence for per-agent monitor state files.
+
+The default ("snapshot") mode rewrites ``data/agents/{agent_id}_state.json``
+in full on every update: ``to_dict_with_history()`` carries ~15 history arrays
+capped at 100 entries, so each check-in costs tens of KB of serialization and
+a temp-file + ``os.replace``.
+
+In "delta" mode (``UNITARES_MONITOR_STATE_PERSISTENCE=delta``) the snapshot is
+written once, and each later save appends one JSONL line to
+``{agent_id}_state.delta.jsonl`` holding only what changed since the previous
+save: changed scalars, and for history arrays just the newly appended entries
+plus the resulting length (the array is a sliding window, so replay is
+``(old + new)[-n:]``). Every ``COMPACT_EVERY`` deltas — or when the log grows
+past ``COMPACT_BYTES`` — the full state is rewritten as a snapshot and the log
+truncated.
+
+Crash safety: each snapshot carries a random generation id (``_log_gen``) and
+each delta line the generation it applies to. Replay only applies lines of the
+snapshot's generation, so a crash between "snapshot written" and "log
+truncated" cannot double-apply old deltas, and a torn final line ends replay.
+
+Readers always go through :func:`read_state_file`, which replays whatever log
+is present regardless of the configured mode, so switching modes is safe.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+COMPACT_EVERY = int(os.getenv("UNITARES_MONITOR_STATE_COMPACT_EVERY", "200"))
+COMPACT_BYTES = int(os.getenv("UNITARES_MONITOR_STATE_COMPACT_BYTES", str(256 * 1024)))
+
+_GEN_KEY = "_log_gen"
+
+# state_file path -> {"data": last persisted dict, "gen": str, "deltas": int, "bytes": int}
+_shadows: Dict[str, Dict[str, Any]] = {}
+_path_locks: Dict[str, threading.Lock] = {}
+_path_locks_guard = threading.Lock()
+
+
+def persistence_mode() -> str:
+    """``snapshot`` (default) or ``delta``."""
+    mode = os.getenv("UNITARES_MONITOR_STATE_PERSISTENCE", "snapshot").strip().lower()
+    return "delta" if mode == "delta" else "snapshot"
+
+
+def delta_log_path(state_file: Path) -> Path:
+    return state_file.parent / f"{state_file.stem}.delta.jsonl"
+
+
+def _lock_for(key: str) -> threading.Lock:
+    with _path_locks_guard:
+        lock = _path_locks.get(key)
+        if lock is None:
+            lock = threading.Lock()
+            _path_locks[key] = lock
+        return lock
+
+
+# ---------------------------------------------------------------------------
+# Structural diff / apply
+# ---------------------------------------------------------------------------
+
+def _appended_tail(prev: List[Any], cur: List[Any]) -> Optional[List[Any]]:
+    """Entries appended to ``prev`` to get ``cur`` under a sliding window.
+
+    Returns the smallest ``new`` such that ``(prev + new)[-len(cur):] == cur``,
+    or None when ``cur`` shares nothing with ``prev`` (caller stores it whole).
+    """
+    n = len(cur)
+    for m in range(n + 1):
+        keep = n - m
+        if keep > len(prev):
+            continue
+        if keep == 0:
+            return None
+        if cur[:keep] == prev[len(prev) - keep:]:
+            return cur[keep:]
+    return None
+
+
+def diff_state(prev: Dict[str, Any], cur: Dict[str, Any]) -> Dict[str, Any]:
+    """Compute the delta turning ``prev`` into ``cur``.
+
+    Shape: ``{"set": {k: v}, "del": [k], "win": {k: new_entries},
+    "app": {k: [new_entries, length]}, "sub": {k: nested_delta}}`` with empty
+    sections omitted. ``win`` is the steady-state case of ``app`` — a full
+    sliding window whose length did not change — and omits the length.
+    """
+    sets: Dict[str, Any] = {}
+    wins: Dict[str, Any] = {}
+    apps: Dict[str, Any] = {}
+    subs: Dict[str, Any] = {}
+    for key, value in cur.items():
+        if key not in prev:
+            sets[key] = value
+            continue
+        old = prev[key]
+        if old == value:
+            continue
+        if isinstance(value, list) and isinstance(old, list):
+            tail = _appended_tail(old, value)
+            if tail is not None and len(tail) < len(value):
+                if len(value) == len(old):
+                    wins[key] = tail
+                else:
+                    apps[key] = [tail, len(value)]
+                continue
+        elif isinstance(value, dict) and isinstance(old, dict):
+            subs[key] = diff_state(old, value)
+            continue
+        sets[key] = value
+    delta: Dict[str, Any] = {}
+    if sets:
+        delta["set"] = sets
+    removed = [key for key in prev if key not in cur]
+    if removed:
+        delta["del"] = removed
+    if wins:
+        delta["win"] = wins
+    if apps:
+        delta["app"] = apps
+    if subs:
+        delta["sub"] = subs
+    return delta
+
+
+def apply_delta(base: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply a :func:`diff_state` delta to ``base`` in place and return it."""
+    for key, value in delta.get("set", {}).items():
+        base[key] = value
+    for key in delta.get("del", ()):
+        base.pop(key, None)
+    for key, tail in delta.get("win", {}).items():
+        current = base.get(key)
+        if not isinstance(current, list):
+            current = []
+        base[key] = (current + tail)[-len(current):] if current else list(tail)
+    for key, (tail, length) in delta.get("app", {}).items():
+        current = base.get(key)
+        if not isinstance(current, list):
+            current = []
+        merged = current + tail
+        base[key] = merged[-length:] if length else []
+    for key, nested in delta.get("sub", {}).items():
+        current = base.get(key)
+        if not isinstance(current, dict):
+            current = {}
+        base[key] = apply_delta(current, nested)
+    return base
+
+
+# ---------------------------------------------------------------------------
+# File I/O
+# ---------------------------------------------------------------------------
+
+def write_snapshot(state_file: Path, state_data: Dict[str, Any]) -> None:
+    """Atomically write the full state file (tempfile + fsync + os.replace)."""
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_fd, tmp_path = tempfile.mkstemp(
+        dir=state_file.parent,
+        prefix=f".{state_file.stem}.",
+        suffix=".tmp",
+    )
+    try:
+        with os.fdopen(tmp_fd, 'w') as f:
+            json.dump(state_data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, state_file)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _compact(state_file: Path, state_data: Dict[str, Any], key: str) -> int:
+    gen = uuid.uuid4().hex[:12]
+    write_snapshot(state_file, {**state_data, _GEN_KEY: gen})
+    log_path = delta_log_path(state_file)
+    try:
+        with open(log_path, 'w'):
+            pass
+    except OSError as e:
+        # Stale lines carry the old generation and are skipped on replay.
+        logger.debug(f"Could not truncate delta log {log_path}: {e}")
+    _shadows[key] = {"data": state_data, "gen": gen, "deltas": 0, "bytes": 0}
+    return state_file.stat().st_size
+
+
+def write_state(state_file: Path, state_data: Dict[str, Any]) -> int:
+    """Persist ``state_data`` for ``state_file`` in the configured mode.
+
+    Returns the number of bytes written (snapshot size or delta line size).
+    ``state_data`` must not be mutated by the caller afterwards — it becomes
+    the base for the next diff.
+    """
+    key = str(state_file)
+    with _lock_for(key):
+        if persistence_mode() != "delta":
+            _shadows.pop(key, None)
+            write_snapshot(state_file, state_data)
+            log_path = delta_log_path(state_file)
+            if log_path.exists():
+                try:
+                    log_path.unlink()
+                except OSError:
+                    pass
+            return state_file.stat().st_size
+
+        shadow = _shadows.get(key)
+        if (
+            shadow is None
+            or not state_file.exists()
+            or shadow["deltas"] >= COMPACT_EVERY
+            or shadow["bytes"] >= COMPACT_BYTES
+        ):
+            return _compact(state_file, state_data, key)
+
+        delta = diff_state(shadow["data"], state_data)
+        line = json.dumps({"gen": shadow["gen"], "d": delta}, separators=(',', ':')) + '\n'
+        with open(delta_log_path(state_file), 'a') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        size = len(line.encode('utf-8'))
+        shadow["data"] = state_data
+        shadow["deltas"] += 1
+        shadow["bytes"] += size
+        return size
+
+
+def read_state_file(state_file: Path) -> Tuple[Optional[Dict[str, Any]], int]:
+    """Load the snapshot and replay its delta log.
+
+    Returns ``(state_dict, deltas_applied)``; ``state_dict`` is None when the
+    snapshot does not exist. Raises on an unreadable snapshot, like the
+    plain ``json.load`` it replaces.
+    """
+    if not state_file.exists():
+        return None, 0
+    with open(state_file, 'r') as f:
+        data = json.load(f)
+    gen = data.pop(_GEN_KEY, None)
+    applied = 0
+    log_path = delta_log_path(state_file)
+    if gen is None or not log_path.exists():
+        return data, applied
+    with open(log_path, 'r') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                break  # torn final write
+            if record.get("gen") != gen:
+                continue
+            apply_delta(data, record.get("d", {}))
+            applied += 1
+    return data, applied
+
+
+def forget(state_file: Path) -> None:
+    """Drop the cached diff base (next delta-mode save writes a snapshot)."""
+    _shadows.pop(str(state_file), None)
@@ -6,6 +6,8 @@ Design goals:
 - Very low overhead
 - Safe for multi-threaded access
 - Snapshot returns compact summary (count/avg/p50/p95/p99/max/last)
+- Event counters (incr) for things without a duration, e.g. cache hits;
+  they appear in the snapshot as {"total": n}
 """
 
 from __future__ import annotations
@@ -31,6 +33,7 @@ class PerfMonitor:
     def __init__(self, max_samples_per_op: int = 1000):
         self._lock = threading.Lock()
         self._samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=max_samples_per_op))
+        self._counters: Dict[str, int] = defaultdict(int)
 
     def record_ms(self, op: str, duration_ms: float) -> None:
         if not op:
@@ -46,6 +49,12 @@ class PerfMonitor:
         with self._lock:
             self._samples[op].append(float(duration_ms))
 
+    def incr(self, op: str, n: int = 1) -> None:
+        if not op or n <= 0:
+            return
+        with self._lock:
+            self._counters[op] += int(n)
+
     def snapshot(self) -> Dict[str, Dict[str, Any]]:
         """
         Return compact stats per operation.
@@ -53,6 +62,7 @@ class PerfMonitor:
         out: Dict[str, Dict[str, Any]] = {}
         with self._lock:
             items = list(self._samples.items())
+            counters = dict(self._counters)
         for op, samples in items:
             s = list(samples)
             if not s:
@@ -88,6 +98,8 @@ class PerfMonitor:
                 "last_ms": round(stats.last_ms, 3),
                 "sample_window": len(s_sorted),
             }
+        for op, total in counters.items():
+            out.setdefault(op, {})["total"] = total
         return out
 
 
@@ -99,6 +111,10 @@ def record_ms(op: str, duration_ms: float) -> None:
     perf_monitor.record_ms(op, duration_ms)
 
 
+def incr(op: str, n: int = 1) -> None:
+    perf_monitor.incr(op, n)
+
+
 def snapshot() -> Dict[str, Dict[str, Any]]:
     return perf_monitor.snapshot()
 
@@ -15,16 +15,32 @@ Model registry (UNITARES_RERANKER_MODEL env var):
 Enable via UNITARES_ENABLE_RERANKER=1. When disabled, `rerank()` returns the
 input unchanged — safe no-op.
 
+Inference backend (UNITARES_RERANKER_BACKEND, else UNITARES_INFERENCE_BACKEND):
+`torch` (default), `onnx`, or `onnx-int8` — see src/inference_backend.py.
+
+Scores are cached per (model, query, discovery, discovery text) — repeated
+searches rescore only what changed — and uncached pairs from concurrent
+rerank() calls are scored together in bounded batches on one executor, with
+the same TTLCache / MicroBatcher as the query embedder
+(src/inference_batching.py, UNITARES_RERANK_* settings).
+
 Phase 3 of docs/plans/2026-04-20-kg-retrieval-rebuild.md.
 """
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import os
-from typing import Dict, List, Optional, Tuple
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
+from src.embeddings import normalize_query_text
+from src.inference_backend import configured_backend, load_model
+from src.inference_batching import MicroBatcher, TTLCache
 from src.logging_utils import get_logger
+from src.metrics_registry import RERANK_BATCH_SIZE, RERANK_SCORE_CACHE
+from src.perf_monitor import incr as perf_incr, record_ms as perf_record_ms
 
 logger = get_logger(__name__)
 
@@ -43,6 +59,15 @@ if DEFAULT_RERANKER_KEY not in KNOWN_RERANKERS:
     )
     DEFAULT_RERANKER_KEY = "bge-m3"
 
+RERANKER_BACKEND = configured_backend("UNITARES_RERANKER_BACKEND")
+
+# Pair batching and score cache (src/inference_batching.py).
+RERANK_BATCH_WINDOW_MS = float(os.getenv("UNITARES_RERANK_BATCH_WINDOW_MS", "3"))
+RERANK_BATCH_MAX = int(os.getenv("UNITARES_RERANK_BATCH_MAX", "64"))
+RERANK_WORKERS = int(os.getenv("UNITARES_RERANK_WORKERS", "1"))
+RERANK_CACHE_SIZE = int(os.getenv("UNITARES_RERANK_CACHE_SIZE", "8192"))
+RERANK_CACHE_TTL_S = float(os.getenv("UNITARES_RERANK_CACHE_TTL_S", "3600"))
+
 
 def _flag_enabled(name: str, default: bool = False) -> bool:
     raw = os.getenv(name)
@@ -66,18 +91,61 @@ except ImportError:
     )
 
 
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+ScoreKey = Tuple[str, str, Optional[str], str]  # (model, query hash, discovery id, text hash)
+
+
+def _score_discovery(key: ScoreKey) -> Optional[str]:
+    """Cache tag of a score: its discovery id, for invalidate_discovery()."""
+    return key[2]
+
+
 class CrossEncoderReranker:
-    """Lazy-loaded cross-encoder reranker, async-safe via run_in_executor."""
+    """Lazy-loaded cross-encoder reranker, async-safe via run_in_executor.
+
+    score_pairs() serves cached scores first and submits the rest to a
+    MicroBatcher over model.predict. Each pair is scored independently, so
+    pairs from concurrent calls share a batch even across queries. A cached
+    score is keyed by ScoreKey and tagged with its discovery id.
+    """
 
-    def __init__(self, model_key: str = DEFAULT_RERANKER_KEY):
+    def __init__(
+        self,
+        model_key: str = DEFAULT_RERANKER_KEY,
+        backend: str = RERANKER_BACKEND,
+        batch_window_ms: float = RERANK_BATCH_WINDOW_MS,
+        batch_max: int = RERANK_BATCH_MAX,
+        workers: int = RERANK_WORKERS,
+        cache_size: int = RERANK_CACHE_SIZE,
+        cache_ttl_s: float = RERANK_CACHE_TTL_S,
+    ):
         if model_key not in KNOWN_RERANKERS:
             model_key = "bge-m3"
         entry = KNOWN_RERANKERS[model_key]
         self.model_key = model_key
         self.model_name: str = str(entry["hf_name"])
+        # Requested backend until the model loads, then the one actually used.
+        self.backend = backend
         self._model: Optional[CrossEncoder] = None
         self._load_lock: Optional[asyncio.Lock] = None
 
+        self.cache = TTLCache(cache_size, cache_ttl_s, tag=_score_discovery)
+        self._batcher = MicroBatcher(
+            self._predict_batch,
+            window_ms=batch_window_ms,
+            batch_max=batch_max,
+            workers=workers,
+            thread_name_prefix="rerank",
+            cache=self.cache,
+            on_batch=RERANK_BATCH_SIZE.observe,
+        )
+
+    def _predict_batch(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        return _predict_pairs(self._model, pairs)
+
     async def _ensure_model(self) -> CrossEncoder:
         if not CROSS_ENCODER_AVAILABLE:
             raise RuntimeError("sentence-transformers CrossEncoder not installed")
@@ -95,36 +163,77 @@ class CrossEncoderReranker:
             loop = asyncio.get_running_loop()
 
             def _load():
-                logger.info(f"Loading cross-encoder reranker: {self.model_name} (key={self.model_key})")
-                model = CrossEncoder(self.model_name)
-                logger.info(f"Cross-encoder loaded: {self.model_name}")
-                return model
-
-            self._model = await loop.run_in_executor(None, _load)
+                logger.info(
+                    f"Loading cross-encoder reranker: {self.model_name} "
+                    f"(key={self.model_key}, backend={self.backend})"
+                )
+                model, backend = load_model(CrossEncoder, self.model_name, self.backend)
+                logger.info(f"Cross-encoder loaded: {self.model_name} ({backend})")
+                return model, backend
+
+            self._model, self.backend = await loop.run_in_executor(None, _load)
             return self._model
 
     async def score_pairs(
         self,
         query: str,
         docs: List[str],
-        batch_size: int = 32,
+        doc_ids: Optional[List[str]] = None,
     ) -> List[float]:
-        """Return relevance scores (one per doc, order-preserving)."""
+        """Return relevance scores (one per doc, order-preserving).
+
+        ``doc_ids`` (discovery ids, parallel to ``docs``) tag the cache
+        entries so invalidate_discovery() can find them; without ids scores
+        are still cached by text.
+        """
         if not docs:
             return []
-        model = await self._ensure_model()
-        loop = asyncio.get_running_loop()
-
-        def _score():
-            pairs = [(query, d) for d in docs]
-            scores = model.predict(
-                pairs,
-                batch_size=batch_size,
-                show_progress_bar=len(pairs) > 100,
-            )
-            return [float(s) for s in scores]
-
-        return await loop.run_in_executor(None, _score)
+        started = time.perf_counter()
+        await self._ensure_model()
+
+        caching = self.cache.enabled
+        query_hash = _digest(normalize_query_text(query)) if caching else ""
+        scores: List[Optional[float]] = [None] * len(docs)
+        waiting: List[Tuple[int, asyncio.Future]] = []
+        hits = 0
+        for i, doc in enumerate(docs):
+            key = None
+            if caching:
+                doc_id = doc_ids[i] if doc_ids is not None else None
+                key = (self.model_name, query_hash, doc_id, _digest(doc))
+                cached = self.cache.get(key)
+                if cached is not None:
+                    scores[i] = cached
+                    hits += 1
+                    continue
+            waiting.append((i, self._batcher.submit((query, doc), key)))
+
+        if caching:
+            misses = len(docs) - hits
+            RERANK_SCORE_CACHE.labels(result="hit").inc(hits)
+            RERANK_SCORE_CACHE.labels(result="miss").inc(misses)
+            perf_incr("reranker.cache.hit", hits)
+            perf_incr("reranker.cache.miss", misses)
+        if waiting:
+            # shield: one cancelled caller must not cancel a shared result.
+            results = await asyncio.gather(*(asyncio.shield(fut) for _, fut in waiting))
+            for (i, _), score in zip(waiting, results):
+                scores[i] = score
+        perf_record_ms("reranker.score_pairs", (time.perf_counter() - started) * 1000.0)
+        return scores
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._batcher.stats(),
+            "backend": self.backend,
+            "cache": self.cache.stats(),
+        }
+
+
+def _predict_pairs(model, pairs: List[Tuple[str, str]]) -> List[float]:
+    """Score one batch of (query, doc) pairs on the reranker executor."""
+    scores = model.predict(pairs, batch_size=len(pairs), show_progress_bar=False)
+    return [float(s) for s in scores]
 
 
 # Global singleton
@@ -177,7 +286,7 @@ async def rerank(
 
     reranker = await get_reranker()
     try:
-        scores = await reranker.score_pairs(query, texts)
+        scores = await reranker.score_pairs(query, texts, doc_ids=ids)
     except Exception as e:
         logger.warning(f"Reranker failed, returning first-stage order: {e}")
         return [(d, 0.0) for d, _ in pool[:top_k]]
@@ -187,5 +296,11 @@ async def rerank(
     return scored[:top_k]
 
 
+def invalidate_discovery(discovery_id: str) -> None:
+    """Drop cached rerank scores for a discovery whose summary/details changed."""
+    if _reranker is not None:
+        _reranker.cache.invalidate_tag(discovery_id)
+
+
 def reranker_available() -> bool:
     return CROSS_ENCODER_AVAILABLE
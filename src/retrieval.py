@@ -10,7 +10,7 @@ Phase 4 of docs/plans/2026-04-20-kg-retrieval-rebuild.md.
 from __future__ import annotations
 
 import os
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
 from src.logging_utils import get_logger
 
@@ -34,6 +34,36 @@ def graph_expansion_enabled() -> bool:
     return _flag_enabled("UNITARES_ENABLE_GRAPH_EXPANSION", default=False)
 
 
+def graph_expansion_hops() -> int:
+    """Edges followed from each seed when the edge index is loaded. UNITARES_GRAPH_EXPANSION_HOPS."""
+    try:
+        return max(1, int(os.getenv("UNITARES_GRAPH_EXPANSION_HOPS", "1")))
+    except ValueError:
+        return 1
+
+
+# Per-edge-type weight a neighbor inherits from its seed (multiplied along
+# multi-hop paths). 0 means the edge type is not followed.
+DEFAULT_EDGE_TYPE_WEIGHTS: Dict[str, float] = {
+    "related": 0.5,
+    "responds_to": 0.5,
+    "supersedes": 0.0,
+}
+
+
+def graph_expansion_type_weights() -> Dict[str, float]:
+    """Edge-type weights, e.g. UNITARES_GRAPH_EXPANSION_WEIGHTS="related=0.5,supersedes=0.25"."""
+    weights = dict(DEFAULT_EDGE_TYPE_WEIGHTS)
+    for item in os.getenv("UNITARES_GRAPH_EXPANSION_WEIGHTS", "").split(","):
+        name, _, value = item.partition("=")
+        if name.strip() in weights:
+            try:
+                weights[name.strip()] = float(value)
+            except ValueError:
+                logger.warning(f"Ignoring UNITARES_GRAPH_EXPANSION_WEIGHTS entry {item!r}")
+    return weights
+
+
 def rrf_fuse(
     ranked_lists: Sequence[Sequence[str]],
     k: int = 60,
@@ -99,7 +129,7 @@ def apply_tag_boost(
 
 def expand_with_neighbors(
     scored: Sequence[Tuple[str, float]],
-    seed_neighbors: Dict[str, Iterable[str]],
+    seed_neighbors: Dict[str, Union[Iterable[str], Mapping[str, float]]],
     edge_weight: float = 0.5,
     max_seeds: int = 10,
 ) -> List[Tuple[str, float]]:
@@ -109,17 +139,54 @@ def expand_with_neighbors(
     `seed_neighbors[seed_id]`) into the candidate pool with a score inherited
     from the seed, discounted by `edge_weight`. Neighbors already in `scored`
     keep the max of their existing score and the inherited boost.
+
+    `seed_neighbors[seed_id]` may also map each neighbor to its own weight
+    (TypedEdgeIndex.expand: edge-type weights over possibly several hops),
+    which then replaces `edge_weight`.
     """
     expanded: Dict[str, float] = {doc_id: score for doc_id, score in scored}
     seeds = list(scored[:max_seeds])
     for seed_id, seed_score in seeds:
         neighbors = seed_neighbors.get(seed_id) or []
+        weighted = isinstance(neighbors, Mapping)
         for nid in neighbors:
             if not nid or nid == seed_id:
                 continue
-            inherited = seed_score * edge_weight
+            inherited = seed_score * (neighbors[nid] if weighted else edge_weight)
             if inherited > expanded.get(nid, 0.0):
                 expanded[nid] = inherited
     items = list(expanded.items())
     items.sort(key=lambda kv: kv[1], reverse=True)
     return items
+
+
+def collect_seed_neighbors(
+    seed_ids: Sequence[str],
+    pool: Mapping[str, Any],
+    edge_index: Any = None,
+) -> Dict[str, Union[set, Dict[str, float]]]:
+    """Typed-edge neighbors of `seed_ids`, for expand_with_neighbors.
+
+    With a loaded TypedEdgeIndex (KnowledgeGraphAGE.edge_index) this is a
+    local lookup over every RELATED_TO / RESPONDS_TO / SUPERSEDES edge, with
+    graph_expansion_type_weights() and graph_expansion_hops(). Otherwise it
+    falls back to the edges carried on the pooled seed docs (related_to,
+    responses_from, response_to); seeds not in `pool` are skipped.
+    """
+    if edge_index is not None:
+        return edge_index.expand(
+            seed_ids, graph_expansion_type_weights(), hops=graph_expansion_hops(),
+        )
+    seed_neighbors: Dict[str, Union[set, Dict[str, float]]] = {}
+    for seed_id in seed_ids:
+        seed_doc = pool.get(seed_id)
+        if seed_doc is None:
+            continue
+        nbrs: set = set()
+        nbrs.update(seed_doc.related_to or [])
+        nbrs.update(getattr(seed_doc, "responses_from", None) or [])
+        if seed_doc.response_to:
+            nbrs.add(seed_doc.response_to.discovery_id)
+        nbrs.discard(seed_id)
+        seed_neighbors[seed_id] = nbrs
+    return seed_neighbors
@@ -14,7 +14,8 @@ from src.mcp_handlers.identity.handlers import (
     handle_identity_adapter,
     handle_onboard_v2,
 )
-from src.mcp_handlers.core import handle_process_agent_update
+from src.mcp_handlers.core import handle_process_agent_update, handle_process_agent_updates_batch
+from src.mcp_handlers.serialization import structured_payload
 from src.mcp_handlers.utils import require_agent_id
 from src.services.http_dispatch_fallback import execute_http_dispatch_fallback
 from src.services.runtime_queries import get_governance_metrics_data, get_health_check_data
@@ -24,8 +25,14 @@ ToolHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
 
 
 def _normalize_direct_http_result(result: Any) -> Any:
-    """Convert direct-handler MCP text output into plain data for HTTP callers."""
+    """Convert direct-handler MCP text output into plain data for HTTP callers.
+
+    StructuredTextContent results are left as-is: the HTTP layer splices
+    their encoded text straight into the response body.
+    """
     if isinstance(result, (list, tuple)) and len(result) == 1 and hasattr(result[0], "text"):
+        if structured_payload(result[0]) is not None:
+            return result
         try:
             return json.loads(result[0].text)
         except (json.JSONDecodeError, TypeError):
@@ -49,6 +56,7 @@ _DIRECT_HTTP_TOOL_HANDLERS: Dict[str, ToolHandler] = {
     "identity": handle_identity_adapter,
     "onboard": handle_onboard_v2,
     "process_agent_update": handle_process_agent_update,
+    "process_agent_updates_batch": handle_process_agent_updates_batch,
 }
 
 
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 import time
 from pathlib import Path
-from typing import Sequence
+from typing import Callable, Dict, List, Optional, Sequence
 
 from mcp.types import TextContent
 
@@ -17,6 +19,111 @@ from src.services.update_response_service import (
 logger = get_logger(__name__)
 
 
+def _enrichment_planning_enabled() -> bool:
+    """``UNITARES_ENRICHMENT_PLANNING`` — skip enrichments the response mode discards."""
+    return os.getenv("UNITARES_ENRICHMENT_PLANNING", "1").strip().lower() not in ("0", "false", "no")
+
+
+async def _lock_timeout_response(ctx) -> Sequence[TextContent]:
+    """Clean stale lock files after an agent-lock timeout and build the LOCK_TIMEOUT error."""
+    from src.mcp_handlers.utils import error_response
+
+    cleaned = False
+    try:
+        from src.lock_cleanup import cleanup_stale_state_locks
+        project_root = Path(__file__).resolve().parent.parent
+        cleanup_result = await ctx.loop.run_in_executor(
+            None, cleanup_stale_state_locks, project_root, 60.0, False
+        )
+        if cleanup_result["cleaned"] > 0:
+            logger.info(f"Auto-recovery: Cleaned {cleanup_result['cleaned']} stale lock(s) after timeout")
+            cleaned = True
+    except Exception as cleanup_error:
+        logger.warning(f"Could not perform emergency lock cleanup: {cleanup_error}")
+
+    cleanup_msg = (
+        "The system has automatically cleaned stale locks. " if cleaned
+        else "Automatic lock cleanup was attempted but did not resolve the issue. "
+    )
+    return [error_response(
+        f"Failed to acquire lock for agent '{ctx.agent_id}' after automatic retries and cleanup. "
+        f"This usually means another active process is updating this agent. "
+        f"{cleanup_msg}If this persists, try: "
+        f"1) Wait a few seconds and retry, 2) Check for other Cursor/Claude sessions, "
+        f"3) Use cleanup_stale_locks tool, or 4) Restart Cursor if stuck."
+        ,
+        error_code="LOCK_TIMEOUT",
+        error_category="system_error",
+        details={
+            "lock_error": True,
+            "agent_id": ctx.agent_id,
+        },
+        arguments=ctx.arguments,
+    )]
+
+
+async def _respond(ctx, *, serializer=None, tick=None) -> Sequence[TextContent]:
+    """Build, enrich, format and serialize the response for an applied update."""
+    from src.mcp_handlers.updates.pipeline import run_enrichment_pipeline
+    from src.mcp_handlers.response_formatter import (
+        fields_for_mode,
+        format_response,
+        resolve_response_mode,
+    )
+
+    if tick is None:
+        def tick(label: str) -> None:
+            pass
+
+    ctx.response_data = build_process_update_response_data(
+        result=ctx.result,
+        agent_id=ctx.agent_id,
+        identity_assurance=ctx.identity_assurance,
+        monitor=ctx.monitor,
+        ctx_warnings=getattr(ctx, "warnings", ()),
+    )
+    tick("build_response")
+
+    # Resolve the response mode up front so enrichments whose output the
+    # mode discards are never run (side-effecting ones always run).
+    response_mode = None
+    kept_fields = None
+    try:
+        response_mode = resolve_response_mode(ctx.response_data, ctx.arguments, meta=ctx.meta)
+        if _enrichment_planning_enabled():
+            kept_fields = fields_for_mode(response_mode)
+    except Exception as mode_err:
+        logger.debug(f"Response mode pre-resolution failed, running full pipeline: {mode_err}")
+
+    await run_enrichment_pipeline(ctx, fields=kept_fields)
+    tick("enrichment")
+
+    try:
+        ctx.response_data = format_response(
+            ctx.response_data,
+            ctx.arguments,
+            meta=ctx.meta,
+            is_new_agent=ctx.is_new_agent,
+            key_was_generated=ctx.key_was_generated,
+            api_key_auto_retrieved=ctx.api_key_auto_retrieved,
+            task_type=ctx.task_type,
+            response_mode=response_mode,
+        )
+    except Exception as fmt_err:
+        logger.error(f"Response formatting failed: {fmt_err}", exc_info=True)
+
+    ctx.arguments["lite_response"] = True
+    result = serialize_process_update_response(
+        response_data=ctx.response_data,
+        agent_uuid=ctx.agent_uuid,
+        arguments=ctx.arguments,
+        fallback_result=ctx.result,
+        serializer=serializer,
+    )
+    tick("serialize")
+    return result
+
+
 async def run_process_update_workflow(ctx, *, serializer=None) -> Sequence[TextContent]:
     """Execute the extracted process_agent_update workflow for a prepared UpdateContext."""
     from src.mcp_handlers.updates.phases import (
@@ -27,9 +134,6 @@ async def run_process_update_workflow(ctx, *, serializer=None) -> Sequence[TextC
         resolve_identity_and_guards,
         transform_inputs,
     )
-    from src.mcp_handlers.updates.pipeline import run_enrichment_pipeline
-    from src.mcp_handlers.response_formatter import format_response
-    from src.mcp_handlers.utils import error_response
 
     # Per-phase latency instrumentation. Emits one INFO line per call so we can
     # see in data whether the anyio-asyncio serialization cost lives in the
@@ -74,80 +178,195 @@ async def run_process_update_workflow(ctx, *, serializer=None) -> Sequence[TextC
                 ctx.monitor = ctx.mcp_server.monitors.get(ctx.agent_id)
         except TimeoutError:
             _tick("lock_timeout")
-            cleaned = False
-            try:
-                from src.lock_cleanup import cleanup_stale_state_locks
-                project_root = Path(__file__).resolve().parent.parent
-                cleanup_result = await ctx.loop.run_in_executor(
-                    None, cleanup_stale_state_locks, project_root, 60.0, False
-                )
-                if cleanup_result["cleaned"] > 0:
-                    logger.info(f"Auto-recovery: Cleaned {cleanup_result['cleaned']} stale lock(s) after timeout")
-                    cleaned = True
-            except Exception as cleanup_error:
-                logger.warning(f"Could not perform emergency lock cleanup: {cleanup_error}")
-
-            cleanup_msg = (
-                "The system has automatically cleaned stale locks. " if cleaned
-                else "Automatic lock cleanup was attempted but did not resolve the issue. "
-            )
-            return [error_response(
-                f"Failed to acquire lock for agent '{ctx.agent_id}' after automatic retries and cleanup. "
-                f"This usually means another active process is updating this agent. "
-                f"{cleanup_msg}If this persists, try: "
-                f"1) Wait a few seconds and retry, 2) Check for other Cursor/Claude sessions, "
-                f"3) Use cleanup_stale_locks tool, or 4) Restart Cursor if stuck."
-                ,
-                error_code="LOCK_TIMEOUT",
-                error_category="system_error",
-                details={
-                    "lock_error": True,
-                    "agent_id": ctx.agent_id,
-                },
-                arguments=ctx.arguments,
-            )]
+            return await _lock_timeout_response(ctx)
 
         # --- Everything below runs OUTSIDE the lock ---
 
         await execute_post_update_effects(ctx)
         _tick("post_update")
 
-        ctx.response_data = build_process_update_response_data(
-            result=ctx.result,
-            agent_id=ctx.agent_id,
-            identity_assurance=ctx.identity_assurance,
-            monitor=ctx.monitor,
-            ctx_warnings=getattr(ctx, "warnings", ()),
-        )
-        _tick("build_response")
-
-        await run_enrichment_pipeline(ctx)
-        _tick("enrichment")
-
-        try:
-            ctx.response_data = format_response(
-                ctx.response_data,
-                ctx.arguments,
-                meta=ctx.meta,
-                is_new_agent=ctx.is_new_agent,
-                key_was_generated=ctx.key_was_generated,
-                api_key_auto_retrieved=ctx.api_key_auto_retrieved,
-                task_type=ctx.task_type,
-            )
-        except Exception as fmt_err:
-            logger.error(f"Response formatting failed: {fmt_err}", exc_info=True)
-
-        ctx.arguments["lite_response"] = True
-        result = serialize_process_update_response(
-            response_data=ctx.response_data,
-            agent_uuid=ctx.agent_uuid,
-            arguments=ctx.arguments,
-            fallback_result=ctx.result,
-            serializer=serializer,
-        )
-        _tick("serialize")
-        return result
+        return await _respond(ctx, serializer=serializer, tick=_tick)
     finally:
         total_ms = int((time.perf_counter() - _t_total) * 1000)
         phases_str = " ".join(f"{k}={v}ms" for k, v in _phase_ms.items())
         logger.info(f"[checkin_phases] total={total_ms}ms {phases_str}")
+
+
+# Identity fields resolve_identity_and_guards sets; a batch resolves them once
+# per agent and copies them onto the agent's other check-ins.
+_BATCH_IDENTITY_FIELDS = (
+    "agent_uuid", "agent_id", "session_key", "session_resolution_source",
+    "trajectory_confidence", "identity_assurance", "label", "declared_agent_id",
+    "loop", "key_was_generated", "api_key_auto_retrieved",
+    "dialectic_enforcement_warning",
+)
+
+
+async def run_process_update_batch(
+    contexts: Sequence,
+    *,
+    serializer=None,
+    on_error: Optional[Callable[[Exception], Sequence[TextContent]]] = None,
+) -> List[Sequence[TextContent]]:
+    """Run several check-ins, grouped by agent. Returns per-item results in order.
+
+    Each context's ``agent_uuid`` must already name its target agent. Per
+    agent group: identity and guards are resolved once, the inputs of every
+    check-in are prepared unlocked, then one lock acquisition applies them in
+    submission order. The agent_state rows of the whole batch are written with
+    one executemany after all groups finish; the effects that follow a state
+    row (execute_recorded_effects) then run for each update whose row was
+    recorded, and enrichment and formatting run per item after that, outside
+    every lock.
+
+    on_error maps an unexpected per-item exception to that item's result;
+    without it the exception propagates.
+    """
+    from src.mcp_handlers.context import (
+        get_context_agent_id,
+        get_session_context,
+        reset_session_context,
+        reset_session_resolution_source,
+        set_session_context,
+        set_session_resolution_source,
+    )
+    from src.mcp_handlers.updates.phases import (
+        execute_locked_update,
+        execute_post_update_effects,
+        execute_recorded_effects,
+        handle_onboarding_and_resume,
+        persist_agent_states,
+        prepare_unlocked_inputs,
+        resolve_identity_and_guards,
+        transform_inputs,
+    )
+
+    t_start = time.perf_counter()
+    results: List[Optional[Sequence[TextContent]]] = [None] * len(contexts)
+    applied: List[int] = []
+
+    def fail(i: int, exc: Exception) -> None:
+        if on_error is None:
+            raise exc
+        logger.error(f"Batched check-in {i} failed: {exc}", exc_info=True)
+        results[i] = on_error(exc)
+
+    groups: Dict[str, List[int]] = {}
+    for i, ctx in enumerate(contexts):
+        groups.setdefault(ctx.agent_uuid, []).append(i)
+    caller_uuid = get_context_agent_id()
+
+    async def run_group(agent_uuid: str, indices: List[int]) -> None:
+        leader = contexts[indices[0]]
+        session = {**get_session_context(), "agent_id": agent_uuid}
+        foreign = agent_uuid != caller_uuid
+        if foreign:
+            # Proven by the item's continuity token, not by the caller's session.
+            session.update(session_key=None, client_session_id=None)
+        session_token = set_session_context(**session)
+        source_token = set_session_resolution_source("continuity_token") if foreign else None
+        try:
+            early_exit = await resolve_identity_and_guards(leader)
+        except Exception as exc:
+            for i in indices:
+                fail(i, exc)
+            return
+        finally:
+            if source_token is not None:
+                reset_session_resolution_source(source_token)
+            reset_session_context(session_token)
+        if early_exit:
+            for i in indices:
+                results[i] = early_exit
+            return
+
+        ready: List[int] = []
+        for i in indices:
+            ctx = contexts[i]
+            try:
+                if ctx is not leader:
+                    for name in _BATCH_IDENTITY_FIELDS:
+                        setattr(ctx, name, getattr(leader, name))
+                    ctx.is_new_agent = False  # the leader's update creates the agent
+                    ctx.arguments["agent_id"] = leader.declared_agent_id
+                    ctx.arguments["_agent_uuid"] = leader.agent_uuid
+                    ctx.arguments["_agent_label"] = leader.declared_agent_id
+                early_exit = await handle_onboarding_and_resume(ctx)
+                if not early_exit:
+                    early_exit = transform_inputs(ctx)
+                if early_exit:
+                    results[i] = early_exit
+                    continue
+                await prepare_unlocked_inputs(ctx)
+                ready.append(i)
+            except Exception as exc:
+                fail(i, exc)
+        if not ready:
+            return
+
+        done: List[int] = []
+        try:
+            async with leader.mcp_server.lock_manager.acquire_agent_lock_async(
+                leader.agent_id, timeout=5.0, max_retries=3
+            ):
+                for i in ready:
+                    ctx = contexts[i]
+                    try:
+                        early_exit = await execute_locked_update(ctx)
+                        if early_exit:
+                            results[i] = early_exit
+                            continue
+                        ctx.monitor = ctx.mcp_server.monitors.get(ctx.agent_id)
+                        done.append(i)
+                    except Exception as exc:
+                        fail(i, exc)
+        except TimeoutError:
+            lock_error = await _lock_timeout_response(leader)
+            for i in ready:
+                if i not in done and results[i] is None:
+                    results[i] = lock_error
+            if not done:
+                return
+
+        # --- Everything below runs OUTSIDE the lock ---
+        for i in done:
+            ctx = contexts[i]
+            ctx.defer_state_record = True
+            try:
+                await execute_post_update_effects(ctx)
+                applied.append(i)
+            except Exception as exc:
+                fail(i, exc)
+
+    await asyncio.gather(*(run_group(uuid, indices) for uuid, indices in groups.items()))
+    applied.sort()
+
+    # PostgreSQL: one executemany for every applied check-in in the batch.
+    # As in the single path, the effects that follow the state row only run
+    # for updates whose row passed persist_agent_state's gate.
+    recorded = {id(ctx) for ctx in await persist_agent_states([contexts[i] for i in applied])}
+
+    async def run_recorded(indices: List[int]) -> None:
+        for i in indices:
+            if i not in applied or id(contexts[i]) not in recorded:
+                continue
+            try:
+                await execute_recorded_effects(contexts[i])
+            except Exception as exc:
+                applied.remove(i)
+                fail(i, exc)
+
+    await asyncio.gather(*(run_recorded(indices) for indices in groups.values()))
+
+    for i in applied:
+        try:
+            results[i] = await _respond(contexts[i], serializer=serializer)
+        except Exception as exc:
+            fail(i, exc)
+
+    total_ms = int((time.perf_counter() - t_start) * 1000)
+    logger.info(
+        f"[checkin_batch] total={total_ms}ms items={len(contexts)} "
+        f"agents={len(groups)} applied={len(applied)}"
+    )
+    return results
@@ -9,6 +9,15 @@ Features:
 - Exponential backoff retry with automatic recovery
 - Process health checking to detect stale locks
 - Async support for non-blocking lock acquisition in async contexts
+- In-process asyncio lock table for async callers, with optional cross-process
+  fencing (file or Redis) layered underneath when multi-process mode is set
+
+Async fencing is selected with UNITARES_AGENT_LOCK_FENCE:
+- "none" (default): single server process. Coroutines for the same agent queue
+  on an asyncio.Lock (FIFO wakeups); no filesystem work per acquisition.
+- "file": additionally hold the fcntl lock file (several server processes on
+  one host share data/locks).
+- "redis": additionally hold DistributedLock (several hosts).
 """
 
 import fcntl
@@ -18,7 +27,16 @@ import json
 import asyncio
 from pathlib import Path
 from contextlib import contextmanager, asynccontextmanager
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+
+from src.metrics_registry import AGENT_LOCK_WAIT
+
+FENCE_MODES = ("none", "file", "redis")
+
+
+def _fence_from_env() -> str:
+    fence = os.getenv("UNITARES_AGENT_LOCK_FENCE", "none").strip().lower()
+    return fence if fence in FENCE_MODES else "none"
 
 
 def is_process_alive(pid: int) -> bool:
@@ -30,6 +48,52 @@ def is_process_alive(pid: int) -> bool:
         return False
 
 
+class AgentLockTable:
+    """Per-agent asyncio locks for one server process.
+
+    Entries are reference-counted and dropped once no coroutine holds or waits
+    on them, so the table only ever contains agents with an update in flight.
+    asyncio.Lock wakes waiters in FIFO order.
+    """
+
+    def __init__(self) -> None:
+        # agent_id -> [lock, holders + waiters]
+        self._entries: Dict[str, List[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def locked(self, agent_id: str) -> bool:
+        entry = self._entries.get(agent_id)
+        return entry is not None and entry[0].locked()
+
+    @asynccontextmanager
+    async def hold(self, agent_id: str, timeout: float):
+        """Hold the agent's lock; raises TimeoutError after ``timeout`` seconds."""
+        entry = self._entries.get(agent_id)
+        if entry is None:
+            entry = [asyncio.Lock(), 0]
+            self._entries[agent_id] = entry
+        entry[1] += 1
+        lock = entry[0]
+        try:
+            try:
+                await asyncio.wait_for(lock.acquire(), timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError(
+                    f"Lock timeout for agent '{agent_id}' after {timeout:.1f}s. "
+                    f"Another update for this agent is still in progress."
+                ) from None
+            try:
+                yield
+            finally:
+                lock.release()
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and self._entries.get(agent_id) is entry:
+                del self._entries[agent_id]
+
+
 class StateLockManager:
     """Ensures only one process can modify agent state at a time"""
     
@@ -37,7 +101,8 @@ class StateLockManager:
         self, 
         lock_dir: Optional[Path] = None, 
         auto_cleanup_stale: bool = True, 
-        stale_threshold: float = 60.0
+        stale_threshold: float = 60.0,
+        fence: Optional[str] = None,
     ) -> None:
         if lock_dir is None:
             # Use project data directory for locks
@@ -47,6 +112,9 @@ class StateLockManager:
         self.lock_dir.mkdir(parents=True, exist_ok=True)
         self.auto_cleanup_stale = auto_cleanup_stale
         self.stale_threshold = stale_threshold  # Seconds before considering lock stale
+        # Cross-process fence for async acquisitions (see module docstring)
+        self.fence = fence if fence in FENCE_MODES else _fence_from_env()
+        self.local_locks = AgentLockTable()
         
     def _check_and_clean_stale_lock(self, lock_file: Path) -> bool:
         """
@@ -284,11 +352,51 @@ class StateLockManager:
     
     @asynccontextmanager
     async def acquire_agent_lock_async(self, agent_id: str, timeout: float = 5.0, max_retries: int = 3):
+        """
+        Acquire exclusive access to an agent's state from async code.
+
+        Always serializes same-process coroutines on the in-process lock table,
+        then takes the configured cross-process fence (if any). Both share one
+        budget of ``timeout * max_retries``: the fence only gets what the
+        in-process wait left over. Time spent waiting is recorded in the
+        unitares_agent_lock_wait_seconds histogram.
+
+        Args:
+            agent_id: Agent identifier
+            timeout: Timeout per retry attempt in seconds
+            max_retries: Maximum number of retry attempts with cleanup
+
+        Raises:
+            TimeoutError: If the lock cannot be acquired in time
+        """
+        retries = max(1, max_retries)
+        budget = timeout * retries
+        start = time.perf_counter()
+        async with self.local_locks.hold(agent_id, budget):
+            remaining = budget - (time.perf_counter() - start)
+            if self.fence in ("file", "redis") and remaining <= 0:
+                raise TimeoutError(
+                    f"Lock timeout for agent '{agent_id}' after {budget:.1f}s. "
+                    f"Another update for this agent is still in progress."
+                )
+            if self.fence == "file":
+                async with self._acquire_file_lock_async(agent_id, remaining / retries, retries):
+                    AGENT_LOCK_WAIT.labels(fence=self.fence).observe(time.perf_counter() - start)
+                    yield
+            elif self.fence == "redis":
+                from src.cache.distributed_lock import get_distributed_lock
+                async with get_distributed_lock().acquire(agent_id, timeout=remaining):
+                    AGENT_LOCK_WAIT.labels(fence=self.fence).observe(time.perf_counter() - start)
+                    yield
+            else:
+                AGENT_LOCK_WAIT.labels(fence=self.fence).observe(time.perf_counter() - start)
+                yield
+
+    @asynccontextmanager
+    async def _acquire_file_lock_async(self, agent_id: str, timeout: float = 5.0, max_retries: int = 3):
         """
         Async version of acquire_agent_lock - uses asyncio.sleep() instead of time.sleep()
-        to avoid blocking the event loop.
-        
-        Use this in async handlers (like MCP handlers) to prevent blocking.
+        to avoid blocking the event loop. Used as the "file" fence.
         
         Args:
             agent_id: Agent identifier
@@ -8,14 +8,22 @@ Uses PostgreSQL + AGE for native graph queries.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
+import time
 import uuid
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set
 from pathlib import Path
 
+try:
+    import asyncpg
+except ImportError:
+    asyncpg = None  # type: ignore
+
 from src.logging_utils import get_logger
-from src.knowledge_graph import DiscoveryNode, ResponseTo
+from src.edge_index import EDGE_LABELS, EDGE_TYPES, TypedEdgeIndex, edge_index_enabled
+from src.knowledge_graph import DiscoveryNode, ResponseTo, invalidate_rerank_scores
 from src.mcp_handlers.knowledge.limits import EMBED_DETAILS_WINDOW
 from src.db import get_db
 from src.db.age_queries import (
@@ -34,6 +42,30 @@ from src.db.age_queries import (
 logger = get_logger(__name__)
 
 
+def discovery_embedding_text(summary: Optional[str], details: Optional[str]) -> str:
+    """The text a discovery's embedding is computed from."""
+    return f"{summary or ''}\n{details[:EMBED_DETAILS_WINDOW] if details else ''}"
+
+
+def embedding_content_hash(text: str) -> str:
+    """sha256 of the embedded text, stored as content_hash (migration 040).
+
+    Must agree with the SQL knowledge.discovery_embedding_hash(summary,
+    details), which stale-embedding checks compare against.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _diff_and_rebuild(
+    index: TypedEdgeIndex, graph_edges: List[tuple[str, str, str]], repair: bool,
+) -> tuple[Dict[str, Any], Optional[TypedEdgeIndex]]:
+    """Diff *index* against the graph; with *repair*, build a replacement on drift."""
+    diff = index.diff(graph_edges)
+    if repair and (diff["missing"] or diff["extra"]):
+        return diff, TypedEdgeIndex(graph_edges, compact_threshold=index.compact_threshold)
+    return diff, None
+
+
 class KnowledgeGraphAGE:
     """
     AGE-backed knowledge graph implementation.
@@ -50,6 +82,14 @@ class KnowledgeGraphAGE:
         self._db = None
         self._indexes_created = False
         self.rate_limit_stores_per_hour = 20  # Max stores per agent per hour
+        # Typed-edge adjacency for graph expansion; None until load_edge_index().
+        self.edge_index: Optional[TypedEdgeIndex] = None
+        # Edges indexed while check_edge_index() runs, replayed onto a rebuild.
+        self._edge_index_replay: Optional[List[tuple[str, str, str]]] = None
+        # Embedding table -> has content_hash (migration 040); probed on first store.
+        self._embedding_content_hash: Dict[str, bool] = {}
+        # Set once knowledge.discovery_connectivity is found missing (pre-039).
+        self._connectivity_table_missing = False
 
     @staticmethod
     def _parse_optional_datetime(value: Any) -> Optional[datetime]:
@@ -181,11 +221,16 @@ class KnowledgeGraphAGE:
         discovery: DiscoveryNode,
         created_at: datetime,
     ) -> None:
-        """Sync durable edge rows sourced from a discovery payload."""
+        """Sync durable edge rows sourced from a discovery payload.
+
+        Edges recorded by link_discoveries (metadata.source = 'link') are not
+        part of the payload and are left alone.
+        """
         await conn.execute(
             """
             DELETE FROM knowledge.discovery_edges
             WHERE src_id = $1 AND edge_type IN ('related', 'responds_to')
+              AND (metadata->>'source') IS DISTINCT FROM 'link'
             """,
             discovery.id,
         )
@@ -267,6 +312,146 @@ class KnowledgeGraphAGE:
                     edge_rows,
                 )
 
+    async def _record_edges(
+        self,
+        edges: List[tuple[str, str, str, Optional[float], Optional[Dict[str, Any]]]],
+    ) -> None:
+        """Record graph edges created outside add_discovery in discovery_edges.
+
+        ``edges`` are ``(src_id, dst_id, edge_type, weight, metadata)``.
+        Best-effort: the AGE edge already exists, and a missing row only
+        leaves the connectivity counters short until reconcile_connectivity
+        runs. Endpoints without a knowledge.discoveries row are skipped.
+        """
+        if not edges:
+            return
+        self._index_edges((src, dst, edge_type) for src, dst, edge_type, _, _ in edges)
+        try:
+            db = await self._get_db()
+            async with db.acquire() as conn:
+                await conn.executemany(
+                    """
+                    INSERT INTO knowledge.discovery_edges (
+                        src_id, dst_id, edge_type, weight, metadata
+                    )
+                    SELECT $1, $2, $3, COALESCE($4, 1.0), $5::jsonb
+                    WHERE EXISTS (SELECT 1 FROM knowledge.discoveries WHERE id = $1)
+                      AND EXISTS (SELECT 1 FROM knowledge.discoveries WHERE id = $2)
+                    ON CONFLICT (src_id, dst_id, edge_type) DO NOTHING
+                    """,
+                    [
+                        (src, dst, edge_type, weight, json.dumps(metadata) if metadata else None)
+                        for src, dst, edge_type, weight, metadata in edges
+                    ],
+                )
+        except Exception as e:
+            logger.warning(f"Failed to record durable edge rows: {e}")
+
+    def _index_edges(self, edges) -> None:
+        """Add new graph edges to the in-memory edge index, if one is loaded."""
+        if self.edge_index is not None:
+            edges = list(edges)
+            self.edge_index.add_many(edges)
+            if self._edge_index_replay is not None:
+                self._edge_index_replay.extend(edges)
+
+    async def _graph_edges(self) -> List[tuple[str, str, str]]:
+        """Every RELATED_TO / RESPONDS_TO / SUPERSEDES edge in AGE, one label at a time."""
+        db = await self._get_db()
+        edges = []
+        for label, edge_type in EDGE_LABELS.items():
+            cypher = f"""
+                MATCH (src:Discovery)-[:{label}]->(dst:Discovery)
+                RETURN {{src: src.id, dst: dst.id}}
+            """
+            for result in await db.graph_query(cypher, {}):
+                if not isinstance(result, dict) or "error" in result:
+                    continue
+                src, dst = result.get("src"), result.get("dst")
+                if isinstance(src, str) and isinstance(dst, str):
+                    edges.append((src.strip('"'), dst.strip('"'), edge_type))
+        return edges
+
+    async def load_edge_index(self) -> Optional[TypedEdgeIndex]:
+        """Build the edge index from knowledge.discovery_edges.
+
+        The durable table loads in one query; graph edges it is missing
+        (links made before migration 039) are picked up by the first
+        check_edge_index().
+        """
+        try:
+            db = await self._get_db()
+            async with db.acquire() as conn:
+                rows = await conn.fetch(
+                    """
+                    SELECT src_id, dst_id, edge_type
+                    FROM knowledge.discovery_edges
+                    WHERE edge_type = ANY($1::text[])
+                    """,
+                    list(EDGE_TYPES),
+                )
+        except Exception as e:
+            logger.warning(f"Edge index not loaded: {e}")
+            return None
+        self.edge_index = TypedEdgeIndex((r["src_id"], r["dst_id"], r["edge_type"]) for r in rows)
+        self._publish_edge_index_metrics()
+        stats = self.edge_index.stats()
+        logger.info(
+            f"Edge index loaded: {stats['edges']} edges over {stats['discoveries']} discoveries "
+            f"({stats['bytes']['total'] // 1024} KiB)"
+        )
+        return self.edge_index
+
+    async def check_edge_index(self, repair: bool = True) -> Dict[str, Any]:
+        """Compare the edge index against the AGE graph.
+
+        The graph is the reference, as in reconcile_connectivity. Returns
+        ``{"edges", "missing", "extra", "sample", "repaired", "consistent"}``
+        as found before any repair; with ``repair``, a drifted index is
+        rebuilt from the graph edges. The diff and rebuild run in the default
+        executor against a snapshot; edges indexed meanwhile are replayed
+        onto the rebuilt index before it is swapped in.
+        """
+        if self.edge_index is None:
+            return {"success": False, "error": "Edge index not loaded"}
+        db = await self._get_db()
+        if not await db.graph_available():
+            return {"success": False, "error": "Graph database not available"}
+
+        self._edge_index_replay = []
+        try:
+            snapshot = self.edge_index.snapshot()
+            graph_edges = await self._graph_edges()
+            diff, rebuilt = await asyncio.get_running_loop().run_in_executor(
+                None, _diff_and_rebuild, snapshot, graph_edges, repair,
+            )
+            if rebuilt is not None:
+                rebuilt.add_many(self._edge_index_replay)
+                self.edge_index = rebuilt
+        finally:
+            self._edge_index_replay = None
+        consistent = not diff["missing"] and not diff["extra"]
+        self.edge_index.checked_at = time.time()
+        self.edge_index.last_check = {"missing": diff["missing"], "extra": diff["extra"]}
+        self._publish_edge_index_metrics()
+        return {
+            "success": True,
+            "edges": len(graph_edges),
+            "missing": diff["missing"],
+            "extra": diff["extra"],
+            "sample": diff["sample"],
+            "repaired": rebuilt is not None,
+            "consistent": consistent,
+        }
+
+    def _publish_edge_index_metrics(self) -> None:
+        from src.metrics_registry import KNOWLEDGE_EDGE_INDEX_BYTES, KNOWLEDGE_EDGE_INDEX_EDGES
+
+        stats = self.edge_index.stats()
+        for edge_type, count in stats["by_type"].items():
+            KNOWLEDGE_EDGE_INDEX_EDGES.labels(edge_type=edge_type).set(count)
+        KNOWLEDGE_EDGE_INDEX_BYTES.set(stats["bytes"]["total"])
+
     async def _sync_updated_discovery_row(
         self,
         conn,
@@ -496,16 +681,22 @@ class KnowledgeGraphAGE:
                 )
                 await db.graph_query(tagged_cypher, tagged_params, conn=conn)
 
+        self._index_edges(
+            [(discovery.id, related_id, "related") for related_id in discovery.related_to]
+            + ([(discovery.id, discovery.response_to.discovery_id, "responds_to")]
+               if discovery.response_to else [])
+        )
+
         # Store embedding for semantic search (async, best-effort)
         if await self._pgvector_available():
             try:
                 from src.embeddings import get_embeddings_service, embeddings_available
                 if embeddings_available():
                     embeddings = await get_embeddings_service()
-                    text = f"{discovery.summary}\n{discovery.details[:EMBED_DETAILS_WINDOW] if discovery.details else ''}"
-                    emb = await embeddings.embed(text)
+                    text = discovery_embedding_text(discovery.summary, discovery.details)
+                    emb = await embeddings.embed(text, cache=False)
                     if emb is not None:
-                        task = asyncio.create_task(self._store_embedding(discovery.id, emb))
+                        task = asyncio.create_task(self._store_embedding(discovery.id, emb, text))
                         task.add_done_callback(lambda t: logger.debug(f"_store_embedding failed: {t.exception()}") if t.exception() else None)
                     else:
                         logger.debug(f"Embedding returned None for {discovery.id}, skipping storage")
@@ -769,10 +960,13 @@ class KnowledgeGraphAGE:
             status=d.get("status", "open"),
             related_to=d.get("related_to", []),
             response_to=response_to,
+            responses_from=d.get("responses_from") or [],
             references_files=d.get("references_files", []),
             resolved_at=d.get("resolved_at"),
             updated_at=d.get("updated_at"),
+            confidence=d.get("confidence"),
             provenance=d.get("provenance"),
+            provenance_chain=d.get("provenance_chain"),
         )
 
     def _node_to_discovery(self, node_data: Dict[str, Any]) -> Optional[DiscoveryNode]:
@@ -860,6 +1054,8 @@ class KnowledgeGraphAGE:
         if result is not None and "tags" in updates:
             async with db._pool.acquire() as conn:
                 await self._sync_discovery_tags(conn, discovery_id, updates.get("tags") or [])
+        if result is not None and ("summary" in updates or "details" in updates):
+            invalidate_rerank_scores(discovery_id)
         return result is not None
 
     async def update_discovery(self, discovery_id: str, updates: Dict[str, Any]) -> bool:
@@ -912,6 +1108,7 @@ class KnowledgeGraphAGE:
                     return await self._sql_update_discovery(discovery_id, updates)
                 await self._sync_updated_discovery_row(conn, discovery_id, updates)
             if "summary" in updates or "details" in updates:
+                invalidate_rerank_scores(discovery_id)
                 await self._refresh_embedding(discovery_id)
             return True
         except Exception as e:
@@ -1155,7 +1352,8 @@ class KnowledgeGraphAGE:
 
     async def load(self) -> None:
         """
-        Initialize AGE backend and rehydrate the graph from PostgreSQL if needed.
+        Initialize AGE backend and rehydrate the graph from PostgreSQL if needed,
+        then load the edge index when graph expansion uses one (edge_index_enabled()).
         """
         db = await self._get_db()
         if not await db.graph_available():
@@ -1164,24 +1362,22 @@ class KnowledgeGraphAGE:
 
         try:
             pg_count = await self._count_postgres_discoveries()
-            if pg_count == 0:
-                return
-
-            graph_count = await self._count_age_discoveries()
-            if graph_count > 0:
-                return
-
-            logger.warning(
-                f"AGE graph '{self.graph_name}' is empty while PostgreSQL has {pg_count} discoveries; rehydrating"
-            )
-            restored = await self._rehydrate_from_postgres()
-            logger.warning(
-                f"Rehydrated AGE graph '{self.graph_name}' from PostgreSQL: "
-                f"{restored['discoveries']} discoveries, {restored['related_edges']} related edges"
-            )
+            graph_count = await self._count_age_discoveries() if pg_count else 0
+            if pg_count and not graph_count:
+                logger.warning(
+                    f"AGE graph '{self.graph_name}' is empty while PostgreSQL has {pg_count} discoveries; rehydrating"
+                )
+                restored = await self._rehydrate_from_postgres()
+                logger.warning(
+                    f"Rehydrated AGE graph '{self.graph_name}' from PostgreSQL: "
+                    f"{restored['discoveries']} discoveries, {restored['related_edges']} related edges"
+                )
         except Exception as e:
             logger.error(f"AGE graph rehydration check failed: {e}")
 
+        if edge_index_enabled():
+            await self.load_edge_index()
+
     async def _count_postgres_discoveries(self) -> int:
         """Count durable discovery rows in PostgreSQL."""
         db = await self._get_db()
@@ -1222,11 +1418,14 @@ class KnowledgeGraphAGE:
             for row in discovery_rows:
                 await self._import_discovery_row(conn, row)
             for row in related_rows:
+                metadata = row["metadata"]
+                if isinstance(metadata, str):
+                    metadata = json.loads(metadata)
                 cypher, params = create_related_to_edge(
                     from_discovery_id=row["src_id"],
                     to_discovery_id=row["dst_id"],
                     strength=row["weight"],
-                    reason=(row["metadata"] or {}).get("reason") if isinstance(row["metadata"], dict) else None,
+                    reason=metadata.get("reason") if isinstance(metadata, dict) else None,
                 )
                 await db.graph_query(cypher, params, conn=conn)
 
@@ -1450,72 +1649,105 @@ class KnowledgeGraphAGE:
         limit: int,
         min_similarity: float,
         agent_id: Optional[str] = None,
-    ) -> List[tuple[str, float]]:
+        discovery_type: Optional[str] = None,
+        status: Optional[str] = None,
+        severity: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        exclude_archived: bool = False,
+    ) -> List[tuple[DiscoveryNode, float]]:
         """
         Search using pgvector's HNSW index.
 
-        Returns list of (discovery_id, similarity_score) tuples.
+        Filters are pushed into the index query and discoveries come back
+        hydrated from knowledge.discoveries in the same round trip (see
+        kg_vector_search), so filtered searches are not short and there is
+        no per-hit get_discovery.
+
+        Returns list of (DiscoveryNode, similarity_score) tuples.
         """
         from src.embeddings import get_active_table_name
         db = await self._get_db()
-        table = get_active_table_name()
 
         # Convert list to pgvector string format: '[0.1, 0.2, ...]'
         embedding_str = '[' + ','.join(str(x) for x in query_embedding) + ']'
 
-        async with db.acquire() as conn:
-            if agent_id:
-                # Hybrid query: pgvector for similarity, later filter by agent via AGE
-                rows = await conn.fetch(
-                    f"""
-                    SELECT de.discovery_id, (1 - (de.embedding <=> $1::vector)) AS similarity
-                    FROM {table} de
-                    WHERE de.embedding IS NOT NULL
-                      AND (1 - (de.embedding <=> $1::vector)) >= $2
-                    ORDER BY de.embedding <=> $1::vector
-                    LIMIT $3
-                    """,
-                    embedding_str, min_similarity, limit * 3,
-                )
-            else:
-                rows = await conn.fetch(
-                    f"""
-                    SELECT discovery_id, (1 - (embedding <=> $1::vector)) AS similarity
-                    FROM {table}
-                    WHERE embedding IS NOT NULL
-                      AND (1 - (embedding <=> $1::vector)) >= $2
-                    ORDER BY embedding <=> $1::vector
-                    LIMIT $3
-                    """,
-                    embedding_str, min_similarity, limit,
-                )
+        rows = await db.kg_vector_search(
+            get_active_table_name(),
+            embedding_str,
+            limit,
+            min_similarity,
+            agent_id=agent_id,
+            type=discovery_type,
+            status=status,
+            severity=severity,
+            tags=tags,
+            exclude_archived=exclude_archived,
+        )
+        results = []
+        for row in rows:
+            discovery = self._dict_to_discovery(row)
+            if discovery is not None:
+                results.append((discovery, row["similarity"]))
+        return results
 
-            return [(row['discovery_id'], float(row['similarity'])) for row in rows]
+    async def _store_embedding(
+        self, discovery_id: str, embedding: List[float], text: Optional[str] = None,
+    ) -> None:
+        """Store embedding in the pgvector table for the active model.
 
-    async def _store_embedding(self, discovery_id: str, embedding: List[float]) -> None:
-        """Store embedding in the pgvector table for the active model."""
+        ``text`` is what was embedded; its hash goes in content_hash so the
+        backfill job (src/embedding_backfill.py) can tell the row is current.
+        """
         from src.embeddings import get_active_table_name, get_embeddings_service
         db = await self._get_db()
         table = get_active_table_name()
         svc = await get_embeddings_service()
         model_name = svc.model_name
+        content_hash = embedding_content_hash(text) if text is not None else None
 
         # Convert list to pgvector string format: '[0.1, 0.2, ...]'
         embedding_str = '[' + ','.join(str(x) for x in embedding) + ']'
 
         try:
             async with db.acquire() as conn:
-                await conn.execute(
-                    f"""
-                    INSERT INTO {table} (discovery_id, embedding, model_name)
-                    VALUES ($1, $2::vector, $3)
-                    ON CONFLICT (discovery_id) DO UPDATE SET
-                        embedding = EXCLUDED.embedding,
-                        model_name = EXCLUDED.model_name,
-                        updated_at = now()
-                    """,
-                    discovery_id, embedding_str, model_name,
-                )
+                has_hash = self._embedding_content_hash.get(table)
+                if has_hash is None:
+                    has_hash = bool(await conn.fetchval(
+                        "SELECT EXISTS (SELECT 1 FROM information_schema.columns "
+                        "WHERE table_schema || '.' || table_name = $1 AND column_name = 'content_hash')",
+                        table,
+                    ))
+                    self._embedding_content_hash[table] = has_hash
+                    if not has_hash:
+                        logger.warning(
+                            f"{table} has no content_hash column (migration 040 not applied); "
+                            "storing embeddings without it"
+                        )
+                if has_hash:
+                    await conn.execute(
+                        f"""
+                        INSERT INTO {table} (discovery_id, embedding, model_name, content_hash)
+                        VALUES ($1, $2::vector, $3, $4)
+                        ON CONFLICT (discovery_id) DO UPDATE SET
+                            embedding = EXCLUDED.embedding,
+                            model_name = EXCLUDED.model_name,
+                            content_hash = EXCLUDED.content_hash,
+                            updated_at = now()
+                        """,
+                        discovery_id, embedding_str, model_name, content_hash,
+                    )
+                else:
+                    await conn.execute(
+                        f"""
+                        INSERT INTO {table} (discovery_id, embedding, model_name)
+                        VALUES ($1, $2::vector, $3)
+                        ON CONFLICT (discovery_id) DO UPDATE SET
+                            embedding = EXCLUDED.embedding,
+                            model_name = EXCLUDED.model_name,
+                            updated_at = now()
+                        """,
+                        discovery_id, embedding_str, model_name,
+                    )
         except Exception as e:
             logger.debug(f"Failed to store embedding for {discovery_id}: {e}")
 
@@ -1532,11 +1764,11 @@ class KnowledgeGraphAGE:
             if not discovery:
                 return
             embeddings = await get_embeddings_service()
-            text = f"{discovery.summary}\n{discovery.details[:EMBED_DETAILS_WINDOW] if discovery.details else ''}"
-            emb = await embeddings.embed(text)
+            text = discovery_embedding_text(discovery.summary, discovery.details)
+            emb = await embeddings.embed(text, cache=False)
             if emb is None:
                 return
-            await self._store_embedding(discovery_id, emb)
+            await self._store_embedding(discovery_id, emb, text)
         except Exception as e:
             logger.debug(f"Failed to refresh embedding for {discovery_id}: {e}")
 
@@ -1591,67 +1823,201 @@ class KnowledgeGraphAGE:
             logger.debug(f"Failed to get connectivity score for {discovery_id}: {e}")
             return 0.0
 
+    @staticmethod
+    def _connectivity_from_counts(related: int, responds: int, superseded_by: int) -> float:
+        """Normalized connectivity score from inbound edge counts."""
+        import math
+        raw_score = min(related + (responds * 2), 50)
+        normalized = math.log1p(raw_score) / math.log1p(100)
+        # Penalize superseded entries: halve score for each supersession
+        if superseded_by > 0:
+            normalized *= 0.5 ** superseded_by
+        return min(1.0, normalized)
+
     async def get_connectivity_scores_batch(self, discovery_ids: List[str]) -> Dict[str, float]:
         """
         Get connectivity scores for multiple discoveries in one query.
 
-        More efficient than calling get_connectivity_score() repeatedly.
+        Reads the in-degree counters in knowledge.discovery_connectivity
+        (migration 039) — one primary-key lookup, no graph traversal. Falls
+        back to counting edges in AGE only when the table does not exist
+        (remembered for the life of the process); any other error yields
+        neutral scores rather than a graph traversal under DB pressure.
         """
         if not discovery_ids:
             return {}
+        if self._connectivity_table_missing:
+            return await self._graph_connectivity_scores_batch(discovery_ids)
 
         db = await self._get_db()
 
-        if not await db.graph_available():
-            return {d: 0.0 for d in discovery_ids}
-
-        # Batch query for all discovery IDs - return single column per row
-        # Need WITH clause for proper grouping before RETURN
-        # Also count inbound SUPERSEDES edges to penalize superseded entries
-        cypher = """
-            UNWIND ${ids} as disc_id
-            MATCH (d:Discovery {id: disc_id})
-            OPTIONAL MATCH (other:Discovery)-[r:RELATED_TO]->(d)
-            OPTIONAL MATCH (resp:Discovery)-[rt:RESPONDS_TO]->(d)
-            OPTIONAL MATCH (newer:Discovery)-[s:SUPERSEDES]->(d)
-            WITH d.id as id, count(DISTINCT other) as related, count(DISTINCT resp) as responds, count(DISTINCT newer) as superseded_by
-            RETURN {id: id, related: related, responds: responds, superseded_by: superseded_by}
-        """
-
         try:
-            results = await db.graph_query(cypher, {"ids": discovery_ids})
-            scores = {}
+            async with db.acquire() as conn:
+                rows = await conn.fetch(
+                    """
+                    SELECT discovery_id, related, responds, superseded_by
+                    FROM knowledge.discovery_connectivity
+                    WHERE discovery_id = ANY($1::text[])
+                    """,
+                    list(discovery_ids),
+                )
+        except Exception as e:
+            if asyncpg is not None and isinstance(e, asyncpg.UndefinedTableError):
+                logger.warning(
+                    "knowledge.discovery_connectivity missing (migration 039 not applied); "
+                    "counting graph edges for connectivity"
+                )
+                self._connectivity_table_missing = True
+                return await self._graph_connectivity_scores_batch(discovery_ids)
+            logger.debug(f"Connectivity counters unavailable, using neutral scores: {e}")
+            return {d: 0.0 for d in discovery_ids}
 
-            import math
-            for result in results:
-                if not isinstance(result, dict) or "error" in result:
-                    continue
+        scores = {d: 0.0 for d in discovery_ids}
+        for row in rows:
+            scores[row["discovery_id"]] = self._connectivity_from_counts(
+                row["related"], row["responds"], row["superseded_by"],
+            )
+        return scores
 
-                disc_id = result.get("id", "")
-                if isinstance(disc_id, str):
-                    disc_id = disc_id.strip('"')
+    async def _graph_inbound_counts(
+        self,
+        discovery_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, int]]:
+        """Count inbound RELATED_TO / RESPONDS_TO / SUPERSEDES sources in AGE.
 
-                related_count = int(result.get("related", 0) or 0)
-                responds_count = int(result.get("responds", 0) or 0)
-                superseded_count = int(result.get("superseded_by", 0) or 0)
+        Restricted to ``discovery_ids`` when given, else every discovery with
+        at least one inbound edge. Returns ``{id: {related, responds,
+        superseded_by}}``.
+        """
+        db = await self._get_db()
+        if discovery_ids is not None:
+            # Batch query for all discovery IDs - return single column per row
+            # Need WITH clause for proper grouping before RETURN
+            cypher = """
+                UNWIND ${ids} as disc_id
+                MATCH (d:Discovery {id: disc_id})
+                OPTIONAL MATCH (other:Discovery)-[r:RELATED_TO]->(d)
+                OPTIONAL MATCH (resp:Discovery)-[rt:RESPONDS_TO]->(d)
+                OPTIONAL MATCH (newer:Discovery)-[s:SUPERSEDES]->(d)
+                WITH d.id as id, count(DISTINCT other) as related, count(DISTINCT resp) as responds, count(DISTINCT newer) as superseded_by
+                RETURN {id: id, related: related, responds: responds, superseded_by: superseded_by}
+            """
+            results = await db.graph_query(cypher, {"ids": discovery_ids})
+        else:
+            # One aggregate per edge label; chaining OPTIONAL MATCHes over the
+            # whole graph would multiply the rows before counting.
+            results = []
+            for label, key in (("RELATED_TO", "related"), ("RESPONDS_TO", "responds"),
+                               ("SUPERSEDES", "superseded_by")):
+                cypher = f"""
+                    MATCH (src:Discovery)-[:{label}]->(d:Discovery)
+                    WITH d.id as id, count(DISTINCT src) as n
+                    RETURN {{id: id, {key}: n}}
+                """
+                results.extend(await db.graph_query(cypher, {}))
 
-                raw_score = min(related_count + (responds_count * 2), 50)
-                normalized = math.log1p(raw_score) / math.log1p(100)
-                # Penalize superseded entries: halve score for each supersession
-                if superseded_count > 0:
-                    normalized *= 0.5 ** superseded_count
-                scores[disc_id] = min(1.0, normalized)
+        counts: Dict[str, Dict[str, int]] = {}
+        for result in results:
+            if not isinstance(result, dict) or "error" in result:
+                continue
+            disc_id = result.get("id", "")
+            if isinstance(disc_id, str):
+                disc_id = disc_id.strip('"')
+            entry = counts.setdefault(disc_id, {"related": 0, "responds": 0, "superseded_by": 0})
+            for key in entry:
+                if key in result:
+                    entry[key] = int(result.get(key, 0) or 0)
+        return counts
+
+    async def _graph_connectivity_scores_batch(self, discovery_ids: List[str]) -> Dict[str, float]:
+        """Connectivity scores from a live AGE traversal (pre-039 fallback)."""
+        db = await self._get_db()
 
-            # Fill in zeros for any missing IDs
-            for d in discovery_ids:
-                if d not in scores:
-                    scores[d] = 0.0
+        if not await db.graph_available():
+            return {d: 0.0 for d in discovery_ids}
 
-            return scores
+        try:
+            counts = await self._graph_inbound_counts(discovery_ids)
         except Exception as e:
             logger.debug(f"Failed to get batch connectivity scores: {e}")
             return {d: 0.0 for d in discovery_ids}
 
+        scores = {d: 0.0 for d in discovery_ids}
+        for disc_id, c in counts.items():
+            scores[disc_id] = self._connectivity_from_counts(
+                c["related"], c["responds"], c["superseded_by"],
+            )
+        return scores
+
+    async def reconcile_connectivity(self, repair: bool = False) -> Dict[str, Any]:
+        """Compare knowledge.discovery_connectivity against the AGE graph.
+
+        The graph is the reference: edges created there before migration 039
+        (or written around the durable edge table) are not reflected in the
+        trigger-maintained counters. Returns ``{"checked", "drifted",
+        "drift", "repaired", "consistent"}`` as found before any repair;
+        ``drift`` samples up to 20 ``{id, table, graph}`` mismatches. With
+        ``repair``, drifted rows are overwritten with the graph counts
+        (AGE-only discoveries with no knowledge.discoveries row are skipped).
+        """
+        db = await self._get_db()
+        if not await db.graph_available():
+            return {"success": False, "error": "Graph database not available"}
+
+        graph_counts = await self._graph_inbound_counts()
+        async with db.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT discovery_id, related, responds, superseded_by
+                FROM knowledge.discovery_connectivity
+                """
+            )
+        zero = {"related": 0, "responds": 0, "superseded_by": 0}
+        table_counts = {
+            row["discovery_id"]: {k: row[k] for k in zero}
+            for row in rows
+        }
+
+        drift = []
+        for disc_id in graph_counts.keys() | table_counts.keys():
+            want = graph_counts.get(disc_id, zero)
+            have = table_counts.get(disc_id, zero)
+            if want != have:
+                drift.append({"id": disc_id, "table": have, "graph": want})
+
+        repaired = 0
+        if repair and drift:
+            async with db.transaction() as conn:
+                await conn.executemany(
+                    """
+                    INSERT INTO knowledge.discovery_connectivity AS c (
+                        discovery_id, related, responds, superseded_by
+                    )
+                    SELECT $1, $2, $3, $4
+                    WHERE EXISTS (SELECT 1 FROM knowledge.discoveries WHERE id = $1)
+                    ON CONFLICT (discovery_id) DO UPDATE SET
+                        related = EXCLUDED.related,
+                        responds = EXCLUDED.responds,
+                        superseded_by = EXCLUDED.superseded_by,
+                        updated_at = now()
+                    """,
+                    [
+                        (d["id"], d["graph"]["related"], d["graph"]["responds"],
+                         d["graph"]["superseded_by"])
+                        for d in drift
+                    ],
+                )
+            repaired = len(drift)
+
+        return {
+            "success": True,
+            "checked": len(graph_counts.keys() | table_counts.keys()),
+            "drifted": len(drift),
+            "drift": drift[:20],
+            "repaired": repaired,
+            "consistent": not drift,
+        }
+
     # Status multipliers for search ranking - resolved/archived entries rank lower
     STATUS_MULTIPLIERS = {
         "open": 1.0,
@@ -1768,6 +2134,11 @@ class KnowledgeGraphAGE:
         temporal_decay: bool = True,
         half_life_days: float = 90.0,
         status_weight: bool = True,
+        discovery_type: Optional[str] = None,
+        status: Optional[str] = None,
+        severity: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        exclude_archived: bool = False,
     ) -> List[tuple[DiscoveryNode, float]]:
         """
         Semantic search using sentence-transformer embeddings.
@@ -1792,6 +2163,12 @@ class KnowledgeGraphAGE:
             temporal_decay: If True, apply age-based decay (newer entries rank higher)
             half_life_days: Half-life for temporal decay in days (default 90)
             status_weight: If True, apply status multipliers (archived/resolved rank lower)
+            discovery_type, status, severity: Optional exact-match filters
+            tags: Optional filter — discovery has any of these tags
+            exclude_archived: If True, drop archived discoveries
+
+        Metadata filters apply before the limit (pushed into the pgvector
+        query), so a filtered search still returns up to ``limit`` hits.
 
         Returns:
             List of (DiscoveryNode, final_score) tuples, sorted by score descending.
@@ -1826,35 +2203,29 @@ class KnowledgeGraphAGE:
         
         if use_pgvector:
             logger.debug("Using pgvector for semantic search")
-            scored_ids = await self._pgvector_search(
+            raw_results = await self._pgvector_search(
                 query_embedding=query_embedding,
                 limit=limit,
                 min_similarity=min_similarity,
                 agent_id=agent_id,
+                discovery_type=discovery_type,
+                status=status,
+                severity=severity,
+                tags=tags,
+                exclude_archived=exclude_archived,
             )
-            
-            if scored_ids:
-                # Fetch full discovery nodes
-                raw_results = []
-                for discovery_id, similarity in scored_ids:
-                    discovery = await self.get_discovery(discovery_id)
-                    if discovery:
-                        # Apply agent filter if needed (pgvector doesn't filter by agent)
-                        if agent_id and discovery.agent_id != agent_id:
-                            continue
-                        raw_results.append((discovery, similarity))
-
-                if raw_results:
-                    # Blend with connectivity scores
-                    return await self._blend_with_connectivity(
-                        raw_results,
-                        connectivity_weight=connectivity_weight,
-                        exclude_orphans=exclude_orphans,
-                        limit=limit,
-                        temporal_decay=temporal_decay,
-                        half_life_days=half_life_days,
-                        status_weight=status_weight,
-                    )
+
+            if raw_results:
+                # Blend with connectivity scores
+                return await self._blend_with_connectivity(
+                    raw_results,
+                    connectivity_weight=connectivity_weight,
+                    exclude_orphans=exclude_orphans,
+                    limit=limit,
+                    temporal_decay=temporal_decay,
+                    half_life_days=half_life_days,
+                    status_weight=status_weight,
+                )
             
             # Fall through to in-memory if pgvector returned nothing
             logger.debug("pgvector returned no results, falling back to in-memory")
@@ -1865,17 +2236,19 @@ class KnowledgeGraphAGE:
         # Get candidate discoveries
         candidates = await self.query(
             agent_id=agent_id,
+            type=discovery_type,
+            status=status,
+            severity=severity,
+            tags=tags,
             limit=limit * 5,
+            exclude_archived=exclude_archived,
         )
         
         if not candidates:
             return []
         
         # Embed candidates
-        candidate_texts = [
-            f"{d.summary}\n{d.details[:EMBED_DETAILS_WINDOW] if d.details else ''}"
-            for d in candidates
-        ]
+        candidate_texts = [discovery_embedding_text(d.summary, d.details) for d in candidates]
         
         candidate_embeddings = await embeddings.embed_batch(candidate_texts)
 
@@ -1889,8 +2262,11 @@ class KnowledgeGraphAGE:
 
         # Store embeddings for future pgvector use (async, best-effort)
         if use_pgvector:
+            texts_by_id = {d.id: t for d, t in zip(candidates, candidate_texts)}
             for discovery, emb in valid_candidates:
-                task = asyncio.create_task(self._store_embedding(discovery.id, emb))
+                task = asyncio.create_task(
+                    self._store_embedding(discovery.id, emb, texts_by_id[discovery.id])
+                )
                 task.add_done_callback(lambda t: logger.debug(f"_store_embedding failed: {t.exception()}") if t.exception() else None)
 
         # Rank by similarity
@@ -2020,6 +2396,13 @@ class KnowledgeGraphAGE:
             except Exception as e:
                 logger.warning(f"Failed to create reverse edge: {e}")
 
+        # Durable copy; its insert trigger bumps the connectivity counters.
+        await self._record_edges([
+            (edge["from"], edge["to"], "related", strength,
+             {"source": "link", "reason": reason} if reason else {"source": "link"})
+            for edge in edges_created
+        ])
+
         return {
             "success": True,
             "edges_created": edges_created,
@@ -2062,6 +2445,7 @@ class KnowledgeGraphAGE:
         cypher, params = create_supersedes_edge(new_id, old_id)
         try:
             await db.graph_query(cypher, params)
+            await self._record_edges([(new_id, old_id, "supersedes", None, None)])
             return {
                 "success": True,
                 "new_id": new_id,
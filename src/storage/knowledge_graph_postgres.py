@@ -7,7 +7,7 @@ This provides unified storage with the main database and better FTS than AGE.
 
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-from src.knowledge_graph import DiscoveryNode, ResponseTo
+from src.knowledge_graph import DiscoveryNode, ResponseTo, invalidate_rerank_scores
 from src.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -158,6 +158,8 @@ class KnowledgeGraphPostgres:
         """
 
         result = await db._pool.fetchval(query, *params)
+        if result is not None and ("summary" in updates or "details" in updates):
+            invalidate_rerank_scores(discovery_id)
         return result is not None
 
     async def get_stats(
@@ -33,6 +33,7 @@ MINIMAL_MODE_TOOLS: Set[str] = {
 LITE_MODE_TOOLS: Set[str] = {
     # Core governance
     "process_agent_update",       # Log agent work
+    "process_agent_updates_batch",  # Several check-ins in one call
     "get_governance_metrics",     # Check agent state
 
     # Identity (streamlined - Dec 2025)
@@ -132,6 +133,7 @@ TOOL_TIERS: dict[str, Set[str]] = {
         "leave_note",             # Quick notes
     },
     "common": {  # Tier 2: Regularly used tools
+        "process_agent_updates_batch",
         "update_discovery_status_graph",
         "observe_agent",
         "get_agent_metadata",
@@ -190,6 +192,7 @@ TOOL_OPERATIONS: dict[str, str] = {
 
     # Core Governance
     "process_agent_update": "write",      # Updates agent state
+    "process_agent_updates_batch": "write",  # Updates agent state (batched)
     "get_governance_metrics": "read",     # Returns metrics without updating
     "simulate_update": "read",            # Dry-run, no state change
 
@@ -266,6 +269,7 @@ TOOL_OPERATIONS: dict[str, str] = {
 TOOL_CATEGORIES = {
     "core": {
         "process_agent_update",
+        "process_agent_updates_batch",
         "get_governance_metrics",
         "simulate_update",
     },
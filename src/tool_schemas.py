@@ -92,6 +92,7 @@ TOOL_ORDER = [
     "get_server_info",
     "get_connection_status",
     "process_agent_update",
+    "process_agent_updates_batch",
     "get_governance_metrics",
     "get_system_history",
     "export_to_file",
@@ -10,15 +10,17 @@ Tracks tool call frequency to identify:
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 import json
-import fcntl
+import math
 import os
 import sys
+import threading
 
 # Import structured logging
 from src.logging_utils import get_logger
 from src.audit_log import _iter_jsonl_reverse, _parse_ts_naive
+from src.jsonl_writer import append_jsonl_lines
 logger = get_logger(__name__)
 
 
@@ -32,6 +34,156 @@ class ToolUsageEntry:
     error_type: Optional[str] = None
 
 
+class ToolUsageAggregator:
+    """Sliding-window tool call counters, per agent and fleet-wide.
+
+    Each key (an agent_id, or ``None`` for the whole fleet) owns a ring buffer
+    of ``horizon / bucket_seconds`` time buckets. A bucket holds
+    ``{tool_name: [calls, successes]}`` and is tagged with its absolute bucket
+    index, so a slot left over from a previous lap of the ring is recognised
+    as stale and reset on write or skipped on read. Recording is O(1) and a
+    window query is O(buckets in window x tools used), independent of how
+    much the rest of the fleet is doing.
+
+    Windows are bucket-aligned: a query can include up to one bucket's worth
+    of calls older than the exact cutoff. The JSONL scan path stays the
+    source of truth for windows longer than the horizon.
+    """
+
+    def __init__(self, horizon_hours: float = 24.0, bucket_seconds: int = 60):
+        self.bucket_seconds = max(1, int(bucket_seconds))
+        self.horizon_hours = float(horizon_hours)
+        self.num_buckets = max(1, int(math.ceil(self.horizon_hours * 3600 / self.bucket_seconds)))
+        # key -> (bucket_index per slot, counts per slot)
+        self._rings: Dict[Optional[str], tuple] = {}
+        self._lock = threading.Lock()
+        self._records_since_prune = 0
+
+    def covers(self, window_hours: float) -> bool:
+        """True when a window fits inside the ring horizon."""
+        return 0 < window_hours <= self.horizon_hours
+
+    def record(self, tool_name: str, agent_id: Optional[str], success: bool,
+               ts: Optional[float] = None) -> None:
+        """Count one tool call at epoch seconds ``ts`` (default: now)."""
+        if ts is None:
+            ts = datetime.now().timestamp()
+        idx = int(ts // self.bucket_seconds)
+        with self._lock:
+            self._bump(None, idx, tool_name, success)
+            if agent_id:
+                self._bump(agent_id, idx, tool_name, success)
+            self._records_since_prune += 1
+            if self._records_since_prune >= 10000:
+                self._prune_locked(idx)
+
+    def _bump(self, key: Optional[str], idx: int, tool_name: str, success: bool) -> None:
+        ring = self._rings.get(key)
+        if ring is None:
+            ring = ([-1] * self.num_buckets, [None] * self.num_buckets)
+            self._rings[key] = ring
+        indices, buckets = ring
+        slot = idx % self.num_buckets
+        if indices[slot] != idx:
+            if indices[slot] > idx:
+                return  # older than one full lap of the ring — outside the horizon
+            indices[slot] = idx
+            buckets[slot] = {}
+        counts = buckets[slot].get(tool_name)
+        if counts is None:
+            counts = [0, 0]
+            buckets[slot][tool_name] = counts
+        counts[0] += 1
+        if success:
+            counts[1] += 1
+
+    def _prune_locked(self, now_idx: int) -> None:
+        """Drop agent rings whose newest bucket has aged out of the horizon."""
+        self._records_since_prune = 0
+        oldest = now_idx - self.num_buckets + 1
+        stale = [
+            key for key, (indices, _) in self._rings.items()
+            if key is not None and max(indices) < oldest
+        ]
+        for key in stale:
+            del self._rings[key]
+
+    def window_counts(self, window_hours: float, agent_id: Optional[str] = None,
+                      now: Optional[float] = None) -> Dict[str, List[int]]:
+        """Return ``{tool_name: [calls, successes]}`` summed over the window."""
+        if now is None:
+            now = datetime.now().timestamp()
+        now_idx = int(now // self.bucket_seconds)
+        span = min(self.num_buckets, max(1, int(math.ceil(window_hours * 3600 / self.bucket_seconds))))
+        oldest = now_idx - span + 1
+        totals: Dict[str, List[int]] = {}
+        with self._lock:
+            ring = self._rings.get(agent_id)
+            if ring is None:
+                return totals
+            indices, buckets = ring
+            for idx in range(oldest, now_idx + 1):
+                slot = idx % self.num_buckets
+                if indices[slot] != idx:
+                    continue
+                for tool, (calls, successes) in buckets[slot].items():
+                    acc = totals.get(tool)
+                    if acc is None:
+                        totals[tool] = [calls, successes]
+                    else:
+                        acc[0] += calls
+                        acc[1] += successes
+        return totals
+
+    def load_records(self, records: Iterable[Dict[str, Any]],
+                     removed_tools: Iterable[str] = ()) -> int:
+        """Fold historical records into the rings. Returns the number counted.
+
+        Accepts JSONL-shaped dicts (``timestamp`` ISO string) and
+        ``audit.tool_usage`` rows (``ts`` datetime). Records older than the
+        horizon are ignored.
+        """
+        removed = set(removed_tools)
+        cutoff = datetime.now().timestamp() - self.horizon_hours * 3600
+        loaded = 0
+        for rec in records:
+            try:
+                tool = rec["tool_name"]
+                if tool in removed:
+                    continue
+                raw_ts = rec.get("timestamp", rec.get("ts"))
+                if isinstance(raw_ts, datetime):
+                    ts = raw_ts.timestamp()
+                else:
+                    ts = _parse_ts_naive(raw_ts).timestamp()
+            except (KeyError, TypeError, ValueError):
+                continue
+            if ts < cutoff:
+                continue
+            self.record(tool, rec.get("agent_id"), rec.get("success", True) is not False, ts=ts)
+            loaded += 1
+        return loaded
+
+    def reset(self) -> None:
+        with self._lock:
+            self._rings.clear()
+            self._records_since_prune = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Introspection for health/debug output."""
+        with self._lock:
+            return {
+                "agents": sum(1 for key in self._rings if key is not None),
+                "bucket_seconds": self.bucket_seconds,
+                "horizon_hours": self.horizon_hours,
+                "num_buckets": self.num_buckets,
+            }
+
+
+def _aggregator_enabled() -> bool:
+    return os.getenv("UNITARES_TOOL_USAGE_AGGREGATOR", "1").strip().lower() not in ("0", "false", "no")
+
+
 class ToolUsageTracker:
     """Tracks tool usage across the system"""
     
@@ -54,32 +206,123 @@ class ToolUsageTracker:
         
         self.log_file = log_file
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
-    
+
+        # Set by enable_group_commit() at server startup; None = write inline.
+        self._writer = None
+
+        # In-memory window counters answer the per-check-in 1h queries
+        # without rescanning the JSONL. Populated lazily from the log on
+        # first use (or by the startup warmup), then fed by log_tool_call.
+        self._aggregator: Optional[ToolUsageAggregator] = None
+        self._aggregator_ready = False
+        self._aggregator_lock = threading.Lock()
+        if _aggregator_enabled():
+            self._aggregator = ToolUsageAggregator(
+                horizon_hours=float(os.getenv("UNITARES_TOOL_USAGE_AGGREGATOR_HOURS", "24")),
+                bucket_seconds=int(os.getenv("UNITARES_TOOL_USAGE_AGGREGATOR_BUCKET_SECONDS", "60")),
+            )
+
     def log_tool_call(self, tool_name: str, agent_id: Optional[str] = None, 
                      success: bool = True, error_type: Optional[str] = None):
         """Log a tool call"""
+        now = datetime.now()
         entry = ToolUsageEntry(
-            timestamp=datetime.now().isoformat(),
+            timestamp=now.isoformat(),
             tool_name=tool_name,
             agent_id=agent_id,
             success=success,
             error_type=error_type
         )
-        
-        self._write_entry(entry)
+
+        # Held across write + record so a concurrent rebuild never sees the
+        # line on disk and then counts it a second time live.
+        with self._aggregator_lock:
+            self._write_entry(entry)
+            if self._aggregator_ready and tool_name not in self.REMOVED_TOOLS:
+                self._aggregator.record(tool_name, agent_id, success, ts=now.timestamp())
+
+    def enable_group_commit(self, writer=None):
+        """Route JSONL appends through a background group-commit writer.
+
+        Readers in this class (scan path, aggregator rebuild, rotation)
+        flush the writer before touching the file.
+        """
+        if self._writer is None:
+            from src.jsonl_writer import make_group_commit_writer
+            self._writer = writer or make_group_commit_writer(self.log_file)
+        return self._writer
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until every call logged so far is on disk. No-op when writing inline."""
+        if self._writer is None:
+            return True
+        return self._writer.flush(timeout)
+
+    @property
+    def aggregator(self) -> Optional[ToolUsageAggregator]:
+        """The window counters, or None when disabled via env."""
+        return self._aggregator
+
+    def rebuild_aggregator(self) -> int:
+        """(Re)build the window counters from the tail of the JSONL log.
+
+        Returns the number of entries loaded, or -1 when the aggregator is
+        disabled. Only the aggregator horizon is read, newest-first.
+        """
+        if self._aggregator is None:
+            return -1
+        cutoff = datetime.now() - timedelta(hours=self._aggregator.horizon_hours)
+
+        def _tail():
+            for line in _iter_jsonl_reverse(self.log_file):
+                try:
+                    entry_dict = json.loads(line)
+                    if _parse_ts_naive(entry_dict['timestamp']) < cutoff:
+                        return
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    continue
+                yield entry_dict
+
+        with self._aggregator_lock:
+            self.flush()
+            self._aggregator.reset()
+            loaded = 0
+            try:
+                if self.log_file.exists():
+                    loaded = self._aggregator.load_records(_tail(), self.REMOVED_TOOLS)
+            except Exception as e:
+                logger.warning(f"Could not rebuild tool usage aggregator from log: {e}")
+            self._aggregator_ready = True
+        return loaded
+
+    def rebuild_aggregator_from_records(self, records: Iterable[Dict[str, Any]]) -> int:
+        """(Re)build the window counters from ``audit.tool_usage`` rows.
+
+        Used at startup when the JSONL log is missing (fresh data dir, or a
+        host that only keeps the Postgres mirror).
+        """
+        if self._aggregator is None:
+            return -1
+        with self._aggregator_lock:
+            self._aggregator.reset()
+            loaded = self._aggregator.load_records(records, self.REMOVED_TOOLS)
+            self._aggregator_ready = True
+        return loaded
+
+    def _ensure_aggregator(self) -> bool:
+        if self._aggregator is None:
+            return False
+        if not self._aggregator_ready:
+            self.rebuild_aggregator()
+        return True
     
     def _write_entry(self, entry: ToolUsageEntry):
-        """Write entry to log file with locking"""
+        """Write entry to log file with locking (or hand it to the group-commit writer)"""
         try:
-            with open(self.log_file, 'a') as f:
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                try:
-                    json.dump(asdict(entry), f)
-                    f.write('\n')
-                    f.flush()
-                    os.fsync(f.fileno())
-                finally:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            if self._writer is not None:
+                self._writer.submit(asdict(entry))
+            else:
+                append_jsonl_lines(self.log_file, [json.dumps(asdict(entry)) + '\n'])
         except Exception as e:
             # Don't fail tool execution if logging fails
             logger.warning(f"Could not log tool usage: {e}", exc_info=True)
@@ -98,6 +341,11 @@ class ToolUsageTracker:
         Returns:
             Dict with usage statistics
         """
+        if (self._aggregator is not None and self._aggregator.covers(window_hours)
+                and self._ensure_aggregator()):
+            return self._get_usage_stats_aggregated(window_hours, tool_name, agent_id)
+
+        self.flush()
         if not self.log_file.exists():
             return {
                 "total_calls": 0,
@@ -161,6 +409,35 @@ class ToolUsageTracker:
             logger.error(f"Error reading tool usage log: {e}")
             return {"error": str(e)}
 
+        return self._build_stats(
+            window_hours, agent_id, total_calls, tool_counts,
+            tool_success_counts, tool_error_counts, agent_tool_counts,
+        )
+
+    def _get_usage_stats_aggregated(self, window_hours: float, tool_name: Optional[str],
+                                    agent_id: Optional[str]) -> Dict:
+        """get_usage_stats answered from the in-memory window counters."""
+        counts = self._aggregator.window_counts(window_hours, agent_id=agent_id)
+        tool_counts: Dict[str, int] = {}
+        tool_success_counts: Dict[str, int] = {}
+        tool_error_counts: Dict[str, int] = {}
+        for tool, (calls, successes) in counts.items():
+            if tool_name and tool != tool_name:
+                continue
+            tool_counts[tool] = calls
+            tool_success_counts[tool] = successes
+            if calls > successes:
+                tool_error_counts[tool] = calls - successes
+        total_calls = sum(tool_counts.values())
+        agent_tool_counts = {agent_id: dict(tool_counts)} if agent_id and tool_counts else {}
+        return self._build_stats(
+            window_hours, agent_id, total_calls, tool_counts,
+            tool_success_counts, tool_error_counts, agent_tool_counts,
+        )
+
+    @staticmethod
+    def _build_stats(window_hours, agent_id, total_calls, tool_counts,
+                     tool_success_counts, tool_error_counts, agent_tool_counts) -> Dict:
         # Sort tools by usage
         sorted_tools = sorted(tool_counts.items(), key=lambda x: x[1], reverse=True)
 
@@ -196,6 +473,7 @@ class ToolUsageTracker:
         on success, ``(None, None)`` on failure. Designed for periodic
         background-task rotation; safe to run while writers append.
         """
+        self.flush()
         if not self.log_file.exists():
             return None, None
 
@@ -203,6 +481,13 @@ class ToolUsageTracker:
         archive_dir = self.log_file.parent / "tool_usage_archive"
         archive_dir.mkdir(exist_ok=True)
         archived_file = archive_dir / f"tool_usage_{datetime.now().strftime('%Y%m%d')}.jsonl"
+
+        if self._writer is not None:
+            with self._writer.exclusive():
+                return self._rotate_locked(cutoff_time, archived_file)
+        return self._rotate_locked(cutoff_time, archived_file)
+
+    def _rotate_locked(self, cutoff_time: datetime, archived_file: Path):
         recent_lines: List[str] = []
 
         try:
@@ -12,13 +12,18 @@ This is a lightweight integration - trajectory data is optional and non-blocking
 Agents can operate without providing trajectory signatures; this is additive.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import json
 import math
+import os
+
+import numpy as np
 
 from src.logging_utils import get_logger
+from src.metrics_registry import TRAJECTORY_SIGNATURE_CACHE
 
 logger = get_logger(__name__)
 
@@ -37,6 +42,59 @@ VIABILITY_BOUNDS = {
     "V": (-0.2, 0.15),
 }
 
+# Sakoe-Chiba band for DTW: a warping path may stray at most this fraction of
+# the longer series (never less than _DTW_MIN_BAND samples, never less than the
+# length difference) off the diagonal. 1 or more disables the band.
+DTW_BAND = float(os.getenv("UNITARES_DTW_BAND", "0.1"))
+_DTW_MIN_BAND = 10
+
+# Parsed genesis/current signatures kept per agent (LRU); 0 disables the cache.
+TRAJECTORY_CACHE_SIZE = int(os.getenv("UNITARES_TRAJECTORY_CACHE_SIZE", "1024"))
+
+_EISV_DIMS = ("E", "I", "S", "V")
+_COV_EPS = 1e-6
+
+
+def _center_similarity(diff: np.ndarray) -> float:
+    """Center-only fallback: exp(-2 * ||mu1 - mu2||)."""
+    return math.exp(-float(np.sqrt(diff @ diff)) * 2)
+
+
+def _gaussian(cov: Any) -> Tuple[Optional[np.ndarray], Optional[float]]:
+    """Regularized covariance and its log-determinant (None if not positive definite)."""
+    try:
+        c = np.asarray(cov, dtype=np.float64)
+        c = 0.5 * (c + c.T) + _COV_EPS * np.eye(len(c))
+        chol = np.linalg.cholesky(c)
+    except (TypeError, ValueError, np.linalg.LinAlgError):
+        return None, None
+    return c, 2.0 * float(np.log(np.diag(chol)).sum())
+
+
+def _bhattacharyya_distance(diff: np.ndarray, chol_avg: np.ndarray, logdet1: float, logdet2: float) -> float:
+    """Similarity exp(-D_B) given the Cholesky factor of Sigma_avg."""
+    z = np.linalg.solve(chol_avg, diff)
+    mahal = float(z @ z) / 8.0
+    logdet_avg = 2.0 * float(np.log(np.diag(chol_avg)).sum())
+    d_b = mahal + 0.5 * (logdet_avg - 0.5 * (logdet1 + logdet2))
+    return max(0.0, min(1.0, math.exp(-d_b)))
+
+
+def _bhattacharyya(
+    mu1: np.ndarray, gauss1: Tuple[Optional[np.ndarray], Optional[float]],
+    mu2: np.ndarray, gauss2: Tuple[Optional[np.ndarray], Optional[float]],
+) -> float:
+    """bhattacharyya_similarity over pre-factored covariances (see _gaussian)."""
+    diff = mu1 - mu2
+    (c1, logdet1), (c2, logdet2) = gauss1, gauss2
+    if c1 is None or c2 is None or c1.shape != c2.shape or diff.shape != c1.shape[:1]:
+        return _center_similarity(diff)
+    try:
+        chol = np.linalg.cholesky(0.5 * (c1 + c2))
+    except np.linalg.LinAlgError:
+        return _center_similarity(diff)
+    return _bhattacharyya_distance(diff, chol, logdet1, logdet2)
+
 
 def bhattacharyya_similarity(
     mu1: List[float], cov1: List[List[float]],
@@ -49,78 +107,22 @@ def bhattacharyya_similarity(
         + (1/2) ln(|Sigma_avg| / sqrt(|Sigma1| * |Sigma2|))
     sim = exp(-D_B)
 
-    Falls back to center-only distance if matrices are singular.
+    Covariances are symmetrized and epsilon-regularized, then Sigma1,
+    Sigma2 and Sigma_avg are Cholesky-factored in one batched call; the
+    Mahalanobis term and log-determinants come from the factors. Falls back
+    to center-only distance if a matrix is not positive definite.
     """
-    n = len(mu1)
-    eps = 1e-6
-
-    # Average covariance with epsilon regularization
-    s_avg = [[(cov1[i][j] + cov2[i][j]) / 2.0 + (eps if i == j else 0.0)
-              for j in range(n)] for i in range(n)]
-    s1_reg = [[cov1[i][j] + (eps if i == j else 0.0) for j in range(n)] for i in range(n)]
-    s2_reg = [[cov2[i][j] + (eps if i == j else 0.0) for j in range(n)] for i in range(n)]
-
-    det_avg = _det(s_avg)
-    det1 = _det(s1_reg)
-    det2 = _det(s2_reg)
-
-    if det_avg <= 0 or det1 <= 0 or det2 <= 0:
-        dist = sum((a - b)**2 for a, b in zip(mu1, mu2)) ** 0.5
-        return math.exp(-dist * 2)
-
-    inv_avg = _inv(s_avg)
-    if inv_avg is None:
-        dist = sum((a - b)**2 for a, b in zip(mu1, mu2)) ** 0.5
-        return math.exp(-dist * 2)
-
-    diff = [a - b for a, b in zip(mu1, mu2)]
-    mahal = sum(diff[i] * inv_avg[i][j] * diff[j] for i in range(n) for j in range(n)) / 8.0
-    det_term = 0.5 * math.log(det_avg / math.sqrt(det1 * det2))
-    d_b = mahal + det_term
-    return max(0.0, min(1.0, math.exp(-d_b)))
-
-
-def _det(m: List[List[float]]) -> float:
-    """Determinant via LU elimination."""
-    n = len(m)
-    mat = [row[:] for row in m]
-    det = 1.0
-    for i in range(n):
-        if abs(mat[i][i]) < 1e-12:
-            for j in range(i + 1, n):
-                if abs(mat[j][i]) > 1e-12:
-                    mat[i], mat[j] = mat[j], mat[i]
-                    det *= -1
-                    break
-            else:
-                return 0.0
-        det *= mat[i][i]
-        for j in range(i + 1, n):
-            factor = mat[j][i] / mat[i][i]
-            for k in range(i, n):
-                mat[j][k] -= factor * mat[i][k]
-    return det
-
-
-def _inv(m: List[List[float]]) -> Optional[List[List[float]]]:
-    """Inverse via Gauss-Jordan elimination."""
-    n = len(m)
-    aug = [m[i][:] + [1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
-    for col in range(n):
-        max_row = max(range(col, n), key=lambda r: abs(aug[r][col]))
-        if max_row != col:
-            aug[col], aug[max_row] = aug[max_row], aug[col]
-        pivot = aug[col][col]
-        if abs(pivot) < 1e-12:
-            return None
-        for j in range(2 * n):
-            aug[col][j] /= pivot
-        for row in range(n):
-            if row != col:
-                factor = aug[row][col]
-                for j in range(2 * n):
-                    aug[row][j] -= factor * aug[col][j]
-    return [[aug[i][j + n] for j in range(n)] for i in range(n)]
+    diff = np.asarray(mu1, dtype=np.float64) - np.asarray(mu2, dtype=np.float64)
+    try:
+        c = np.asarray([cov1, cov2], dtype=np.float64)
+        c = 0.5 * (c + c.transpose(0, 2, 1)) + _COV_EPS * np.eye(c.shape[-1])
+        chol = np.linalg.cholesky(np.concatenate([c, 0.5 * (c[0] + c[1])[None]]))
+        if diff.shape != c.shape[1:2]:
+            raise ValueError("center / covariance size mismatch")
+    except (TypeError, ValueError, np.linalg.LinAlgError):
+        return _center_similarity(diff)
+    logdet1, logdet2 = 2.0 * np.log(np.diagonal(chol[:2], axis1=1, axis2=2)).sum(axis=1)
+    return _bhattacharyya_distance(diff, chol[2], float(logdet1), float(logdet2))
 
 
 def homeostatic_similarity(eta1: Dict[str, Any], eta2: Dict[str, Any]) -> float:
@@ -179,56 +181,184 @@ def _viability_margin(set_point: List[float], bounds: Dict[str, Any]) -> Optiona
     return sum(margins) / len(margins) if margins else None
 
 
-def _dtw_distance(s1: List[float], s2: List[float]) -> float:
-    """Dynamic Time Warping distance between two 1D time series.
+def _as_series(s: Any) -> np.ndarray:
+    """(n, d) float array from a 1-D series or a list of d-dimensional samples."""
+    arr = np.asarray(s, dtype=np.float64)
+    return arr[:, None] if arr.ndim == 1 else arr
 
-    O(n*m) DP. For typical governance history lengths (100 samples),
-    this is ~10,000 operations — trivially fast.
 
-    Returns normalized distance in [0, inf). Lower = more similar.
+def _dtw_window(n: int, m: int, window: Optional[int] = None) -> int:
+    """Sakoe-Chiba half-width for an n x m alignment (see DTW_BAND)."""
+    if window is None:
+        if DTW_BAND >= 1:
+            return max(n, m)
+        window = max(_DTW_MIN_BAND, math.ceil(DTW_BAND * max(n, m)))
+    return max(int(window), abs(n - m))
+
+
+def _sliding_min(x: np.ndarray, width: int) -> np.ndarray:
+    """out[i] = min(x[i:i + width]) along axis 0, by doubling."""
+    span = 1
+    while span * 2 <= width:
+        x = np.minimum(x[:-span], x[span:])
+        span *= 2
+    rest = width - span
+    return np.minimum(x[:len(x) - rest], x[rest:]) if rest else x
+
+
+def _envelope(c: np.ndarray, w: int) -> Tuple[np.ndarray, np.ndarray]:
+    """LB_Keogh envelope: running min / max of c over [i - w, i + w]."""
+    pad = np.full((w, c.shape[1]), np.inf)
+    lower = _sliding_min(np.concatenate([pad, c, pad]), 2 * w + 1)
+    upper = -_sliding_min(np.concatenate([pad, -c, pad]), 2 * w + 1)
+    return lower, upper
+
+
+def lb_keogh(query: Any, candidate: Any, window: Optional[int] = None) -> float:
+    """LB_Keogh lower bound on _dtw_distance(query, candidate, window).
+
+    Each query sample is charged its distance to the candidate's envelope
+    within the band. Only defined for equal lengths; returns 0.0 (no bound)
+    otherwise.
     """
-    n, m = len(s1), len(s2)
+    q, c = _as_series(query), _as_series(candidate)
+    n, m = len(q), len(c)
     if n == 0 or m == 0:
         return float("inf")
+    if n != m or q.shape[1] != c.shape[1]:
+        return 0.0
+    lower, upper = _envelope(c, _dtw_window(n, m, window))
+    gap = np.maximum(q - upper, 0.0) + np.maximum(lower - q, 0.0)
+    return float(gap.mean(axis=1).sum()) / n
 
-    dtw = [[float("inf")] * (m + 1) for _ in range(n + 1)]
-    dtw[0][0] = 0.0
 
-    for i in range(1, n + 1):
-        for j in range(1, m + 1):
-            cost = abs(s1[i - 1] - s2[j - 1])
-            dtw[i][j] = cost + min(dtw[i - 1][j], dtw[i][j - 1], dtw[i - 1][j - 1])
+def _dtw_distance(
+    s1: Any,
+    s2: Any,
+    window: Optional[int] = None,
+    cutoff: Optional[float] = None,
+) -> float:
+    """Dynamic Time Warping distance between two time series.
 
-    return dtw[n][m] / max(n, m)
+    Series are 1-D or (n, d) arrays of samples; the local cost is the mean
+    absolute difference across dimensions, so d-dimensional series are
+    aligned along one shared warping path. The DP is restricted to a
+    Sakoe-Chiba band and run a row at a time: the left-neighbour recurrence
+    within a row is a running minimum over cumulative costs, so each row is a
+    handful of array operations.
 
+    With ``cutoff``, returns inf for any distance above it, stopping as soon
+    as that is certain (LB_Keogh first, then when a whole row of the band
+    exceeds it).
 
-def _dtw_similarity(s1: List[float], s2: List[float]) -> float:
+    Returns normalized distance in [0, inf). Lower = more similar.
+    """
+    a, b = _as_series(s1), _as_series(s2)
+    n, m = len(a), len(b)
+    if n == 0 or m == 0:
+        return float("inf")
+    if a.shape[1] != b.shape[1]:
+        raise ValueError(f"DTW dimension mismatch: {a.shape[1]} vs {b.shape[1]}")
+    w = _dtw_window(n, m, window)
+    scale = max(n, m)
+    budget = float("inf")
+    if cutoff is not None:
+        if lb_keogh(a, b, w) > cutoff:
+            return float("inf")
+        budget = cutoff * scale
+
+    d = a.shape[1]
+    cols = np.ascontiguousarray(b.T)
+    prev = np.full(m + 1, np.inf)
+    prev[0] = 0.0
+    cur = np.full(m + 1, np.inf)
+    for i in range(1, n + 1):
+        lo, hi = max(1, i - w), min(m, i + w)
+        row = a[i - 1]
+        cost = np.abs(cols[0, lo - 1:hi] - row[0])
+        for k in range(1, d):
+            cost += np.abs(cols[k, lo - 1:hi] - row[k])
+        if d > 1:
+            cost /= d
+        # Best arrival from the row above (vertical or diagonal) ...
+        entry = cost + np.minimum(prev[lo:hi + 1], prev[lo - 1:hi])
+        # ... then horizontal moves: cur[j] = min_k(entry[k] + cost[k+1..j])
+        run = np.cumsum(cost)
+        cur[max(0, lo - 2):lo] = np.inf  # left of the band; the buffer holds row i - 2
+        cur[lo:hi + 1] = run + np.minimum.accumulate(entry - run)
+        if budget < float("inf") and cur[lo:hi + 1].min() > budget:
+            return float("inf")
+        prev, cur = cur, prev
+    return float(prev[m]) / scale if prev[m] <= budget else float("inf")
+
+
+def _dtw_similarity(
+    s1: Any,
+    s2: Any,
+    window: Optional[int] = None,
+    min_similarity: Optional[float] = None,
+) -> float:
     """Convert DTW distance to similarity score in [0, 1].
 
-    Uses exponential kernel: sim = exp(-distance * 2.0).
+    Uses exponential kernel: sim = exp(-distance * 2.0). With
+    ``min_similarity``, pairs scoring below it return 0.0, usually without
+    finishing the alignment.
     """
-    dist = _dtw_distance(s1, s2)
+    cutoff = -math.log(min_similarity) / 2.0 if min_similarity and min_similarity > 0 else None
+    dist = _dtw_distance(s1, s2, window, cutoff)
     if dist == float("inf"):
         return 0.0
     return math.exp(-dist * 2.0)
 
 
+def nearest_trajectories(
+    query: Any,
+    candidates: Dict[str, Any],
+    k: int = 5,
+    window: Optional[int] = None,
+) -> List[Tuple[str, float]]:
+    """The k candidate series closest to ``query`` by DTW, nearest first.
+
+    Candidates are visited in LB_Keogh order and each alignment is abandoned
+    once it can no longer beat the current k-th best, so most of a large
+    candidate set is pruned without a full DP.
+    """
+    q = _as_series(query)
+    bounds = sorted((lb_keogh(q, c, window), key) for key, c in candidates.items())
+    best: List[Tuple[float, str]] = []
+    for bound, key in bounds:
+        if len(best) == k and bound > best[-1][0]:
+            break
+        cutoff = best[-1][0] if len(best) == k else None
+        dist = _dtw_distance(q, candidates[key], window, cutoff)
+        if dist != float("inf"):
+            best.append((dist, key))
+            best.sort()
+            del best[k:]
+    return [(key, dist) for dist, key in best]
+
+
 def _eisv_trajectory_similarity(
     sig1: "TrajectorySignature",
     sig2: "TrajectorySignature",
 ) -> Optional[float]:
-    """Compare EISV trajectory shapes using per-dimension DTW.
+    """Compare EISV trajectory shapes using DTW.
 
     Looks for E_trajectory, I_trajectory, S_trajectory, V_trajectory
-    in the attractor dict. Returns None if insufficient data (< 10 samples).
+    in the attractor dict. When both signatures carry all four at equal
+    lengths they are aligned as one 4-D series in a single pass; otherwise
+    the dimensions with data on both sides are compared one by one and
+    averaged. Returns None if insufficient data (< 10 samples).
     """
+    m1, m2 = sig1._eisv_matrix(), sig2._eisv_matrix()
+    if m1 is not None and m2 is not None:
+        return _dtw_similarity(m1, m2)
+
     a1 = sig1.attractor or {}
     a2 = sig2.attractor or {}
-
-    dimensions = ["E", "I", "S", "V"]
     sims = []
 
-    for dim in dimensions:
+    for dim in _EISV_DIMS:
         key = f"{dim}_trajectory"
         t1 = a1.get(key, [])
         t2 = a2.get(key, [])
@@ -248,6 +378,9 @@ class TrajectorySignature:
 
     Full computation happens upstream in the agent; UNITARES receives and
     stores the computed signature for comparison and anomaly detection.
+    Arrays derived for comparison (EISV trajectory matrix, attractor
+    covariance factors) are memoized on first use, so treat a signature as
+    immutable once compared.
     """
     # Core components (as computed upstream; see agent's trajectory module)
     preferences: Dict[str, Any] = field(default_factory=dict)   # Π
@@ -263,6 +396,8 @@ class TrajectorySignature:
     stability_score: float = 0.0
     identity_confidence: float = 0.0
 
+    _derived: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TrajectorySignature":
         """Create from dictionary (e.g., from MCP tool argument)."""
@@ -330,7 +465,10 @@ class TrajectorySignature:
                 cov1 = self.attractor.get("covariance")
                 cov2 = other.attractor.get("covariance")
                 if cov1 and cov2 and len(cov1) == len(c1) and len(cov2) == len(c2):
-                    scores.append(bhattacharyya_similarity(c1, cov1, c2, cov2))
+                    scores.append(_bhattacharyya(
+                        np.asarray(c1, dtype=np.float64), self._attractor_gaussian(),
+                        np.asarray(c2, dtype=np.float64), other._attractor_gaussian(),
+                    ))
                 else:
                     dist = sum((a - b)**2 for a, b in zip(c1, c2)) ** 0.5
                     scores.append(math.exp(-dist * 2))
@@ -368,6 +506,24 @@ class TrajectorySignature:
         """
         return _eisv_trajectory_similarity(self, other)
 
+    def _eisv_matrix(self) -> Optional[np.ndarray]:
+        """(n, 4) EISV trajectory, or None unless all four have the same n >= 10 samples."""
+        if "eisv" not in self._derived:
+            a = self.attractor or {}
+            series = [a.get(f"{dim}_trajectory") or [] for dim in _EISV_DIMS]
+            n = len(series[0])
+            self._derived["eisv"] = (
+                np.column_stack([np.asarray(t, dtype=np.float64) for t in series])
+                if n >= 10 and all(len(t) == n for t in series) else None
+            )
+        return self._derived["eisv"]
+
+    def _attractor_gaussian(self) -> Tuple[Optional[np.ndarray], Optional[float]]:
+        """Regularized attractor covariance and its log-determinant."""
+        if "gaussian" not in self._derived:
+            self._derived["gaussian"] = _gaussian((self.attractor or {}).get("covariance"))
+        return self._derived["gaussian"]
+
     def _cosine_similarity(self, v1: List[float], v2: List[float]) -> Optional[float]:
         """Cosine similarity between vectors."""
         if len(v1) != len(v2) or len(v1) == 0:
@@ -380,6 +536,77 @@ class TrajectorySignature:
         return dot / (norm1 * norm2)
 
 
+# Metadata timestamp written alongside each stored signature
+_SIGNATURE_STAMPS = {
+    "genesis": "trajectory_genesis_at",
+    "current": "trajectory_updated_at",
+}
+
+
+class SignatureCache:
+    """LRU of parsed genesis/current signatures per agent.
+
+    Entries are keyed by (agent_id, kind) and versioned by the timestamp
+    stored next to the signature in identity metadata, plus its
+    computed_at and observation_count. Every write path restamps, so an
+    entry whose version no longer matches the metadata just read is
+    replaced rather than served. Reusing the parsed signature also reuses
+    its memoized arrays (EISV matrix, covariance factors).
+    """
+
+    def __init__(self, max_size: int = TRAJECTORY_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[tuple, TrajectorySignature]]" = OrderedDict()
+
+    @staticmethod
+    def _version(metadata: Dict[str, Any], kind: str) -> Optional[tuple]:
+        stamp = metadata.get(_SIGNATURE_STAMPS[kind])
+        data = metadata.get(f"trajectory_{kind}") or {}
+        if not stamp:
+            return None
+        return (stamp, data.get("computed_at"), data.get("observation_count"))
+
+    def get(self, agent_id: str, metadata: Dict[str, Any], kind: str) -> Optional[TrajectorySignature]:
+        """Signature stored under ``trajectory_<kind>`` in metadata, or None."""
+        data = metadata.get(f"trajectory_{kind}")
+        if not data:
+            return None
+        version = self._version(metadata, kind)
+        if version is None or self.max_size <= 0:
+            return TrajectorySignature.from_dict(data)
+        key = (agent_id, kind)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            self._entries.move_to_end(key)
+            TRAJECTORY_SIGNATURE_CACHE.labels(result="hit").inc()
+            return entry[1]
+        TRAJECTORY_SIGNATURE_CACHE.labels(result="miss").inc()
+        signature = TrajectorySignature.from_dict(data)
+        self.put(agent_id, metadata, kind, signature)
+        return signature
+
+    def put(self, agent_id: str, metadata: Dict[str, Any], kind: str, signature: TrajectorySignature) -> None:
+        """Remember ``signature`` as the one just written to metadata."""
+        version = self._version(metadata, kind)
+        if version is None or self.max_size <= 0:
+            return
+        key = (agent_id, kind)
+        self._entries[key] = (version, signature)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, agent_id: str) -> None:
+        for kind in _SIGNATURE_STAMPS:
+            self._entries.pop((agent_id, kind), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_signature_cache = SignatureCache()
+
+
 async def store_genesis_signature(
     agent_id: str,
     signature: TrajectorySignature,
@@ -425,7 +652,7 @@ async def store_genesis_signature(
             # similarity() returns 0.5 for empty data, which isn't a real signal.
             lineage_low = False
             try:
-                g = TrajectorySignature.from_dict(existing_genesis)
+                g = _signature_cache.get(agent_id, metadata, "genesis")
                 has_comparable_data = (g.attractor is not None or g.beliefs.get("values"))
                 if has_comparable_data:
                     lineage_sim = signature.similarity(g)
@@ -448,6 +675,7 @@ async def store_genesis_signature(
         metadata["trajectory_genesis_at"] = datetime.now(timezone.utc).isoformat()
 
         await db.update_identity_metadata(agent_id, metadata)
+        _signature_cache.put(agent_id, metadata, "genesis", signature)
         logger.info(f"[Trajectory] Stored genesis Σ₀ for {agent_id[:8]}... (confidence={signature.identity_confidence:.2f})")
         return True
 
@@ -597,7 +825,7 @@ async def update_current_signature(
         # Compare to genesis if exists
         genesis_data = metadata.get("trajectory_genesis")
         if genesis_data:
-            genesis = TrajectorySignature.from_dict(genesis_data)
+            genesis = _signature_cache.get(agent_id, metadata, "genesis")
             lineage_sim = signature.similarity(genesis)
 
             result["lineage_similarity"] = round(lineage_sim, 4)
@@ -715,6 +943,7 @@ async def update_current_signature(
 
         # Save updated metadata
         await db.update_identity_metadata(agent_id, metadata)
+        _signature_cache.put(agent_id, metadata, "current", signature)
 
         return result
 
@@ -862,17 +1091,16 @@ async def get_trajectory_status(agent_id: str) -> Dict[str, Any]:
         }
 
         if genesis:
-            g = TrajectorySignature.from_dict(genesis)
+            g = _signature_cache.get(agent_id, metadata, "genesis")
             result["genesis_confidence"] = g.identity_confidence
             result["genesis_observations"] = g.observation_count
 
         if current:
-            c = TrajectorySignature.from_dict(current)
+            c = _signature_cache.get(agent_id, metadata, "current")
             result["current_confidence"] = c.identity_confidence
             result["current_observations"] = c.observation_count
 
             if genesis:
-                g = TrajectorySignature.from_dict(genesis)
                 result["lineage_similarity"] = round(c.similarity(g), 4)
                 result["is_drifting"] = result["lineage_similarity"] < 0.7
 
@@ -916,7 +1144,7 @@ async def verify_trajectory_identity(
         # Tier 1: Coherence (compare to recent)
         current_data = metadata.get("trajectory_current")
         if current_data:
-            current = TrajectorySignature.from_dict(current_data)
+            current = _signature_cache.get(agent_id, metadata, "current")
             coherence_sim = signature.similarity(current)
             tier1_passed = coherence_sim >= coherence_threshold
             result["tiers"]["coherence"] = {
@@ -932,7 +1160,7 @@ async def verify_trajectory_identity(
         # Tier 2: Lineage (compare to genesis)
         genesis_data = metadata.get("trajectory_genesis")
         if genesis_data:
-            genesis = TrajectorySignature.from_dict(genesis_data)
+            genesis = _signature_cache.get(agent_id, metadata, "genesis")
             lineage_sim = signature.similarity(genesis)
             tier2_passed = lineage_sim >= lineage_threshold
             result["tiers"]["lineage"] = {
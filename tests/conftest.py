@@ -361,6 +361,8 @@ def _isolate_identity_state():
     - agent_metadata / monitors: server-level agent registries
     - pattern tracker per-agent state
     - middleware _tool_call_history: rate-limit loop detection
+    - trajectory_identity _signature_cache: parsed genesis/current signatures
+    - fleet_index fleet_index: latest per-agent metrics rows
     - contextvars: session_context, mcp_session_id, transport_client_hint,
       session_signals, trajectory_confidence
     """
@@ -428,6 +430,22 @@ def _isolate_identity_state():
         import warnings
         warnings.warn(f"test cleanup failed: {exc}", stacklevel=2)
 
+    # --- parsed trajectory signatures ---
+    try:
+        if 'src.trajectory_identity' in sys.modules:
+            sys.modules['src.trajectory_identity']._signature_cache.clear()
+    except Exception as exc:
+        import warnings
+        warnings.warn(f"test cleanup failed: {exc}", stacklevel=2)
+
+    # --- fleet metrics index ---
+    try:
+        if 'src.fleet_index' in sys.modules:
+            sys.modules['src.fleet_index'].fleet_index.clear()
+    except Exception as exc:
+        import warnings
+        warnings.warn(f"test cleanup failed: {exc}", stacklevel=2)
+
     # --- middleware rate-limit loop history ---
     try:
         from src.mcp_handlers import middleware
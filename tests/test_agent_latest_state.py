@@ -0,0 +1,166 @@
+"""Tests for the write-through core.agent_latest_state table (migration 038).
+
+The table itself is maintained by an INSERT trigger and is exercised against
+a live DB in test_bootstrap_checkin_filters_3a.py. These cover the StateMixin
+read path, backfill and consistency checker with a stubbed connection.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+
+class _AcquireCtx:
+    def __init__(self, conn):
+        self._conn = conn
+
+    async def __aenter__(self):
+        return self._conn
+
+    async def __aexit__(self, *args):
+        return None
+
+
+def _backend(conn):
+    from src.db.mixins.state import StateMixin
+
+    class _Stub(StateMixin):
+        def acquire(self):
+            return _AcquireCtx(conn)
+
+    return _Stub()
+
+
+def _row(**kw):
+    base = {
+        "state_id": 1, "identity_id": 1, "agent_id": "a", "recorded_at": None,
+        "entropy": 0.5, "integrity": 0.5, "stability_index": 0.5, "volatility": 0.1,
+        "regime": "nominal", "coherence": 1.0, "state_json": "{}",
+    }
+    base.update(kw)
+    return base
+
+
+@pytest.mark.asyncio
+async def test_get_all_latest_reads_table_for_current_epoch():
+    from config.governance_config import GovernanceConfig
+
+    conn = AsyncMock()
+    conn.fetch = AsyncMock(return_value=[_row(state_id=7, identity_id=3)])
+    rows = await _backend(conn).get_all_latest_agent_states()
+
+    query, epoch = conn.fetch.call_args.args
+    assert "core.agent_latest_state" in query
+    assert "mv_latest_agent_states" not in query
+    assert epoch == GovernanceConfig.CURRENT_EPOCH
+    assert [(r.identity_id, r.state_id) for r in rows] == [(3, 7)]
+
+
+@pytest.mark.asyncio
+async def test_get_all_latest_falls_back_to_base_table_before_migration():
+    conn = AsyncMock()
+    conn.fetch = AsyncMock(side_effect=[Exception("relation does not exist"), [_row(state_id=9)]])
+    rows = await _backend(conn).get_all_latest_agent_states()
+
+    fallback_query = conn.fetch.call_args_list[1].args[0]
+    assert "core.agent_state s" in fallback_query
+    assert "s.synthetic = false" in fallback_query
+    assert [r.state_id for r in rows] == [9]
+
+
+@pytest.mark.asyncio
+async def test_record_agent_states_stamps_recorded_at_from_db_clock_in_order():
+    # The rows share one transaction: DEFAULT now() would give two rows of the
+    # same agent the same recorded_at and violate UNIQUE (identity_id, recorded_at).
+    # Offsets are added to the DB's now(), as single inserts use it.
+    from src.db.mixins.state import INSERT_STATES, StateMixin
+
+    captured = {}
+
+    class _Stub(StateMixin):
+        async def run_unit(self, fn):
+            return await fn("conn")
+
+    async def fake_execute(conn, *args):
+        captured["args"] = args
+        return "INSERT 0 3"
+
+    rows = [
+        {"identity_id": 1, "entropy": e, "integrity": 0.5, "stability_index": 0.5,
+         "void": 0.1, "regime": "nominal", "coherence": 1.0}
+        for e in (0.1, 0.2, 0.3)
+    ]
+    stub = SimpleNamespace(execute=fake_execute)
+    with patch("src.db.mixins.state.INSERT_STATES", stub):
+        assert await _Stub().record_agent_states(rows) == 3
+
+    args = captured["args"]
+    assert args[0] == [1, 1, 1]
+    assert args[1] == [0.1, 0.2, 0.3]
+    assert len(args) == 9  # eight column arrays + epoch; no client timestamps
+    assert "now() + r.ord * interval '1 microsecond'" in INSERT_STATES.sql
+    assert "WITH ORDINALITY" in INSERT_STATES.sql
+
+
+@pytest.mark.asyncio
+async def test_check_classifies_missing_stale_and_extra():
+    conn = AsyncMock()
+    conn.fetch = AsyncMock(return_value=[
+        {"identity_id": 1, "expected_state_id": 10, "actual_state_id": 10},
+        {"identity_id": 2, "expected_state_id": 20, "actual_state_id": None},
+        {"identity_id": 3, "expected_state_id": 31, "actual_state_id": 30},
+        {"identity_id": 4, "expected_state_id": None, "actual_state_id": 40},
+    ])
+    report = await _backend(conn).check_agent_latest_state(epoch=2)
+
+    assert conn.fetch.call_args.args[1] == 2
+    assert report == {
+        "epoch": 2,
+        "expected": 3,
+        "actual": 3,
+        "missing": [2],
+        "stale": [3],
+        "extra": [4],
+        "consistent": False,
+    }
+
+
+@pytest.mark.asyncio
+async def test_check_consistent_when_table_matches():
+    conn = AsyncMock()
+    conn.fetch = AsyncMock(return_value=[
+        {"identity_id": 1, "expected_state_id": 10, "actual_state_id": 10},
+    ])
+    report = await _backend(conn).check_agent_latest_state(epoch=1)
+    assert report["consistent"] is True
+
+
+@pytest.mark.asyncio
+async def test_backfill_returns_rows_written():
+    conn = AsyncMock()
+    conn.execute = AsyncMock(return_value="INSERT 0 12")
+    written = await _backend(conn).backfill_agent_latest_state()
+
+    query = conn.execute.call_args.args[0]
+    assert "ON CONFLICT (identity_id, epoch) DO UPDATE" in query
+    assert "s.synthetic = false" in query
+    assert written == 12
+
+
+def test_migration_trigger_is_measured_only_and_newest_wins():
+    sql = (
+        Path(__file__).parent.parent / "db" / "postgres" / "migrations" / "038_agent_latest_state.sql"
+    ).read_text()
+    assert "AFTER INSERT ON core.agent_state" in sql
+    assert "WHEN (NEW.synthetic = false)" in sql
+    assert "WHERE EXCLUDED.recorded_at >= l.recorded_at" in sql
+    assert "VALUES (38, 'agent_latest_state', NOW())" in sql
+
+
+def test_matview_refresh_loop_removed():
+    import src.background_tasks as bt
+    assert not hasattr(bt, "periodic_matview_refresh")
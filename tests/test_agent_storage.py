@@ -892,6 +892,42 @@ class TestRecordAgentState:
         assert call_kwargs["stability_index"] == 0.0
 
 
+class TestRecordAgentStates:
+
+    @pytest.mark.asyncio
+    async def test_one_bulk_write_with_identity_lookup_per_agent(self):
+        identities = {"agent-1": _make_identity(identity_id=1), "agent-2": _make_identity(identity_id=2)}
+        db = _mock_db()
+        db.get_identity = AsyncMock(side_effect=lambda agent_id: identities.get(agent_id))
+        db.record_agent_states = AsyncMock(return_value=3)
+        state = dict(E=0.7, I=0.8, S=0.15, V=0.0, regime="EXPLORATION", coherence=0.5)
+        with patch("src.agent_storage.get_db", return_value=db):
+            from src.agent_storage import record_agent_states
+            missing = await record_agent_states([
+                {"agent_id": "agent-1", **state},
+                {"agent_id": "agent-2", **state, "action": "proceed"},
+                {"agent_id": "agent-1", **state},
+                {"agent_id": "ghost", **state},
+            ])
+
+        assert missing == ["ghost"]
+        assert db.get_identity.await_count == 3
+        db.record_agent_states.assert_awaited_once()
+        rows = db.record_agent_states.await_args.args[0]
+        assert [row["identity_id"] for row in rows] == [1, 2, 1]
+        assert rows[1]["state_json"]["action"] == "proceed"
+        assert rows[0]["entropy"] == 0.15
+        db.record_agent_state.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_touches_nothing(self):
+        db = _mock_db()
+        with patch("src.agent_storage.get_db", return_value=db):
+            from src.agent_storage import record_agent_states
+            assert await record_agent_states([]) == []
+        db.get_identity.assert_not_awaited()
+
+
 # ---------------------------------------------------------------------------
 # get_agent_state_history
 # ---------------------------------------------------------------------------
@@ -98,7 +98,7 @@ async def test_get_latest_returns_measured_when_present(db):
 
 
 # ---------------------------------------------------------------------------
-# Site #2: get_all_latest_agent_states (matview + base-table fallback)
+# Site #2: get_all_latest_agent_states (agent_latest_state + base-table fallback)
 # ---------------------------------------------------------------------------
 
 
@@ -109,10 +109,7 @@ async def test_all_latest_excludes_bootstrap_only_agents(db):
     await write_bootstrap(db, identity_id=identity_id, agent_id=agent_id,
                           params=BootstrapStateParams())
 
-    # Refresh the matview so it sees the latest agent_state state.
-    async with db.acquire() as conn:
-        await conn.execute("REFRESH MATERIALIZED VIEW core.mv_latest_agent_states")
-
+    # No refresh: core.agent_latest_state is written through by trigger.
     rows = await db.get_all_latest_agent_states()
     assert all(r.identity_id != identity_id for r in rows)
 
@@ -125,9 +122,6 @@ async def test_all_latest_includes_measured_after_bootstrap(db):
                           params=BootstrapStateParams())
     measured_id = await _record_measured(db, identity_id, entropy=0.2)
 
-    async with db.acquire() as conn:
-        await conn.execute("REFRESH MATERIALIZED VIEW core.mv_latest_agent_states")
-
     rows = await db.get_all_latest_agent_states()
     matching = [r for r in rows if r.identity_id == identity_id]
     assert len(matching) == 1
@@ -150,13 +144,13 @@ async def test_matview_definition_excludes_synthetic(db):
 
 @pytest.mark.asyncio
 async def test_all_latest_base_table_fallback_excludes_bootstrap(db, monkeypatch):
-    """When the matview query raises, the base-table fallback also excludes synthetic."""
+    """When the agent_latest_state query raises, the base-table fallback also excludes synthetic."""
     agent_id, identity_id = await _seed_identity(db)
     await write_bootstrap(db, identity_id=identity_id, agent_id=agent_id,
                           params=BootstrapStateParams())
     measured_id = await _record_measured(db, identity_id, entropy=0.25)
 
-    # Force the matview path to fail so the fallback is exercised.
+    # Force the agent_latest_state path to fail so the fallback is exercised.
     original_acquire = db.acquire
 
     class _ForceFallbackConn:
@@ -164,8 +158,8 @@ async def test_all_latest_base_table_fallback_excludes_bootstrap(db, monkeypatch
             self._real = real
 
         async def fetch(self, query, *args):
-            if "mv_latest_agent_states" in query:
-                raise Exception("simulated matview unavailable")
+            if "agent_latest_state" in query:
+                raise Exception("simulated agent_latest_state unavailable")
             return await self._real.fetch(query, *args)
 
         def __getattr__(self, name):
@@ -194,6 +188,33 @@ async def test_all_latest_base_table_fallback_excludes_bootstrap(db, monkeypatch
     assert matching[0].state_id == measured_id
 
 
+@pytest.mark.asyncio
+async def test_agent_latest_state_written_through_and_consistent(db):
+    """Each measured insert updates core.agent_latest_state in the same
+    statement; bootstrap rows never land there; the checker agrees."""
+    agent_id, identity_id = await _seed_identity(db)
+    await write_bootstrap(db, identity_id=identity_id, agent_id=agent_id,
+                          params=BootstrapStateParams())
+    async with db.acquire() as conn:
+        count = await conn.fetchval(
+            "SELECT COUNT(*) FROM core.agent_latest_state WHERE identity_id = $1",
+            identity_id,
+        )
+    assert count == 0
+
+    await _record_measured(db, identity_id, entropy=0.2)
+    second_id = await _record_measured(db, identity_id, entropy=0.4)
+    async with db.acquire() as conn:
+        latest_id = await conn.fetchval(
+            "SELECT state_id FROM core.agent_latest_state WHERE identity_id = $1",
+            identity_id,
+        )
+    assert latest_id == second_id
+
+    report = await db.check_agent_latest_state()
+    assert identity_id not in report["missing"] + report["stale"] + report["extra"]
+
+
 # ---------------------------------------------------------------------------
 # Site #3: get_recent_cross_agent_activity
 # ---------------------------------------------------------------------------
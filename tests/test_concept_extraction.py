@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import numpy as np
 import pytest
 
+from src import concept_extraction
 from src.concept_extraction import ConceptExtractor, UnionFind
 
 
@@ -237,3 +238,120 @@ class TestEndToEndMock:
         assert result["status"] == "completed"
         assert result["concepts_created"] >= 1
         assert result["tags_processed"] >= 2
+
+
+def _random_tag_corpus(seed, n_tags=40, n_discs=120, dim=8):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(5, dim))
+    embeddings = {
+        f"d{i}": (centers[i % 5] + rng.normal(scale=0.3, size=dim)).astype(np.float32)
+        for i in range(n_discs)
+    }
+    tag_discoveries = {
+        f"t{k}": [f"d{i}" for i in rng.choice(n_discs, size=rng.integers(2, 12), replace=False)]
+        for k in range(n_tags)
+    }
+    return tag_discoveries, embeddings
+
+
+class TestVectorizedMatchesPairwise:
+    """The array implementation agrees with the pairwise definitions."""
+
+    def test_co_occurrence_matches_naive(self):
+        tag_discoveries, _ = _random_tag_corpus(1)
+        naive = defaultdict(int)
+        tags = sorted(tag_discoveries)
+        for i, a in enumerate(tags):
+            for b in tags[i + 1:]:
+                shared = len(set(tag_discoveries[a]) & set(tag_discoveries[b]))
+                if shared:
+                    naive[(a, b)] = shared
+
+        assert ConceptExtractor()._compute_co_occurrence(tag_discoveries) == dict(naive)
+
+    def test_duplicate_incidence_counts_once(self):
+        co = ConceptExtractor()._compute_co_occurrence({"a": ["d1", "d1", "d2"], "b": ["d1", "d2", "d2"]})
+        assert co == {("a", "b"): 2}
+
+    @pytest.mark.parametrize("co_min", [0, 2])
+    def test_merge_matches_naive_union_find(self, co_min):
+        tag_discoveries, embeddings = _random_tag_corpus(2)
+        extractor = ConceptExtractor(merge_cosine_threshold=0.8, merge_co_occurrence_min=co_min)
+        tag_embeddings = extractor._compute_tag_embeddings(tag_discoveries, embeddings)
+        co = extractor._compute_co_occurrence(tag_discoveries)
+
+        uf = UnionFind(list(tag_embeddings))
+        tags = sorted(tag_embeddings)
+        for i, a in enumerate(tags):
+            for b in tags[i + 1:]:
+                u, v = tag_embeddings[a], tag_embeddings[b]
+                cos = float(u @ v / (np.linalg.norm(u) * np.linalg.norm(v)))
+                if cos > 0.8 and co.get((a, b), 0) >= co_min:
+                    uf.union(a, b)
+        expected = sorted(sorted(g) for g in uf.groups().values())
+
+        got = extractor._merge_similar_tags(tag_embeddings, co)
+        assert sorted(sorted(g) for g in got.values()) == expected
+
+    def test_blockwise_similarity_matches_full_matrix(self, monkeypatch):
+        rng = np.random.default_rng(3)
+        unit = concept_extraction._normalize_rows(rng.normal(size=(50, 6)))
+        monkeypatch.setattr(concept_extraction, "SIMILARITY_BLOCK_ELEMENTS", 7 * 50)
+
+        left, right = concept_extraction._similar_pairs(unit, 0.5)
+
+        full = unit @ unit.T
+        expected = {(i, j) for i in range(50) for j in range(i + 1, 50) if full[i, j] > 0.5}
+        assert set(zip(left.tolist(), right.tolist())) == expected
+        assert len(left) == len(expected)
+
+    def test_tag_means_match_per_tag_mean(self):
+        tag_discoveries, embeddings = _random_tag_corpus(4)
+        means = ConceptExtractor()._compute_tag_embeddings(tag_discoveries, embeddings)
+        for tag, ids in tag_discoveries.items():
+            np.testing.assert_allclose(means[tag], np.mean([embeddings[d] for d in ids], axis=0), rtol=1e-5)
+
+    def test_threshold_split_matches_greedy_pairwise(self):
+        rng = np.random.default_rng(5)
+        vecs = rng.normal(size=(30, 4)).astype(np.float32)
+        ids = [f"d{i}" for i in range(30)]
+        extractor = ConceptExtractor(split_distance_threshold=0.5)
+
+        assigned, expected = [False] * 30, []
+        for i in range(30):
+            if assigned[i]:
+                continue
+            cluster, assigned[i] = [ids[i]], True
+            for j in range(i + 1, 30):
+                cos = vecs[i] @ vecs[j] / (np.linalg.norm(vecs[i]) * np.linalg.norm(vecs[j]))
+                if not assigned[j] and cos > 0.5:
+                    cluster.append(ids[j])
+                    assigned[j] = True
+            expected.append(cluster)
+
+        assert extractor._simple_threshold_split(ids, vecs) == expected
+
+    def test_concept_overlaps(self):
+        concepts = [
+            {"discovery_ids": ["d1", "d2", "d3"]},
+            {"discovery_ids": ["d3", "d4"]},
+            {"discovery_ids": ["d5"]},
+            {"discovery_ids": ["d1", "d3", "d5"]},
+        ]
+        assert concept_extraction._concept_overlaps(concepts) == [(0, 1, 1), (0, 3, 2), (1, 3, 1), (2, 3, 1)]
+
+    @pytest.mark.asyncio
+    async def test_in_thread_and_in_process_agree(self):
+        tag_discoveries, embeddings = _random_tag_corpus(6)
+        disc_ids = list(embeddings)
+        matrix = np.stack([embeddings[d] for d in disc_ids])
+
+        in_thread = await ConceptExtractor(use_process_pool=False)._run_clustering(
+            tag_discoveries, disc_ids, matrix
+        )
+        in_process = await ConceptExtractor(use_process_pool=True)._run_clustering(
+            tag_discoveries, disc_ids, matrix
+        )
+        assert in_thread[0] == in_process[0] > 0
+        assert sorted(map(sorted, in_thread[1])) == sorted(map(sorted, in_process[1]))
+
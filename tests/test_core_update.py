@@ -2560,3 +2560,108 @@ class TestProcessAgentUpdateExtended:
 
             data = parse_result(result)
             assert isinstance(data, dict)
+
+
+class TestProcessAgentUpdatesBatch:
+    """Tests for the process_agent_updates_batch handler."""
+
+    @pytest.fixture
+    def mock_server(self):
+        return _make_mock_mcp_server()
+
+    @pytest.fixture
+    def mock_monitor(self):
+        return _make_monitor()
+
+    def _apply_patches(self, mock_server, agent_uuid):
+        from contextlib import ExitStack
+        storage = MagicMock(
+            update_agent=AsyncMock(),
+            get_agent=AsyncMock(return_value=None),
+            record_agent_state=AsyncMock(),
+            record_agent_states=AsyncMock(return_value=[]),
+            create_agent=AsyncMock(),
+        )
+        stack = ExitStack()
+        stack.enter_context(patch("src.mcp_handlers.core.mcp_server", mock_server))
+        stack.enter_context(patch("src.mcp_handlers.context.get_context_agent_id", return_value=agent_uuid))
+        stack.enter_context(patch("src.mcp_handlers.context.get_context_session_key", return_value="session-1"))
+        stack.enter_context(patch("src.mcp_handlers.identity.handlers.ensure_agent_persisted", new_callable=AsyncMock, return_value=False))
+        stack.enter_context(patch("src.mcp_handlers.updates.phases.agent_storage", storage))
+        return stack, storage
+
+    def _active_agent(self, mock_server, mock_monitor, agent_uuid):
+        mock_server.agent_metadata = {agent_uuid: _make_metadata(status="active", total_updates=5)}
+        mock_server.get_or_create_monitor.return_value = mock_monitor
+        mock_server.monitors = {agent_uuid: mock_monitor}
+
+    @pytest.mark.asyncio
+    async def test_batch_applies_items_in_order_under_one_lock(self, mock_server, mock_monitor):
+        agent_uuid = "test-uuid-batch"
+        self._active_agent(mock_server, mock_monitor, agent_uuid)
+        stack, storage = self._apply_patches(mock_server, agent_uuid)
+        with stack:
+            from src.mcp_handlers.core import handle_process_agent_updates_batch
+            result = await handle_process_agent_updates_batch({
+                "checkins": [
+                    {"response_text": "first", "complexity": 0.2},
+                    {"response_text": "second", "complexity": 0.4},
+                    {"response_text": "third", "complexity": 0.6},
+                ],
+                "response_mode": "compact",
+            })
+
+        data = parse_result(result)
+        assert data["success"] is True
+        assert data["count"] == 3 and data["succeeded"] == 3 and data["failed"] == 0
+        assert all(item.get("success") is True for item in data["results"])
+        mock_server.lock_manager.acquire_agent_lock_async.assert_called_once()
+        texts = [
+            call.kwargs["agent_state"]["response_text"]
+            for call in mock_server.process_update_authenticated_async.await_args_list
+        ]
+        assert texts == ["first", "second", "third"]
+        storage.record_agent_states.assert_awaited_once()
+        assert len(storage.record_agent_states.await_args.args[0]) == 3
+        storage.record_agent_state.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_per_item_errors_in_place(self, mock_server, mock_monitor):
+        agent_uuid = "test-uuid-batch"
+        self._active_agent(mock_server, mock_monitor, agent_uuid)
+        stack, _ = self._apply_patches(mock_server, agent_uuid)
+        with stack:
+            from src.mcp_handlers.core import handle_process_agent_updates_batch
+            result = await handle_process_agent_updates_batch({
+                "checkins": [
+                    {"response_text": "mine"},
+                    {"response_text": "someone else's", "agent_id": "impostor"},
+                    {"response_text": "bad token", "continuity_token": "v1.bogus.sig"},
+                    "not an object",
+                ],
+            })
+
+        data = parse_result(result)
+        results = data["results"]
+        assert data["succeeded"] == 1 and data["failed"] == 3
+        assert results[0]["success"] is True
+        assert "mismatch" in results[1]["error"].lower()
+        assert "continuity_token" in results[2]["error"]
+        assert results[3]["success"] is False
+        mock_server.process_update_authenticated_async.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_rejects_empty_and_oversized_lists(self, mock_server, monkeypatch):
+        from src.mcp_handlers.core import handle_process_agent_updates_batch
+
+        with patch("src.mcp_handlers.core.mcp_server", mock_server):
+            empty = parse_result(await handle_process_agent_updates_batch({"checkins": []}))
+            monkeypatch.setenv("UNITARES_CHECKIN_BATCH_MAX", "2")
+            too_many = parse_result(await handle_process_agent_updates_batch({
+                "checkins": [{"response_text": str(i)} for i in range(3)],
+            }))
+
+        assert empty["success"] is False
+        assert too_many["success"] is False
+        assert "2" in too_many["error"]
+        mock_server.process_update_authenticated_async.assert_not_awaited()
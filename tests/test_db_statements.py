@@ -0,0 +1,170 @@
+"""
+Tests for src/db/statements.py - named statements, per-statement stats and
+the mixins that run their hot queries through them.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from prometheus_client import REGISTRY as PROM
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.db.executor_pool import _Connection
+from src.db.statements import StatementRegistry
+
+
+class FakeConn:
+    """Weak-referenceable connection double that records the SQL it runs."""
+
+    def __init__(self, result=None, error=None):
+        self.calls = []
+        self.result = result
+        self.error = error
+
+    async def _run(self, method, sql, *args, **kwargs):
+        self.calls.append((method, sql, args))
+        if self.error:
+            raise self.error
+        return self.result
+
+    async def fetch(self, sql, *args, **kwargs):
+        return await self._run("fetch", sql, *args, **kwargs)
+
+    async def fetchval(self, sql, *args, **kwargs):
+        return await self._run("fetchval", sql, *args, **kwargs)
+
+    async def execute(self, sql, *args, **kwargs):
+        return await self._run("execute", sql, *args, **kwargs)
+
+    async def executemany(self, sql, *args, **kwargs):
+        return await self._run("executemany", sql, *args, **kwargs)
+
+
+def test_register_normalizes_and_rejects_conflicts():
+    reg = StatementRegistry()
+    stmt = reg.register("t.get", """
+        SELECT 1
+        FROM t WHERE id = $1
+    """)
+
+    assert stmt.sql == "SELECT 1\nFROM t WHERE id = $1"
+    assert reg.register("t.get", "SELECT 1\n    FROM t WHERE id = $1") is stmt
+    with pytest.raises(ValueError):
+        reg.register("t.get", "SELECT 2")
+    with pytest.raises(ValueError):
+        reg.register("t.bad")
+    with pytest.raises(ValueError):
+        reg.register("t.bad", "SELECT 1", dynamic=True)
+
+
+@pytest.mark.asyncio
+async def test_calls_record_rows_errors_and_rank_by_total_time():
+    reg = StatementRegistry()
+    fast = reg.register("t.fast", "SELECT id FROM t")
+    update = reg.register("t.update", "UPDATE t SET x = $1")
+    conn = FakeConn(result=[{"id": 1}, {"id": 2}])
+
+    assert await fast.fetch(conn) == [{"id": 1}, {"id": 2}]
+    conn.result = "UPDATE 3"
+    await update.execute(conn, 5)
+    await update.executemany(conn, [(1,), (2,)])
+    with pytest.raises(RuntimeError):
+        await update.execute(FakeConn(error=RuntimeError("boom")), 1)
+
+    assert conn.calls[1] == ("execute", "UPDATE t SET x = $1", (5,))
+    report = {r["statement"]: r for r in reg.report(include_idle=True)}
+    assert (report["t.fast"]["calls"], report["t.fast"]["rows"]) == (1, 2)
+    assert (report["t.update"]["calls"], report["t.update"]["rows"], report["t.update"]["errors"]) == (3, 5, 1)
+
+    reg._stats["t.fast"]["total_ms"] = 10_000.0
+    assert [r["statement"] for r in reg.report()] == ["t.fast", "t.update"]
+    assert len(reg.report(limit=1)) == 1
+
+    reg.reset()
+    assert reg.report() == []
+
+
+@pytest.mark.asyncio
+async def test_prepares_counted_once_per_underlying_connection():
+    reg = StatementRegistry()
+    stmt = reg.register("t.count", "SELECT count(*) FROM t")
+    raw_a, raw_b = FakeConn(result=1), FakeConn(result=2)
+    loop = asyncio.get_running_loop()
+
+    await stmt.fetchval(raw_a)
+    await stmt.fetchval(raw_a)
+    await stmt.fetchval(_Connection(raw_a, loop))  # same server connection via the executor wrapper
+    await stmt.fetchval(raw_b)
+
+    row = reg.report()[0]
+    assert (row["calls"], row["prepares"]) == (4, 2)
+
+
+@pytest.mark.asyncio
+async def test_prepares_keyed_by_server_pid_across_pool_proxies():
+    class PidConn(FakeConn):
+        def __init__(self, pid, result=None):
+            super().__init__(result=result)
+            self.pid = pid
+
+        def get_server_pid(self):
+            return self.pid
+
+    reg = StatementRegistry()
+    stmt = reg.register("t.pid", "SELECT 1")
+
+    # Distinct proxy objects for the same backend session count once.
+    await stmt.fetchval(PidConn(101))
+    await stmt.fetchval(PidConn(101))
+    await stmt.fetchval(PidConn(202))
+
+    row = reg.report()[0]
+    assert (row["calls"], row["prepares"]) == (3, 2)
+
+
+@pytest.mark.asyncio
+async def test_dynamic_statement_takes_sql_per_call():
+    reg = StatementRegistry()
+    cypher = reg.register("t.cypher", dynamic=True)
+    conn = FakeConn(result=[])
+
+    await cypher.fetch(conn, sql="SELECT * FROM cypher('g', $$ RETURN 1 $$) as (result agtype)")
+
+    with pytest.raises(ValueError):
+        await cypher.fetch(conn)
+    with pytest.raises(ValueError):
+        await reg.register("t.fixed", "SELECT 1").fetch(conn, sql="SELECT 2")
+    row = reg.report()[0]
+    assert (row["statement"], row["calls"], row["prepares"], row["dynamic"]) == ("t.cypher", 1, 0, True)
+
+
+@pytest.mark.asyncio
+async def test_mixin_hot_path_runs_registered_statement():
+    from src.db.mixins.identity import GET_IDENTITY, IdentityMixin
+    from src.db.statements import REGISTRY
+
+    conn = MagicMock()
+    conn.fetchrow = AsyncMock(return_value=None)
+    backend = IdentityMixin()
+
+    async def run_unit(work, **kwargs):
+        return await work(conn)
+
+    backend.run_unit = run_unit
+    before = PROM.get_sample_value(
+        "unitares_db_statement_duration_seconds_count", {"statement": "identity.get"}
+    ) or 0
+
+    assert await backend.get_identity("agent-1") is None
+
+    conn.fetchrow.assert_awaited_once_with(GET_IDENTITY.sql, "agent-1")
+    assert REGISTRY.get("identity.get") is GET_IDENTITY
+    after = PROM.get_sample_value(
+        "unitares_db_statement_duration_seconds_count", {"statement": "identity.get"}
+    )
+    assert after == before + 1
@@ -136,6 +136,9 @@ async def ensure_test_database_schema() -> None:
         # lineage_last_eval_at, chain_obs_count to core.identities. Required for
         # the R2 provisional → confirmed/demoted/archived FSM (PR 1).
         await _execute_sql_file(conn, "db/postgres/migrations/036_r2_lineage_lifecycle.sql")
+        # Migration 038: write-through core.agent_latest_state (trigger on
+        # core.agent_state) read by get_all_latest_agent_states.
+        await _execute_sql_file(conn, "db/postgres/migrations/038_agent_latest_state.sql")
 
         # Ensure partitioned audit tables can accept inserts for current month.
         await _execute_sql_file(conn, "db/postgres/partitions.sql")
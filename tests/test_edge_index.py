@@ -0,0 +1,190 @@
+"""
+Tests for src/edge_index.py - the typed-edge adjacency index - and its
+upkeep in KnowledgeGraphAGE (load, incremental adds, graph check).
+"""
+
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.edge_index import TypedEdgeIndex
+from src.storage.knowledge_graph_age import KnowledgeGraphAGE
+
+WEIGHTS = {"related": 0.5, "responds_to": 0.5, "supersedes": 0.25}
+
+EDGES = [
+    ("a", "b", "related"),
+    ("c", "a", "responds_to"),
+    ("b", "d", "related"),
+    ("e", "a", "supersedes"),
+]
+
+
+def test_one_hop_follows_both_directions_with_type_weights():
+    index = TypedEdgeIndex(EDGES)
+
+    assert index.expand(["a", "unknown"], WEIGHTS) == {
+        "a": {"b": 0.5, "c": 0.5, "e": 0.25},
+        "unknown": {},
+    }
+
+
+def test_multi_hop_keeps_best_path_and_skips_zero_weight_types():
+    index = TypedEdgeIndex(EDGES + [("a", "d", "supersedes")])
+
+    out = index.expand(["a"], {"related": 0.5, "responds_to": 0.5}, hops=3)
+
+    # d: 0.5 * 0.5 via b; the direct supersedes edge has weight 0.
+    assert out == {"a": {"b": 0.5, "c": 0.5, "d": 0.25}}
+    assert list(index.expand(["a"], WEIGHTS, hops=2, limit=2)["a"]) == ["b", "c"]
+
+
+def test_incremental_adds_are_visible_and_compact():
+    index = TypedEdgeIndex(EDGES, compact_threshold=3)
+
+    assert index.add("a", "f", "related")
+    assert not index.add("a", "b", "related")  # already in the arrays
+    assert not index.add("a", "f", "related")  # already pending
+    assert not index.add("a", "a", "related")
+    assert not index.add("a", "g", "mentions")
+    assert index.stats()["pending"] == 1
+    assert index.expand(["f"], WEIGHTS) == {"f": {"a": 0.5}}
+
+    index.add_many([("f", "g", "related"), ("g", "h", "responds_to")])
+
+    stats = index.stats()
+    assert stats["pending"] == 0
+    assert stats["edges"] == len(index.edges()) == 7
+    assert stats["by_type"] == {"related": 4, "responds_to": 2, "supersedes": 1}
+    assert index.expand(["a"], WEIGHTS, hops=2)["a"]["g"] == pytest.approx(0.25)
+
+
+def test_diff_and_memory_stats():
+    index = TypedEdgeIndex(EDGES)
+    reference = EDGES[1:] + [("x", "y", "related"), ("x", "x", "related")]
+
+    diff = index.diff(reference)
+
+    assert (diff["missing"], diff["extra"]) == (1, 1)
+    assert ("x", "y", "related") in diff["sample"]
+    memory = index.stats()["bytes"]
+    assert memory["arrays"] > 0
+    assert memory["total"] == memory["arrays"] + memory["ids"] + memory["pending"]
+
+
+# --- KnowledgeGraphAGE upkeep ---
+
+
+def make_graph(rows=(), graph_edges=None):
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=[
+        {"src_id": s, "dst_id": d, "edge_type": t} for s, d, t in rows
+    ])
+    conn.executemany = AsyncMock()
+    db = MagicMock()
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    labels = {"related": "RELATED_TO", "responds_to": "RESPONDS_TO", "supersedes": "SUPERSEDES"}
+
+    async def graph_query(cypher, params, conn=None):
+        return [
+            {"src": f'"{s}"', "dst": f'"{d}"'}
+            for s, d, t in (graph_edges or [])
+            if f"[:{labels[t]}]" in cypher
+        ]
+
+    db.acquire = acquire
+    db.graph_query = graph_query
+    db.graph_available = AsyncMock(return_value=True)
+    kg = KnowledgeGraphAGE()
+    kg._get_db = AsyncMock(return_value=db)
+    return kg, conn
+
+
+@pytest.mark.asyncio
+async def test_load_edge_index_reads_durable_edges():
+    kg, conn = make_graph(rows=EDGES)
+
+    index = await kg.load_edge_index()
+
+    assert index is kg.edge_index
+    assert index.edges() == set(EDGES)
+    assert "edge_type = ANY" in conn.fetch.await_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_recorded_link_and_supersede_edges_reach_index():
+    kg, conn = make_graph(rows=EDGES)
+    await kg._record_edges([("a", "z", "related", None, None)])  # no index yet: no-op
+    await kg.load_edge_index()
+
+    await kg._record_edges([
+        ("b", "c", "related", 0.7, {"source": "link"}),
+        ("d", "b", "supersedes", None, None),
+    ])
+
+    assert kg.edge_index.expand(["b"], WEIGHTS) == {"b": {"a": 0.5, "c": 0.5, "d": 0.5}}
+    assert conn.executemany.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_check_edge_index_rebuilds_from_graph_on_drift():
+    graph_edges = EDGES + [("f", "a", "related")]  # a pre-039 link with no table row
+    kg, _ = make_graph(rows=EDGES[:-1], graph_edges=graph_edges)
+    await kg.load_edge_index()
+
+    result = await kg.check_edge_index()
+
+    assert (result["missing"], result["extra"], result["repaired"]) == (2, 0, True)
+    assert kg.edge_index.edges() == set(graph_edges)
+    assert (await kg.check_edge_index())["consistent"]
+    assert kg.edge_index.stats()["last_check"] == {"missing": 0, "extra": 0}
+
+
+@pytest.mark.asyncio
+async def test_edges_indexed_during_check_survive_rebuild():
+    graph_edges = EDGES + [("f", "a", "related")]
+    kg, _ = make_graph(rows=EDGES, graph_edges=graph_edges)
+    await kg.load_edge_index()
+    graph_query = kg._get_db.return_value.graph_query
+    linked = []
+
+    async def linking_graph_query(cypher, params, conn=None):
+        if not linked:  # a link_discoveries call lands mid-check
+            linked.append(True)
+            await kg._record_edges([("g", "h", "related", None, None)])
+        return await graph_query(cypher, params)
+
+    kg._get_db.return_value.graph_query = linking_graph_query
+    before = kg.edge_index
+
+    result = await kg.check_edge_index()
+
+    assert result["repaired"] and kg.edge_index is not before
+    assert kg.edge_index.edges() == set(graph_edges) | {("g", "h", "related")}
+    assert kg._edge_index_replay is None
+
+
+def test_snapshot_is_unaffected_by_later_adds():
+    index = TypedEdgeIndex(EDGES)
+    snap = index.snapshot()
+
+    index.add("a", "f", "related")
+
+    assert snap.edges() == set(EDGES)
+    assert ("a", "f", "related") in index.edges()
+
+
+@pytest.mark.asyncio
+async def test_check_without_index_reports_error():
+    kg, _ = make_graph()
+    assert (await kg.check_edge_index())["success"] is False
@@ -0,0 +1,183 @@
+"""
+Tests for src/embedding_backfill.py - chunked, resumable embedding backfill.
+
+Uses a fake asyncpg connection that serves discoveries by keyset cursor and
+records COPY / executemany writes, and a fake embeddings service.
+"""
+
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.embedding_backfill import EmbeddingBackfill
+from src.storage.knowledge_graph_age import discovery_embedding_text, embedding_content_hash
+
+
+class FakeConn:
+    def __init__(self, discoveries):
+        self.discoveries = sorted(discoveries)
+        self.fetch_sql = []
+        self.copied = []
+        self.executemany_rows = []
+
+    async def fetch(self, sql, after_id, limit):
+        self.fetch_sql.append(sql)
+        rows = [d for d in self.discoveries if d[0] > after_id][:limit]
+        return [{"id": i, "summary": s, "details": d} for i, s, d in rows]
+
+    @asynccontextmanager
+    async def _transaction(self):
+        yield
+
+    def transaction(self):
+        return self._transaction()
+
+    async def execute(self, sql, *args):
+        if sql.lstrip().startswith("INSERT"):
+            return f"INSERT 0 {len(self.copied[-1])}"
+        return "CREATE TABLE"
+
+    async def copy_records_to_table(self, table, records):
+        self.copied.append(list(records))
+
+    async def executemany(self, sql, rows):
+        self.executemany_rows.append(list(rows))
+
+
+def make_db(conn):
+    db = MagicMock()
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    db.acquire = acquire
+    return db
+
+
+def make_service():
+    svc = MagicMock()
+    svc.table_name = "core.discovery_embeddings"
+    svc.model_name = "sentence-transformers/all-MiniLM-L6-v2"
+    svc.embed_batch = AsyncMock(side_effect=lambda texts, batch_size=32: [[0.5, 0.25] for _ in texts])
+    return svc
+
+
+def make_job(conn, **kwargs):
+    kwargs.setdefault("coverage", AsyncMock(return_value={"ratio": 1.0, "stale": 0}))
+    return EmbeddingBackfill(make_db(conn), make_service(), **kwargs)
+
+
+CORPUS = [(f"d{i:03d}", f"summary {i}", f"details {i}" if i % 2 else None) for i in range(10)]
+
+
+@pytest.mark.asyncio
+async def test_streams_chunks_and_copies_each_once():
+    conn = FakeConn(CORPUS)
+    job = make_job(conn, chunk_size=4)
+
+    result = await job.run()
+
+    assert [len(c) for c in conn.copied] == [4, 4, 2]
+    written = [row[0] for chunk in conn.copied for row in chunk]
+    assert written == [d[0] for d in CORPUS]
+    assert result["selected"] == result["written"] == 10
+    assert result["chunks"] == 3
+    assert result["last_id"] == "d009"
+    assert job.service.embed_batch.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_rows_carry_vector_literal_and_content_hash():
+    conn = FakeConn(CORPUS[:1])
+    await make_job(conn).run()
+
+    discovery_id, vector, model, content_hash = conn.copied[0][0]
+    assert discovery_id == "d000"
+    assert vector == "[0.5,0.25]"
+    assert model == "sentence-transformers/all-MiniLM-L6-v2"
+    assert content_hash == embedding_content_hash(discovery_embedding_text("summary 0", None))
+
+
+@pytest.mark.parametrize("mode,fragment", [
+    ("missing", "e.discovery_id IS NULL"),
+    ("stale", "knowledge.discovery_embedding_hash(d.summary, d.details)"),
+    ("all", "(TRUE)"),
+])
+@pytest.mark.asyncio
+async def test_mode_selects_predicate(mode, fragment):
+    conn = FakeConn(CORPUS[:1])
+    await make_job(conn, mode=mode).run()
+    assert fragment in conn.fetch_sql[0]
+    assert "ORDER BY d.id" in conn.fetch_sql[0]
+
+
+def test_unknown_mode_rejected():
+    with pytest.raises(ValueError):
+        make_job(FakeConn([]), mode="everything")
+
+
+@pytest.mark.asyncio
+async def test_limit_and_start_after_resume():
+    conn = FakeConn(CORPUS)
+    result = await make_job(conn, chunk_size=4).run(limit=5, start_after="d002")
+
+    written = [row[0] for chunk in conn.copied for row in chunk]
+    assert written == ["d003", "d004", "d005", "d006", "d007"]
+    assert result["last_id"] == "d007"
+
+
+@pytest.mark.asyncio
+async def test_executemany_path():
+    conn = FakeConn(CORPUS[:3])
+    result = await make_job(conn, use_copy=False).run()
+
+    assert conn.copied == []
+    assert [row[0] for row in conn.executemany_rows[0]] == ["d000", "d001", "d002"]
+    assert result["written"] == 3
+
+
+@pytest.mark.asyncio
+async def test_dry_run_neither_embeds_nor_writes():
+    conn = FakeConn(CORPUS)
+    job = make_job(conn, chunk_size=3)
+    result = await job.run(dry_run=True)
+
+    assert result["selected"] == 10
+    assert result["written"] == 0
+    job.service.embed_batch.assert_not_awaited()
+    assert conn.copied == []
+
+
+@pytest.mark.asyncio
+async def test_max_rate_sleeps_between_chunks():
+    conn = FakeConn(CORPUS)
+    job = make_job(conn, chunk_size=5, max_rate=10)
+    with patch("src.embedding_backfill.asyncio.sleep", new=AsyncMock()) as sleep:
+        await job.run()
+
+    # After each full chunk (the next fetch may find more): 5 rows at
+    # 10/s ≈ 0.5 s, then 10 rows ≈ 1.0 s since the start.
+    assert sleep.await_count == 2
+    assert 0.3 < sleep.await_args_list[0].args[0] <= 0.5
+    assert 0.8 < sleep.await_args_list[1].args[0] <= 1.0
+
+
+@pytest.mark.asyncio
+async def test_progress_reports_coverage_snapshots():
+    conn = FakeConn(CORPUS)
+    coverage = AsyncMock(side_effect=[{"ratio": 0.1}, {"ratio": 0.5}, {"ratio": 1.0}, {"ratio": 1.0}])
+    seen = []
+    job = make_job(conn, chunk_size=5, report_every=1, coverage=coverage, on_progress=seen.append)
+
+    result = await job.run()
+
+    assert result["coverage_before"] == {"ratio": 0.1}
+    assert result["coverage"] == {"ratio": 1.0}
+    assert [p["selected"] for p in seen] == [5, 10, 10]
@@ -261,3 +261,69 @@ def test_default_model_constant():
     """DEFAULT_MODEL should be sentence-transformers/all-MiniLM-L6-v2."""
     from src.embeddings import DEFAULT_MODEL
     assert DEFAULT_MODEL == "sentence-transformers/all-MiniLM-L6-v2"
+
+
+# --- Micro-batching and query cache (shared pieces: test_inference_batching.py) ---
+
+
+def _batch_model():
+    """Mock model returning a distinct vector per text, single or batched."""
+    def encode(texts, batch_size=None, normalize_embeddings=True):
+        if isinstance(texts, str):
+            return np.full(4, float(len(texts)), dtype=np.float32)
+        return np.array([np.full(4, float(len(t))) for t in texts], dtype=np.float32)
+    model = MagicMock()
+    model.encode.side_effect = encode
+    return model
+
+
+@pytest.mark.asyncio
+async def test_concurrent_embeds_reach_the_model_as_one_encode():
+    """Batched texts go to encode() as a list; a lone text as a plain string."""
+    from src.embeddings import EmbeddingsService
+
+    service = EmbeddingsService(batch_window_ms=5, cache_size=0)
+    service._model = _batch_model()
+
+    texts = ["a", "bb", "ccc", "dddd"]
+    results = await asyncio.gather(*(service.embed(t) for t in texts))
+    await service.embed("solo")
+
+    assert [r[0] for r in results] == [1.0, 2.0, 3.0, 4.0]
+    calls = service._model.encode.call_args_list
+    assert calls[0].args[0] == texts and calls[0].kwargs["normalize_embeddings"] is True
+    assert calls[1].args[0] == "solo"
+    assert service.stats()["batches"] == 2
+
+
+@pytest.mark.asyncio
+async def test_query_cache_hits_on_normalized_text():
+    """Whitespace variants of a query reuse the cached embedding."""
+    from src.embeddings import EmbeddingsService
+
+    service = EmbeddingsService(batch_window_ms=0)
+    service._model = _batch_model()
+
+    first = await service.embed("circuit breaker  triggered")
+    first.append(99.0)  # callers get copies; the cached vector stays intact
+    second = await service.embed("  circuit breaker triggered\n")
+
+    assert second == first[:-1]
+    service._model.encode.assert_called_once()
+    cache = service.stats()["cache"]
+    assert (cache["hits"], cache["misses"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_embed_without_cache_bypasses_query_cache():
+    """cache=False (passage text) neither reads nor fills the query cache."""
+    from src.embeddings import EmbeddingsService
+
+    service = EmbeddingsService(batch_window_ms=0)
+    service._model = _batch_model()
+
+    await service.embed("discovery body", cache=False)
+    await service.embed("discovery body", cache=False)
+
+    assert service._model.encode.call_count == 2
+    assert service.stats()["cache"]["size"] == 0
@@ -1,7 +1,7 @@
 """Tests for the enrichment pipeline registry and runner."""
 
 import asyncio
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -223,3 +223,327 @@ class TestLiteModeSkipping:
         assert names_to_lite_safe.get("enrich_websocket_broadcast") is False
         assert names_to_lite_safe.get("enrich_basin_tracking") is False
         assert names_to_lite_safe.get("enrich_identity_notifications") is False
+
+
+class TestConcurrentScheduling:
+    """Declared reads/writes let non-conflicting enrichments overlap."""
+
+    @staticmethod
+    def _swap(entries):
+        original = list(_ENRICHMENTS)
+        _ENRICHMENTS.clear()
+        _ENRICHMENTS.extend(entries)
+        return original
+
+    @staticmethod
+    def _restore(original):
+        _ENRICHMENTS.clear()
+        _ENRICHMENTS.extend(original)
+
+    @staticmethod
+    def _entry(fn, order, reads=None, writes=None, **kw):
+        from src.mcp_handlers.updates.pipeline import _EnrichmentEntry
+        return _EnrichmentEntry(
+            fn=fn, order=order, name=fn.__name__, is_async=asyncio.iscoroutinefunction(fn),
+            reads=None if reads is None else frozenset(reads),
+            writes=None if writes is None else frozenset(writes),
+            **kw,
+        )
+
+    @pytest.mark.asyncio
+    async def test_independent_io_steps_overlap(self, monkeypatch):
+        import time
+        monkeypatch.setenv("UNITARES_ENRICHMENT_CONCURRENT", "1")
+
+        async def slow_a(ctx):
+            await asyncio.sleep(0.1)
+            ctx.response_data["a"] = 1
+
+        async def slow_b(ctx):
+            await asyncio.sleep(0.1)
+            ctx.response_data["b"] = 1
+
+        async def slow_c(ctx):
+            await asyncio.sleep(0.1)
+            ctx.response_data["c"] = 1
+
+        original = self._swap([
+            self._entry(slow_a, 1, reads=(), writes=("a",)),
+            self._entry(slow_b, 2, reads=(), writes=("b",)),
+            self._entry(slow_c, 3, reads=(), writes=("c",)),
+        ])
+        try:
+            ctx = MagicMock()
+            ctx.response_data = {}
+            start = time.perf_counter()
+            await run_enrichment_pipeline(ctx)
+            assert time.perf_counter() - start < 0.25
+            assert ctx.response_data == {"a": 1, "b": 1, "c": 1}
+        finally:
+            self._restore(original)
+
+    @pytest.mark.asyncio
+    async def test_conflicting_steps_keep_order(self):
+        call_log = []
+
+        async def writer(ctx):
+            await asyncio.sleep(0.02)
+            call_log.append("writer")
+            ctx.response_data["metrics"] = {"E": 0.5}
+
+        async def reader(ctx):
+            call_log.append(("reader", ctx.response_data["metrics"]["E"]))
+
+        async def unrelated(ctx):
+            call_log.append("unrelated")
+
+        original = self._swap([
+            self._entry(writer, 1, reads=(), writes=("metrics",)),
+            self._entry(reader, 2, reads=("metrics.E",), writes=("x",)),
+            self._entry(unrelated, 3, reads=(), writes=("y",)),
+        ])
+        try:
+            ctx = MagicMock()
+            ctx.response_data = {}
+            await run_enrichment_pipeline(ctx)
+            # unrelated does not wait for writer; reader does
+            assert call_log.index("unrelated") < call_log.index("writer")
+            assert call_log[-1] == ("reader", 0.5)
+        finally:
+            self._restore(original)
+
+    @pytest.mark.asyncio
+    async def test_undeclared_step_is_a_barrier(self):
+        call_log = []
+
+        async def slow(ctx):
+            await asyncio.sleep(0.02)
+            call_log.append("slow")
+
+        def barrier(ctx):
+            call_log.append("barrier")
+
+        async def after(ctx):
+            call_log.append("after")
+
+        original = self._swap([
+            self._entry(slow, 1, reads=(), writes=("a",)),
+            self._entry(barrier, 2),
+            self._entry(after, 3, reads=(), writes=("b",)),
+        ])
+        try:
+            await run_enrichment_pipeline(MagicMock())
+            assert call_log == ["slow", "barrier", "after"]
+        finally:
+            self._restore(original)
+
+    @pytest.mark.asyncio
+    async def test_snapshot_reads_only_blocks_writer_until_start(self):
+        call_log = []
+
+        async def coach(ctx):
+            seen = ctx.response_data["metrics"]["E"]
+            await asyncio.sleep(0.05)
+            call_log.append(("coach", seen))
+
+        def rewrite(ctx):
+            ctx.response_data["metrics"]["E"] = 0.9
+            call_log.append("rewrite")
+
+        original = self._swap([
+            self._entry(coach, 1, reads=("metrics.E",), writes=("coaching",), snapshot_reads=True),
+            self._entry(rewrite, 2, reads=(), writes=("metrics.E",)),
+        ])
+        try:
+            ctx = MagicMock()
+            ctx.response_data = {"metrics": {"E": 0.4}}
+            await run_enrichment_pipeline(ctx)
+            assert call_log == ["rewrite", ("coach", 0.4)]
+        finally:
+            self._restore(original)
+
+    @pytest.mark.asyncio
+    async def test_step_timeout_does_not_stall_pipeline(self, monkeypatch):
+        monkeypatch.setenv("UNITARES_ENRICHMENT_STEP_TIMEOUT_MS", "50")
+        call_log = []
+
+        async def hung(ctx):
+            await asyncio.sleep(10)
+            call_log.append("hung")
+
+        def after(ctx):
+            call_log.append("after")
+
+        original = self._swap([self._entry(hung, 1), self._entry(after, 2)])
+        try:
+            await asyncio.wait_for(run_enrichment_pipeline(MagicMock()), 2.0)
+            assert call_log == ["after"]
+        finally:
+            self._restore(original)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrent", ["1", "0"])
+    async def test_side_effect_step_finishes_past_its_budget(self, monkeypatch, concurrent):
+        monkeypatch.setenv("UNITARES_ENRICHMENT_STEP_TIMEOUT_MS", "30")
+        monkeypatch.setenv("UNITARES_ENRICHMENT_CONCURRENT", concurrent)
+        call_log = []
+        persisted = asyncio.Event()
+
+        async def persist(ctx):
+            await asyncio.sleep(0.1)
+            call_log.append("persisted")
+            persisted.set()
+
+        def after(ctx):
+            call_log.append("after")
+
+        original = self._swap([
+            self._entry(persist, 1, side_effects=True),
+            self._entry(after, 2),
+        ])
+        try:
+            await asyncio.wait_for(run_enrichment_pipeline(MagicMock()), 2.0)
+            assert call_log == ["after"]  # the pipeline did not wait
+            await asyncio.wait_for(persisted.wait(), 2.0)  # nor cancel it
+            assert call_log == ["after", "persisted"]
+        finally:
+            self._restore(original)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrent", ["1", "0"])
+    async def test_phase_log_reports_critical_path(self, monkeypatch, concurrent):
+        monkeypatch.setenv("UNITARES_ENRICHMENT_CONCURRENT", concurrent)
+        from src.mcp_handlers.updates import pipeline
+
+        async def step_a(ctx):
+            await asyncio.sleep(0.03)
+
+        async def step_b(ctx):
+            await asyncio.sleep(0.03)
+
+        original = self._swap([
+            self._entry(step_a, 1, reads=(), writes=("a",)),
+            self._entry(step_b, 2, reads=(), writes=("b",)),
+        ])
+        try:
+            with patch.object(pipeline.logger, "info") as info:
+                await run_enrichment_pipeline(MagicMock())
+            line = info.call_args[0][0]
+            assert line.startswith("[enrichment_phases] wall=")
+            assert "critical_path=" in line and "step_a=" in line and "step_b=" in line
+            critical_ms = int(line.split("critical_path=")[1].split("ms")[0])
+            assert 25 <= critical_ms < 55
+        finally:
+            self._restore(original)
+
+    def test_production_io_steps_are_independent(self):
+        """The slow I/O enrichments must not be chained to one another."""
+        from src.mcp_handlers.updates.pipeline import _dependency_graph
+
+        entries = list(_ENRICHMENTS)
+        graph = _dependency_graph(entries)
+        idx = {e.name: i for i, e in enumerate(entries)}
+
+        def ancestors(i):
+            """Steps that must *finish* before step i starts."""
+            seen, visited, stack = set(), set(), [i]
+            while stack:
+                for dep, kind in graph[stack.pop()]:
+                    if kind == "done":
+                        seen.add(dep)
+                    if dep not in visited:
+                        visited.add(dep)
+                        stack.append(dep)
+            return seen
+
+        io_steps = [
+            "enrich_llm_coaching", "enrich_knowledge_surfacing", "enrich_trajectory_identity",
+            "enrich_pending_dialectic", "enrich_learning_context", "enrich_temporal_context",
+        ]
+        for a in io_steps:
+            for b in io_steps:
+                if a != b:
+                    assert idx[a] not in ancestors(idx[b]), f"{b} waits on {a}"
+
+        # Broadcast must see the trajectory risk adjustment; drift forecast
+        # must read event_detector state before broadcast advances it.
+        assert idx["enrich_trajectory_identity"] in ancestors(idx["enrich_websocket_broadcast"])
+        assert idx["enrich_drift_forecast"] in ancestors(idx["enrich_websocket_broadcast"])
+        assert all(e.reads is not None for e in entries), "undeclared enrichment serializes the pipeline"
+
+
+class TestEnrichmentPlanning:
+    """fields= runs only the enrichments the resolved response mode keeps."""
+
+    @staticmethod
+    def _planned(fields):
+        from src.mcp_handlers.updates.pipeline import plan_enrichments
+        entries = list(_ENRICHMENTS)
+        return {e.name for e, keep in zip(entries, plan_enrichments(entries, fields)) if keep}
+
+    def test_full_response_runs_everything(self):
+        assert self._planned(None) == set(get_enrichment_names())
+
+    def test_compact_skips_discarded_enrichments(self):
+        from src.mcp_handlers.response_formatter import fields_for_mode
+        planned = self._planned(fields_for_mode("compact"))
+        for name in ("enrich_learning_context", "enrich_knowledge_surfacing", "enrich_llm_coaching",
+                     "enrich_pending_dialectic", "enrich_convergence_guidance", "enrich_mirror_signals",
+                     "enrich_temporal_context", "enrich_drift_forecast"):
+            assert name not in planned, name
+        # Fields compact keeps, and the steps feeding them
+        for name in ("enrich_metric_standardization", "enrich_grounding", "enrich_health_status_toplevel",
+                     "enrich_thread_identity", "enrich_identity_notifications", "enrich_trajectory_identity"):
+            assert name in planned, name
+
+    def test_side_effecting_enrichments_always_run(self):
+        planned = self._planned(frozenset())
+        for e in _ENRICHMENTS:
+            if e.side_effects:
+                assert e.name in planned
+        assert "enrich_websocket_broadcast" in planned
+
+    def test_mirror_pulls_in_producers_of_what_it_reads(self):
+        from src.mcp_handlers.response_formatter import fields_for_mode
+        planned = self._planned(fields_for_mode("mirror"))
+        # learning_context/calibration_feedback are kept; the mirror step
+        # itself reads state (from state_interpretation).
+        assert {"enrich_mirror_signals", "enrich_learning_context",
+                "enrich_calibration_feedback", "enrich_state_interpretation"} <= planned
+
+    @pytest.mark.asyncio
+    async def test_unplanned_steps_not_called(self):
+        from src.mcp_handlers.updates.pipeline import _EnrichmentEntry
+
+        call_log = []
+
+        def producer(ctx):
+            call_log.append("producer")
+
+        def consumer(ctx):
+            call_log.append("consumer")
+
+        def extra(ctx):
+            call_log.append("extra")
+
+        def broadcast(ctx):
+            call_log.append("broadcast")
+
+        original = list(_ENRICHMENTS)
+        _ENRICHMENTS.clear()
+        _ENRICHMENTS.extend([
+            _EnrichmentEntry(fn=producer, order=1, name="producer", is_async=False,
+                             reads=frozenset(), writes=frozenset({"state"})),
+            _EnrichmentEntry(fn=extra, order=2, name="extra", is_async=False,
+                             reads=frozenset(), writes=frozenset({"extra"})),
+            _EnrichmentEntry(fn=consumer, order=3, name="consumer", is_async=False,
+                             reads=frozenset({"state"}), writes=frozenset({"kept"})),
+            _EnrichmentEntry(fn=broadcast, order=4, name="broadcast", is_async=False,
+                             reads=frozenset(), writes=frozenset(), side_effects=True),
+        ])
+        try:
+            await run_enrichment_pipeline(MagicMock(), fields={"kept"})
+            assert sorted(call_log) == ["broadcast", "consumer", "producer"]
+        finally:
+            _ENRICHMENTS.clear()
+            _ENRICHMENTS.extend(original)
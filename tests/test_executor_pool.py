@@ -14,7 +14,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from src.db.executor_pool import ExecutorPool
+from src.db.executor_pool import AcquireTimeoutError, ExecutorPool
 
 
 @pytest.mark.asyncio
@@ -352,6 +352,124 @@ async def test_acquire_timeout_passes_through_in_context_form():
     assert captured.get('timeout') == 5, f"timeout not forwarded: {captured}"
 
 
+# ============================================================================
+# run(): whole unit of work in one hop
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_run_executes_unit_on_executor_thread_in_one_hop():
+    """acquire + statements + release happen on the executor loop, and the
+    caller crosses threads once — not once per step as with acquire()."""
+    import src.db.executor_pool as ep_mod
+
+    caller_tid = threading.get_ident()
+    seen_tids = []
+
+    async def fetchval_impl(*a, **k):
+        seen_tids.append(threading.get_ident())
+        return 7
+
+    wrapped, _ = _make_pool_with_conn({"fetchval": fetchval_impl})
+    hops = []
+    original = ep_mod._await_on_loop
+
+    async def counting_await_on_loop(target, loop):
+        hops.append(target)
+        return await original(target, loop)
+
+    async def work(conn):
+        return await conn.fetchval("SELECT 1") + await conn.fetchval("SELECT 2")
+
+    ep_mod._await_on_loop = counting_await_on_loop
+    try:
+        result = await wrapped.run(work)
+    finally:
+        ep_mod._await_on_loop = original
+        await wrapped.close()
+
+    assert result == 14
+    assert len(hops) == 1, f"expected one cross-thread hop, got {len(hops)}"
+    assert len(seen_tids) == 2 and all(t != caller_tid for t in seen_tids)
+
+
+@pytest.mark.asyncio
+async def test_run_with_transaction_wraps_work():
+    events = []
+
+    class _Txn:
+        async def __aenter__(self):
+            events.append("begin")
+        async def __aexit__(self, *exc):
+            events.append("rollback" if exc[0] else "commit")
+
+    async def execute_impl(*a, **k):
+        events.append("execute")
+
+    wrapped, _ = _make_pool_with_conn({"execute": execute_impl, "transaction": lambda: _Txn()})
+
+    async def work(conn):
+        await conn.execute("INSERT 1")
+        await conn.execute("INSERT 2")
+
+    try:
+        await wrapped.run(work, transaction=True)
+        with pytest.raises(ValueError):
+            async def failing(conn):
+                await conn.execute("INSERT 3")
+                raise ValueError("boom")
+            await wrapped.run(failing, transaction=True)
+    finally:
+        await wrapped.close()
+
+    assert events == ["begin", "execute", "execute", "commit", "begin", "execute", "rollback"]
+
+
+@pytest.mark.asyncio
+async def test_run_maps_only_acquire_timeout_to_acquire_timeout_error():
+    captured = {}
+
+    async def timeout_aenter():
+        raise asyncio.TimeoutError()
+
+    def make_acquire_ctx(*args, timeout=None):
+        captured["timeout"] = timeout
+        ctx = MagicMock()
+        ctx.__aenter__ = MagicMock(side_effect=timeout_aenter)
+        ctx.__aexit__ = AsyncMock(return_value=None)
+        return ctx
+
+    raw_pool = MagicMock()
+    raw_pool.acquire = make_acquire_ctx
+    raw_pool.close = AsyncMock()
+    wrapped = ExecutorPool(raw_pool)
+
+    async def work(conn):
+        return 1
+
+    try:
+        with pytest.raises(AcquireTimeoutError):
+            await wrapped.run(work, timeout=3)
+    finally:
+        await wrapped.close()
+    assert captured["timeout"] == 3
+
+    # A timeout raised by the statement itself is not pool exhaustion.
+    async def slow_fetchval(*a, **k):
+        raise asyncio.TimeoutError()
+
+    wrapped, _ = _make_pool_with_conn({"fetchval": slow_fetchval})
+
+    async def statement_work(conn):
+        return await conn.fetchval("SELECT pg_sleep(10)")
+
+    try:
+        with pytest.raises(asyncio.TimeoutError) as excinfo:
+            await wrapped.run(statement_work)
+    finally:
+        await wrapped.close()
+    assert not isinstance(excinfo.value, AcquireTimeoutError)
+
+
 # ============================================================================
 # Wedged-loop recovery (PR #226 followup #1)
 # ============================================================================
@@ -0,0 +1,165 @@
+"""
+Parity tests for governance_core.fleet - the vectorized fleet kernel must
+reproduce compute_dynamics row by row.
+"""
+
+import numpy as np
+import pytest
+
+# Hypothesis is optional - use if available, skip property tests if not
+try:
+    from hypothesis import given, settings, strategies as st
+    HAS_HYPOTHESIS = True
+except ImportError:
+    HAS_HYPOTHESIS = False
+
+from governance_core import (
+    DEFAULT_PARAMS, DEFAULT_THETA, FleetState, State, Theta,
+    compute_dynamics, compute_fleet_dynamics, simulate_fleet,
+)
+
+# tanh is the only operation whose NumPy and libm results may differ (1 ulp).
+TOL = dict(rtol=0, atol=1e-12)
+
+
+def _random_fleet(rng, n, k=5, anchored=0.5):
+    """Inputs spanning the interior, the barrier margins and the clip bounds."""
+    p = DEFAULT_PARAMS
+    arr = np.column_stack([
+        rng.uniform(p.E_min - 0.02, p.E_max + 0.02, n),
+        rng.uniform(p.I_min - 0.02, p.I_max + 0.02, n),
+        rng.uniform(p.S_min, p.S_max + 0.02, n),
+        rng.uniform(p.V_min - 0.02, p.V_max + 0.02, n),
+    ])
+    edge = rng.random((n, 4)) < 0.15  # pin some values to the bounds exactly
+    lo = np.array([p.E_min, p.I_min, p.S_min, p.V_min])
+    hi = np.array([p.E_max, p.I_max, p.S_max, p.V_max])
+    arr = np.where(edge, np.where(rng.random((n, 4)) < 0.5, lo, hi), arr)
+    sensors = rng.uniform(0, 1, (n, 4))
+    sensors[rng.random(n) >= anchored] = np.nan
+    return {
+        "state": FleetState.from_array(arr),
+        "delta_eta": rng.normal(0, 0.3, (n, k)),
+        "theta": Theta(C1=rng.uniform(0.5, 1.5, n), eta1=rng.uniform(0.0, 0.6, n),
+                       eta2=rng.uniform(0.0, 0.6, n)),
+        "dt": rng.uniform(0.01, 1.0, n),
+        "noise_S": rng.normal(0, 0.05, n),
+        "complexity": rng.uniform(-0.2, 1.2, n),
+        "sensor_eisv": FleetState.from_array(sensors),
+    }
+
+
+def _scalar(inputs, i, integrator, i_mode, monkeypatch):
+    monkeypatch.setenv("UNITARES_INTEGRATOR", integrator)
+    monkeypatch.setenv("UNITARES_I_DYNAMICS", i_mode)
+    th = inputs["theta"]
+    sensor = inputs["sensor_eisv"][i]
+    return compute_dynamics(
+        state=inputs["state"][i],
+        delta_eta=list(inputs["delta_eta"][i]),
+        theta=Theta(C1=float(th.C1[i]), eta1=float(th.eta1[i]), eta2=float(th.eta2[i])),
+        params=DEFAULT_PARAMS,
+        dt=float(inputs["dt"][i]),
+        noise_S=float(inputs["noise_S"][i]),
+        complexity=float(inputs["complexity"][i]),
+        sensor_eisv=None if np.isnan(sensor.E) else sensor,
+    )
+
+
+@pytest.mark.parametrize("integrator", ["rk4", "euler"])
+@pytest.mark.parametrize("i_mode", ["linear", "logistic"])
+def test_matches_compute_dynamics_per_row(integrator, i_mode, monkeypatch):
+    inputs = _random_fleet(np.random.default_rng(7), 400)
+
+    batch = compute_fleet_dynamics(
+        **inputs, params=DEFAULT_PARAMS, integrator=integrator, i_mode=i_mode,
+    )
+
+    expected = FleetState.from_states(
+        [_scalar(inputs, i, integrator, i_mode, monkeypatch) for i in range(400)]
+    )
+    np.testing.assert_allclose(batch.to_array(), expected.to_array(), **TOL)
+
+
+def test_scalar_inputs_broadcast_and_modes_follow_env(monkeypatch):
+    monkeypatch.setenv("UNITARES_INTEGRATOR", "euler")
+    states = [State(0.7, 0.8, 0.2, 0.0), State(0.02, 0.99, 0.9, -0.95), State(1.0, 0.0, 0.001, 1.0)]
+
+    batch = compute_fleet_dynamics(
+        FleetState.from_states(states), None, DEFAULT_THETA, DEFAULT_PARAMS, dt=0.3,
+    )
+
+    for row, s in zip(batch.to_states(), states):
+        want = compute_dynamics(s, [], DEFAULT_THETA, DEFAULT_PARAMS, dt=0.3)
+        np.testing.assert_allclose(
+            [row.E, row.I, row.S, row.V], [want.E, want.I, want.S, want.V], **TOL
+        )
+
+
+def test_simulate_matches_repeated_steps_and_records_trajectory():
+    inputs = _random_fleet(np.random.default_rng(11), 50)
+    inputs.pop("dt")
+
+    trajectory = simulate_fleet(
+        n_steps=20, params=DEFAULT_PARAMS, dt=0.2, integrator="rk4", i_mode="linear",
+        record=True, **inputs,
+    )
+
+    state = inputs.pop("state")
+    for step in range(20):
+        state = compute_fleet_dynamics(
+            state, params=DEFAULT_PARAMS, dt=0.2, integrator="rk4", i_mode="linear", **inputs,
+        )
+    assert trajectory.shape == (21, 50, 4)
+    np.testing.assert_array_equal(trajectory[-1], state.to_array())
+
+
+def test_shape_errors():
+    state = FleetState.from_states([DEFAULT_STATE_ROW, DEFAULT_STATE_ROW])
+    with pytest.raises(ValueError):
+        compute_fleet_dynamics(state, np.zeros((3, 2)), DEFAULT_THETA, DEFAULT_PARAMS)
+    with pytest.raises(ValueError):
+        compute_fleet_dynamics(
+            state, None, DEFAULT_THETA, DEFAULT_PARAMS,
+            sensor_eisv=FleetState.from_states([DEFAULT_STATE_ROW]),
+        )
+
+
+DEFAULT_STATE_ROW = State(E=0.7, I=0.8, S=0.2, V=0.0)
+
+
+@pytest.mark.skipif(not HAS_HYPOTHESIS, reason="hypothesis not installed")
+def test_parity_property(monkeypatch):
+    """Property-based parity over single agents, including bound values."""
+
+    unit = st.floats(-0.05, 1.05, allow_nan=False)
+
+    @settings(max_examples=300, deadline=None)
+    @given(
+        unit, unit, unit, st.floats(-1.05, 1.05),
+        st.lists(st.floats(-2, 2), max_size=6),
+        st.floats(0.5, 1.5), st.floats(0, 0.6), st.floats(0, 0.6),
+        st.floats(0.001, 1.0), st.floats(-0.2, 0.2), st.floats(-0.5, 1.5),
+        st.none() | st.tuples(unit, unit, unit, unit),
+        st.sampled_from(["rk4", "euler"]), st.sampled_from(["linear", "logistic"]),
+    )
+    def _check(E, I, S, V, drift, C1, eta1, eta2, dt, noise, complexity, sensor, integrator, i_mode):
+        theta = Theta(C1=C1, eta1=eta1, eta2=eta2)
+        sensor_state = State(*sensor) if sensor else None
+        monkeypatch.setenv("UNITARES_INTEGRATOR", integrator)
+        monkeypatch.setenv("UNITARES_I_DYNAMICS", i_mode)
+        want = compute_dynamics(
+            State(E, I, S, V), drift, theta, DEFAULT_PARAMS, dt=dt, noise_S=noise,
+            complexity=complexity, sensor_eisv=sensor_state,
+        )
+        got = compute_fleet_dynamics(
+            FleetState.from_states([State(E, I, S, V)]),
+            np.array([drift]).reshape(1, len(drift)),
+            theta, DEFAULT_PARAMS, dt=dt, noise_S=noise, complexity=complexity,
+            sensor_eisv=FleetState.from_states([sensor_state]),
+        )[0]
+        np.testing.assert_allclose(
+            [got.E, got.I, got.S, got.V], [want.E, want.I, want.S, want.V], **TOL
+        )
+
+    _check()
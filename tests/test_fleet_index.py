@@ -0,0 +1,143 @@
+"""
+Tests for src/fleet_index.py - the columnar per-agent metrics index behind
+compare_me_to_similar, compare_agents and aggregate_metrics.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.fleet_index import FleetIndex, fleet_index, forget_agent, record_monitor
+
+
+def _state(E=0.7, I=0.8, S=0.2, V=0.0, coherence=0.5, risk_history=(0.3,), update_count=5, void_active=False):
+    return SimpleNamespace(
+        E=E, I=I, S=S, V=V, coherence=coherence, risk_history=list(risk_history),
+        update_count=update_count, void_active=void_active,
+    )
+
+
+def _metrics(**overrides):
+    metrics = {
+        "E": 0.7, "I": 0.8, "S": 0.2, "V": 0.0, "coherence": 0.5, "phi": 0.1,
+        "risk_score": 0.3, "current_risk": 0.3, "mean_risk": 0.3,
+        "verdict": "safe", "status": "healthy", "regime": "convergence",
+        "decision_statistics": {"proceed": 2, "pause": 1, "total": 3},
+    }
+    metrics.update(overrides)
+    return metrics
+
+
+def _random_fleet(n, seed=0, capacity=16):
+    rng = np.random.default_rng(seed)
+    values = rng.random((n, 4))
+    index = FleetIndex(capacity=capacity)
+    for i, (e, i_, s, c) in enumerate(values):
+        index.record(f"agent-{i}", _metrics(E=e, I=i_, S=s, coherence=c), _state(coherence=c))
+    return index, values
+
+
+def test_record_from_monitor_matches_get_metrics():
+    from src.governance_monitor import UNITARESMonitor
+
+    monitor = UNITARESMonitor("fleet-index-agent", load_state=False)
+    for _ in range(3):
+        monitor.process_update({"response_text": "ok", "complexity": 0.4})
+    record_monitor("fleet-index-agent", monitor)
+
+    row = fleet_index.get("fleet-index-agent")
+    metrics = monitor.get_metrics()
+    for key in ("E", "I", "S", "V", "coherence", "phi", "risk_score", "current_risk", "mean_risk"):
+        assert row[key] == pytest.approx(metrics[key])
+    for key in ("verdict", "status", "regime", "void_active", "initialized"):
+        assert row[key] == metrics[key]
+    assert row["ode_E"] == pytest.approx(metrics["ode"]["E"])
+    assert row["update_count"] == 3
+    counts = metrics["decision_statistics"]
+    assert row["decision_statistics"] == {k: counts.get(k, 0) for k in row["decision_statistics"]}
+
+    forget_agent("fleet-index-agent")
+    assert "fleet-index-agent" not in fleet_index
+
+
+def test_record_monitor_respects_toggle(monkeypatch):
+    monkeypatch.setenv("UNITARES_FLEET_INDEX", "0")
+    record_monitor("a", SimpleNamespace(state=_state()), _metrics())
+    assert len(fleet_index) == 0
+
+
+def test_knn_and_range_query_match_brute_force():
+    index, values = _random_fleet(500, capacity=8)  # grows past capacity several times
+    center = {"E": 0.5, "I": 0.5, "S": 0.5, "coherence": 0.5}
+    point = np.array([0.5, 0.5, 0.5, 0.5])
+
+    dist = np.sqrt(((values - point) ** 2).sum(axis=1))
+    expected = [f"agent-{i}" for i in np.argsort(dist, kind="stable")[:7]]
+    nearest = index.knn(center, k=7, exclude=["agent-nobody"])
+    assert [aid for aid, _ in nearest] == expected
+    assert nearest[0][1] == pytest.approx(dist.min())
+
+    delta = np.abs(values - point)
+    hit = (delta[:, :3] <= 0.1).all(axis=1)
+    matches = index.range_query(center, {"E": 0.1, "I": 0.1, "S": 0.1})
+    assert {aid for aid, _ in matches} == {f"agent-{i}" for i in np.flatnonzero(hit)}
+    scores = [d for _, d in matches]
+    assert scores == sorted(scores)
+    for aid, d in matches:
+        assert d == pytest.approx(delta[int(aid.split("-")[1])].mean())
+
+    assert len(index.range_query(center, 0.1)) == int((delta <= 0.1).all(axis=1).sum())
+
+
+def test_queries_skip_uninitialized_and_excluded_rows():
+    index = FleetIndex()
+    index.record("fresh", _metrics(status="uninitialized", coherence=None), _state())
+    index.record("me", _metrics(), _state())
+    index.record("peer", _metrics(E=0.71), _state())
+
+    center = {"E": 0.7, "I": 0.8, "S": 0.2, "coherence": 0.5}
+    assert index.knn(center, k=5, exclude=["me"]) == [("peer", pytest.approx(0.01))]
+    assert [aid for aid, _ in index.range_query(center, 0.05)] == ["me", "peer"]
+
+
+def test_remove_moves_last_row_and_keeps_lookups_consistent():
+    index, values = _random_fleet(40)
+    for i in (0, 17, 39, 5):
+        assert index.remove(f"agent-{i}")
+    assert not index.remove("agent-17")
+    assert len(index) == 36
+    for i in range(40):
+        row = index.get(f"agent-{i}")
+        if i in (0, 17, 39, 5):
+            assert row is None
+        else:
+            assert row["E"] == values[i, 0] and row["coherence"] == values[i, 3]
+
+    index.record("agent-17", _metrics(E=0.9), _state())
+    assert index.get("agent-17")["E"] == 0.9 and len(index) == 37
+
+
+def test_aggregate_counts_and_risk_history_fallback():
+    index = FleetIndex()
+    index.record("a", _metrics(risk_score=0.2, verdict="safe"), _state(coherence=0.6))
+    index.record("b", _metrics(risk_score=0.4, verdict="caution", status="moderate",
+                               decision_statistics={"approve": 4, "reject": 1}), _state(coherence=0.4))
+    index.record("c", _metrics(risk_score=None, current_risk=None, verdict=None, status=None),
+                 _state(risk_history=[0.1, 0.3, 0.5], update_count=9))
+
+    agg = index.aggregate(["a", "b", "c", "missing"])
+
+    assert agg["agents"] == 3 and agg["indexed"] == ["a", "b", "c"]
+    assert agg["risk_sum"] / agg["risk_n"] == pytest.approx(np.mean([0.2, 0.4, 0.1, 0.3, 0.5]))
+    assert agg["coherence_mean"] == pytest.approx(0.5)
+    assert agg["status"] == {"healthy": 1, "moderate": 1} and agg["status_unset"] == 1
+    assert agg["verdict"] == {"safe": 1, "caution": 1}
+    assert agg["decisions"]["proceed"] == 4 and agg["decisions"]["approve"] == 4
+    assert agg["last_decisions"]["proceed"] == 2  # "c" carries the default counts
+    assert agg["update_counts"]["c"] == 9
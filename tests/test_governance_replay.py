@@ -0,0 +1,142 @@
+"""
+Tests for src/governance_replay.py - counterfactual replay of stored
+check-ins under candidate parameters.
+"""
+
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src import runtime_config
+from src.governance_replay import (
+    Candidate,
+    CheckIn,
+    JsonlSource,
+    replay_isolation,
+    run_replay,
+    verdict_class,
+)
+
+
+def _audit_entry(agent_id, ts, decision="proceed", **details):
+    return {
+        "timestamp": ts.isoformat(),
+        "agent_id": agent_id,
+        "event_type": "auto_attest",
+        "confidence": 0.7,
+        "details": {
+            "decision": decision,
+            "beh_obs": [0.7, 0.8, 0.2],
+            "continuity": {"self_cx": 0.4},
+            **details,
+        },
+    }
+
+
+@pytest.fixture
+def export(tmp_path):
+    start = datetime(2026, 9, 1, 12, 0, 0)
+    lines = [json.dumps({"timestamp": start.isoformat(), "event_type": "lambda1_skip", "agent_id": "a"})]
+    for agent in ("agent-a", "agent-b"):
+        for i in range(6):
+            lines.append(json.dumps(_audit_entry(agent, start + timedelta(minutes=i))))
+    lines.append("not json")
+    path = tmp_path / "audit_log.jsonl"
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def test_checkin_from_audit_event_and_export_record():
+    ts = datetime(2026, 9, 1, 12, 0, 0)
+    checkin = CheckIn.from_audit_event(_audit_entry("agent-a", ts, decision="pause", gap_suppressed=True))
+
+    assert checkin.ts == ts and checkin.confidence == 0.7 and checkin.complexity == 0.4
+    assert checkin.recorded_action == "proceed"  # the pause was downgraded live
+    assert checkin.agent_state()["behavioral_obs"] == (0.7, 0.8, 0.2)
+    assert CheckIn.from_dict(checkin.to_dict()) == checkin
+    assert CheckIn.from_audit_event({"event_type": "lambda1_skip", "agent_id": "a"}) is None
+
+
+@pytest.mark.parametrize("decision, expected", [
+    ({"action": "proceed", "sub_action": "approve"}, "proceed"),
+    ({"action": "proceed", "sub_action": "guide"}, "guide"),
+    ({"action": "pause", "sub_action": "basin_pause", "critical": False}, "pause"),
+    ({"action": "pause", "sub_action": "risk_pause", "critical": True}, "reject"),
+    ({"action": "pause", "sub_action": "reject"}, "reject"),
+])
+def test_verdict_class(decision, expected):
+    assert verdict_class(decision) == expected
+
+
+def test_candidate_validates_and_restores_overrides(monkeypatch):
+    with pytest.raises(ValueError):
+        Candidate(name="bad", params={"not_a_param": 1.0})
+    with pytest.raises(ValueError):
+        Candidate(name="bad", governor={"tau": 0.3})
+
+    monkeypatch.setenv("UNITARES_PARAMS_JSON", json.dumps({"alpha": 0.5}))
+    candidate = Candidate(
+        name="c", params={"beta_E": 0.2}, thresholds={"coherence_critical_threshold": 0.5},
+    )
+    before = runtime_config.get_thresholds()
+    with candidate.applied():
+        assert json.loads(os.environ["UNITARES_PARAMS_JSON"]) == {"alpha": 0.5, "beta_E": 0.2}
+        assert runtime_config.get_effective_threshold("coherence_critical_threshold") == 0.5
+    assert json.loads(os.environ["UNITARES_PARAMS_JSON"]) == {"alpha": 0.5}
+    assert runtime_config.get_thresholds() == before
+
+    with pytest.raises(ValueError):
+        with Candidate(name="c", thresholds={"coherence_critical_threshold": 2.0}).applied():
+            pass
+
+
+def test_replay_diffs_candidate_against_baseline_and_resumes(export, tmp_path, monkeypatch):
+    from src.audit_log import AuditLogger
+
+    def fail(self, entry):
+        raise AssertionError("replay wrote an audit entry")
+
+    monkeypatch.setattr(AuditLogger, "_write_entry", fail)
+    strict = Candidate(name="strict", thresholds={"coherence_critical_threshold": 0.99})
+    ckpt = str(tmp_path / "ckpt")
+
+    report = run_replay(JsonlSource(str(export)), [strict], workers=0, shards=2, checkpoint_dir=ckpt)
+
+    assert (report["agents"], report["checkins"]) == (2, 12)
+    assert report["throughput"]["replayed_checkins"] == 12
+    assert 0.0 <= report["agreement"] <= 1.0
+    variant = report["variants"]["strict"]
+    assert variant["counts"] == {"reject": 12}  # coherence gate pauses every check-in
+    assert variant["changed"] == 12 - report["baseline"].get("reject", 0)
+    assert {row["agent_id"] for row in variant["agents"]} == {"agent-a", "agent-b"}
+
+    resumed = run_replay(JsonlSource(str(export)), [strict], workers=0, shards=2, checkpoint_dir=ckpt)
+    assert resumed["resumed_agents"] == 2
+    assert resumed["throughput"]["replayed_checkins"] == 0
+    assert resumed["variants"] == report["variants"]
+
+
+def test_replay_isolation_restores_patched_sinks():
+    import src.tool_usage_tracker as tool_usage_tracker
+    from src.audit_log import audit_logger
+
+    original = tool_usage_tracker.get_tool_usage_tracker
+    with replay_isolation():
+        assert tool_usage_tracker.get_tool_usage_tracker().get_usage_stats()["total_calls"] == 0
+        assert "_write_entry" in vars(audit_logger)
+    assert tool_usage_tracker.get_tool_usage_tracker is original
+    assert "_write_entry" not in vars(audit_logger)
+
+
+def test_rejects_reserved_or_duplicate_candidate_names(export):
+    with pytest.raises(ValueError):
+        run_replay(JsonlSource(str(export)), [Candidate()], workers=0)
+    with pytest.raises(ValueError):
+        run_replay(JsonlSource(str(export)), [Candidate(name="x"), Candidate(name="x")], workers=0)
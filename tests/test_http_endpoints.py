@@ -19,6 +19,7 @@ sys.path.insert(0, str(project_root))
 from tests.http_test_app import create_test_app
 from src.http_api import (
     _build_http_tool_response,
+    _http_tool_response,
     _normalize_http_tool_name,
     _resolve_http_bound_agent,
 )
@@ -171,6 +172,18 @@ class TestCallToolEndpoint:
         assert isinstance(call_args[0][1], dict)
 
 
+class TestCheckinsBatchEndpoint:
+
+    @pytest.mark.asyncio
+    async def test_body_is_batch_tool_arguments(self):
+        from src.http_api import http_checkins_batch
+
+        request = MagicMock()
+        with patch("src.http_api._handle_http_tool_call", new=AsyncMock(return_value="resp")) as handle:
+            assert await http_checkins_batch(request) == "resp"
+        handle.assert_awaited_once_with(request, fixed_tool_name="process_agent_updates_batch")
+
+
 class TestHttpToolResponseSerialization:
 
     def test_single_text_json_preserves_legacy_result_shape(self):
@@ -220,6 +233,44 @@ class TestHttpToolResponseSerialization:
         }
 
 
+    def test_structured_result_is_spliced_without_reparse(self):
+        from src.mcp_handlers.serialization import StructuredTextContent
+
+        payload = {"success": True, "agents": [{"id": "a", "note": "caf\u00e9"}]}
+        item = StructuredTextContent.from_payload(payload, json.dumps(payload, ensure_ascii=False))
+        with patch("src.http_api.json.loads", side_effect=AssertionError("re-parsed")):
+            response = _http_tool_response("list_agents", [item])
+            assert _build_http_tool_response("list_agents", [item])["result"] is payload
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {
+            "name": "list_agents",
+            "result": payload,
+            "success": True,
+        }
+
+    @pytest.mark.parametrize("encoder", ["stdlib", "orjson"])
+    def test_non_finite_floats_never_reach_the_body_as_nan(self, monkeypatch, encoder):
+        from src.mcp_handlers.response_base import success_response
+
+        monkeypatch.setenv("UNITARES_JSON_ENCODER", encoder)
+        result = success_response({"coherence": float("nan"), "risk": float("inf")}, {"lite_response": True})
+        response = _http_tool_response("get_governance_metrics", result)
+
+        def reject(token):
+            raise ValueError(f"non-standard JSON token {token}")
+
+        body = json.loads(response.body, parse_constant=reject)
+        assert body["success"] is True
+        assert body["result"]["coherence"] is None and body["result"]["risk"] is None
+
+    def test_plain_text_result_still_uses_json_response(self):
+        response = _http_tool_response(
+            "health_check",
+            [TextContent(type="text", text=json.dumps({"status": "ok"}))]
+        )
+        assert json.loads(response.body)["result"] == {"status": "ok"}
+
+
 class TestHttpToolNameNormalization:
 
     def test_prefixed_mcp_tool_name_maps_to_canonical_name(self):
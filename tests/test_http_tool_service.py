@@ -81,3 +81,9 @@ class TestHttpToolService:
     def test_normalize_direct_http_result_leaves_non_json_textcontent_untouched(self):
         raw_result = [TextContent(type="text", text="plain text")]
         assert _normalize_direct_http_result(raw_result) == raw_result
+
+    def test_normalize_direct_http_result_keeps_structured_result_for_splicing(self):
+        from src.mcp_handlers.serialization import StructuredTextContent
+
+        raw_result = [StructuredTextContent.from_payload({"success": True}, '{"success": true}')]
+        assert _normalize_direct_http_result(raw_result) is raw_result
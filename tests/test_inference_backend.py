@@ -0,0 +1,140 @@
+"""
+Tests for src/inference_backend.py - backend selection, ONNX export caching,
+int8 quantization, and fallback to torch.
+
+Uses a fake model class standing in for SentenceTransformer / CrossEncoder,
+so no model weights, onnxruntime, or optimum are needed.
+"""
+
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src import inference_backend as ib
+
+
+class FakeModel:
+    """Records constructor calls; save_pretrained writes an ONNX file."""
+
+    calls: list = []
+    fail_onnx = False
+
+    def __init__(self, name, backend="torch", model_kwargs=None):
+        if backend == "onnx" and FakeModel.fail_onnx:
+            raise ValueError("onnxruntime not installed")
+        FakeModel.calls.append((name, backend, model_kwargs))
+        self.name, self.backend, self.model_kwargs = name, backend, model_kwargs
+
+    def save_pretrained(self, path):
+        onnx_dir = Path(path) / "onnx"
+        onnx_dir.mkdir(parents=True)
+        (onnx_dir / "model.onnx").write_text("fp32")
+
+
+@pytest.fixture(autouse=True)
+def _isolated(tmp_path, monkeypatch):
+    monkeypatch.setattr(ib, "MODEL_CACHE_DIR", tmp_path / "models")
+    monkeypatch.setattr(ib, "quantization_config", lambda: "avx2")
+    FakeModel.calls = []
+    FakeModel.fail_onnx = False
+
+
+@pytest.fixture
+def fake_quantizer(monkeypatch):
+    """Install a stand-in export_dynamic_quantized_onnx_model."""
+    quantized = []
+
+    def export(model, config, path):
+        quantized.append((model.name, config))
+        (Path(path) / "onnx" / f"model_qint8_{config}.onnx").write_text("int8")
+
+    module = types.ModuleType("sentence_transformers")
+    module.export_dynamic_quantized_onnx_model = export
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+    return quantized
+
+
+@pytest.mark.parametrize("raw,expected", [
+    (None, "torch"),
+    ("", "torch"),
+    ("PyTorch", "torch"),
+    ("onnx", "onnx"),
+    ("ONNX_INT8", "onnx-int8"),
+    ("int8", "onnx-int8"),
+    ("tensorrt", "torch"),
+])
+def test_normalize_backend(raw, expected):
+    assert ib.normalize_backend(raw) == expected
+
+
+def test_service_override_beats_global(monkeypatch):
+    monkeypatch.setenv("UNITARES_INFERENCE_BACKEND", "onnx")
+    monkeypatch.setenv("UNITARES_RERANKER_BACKEND", "onnx-int8")
+    monkeypatch.delenv("UNITARES_EMBEDDING_BACKEND", raising=False)
+    assert ib.configured_backend("UNITARES_RERANKER_BACKEND") == "onnx-int8"
+    assert ib.configured_backend("UNITARES_EMBEDDING_BACKEND") == "onnx"
+    monkeypatch.delenv("UNITARES_INFERENCE_BACKEND")
+    assert ib.configured_backend("UNITARES_EMBEDDING_BACKEND") == "torch"
+
+
+def test_torch_loads_checkpoint_directly():
+    model, backend = ib.load_model(FakeModel, "org/model", "torch")
+    assert backend == "torch"
+    assert FakeModel.calls == [("org/model", "torch", None)]
+
+
+def test_onnx_export_is_cached_across_loads():
+    model, backend = ib.load_model(FakeModel, "org/model", "onnx")
+    target = ib.export_dir("org/model")
+    assert backend == "onnx"
+    assert (target / "onnx" / "model.onnx").exists()
+    assert model.name == str(target)
+    assert not list(target.parent.glob("*.tmp-*"))
+
+    FakeModel.calls = []
+    ib.load_model(FakeModel, "org/model", "onnx")
+    # Second load reads the export; nothing is fetched from the hub.
+    assert FakeModel.calls == [(str(target), "onnx", None)]
+
+
+def test_int8_quantizes_once_and_loads_quantized_file(fake_quantizer):
+    model, backend = ib.load_model(FakeModel, "org/model", "onnx-int8")
+    assert backend == "onnx-int8"
+    assert model.model_kwargs == {"file_name": "onnx/model_qint8_avx2.onnx"}
+    assert fake_quantizer == [(str(ib.export_dir("org/model")), "avx2")]
+
+    ib.load_model(FakeModel, "org/model", "onnx-int8")
+    assert len(fake_quantizer) == 1
+
+
+def test_onnx_failure_falls_back_to_torch():
+    FakeModel.fail_onnx = True
+    model, backend = ib.load_model(FakeModel, "org/model", "onnx-int8")
+    assert backend == "torch"
+    assert model.backend == "torch"
+
+
+@pytest.mark.asyncio
+async def test_services_record_backend_actually_used(monkeypatch):
+    from src import embeddings, reranker
+
+    FakeModel.fail_onnx = True
+    monkeypatch.setattr(embeddings, "SentenceTransformer", FakeModel, raising=False)
+    monkeypatch.setattr(embeddings, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+    monkeypatch.setattr(reranker, "CrossEncoder", FakeModel, raising=False)
+    monkeypatch.setattr(reranker, "CROSS_ENCODER_AVAILABLE", True)
+
+    svc = embeddings.EmbeddingsService(backend="onnx")
+    assert svc.backend == "onnx"
+    await svc._ensure_model()
+    assert svc.backend == "torch"
+    assert svc.stats()["backend"] == "torch"
+
+    rr = reranker.CrossEncoderReranker(backend="onnx-int8")
+    await rr._ensure_model()
+    assert rr.backend == "torch"
@@ -0,0 +1,155 @@
+"""
+Tests for src/inference_batching.py - the TTLCache and MicroBatcher shared by
+the embeddings service and the cross-encoder reranker.
+"""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.inference_batching import MicroBatcher, TTLCache
+
+
+def _batcher(calls, fail=False, **kwargs):
+    def run(items):
+        calls.append(list(items))
+        if fail:
+            raise RuntimeError("boom")
+        return [f"r:{item}" for item in items]
+
+    kwargs.setdefault("window_ms", 5)
+    kwargs.setdefault("batch_max", 32)
+    kwargs.setdefault("workers", 1)
+    return MicroBatcher(run, thread_name_prefix="test", **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_items_within_window_coalesce_into_one_batch():
+    calls, sizes = [], []
+    batcher = _batcher(calls, on_batch=sizes.append)
+
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(4)))
+
+    assert results == ["r:0", "r:1", "r:2", "r:3"]
+    assert calls == [[0, 1, 2, 3]] and sizes == [4]
+    assert batcher.stats()["batches"] == 1 and batcher.stats()["mean_batch_size"] == 4
+
+
+@pytest.mark.asyncio
+async def test_batches_are_bounded_and_queue_behind_busy_workers():
+    calls = []
+    batcher = _batcher(calls, batch_max=2)
+
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+    assert results == [f"r:{i}" for i in range(5)]
+    assert [len(c) for c in calls] == [2, 2, 1]
+    assert batcher.stats()["max_batch_size"] == 2 and batcher.stats()["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_same_key_shares_one_result_and_fills_cache():
+    calls = []
+    cache = TTLCache(max_size=8, ttl_s=60)
+    batcher = _batcher(calls, cache=cache)
+
+    results = await asyncio.gather(*(asyncio.shield(batcher.submit("x", key="k")) for _ in range(5)))
+
+    assert results == ["r:x"] * 5
+    assert calls == [["x"]]
+    assert batcher.inflight == 0
+    assert cache.get("k") == "r:x"
+
+
+@pytest.mark.asyncio
+async def test_batch_error_reaches_every_waiter_and_caches_nothing():
+    calls = []
+    cache = TTLCache(max_size=8, ttl_s=60)
+    batcher = _batcher(calls, fail=True, cache=cache)
+
+    results = await asyncio.gather(
+        batcher.submit("a", key="a"), batcher.submit("b", key="b"), return_exceptions=True,
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert batcher.inflight == 0 and len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_batch_cancels_waiters():
+    started, release = threading.Event(), threading.Event()
+
+    def run(items):
+        started.set()
+        release.wait(5)
+        return [f"r:{item}" for item in items]
+
+    batcher = MicroBatcher(run, window_ms=1, batch_max=8, workers=1, thread_name_prefix="test")
+    try:
+        fut = batcher.submit("a", key="a")
+        while not started.is_set():
+            await asyncio.sleep(0.001)
+        for task in asyncio.all_tasks():
+            if task is not asyncio.current_task():
+                task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(fut, timeout=1)
+        assert batcher.inflight == 0
+    finally:
+        release.set()
+
+
+def test_batcher_rebinds_to_a_new_event_loop():
+    calls = []
+    batcher = _batcher(calls)
+
+    async def once():
+        return await asyncio.wait_for(batcher.submit("x"), 1)
+
+    for _ in range(2):  # a second loop must not wait on the first loop's state
+        assert asyncio.run(once()) == "r:x"
+    assert calls == [["x"], ["x"]]
+
+
+def test_cache_lru_ttl_and_stats():
+    cache = TTLCache(max_size=2, ttl_s=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # a is now most recent
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    with patch("src.inference_batching.time.monotonic", return_value=10**9):
+        assert cache.get("a") is None
+    assert cache.stats() == {"size": 1, "max_size": 2, "hits": 2, "misses": 2, "hit_rate": 0.5}
+
+    disabled = TTLCache(max_size=0, ttl_s=60)
+    disabled.put("a", 1)
+    assert not disabled.enabled and len(disabled) == 0
+
+
+def test_cache_tags_follow_eviction_and_invalidation():
+    cache = TTLCache(max_size=3, ttl_s=60, tag=lambda key: key[0])
+    cache.put(("d1", "q1"), 1)
+    cache.put(("d1", "q2"), 2)
+    cache.put(("d2", "q1"), 3)
+    cache.put(("d3", "q1"), 4)  # evicts ("d1", "q1")
+
+    assert cache.invalidate_tag("d1") == 1
+    assert cache.invalidate_tag("d1") == 0
+    assert cache.get(("d1", "q2")) is None
+    assert cache.get(("d2", "q1")) == 3
+
+    with patch("src.inference_batching.time.monotonic", return_value=10**9):
+        assert cache.get(("d2", "q1")) is None  # expiry drops the tag entry too
+    assert cache.invalidate_tag("d2") == 0
+    assert cache.invalidate_tag("d3") == 1
@@ -0,0 +1,185 @@
+"""
+Tests for src/jsonl_writer.py - group-commit JSONL writer.
+
+Uses tmp_path for file isolation.
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.jsonl_writer import _STOP, GroupCommitWriter, append_jsonl_lines
+
+
+def _read(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class TestAppendJsonlLines:
+
+    def test_appends(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        append_jsonl_lines(path, ['{"a": 1}\n'])
+        append_jsonl_lines(path, ['{"a": 2}\n', '{"a": 3}\n'], fsync=False)
+        assert [r["a"] for r in _read(path)] == [1, 2, 3]
+
+
+class TestGroupCommitWriter:
+
+    def test_flush_makes_records_visible_in_order(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        writer = GroupCommitWriter(path, max_delay=0.5)
+        try:
+            for i in range(100):
+                writer.submit({"i": i})
+            assert writer.flush(timeout=5)
+            assert [r["i"] for r in _read(path)] == list(range(100))
+        finally:
+            writer.close()
+
+    def test_batches_share_fsync(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        writer = GroupCommitWriter(path, max_batch=50, max_delay=1.0)
+        try:
+            for i in range(200):
+                writer.submit({"i": i})
+            writer.flush(timeout=5)
+            stats = writer.stats()
+            assert stats["records"] == 200
+            assert stats["batches"] < 200
+            assert stats["fsyncs"] == stats["batches"]
+        finally:
+            writer.close()
+
+    def test_record_is_snapshotted_at_submit(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        writer = GroupCommitWriter(path, max_delay=0.2)
+        try:
+            record = {"details": {"n": 1}}
+            writer.submit(record)
+            record["details"]["n"] = 2
+            writer.flush(timeout=5)
+            assert _read(path)[0]["details"]["n"] == 1
+        finally:
+            writer.close()
+
+    def test_full_queue_blocks_and_keeps_order(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        writer = GroupCommitWriter(path, max_queue=1, max_delay=0.0)
+        gate = threading.Event()
+        original = writer._write_batch
+
+        def stalled(lines):
+            gate.wait(5)
+            original(lines)
+
+        writer._write_batch = stalled
+        try:
+            writer.submit({"i": 0})
+            while not writer._queue.empty():  # writer thread picked it up
+                time.sleep(0.001)
+            writer.submit({"i": 1})  # fills the queue
+            submitter = threading.Thread(
+                target=lambda: [writer.submit({"i": i}) for i in range(2, 20)]
+            )
+            submitter.start()
+            submitter.join(0.2)
+            assert submitter.is_alive()  # blocked on the full queue, not writing around it
+            assert writer.stats()["backpressure_waits"] == 1
+            assert not path.exists()
+            gate.set()
+            submitter.join(5)
+            writer.flush(timeout=5)
+            assert [r["i"] for r in _read(path)] == list(range(20))
+            assert writer.stats()["sync_fallbacks"] == 0
+        finally:
+            gate.set()
+            writer.close()
+
+    def test_close_drains_and_later_submits_write_inline(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        writer = GroupCommitWriter(path, max_delay=1.0)
+        writer.submit({"i": 0})
+        writer.close()
+        assert len(_read(path)) == 1
+        writer.submit({"i": 1})
+        assert len(_read(path)) == 2
+        assert writer.stats()["sync_fallbacks"] == 1
+
+    def test_dead_writer_thread_writes_queued_records_first(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        writer = GroupCommitWriter(path, max_delay=0.0)
+        writer._queue.put(_STOP)
+        writer._thread.join(5)
+        writer._queue.put('{"i": 0}\n')  # queued, never picked up
+
+        writer.submit({"i": 1})
+
+        assert [r["i"] for r in _read(path)] == [0, 1]
+        assert writer.stats()["sync_fallbacks"] == 1
+        writer.close()
+
+    def test_concurrent_submitters(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        writer = GroupCommitWriter(path, max_delay=0.01)
+
+        def worker(n):
+            for i in range(200):
+                writer.submit({"t": n, "i": i})
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        writer.close()
+        records = _read(path)
+        assert len(records) == 800
+        for n in range(4):
+            assert [r["i"] for r in records if r["t"] == n] == list(range(200))
+
+
+class TestLoggersWithGroupCommit:
+
+    def test_audit_logger_reads_flush_writer(self, tmp_path):
+        from src.audit_log import AuditLogger
+        logger = AuditLogger(log_file=tmp_path / "audit.jsonl")
+        writer = logger.enable_group_commit(GroupCommitWriter(logger.log_file, max_delay=1.0))
+        try:
+            logger.log_lambda1_skip("a1", 0.4, 0.8, 3)
+            logger.log_auto_attest("a1", 0.9, True, 0.1, "proceed")
+            assert len(logger.query_audit_log(agent_id="a1")) == 2
+            assert logger.get_skip_rate_metrics(agent_id="a1")["total_skips"] == 1
+        finally:
+            writer.close()
+
+    def test_tool_usage_tracker_scan_path_flushes(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("UNITARES_TOOL_USAGE_AGGREGATOR", "0")
+        from src.tool_usage_tracker import ToolUsageTracker
+        tracker = ToolUsageTracker(log_file=tmp_path / "usage.jsonl")
+        writer = tracker.enable_group_commit(GroupCommitWriter(tracker.log_file, max_delay=1.0))
+        try:
+            tracker.log_tool_call("search", agent_id="a1")
+            tracker.log_tool_call("search", agent_id="a1", success=False)
+            stats = tracker.get_usage_stats(window_hours=1, agent_id="a1")
+            assert stats["total_calls"] == 2
+            assert stats["tools"]["search"]["error_count"] == 1
+        finally:
+            writer.close()
+
+    def test_tool_usage_rotation_with_writer(self, tmp_path):
+        from src.tool_usage_tracker import ToolUsageTracker
+        tracker = ToolUsageTracker(log_file=tmp_path / "usage.jsonl")
+        writer = tracker.enable_group_commit(GroupCommitWriter(tracker.log_file, max_delay=1.0))
+        try:
+            tracker.log_tool_call("search")
+            kept, _ = tracker.rotate_log(max_age_days=30)
+            assert kept == 1
+        finally:
+            writer.close()
@@ -103,7 +103,7 @@ class TestEmbedTextConstruction:
         # Fake embeddings service capturing the text it receives
         captured = {}
 
-        async def fake_embed(text):
+        async def fake_embed(text, cache=True):
             captured["text"] = text
             return [0.0] * 1024
 
@@ -423,6 +423,19 @@ class TestAddDiscovery:
         # The DELETE always runs; the INSERT must not.
         assert conn.executemany.await_count == 0
 
+    @pytest.mark.asyncio
+    async def test_sync_discovery_edges_keeps_link_edges(self):
+        """Re-syncing a payload must not delete edges made by link_discoveries."""
+        kg, _ = make_kg_with_mock_db()
+
+        conn = AsyncMock()
+        conn.fetch = AsyncMock(return_value=[])
+        await kg._sync_discovery_edges(conn, make_discovery(), datetime(2026, 5, 13))
+
+        delete_sql = conn.execute.await_args_list[0].args[0]
+        assert "DELETE FROM knowledge.discovery_edges" in delete_sql
+        assert "IS DISTINCT FROM 'link'" in delete_sql
+
     @pytest.mark.asyncio
     async def test_add_discovery_with_tags(self):
         """Should create TAGGED edges for each tag."""
@@ -1467,14 +1480,16 @@ class TestPgvectorAvailable:
 class TestPgvectorSearch:
 
     @pytest.mark.asyncio
-    async def test_returns_scored_results(self):
-        """Should return (discovery_id, similarity) tuples."""
+    async def test_returns_hydrated_scored_results(self):
+        """Should return (DiscoveryNode, similarity) tuples from one DB call."""
         kg, mock_db = make_kg_with_mock_db()
-        mock_conn = mock_db._mock_conn
-        mock_conn.fetch.return_value = [
-            {"discovery_id": "d1", "similarity": 0.95},
-            {"discovery_id": "d2", "similarity": 0.80},
-        ]
+        mock_db.kg_vector_search = AsyncMock(return_value=[
+            {"id": "d1", "agent_id": "a", "type": "insight", "summary": "one",
+             "similarity": 0.95, "responses_from": ["d9"]},
+            {"id": "d2", "agent_id": "a", "type": "insight", "summary": "two",
+             "similarity": 0.80, "responses_from": []},
+        ])
+        kg.get_discovery = AsyncMock()
 
         result = await kg._pgvector_search(
             query_embedding=[0.1, 0.2, 0.3],
@@ -1482,25 +1497,36 @@ class TestPgvectorSearch:
             min_similarity=0.5,
         )
 
-        assert len(result) == 2
-        assert result[0] == ("d1", 0.95)
-        assert result[1] == ("d2", 0.80)
+        assert [(d.id, s) for d, s in result] == [("d1", 0.95), ("d2", 0.80)]
+        assert result[0][0].responses_from == ["d9"]
+        kg.get_discovery.assert_not_awaited()
+        args = mock_db.kg_vector_search.await_args.args
+        assert args[1] == "[0.1,0.2,0.3]"
+        assert args[2:] == (10, 0.5)
 
     @pytest.mark.asyncio
-    async def test_with_agent_id_filter(self):
-        """Should use agent-filtered query when agent_id provided."""
+    async def test_pushes_filters_down(self):
+        """Metadata filters go to the vector query, not a post-filter."""
         kg, mock_db = make_kg_with_mock_db()
-        mock_conn = mock_db._mock_conn
-        mock_conn.fetch.return_value = []
+        mock_db.kg_vector_search = AsyncMock(return_value=[])
 
         await kg._pgvector_search(
             query_embedding=[0.1, 0.2],
             limit=5,
             min_similarity=0.3,
             agent_id="agent-1",
+            discovery_type="bug_found",
+            status="open",
+            tags=["perf"],
+            exclude_archived=True,
         )
 
-        mock_conn.fetch.assert_awaited_once()
+        kwargs = mock_db.kg_vector_search.await_args.kwargs
+        assert kwargs["agent_id"] == "agent-1"
+        assert kwargs["type"] == "bug_found"
+        assert kwargs["status"] == "open"
+        assert kwargs["tags"] == ["perf"]
+        assert kwargs["exclude_archived"] is True
 
 
 # ============================================================================
@@ -1525,6 +1551,40 @@ class TestStoreEmbedding:
         assert call_args.args[1] == "disc-001"
         assert call_args.args[2] == "[0.1,0.2,0.3]"
 
+    @pytest.mark.asyncio
+    async def test_records_content_hash_of_embedded_text(self):
+        """The hash of the embedded text is stored so the backfill can skip it."""
+        from src.storage.knowledge_graph_age import (
+            discovery_embedding_text, embedding_content_hash,
+        )
+        kg, mock_db = make_kg_with_mock_db()
+        mock_conn = mock_db._mock_conn
+        mock_conn.fetchval = AsyncMock(return_value=True)  # migration 040 applied
+        text = discovery_embedding_text("summary", "details")
+
+        await kg._store_embedding("disc-001", [0.1], text)
+
+        call_args = mock_conn.execute.await_args
+        assert "content_hash" in call_args.args[0]
+        assert call_args.args[4] == embedding_content_hash(text)
+        assert embedding_content_hash(text) == embedding_content_hash("summary\ndetails")
+
+    @pytest.mark.asyncio
+    async def test_falls_back_without_content_hash_column(self):
+        """Before migration 040 the pre-040 columns are written; the probe runs once."""
+        kg, mock_db = make_kg_with_mock_db()
+        mock_conn = mock_db._mock_conn
+        mock_conn.fetchval = AsyncMock(return_value=False)
+
+        await kg._store_embedding("disc-001", [0.1], "text")
+        await kg._store_embedding("disc-002", [0.2], "text")
+
+        assert mock_conn.fetchval.await_count == 1
+        sql = mock_conn.execute.await_args.args[0]
+        assert "content_hash" not in sql
+        assert len(mock_conn.execute.await_args.args) == 4  # sql + three columns
+        assert mock_conn.execute.await_args.args[1:3] == ("disc-002", "[0.2]")
+
     @pytest.mark.asyncio
     async def test_handles_store_failure_gracefully(self):
         """Should not raise when embedding store fails."""
@@ -1632,11 +1692,61 @@ class TestGetConnectivityScoresBatch:
         result = await kg.get_connectivity_scores_batch([])
         assert result == {}
 
+    @pytest.mark.asyncio
+    async def test_reads_counters_table_without_graph_query(self):
+        """Scores come from one discovery_connectivity lookup, no Cypher."""
+        kg, mock_db = make_kg_with_mock_db()
+        mock_db._mock_conn.fetch.return_value = [
+            {"discovery_id": "d1", "related": 5, "responds": 2, "superseded_by": 0},
+        ]
+
+        result = await kg.get_connectivity_scores_batch(["d1", "d2"])
+
+        base = math.log1p(5 + 4) / math.log1p(100)
+        assert abs(result["d1"] - base) < 0.001
+        assert result["d2"] == 0.0
+        mock_db.graph_query.assert_not_awaited()
+        sql, ids = mock_db._mock_conn.fetch.await_args.args
+        assert "knowledge.discovery_connectivity" in sql
+        assert ids == ["d1", "d2"]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_graph_when_table_missing(self):
+        """Before migration 039 the scores come from the AGE traversal."""
+        import asyncpg
+        kg, mock_db = make_kg_with_mock_db()
+        mock_db._mock_conn.fetch.side_effect = asyncpg.UndefinedTableError(
+            'relation "knowledge.discovery_connectivity" does not exist'
+        )
+        mock_db.graph_query.return_value = [
+            {"id": "d1", "related": 1, "responds": 0, "superseded_by": 0},
+        ]
+
+        result = await kg.get_connectivity_scores_batch(["d1", "d2"])
+        await kg.get_connectivity_scores_batch(["d1"])
+
+        assert result["d1"] > 0.0
+        assert result["d2"] == 0.0
+        assert mock_db.graph_query.await_count == 2
+        mock_db._mock_conn.fetch.assert_awaited_once()  # missing table remembered
+
+    @pytest.mark.asyncio
+    async def test_other_errors_give_neutral_scores_without_graph_query(self):
+        """Pool exhaustion or timeouts must not fall back to the AGE traversal."""
+        kg, mock_db = make_kg_with_mock_db()
+        mock_db._mock_conn.fetch.side_effect = TimeoutError("pool exhausted")
+
+        result = await kg.get_connectivity_scores_batch(["d1", "d2"])
+
+        assert result == {"d1": 0.0, "d2": 0.0}
+        mock_db.graph_query.assert_not_awaited()
+        assert kg._connectivity_table_missing is False
+
     @pytest.mark.asyncio
     async def test_returns_zeros_when_graph_unavailable(self):
         """Should return all zeros when graph is not available."""
         kg, mock_db = make_kg_with_mock_db(graph_available=False)
-        result = await kg.get_connectivity_scores_batch(["d1", "d2"])
+        result = await kg._graph_connectivity_scores_batch(["d1", "d2"])
         assert result == {"d1": 0.0, "d2": 0.0}
 
     @pytest.mark.asyncio
@@ -1648,7 +1758,7 @@ class TestGetConnectivityScoresBatch:
             {"id": "d2", "related": 0, "responds": 0},
         ]
 
-        result = await kg.get_connectivity_scores_batch(["d1", "d2", "d3"])
+        result = await kg._graph_connectivity_scores_batch(["d1", "d2", "d3"])
 
         assert result["d1"] > 0.0
         assert result["d2"] == 0.0  # raw = 0
@@ -1662,7 +1772,7 @@ class TestGetConnectivityScoresBatch:
             {"id": "d1", "related": 1, "responds": 0},
         ]
 
-        result = await kg.get_connectivity_scores_batch(["d1", "d2"])
+        result = await kg._graph_connectivity_scores_batch(["d1", "d2"])
         assert "d2" in result
         assert result["d2"] == 0.0
 
@@ -1674,7 +1784,7 @@ class TestGetConnectivityScoresBatch:
             {"id": '"d1"', "related": 1, "responds": 0},
         ]
 
-        result = await kg.get_connectivity_scores_batch(["d1"])
+        result = await kg._graph_connectivity_scores_batch(["d1"])
         assert "d1" in result
 
     @pytest.mark.asyncio
@@ -1683,7 +1793,7 @@ class TestGetConnectivityScoresBatch:
         kg, mock_db = make_kg_with_mock_db()
         mock_db.graph_query.side_effect = Exception("batch failed")
 
-        result = await kg.get_connectivity_scores_batch(["d1", "d2"])
+        result = await kg._graph_connectivity_scores_batch(["d1", "d2"])
         assert result == {"d1": 0.0, "d2": 0.0}
 
     @pytest.mark.asyncio
@@ -1695,7 +1805,7 @@ class TestGetConnectivityScoresBatch:
             {"id": "d1", "related": 1, "responds": 1},
         ]
 
-        result = await kg.get_connectivity_scores_batch(["d1"])
+        result = await kg._graph_connectivity_scores_batch(["d1"])
         assert result["d1"] > 0.0
 
 
@@ -1919,8 +2029,8 @@ class TestConnectivityCap:
         """Connectivity raw score should be capped at 50."""
         kg, mock_db = make_kg_with_mock_db()
         # 100 related + 200 responds = 500 raw, but should be capped at 50
-        mock_db.graph_query.return_value = [
-            {"id": "d1", "related": 100, "responds": 100, "superseded_by": 0},
+        mock_db._mock_conn.fetch.return_value = [
+            {"discovery_id": "d1", "related": 100, "responds": 100, "superseded_by": 0},
         ]
 
         result = await kg.get_connectivity_scores_batch(["d1"])
@@ -1931,9 +2041,9 @@ class TestConnectivityCap:
     async def test_superseded_entries_penalized(self):
         """Entries with SUPERSEDES edges pointing to them should score lower."""
         kg, mock_db = make_kg_with_mock_db()
-        mock_db.graph_query.return_value = [
-            {"id": "d1", "related": 5, "responds": 2, "superseded_by": 0},
-            {"id": "d2", "related": 5, "responds": 2, "superseded_by": 1},
+        mock_db._mock_conn.fetch.return_value = [
+            {"discovery_id": "d1", "related": 5, "responds": 2, "superseded_by": 0},
+            {"discovery_id": "d2", "related": 5, "responds": 2, "superseded_by": 1},
         ]
 
         result = await kg.get_connectivity_scores_batch(["d1", "d2"])
@@ -1944,8 +2054,8 @@ class TestConnectivityCap:
     async def test_multiple_supersessions_compound(self):
         """Multiple supersessions should compound the penalty."""
         kg, mock_db = make_kg_with_mock_db()
-        mock_db.graph_query.return_value = [
-            {"id": "d1", "related": 5, "responds": 2, "superseded_by": 2},
+        mock_db._mock_conn.fetch.return_value = [
+            {"discovery_id": "d1", "related": 5, "responds": 2, "superseded_by": 2},
         ]
 
         result = await kg.get_connectivity_scores_batch(["d1"])
@@ -1954,6 +2064,52 @@ class TestConnectivityCap:
         assert abs(result["d1"] - base * 0.25) < 0.001
 
 
+class TestReconcileConnectivity:
+
+    @pytest.mark.asyncio
+    async def test_reports_drift_against_graph(self):
+        """Counters missing edges the graph has (pre-039 links) are drift."""
+        kg, mock_db = make_kg_with_mock_db()
+        mock_db.graph_query.side_effect = [
+            [{"id": "d1", "related": 2}],       # RELATED_TO
+            [{"id": "d1", "responds": 1}],      # RESPONDS_TO
+            [{"id": "d3", "superseded_by": 1}],  # SUPERSEDES
+        ]
+        mock_db._mock_conn.fetch.return_value = [
+            {"discovery_id": "d1", "related": 1, "responds": 1, "superseded_by": 0},
+            {"discovery_id": "d2", "related": 0, "responds": 0, "superseded_by": 0},
+        ]
+
+        result = await kg.reconcile_connectivity()
+
+        assert result["checked"] == 3
+        assert result["drifted"] == 2
+        drifted = {d["id"]: d for d in result["drift"]}
+        assert drifted["d1"]["graph"] == {"related": 2, "responds": 1, "superseded_by": 0}
+        assert drifted["d3"]["table"] == {"related": 0, "responds": 0, "superseded_by": 0}
+        assert result["consistent"] is False
+        mock_db._mock_conn.executemany.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_repair_writes_graph_counts(self):
+        kg, mock_db = make_kg_with_mock_db()
+        mock_db.graph_query.side_effect = [[{"id": "d1", "related": 3}], [], []]
+        mock_db._mock_conn.fetch.return_value = []
+
+        result = await kg.reconcile_connectivity(repair=True)
+
+        assert result["repaired"] == 1
+        sql, rows = mock_db._mock_conn.executemany.await_args.args
+        assert "INSERT INTO knowledge.discovery_connectivity" in sql
+        assert rows == [("d1", 3, 0, 0)]
+
+    @pytest.mark.asyncio
+    async def test_graph_unavailable(self):
+        kg, _ = make_kg_with_mock_db(graph_available=False)
+        result = await kg.reconcile_connectivity()
+        assert result["success"] is False
+
+
 class TestSupersedeDiscovery:
 
     @pytest.mark.asyncio
@@ -1970,6 +2126,19 @@ class TestSupersedeDiscovery:
         assert result["success"] is True
         assert mock_db.graph_query.call_count >= 1
 
+    @pytest.mark.asyncio
+    async def test_supersede_records_durable_edge(self):
+        """The SUPERSEDES edge is mirrored into discovery_edges for the counters."""
+        kg, mock_db = make_kg_with_mock_db()
+        kg.get_discovery = AsyncMock(return_value=make_discovery())
+
+        await kg.supersede_discovery(new_id="new-1", old_id="old-1")
+
+        sql, rows = mock_db._mock_conn.executemany.await_args.args
+        assert "INSERT INTO knowledge.discovery_edges" in sql
+        assert "ON CONFLICT (src_id, dst_id, edge_type) DO NOTHING" in sql
+        assert rows == [("new-1", "old-1", "supersedes", None, None)]
+
     @pytest.mark.asyncio
     async def test_supersede_missing_new(self):
         """Should fail if new discovery doesn't exist."""
@@ -2051,7 +2220,7 @@ class TestSemanticSearch:
 
     @pytest.mark.asyncio
     async def test_pgvector_agent_filter(self):
-        """Should filter results by agent_id when specified."""
+        """Should push agent_id and the other filters into the pgvector search."""
         kg, mock_db = make_kg_with_mock_db()
 
         mock_embeddings = AsyncMock()
@@ -2061,19 +2230,20 @@ class TestSemanticSearch:
         mock_module.get_embeddings_service = AsyncMock(return_value=mock_embeddings)
 
         kg._pgvector_available = AsyncMock(return_value=True)
-        kg._pgvector_search = AsyncMock(return_value=[("d1", 0.9)])
-
-        # Discovery belongs to wrong agent
-        d1 = make_discovery(discovery_id="d1", agent_id="other-agent")
-        kg.get_discovery = AsyncMock(return_value=d1)
+        d1 = make_discovery(discovery_id="d1", agent_id="specific-agent")
+        kg._pgvector_search = AsyncMock(return_value=[(d1, 0.9)])
+        kg._blend_with_connectivity = AsyncMock(return_value=[(d1, 0.8)])
 
         with patch.dict("sys.modules", {"src.embeddings": mock_module}):
-            # With agent filter that doesn't match
-            result = await kg.semantic_search("test", agent_id="specific-agent")
+            result = await kg.semantic_search(
+                "test", agent_id="specific-agent", status="open", exclude_archived=True,
+            )
 
-        # d1 should be filtered out because agent_id doesn't match
-        # Falls through to in-memory search
-        # Since we didn't mock the in-memory path, this tests the filter logic
+        assert result == [(d1, 0.8)]
+        kwargs = kg._pgvector_search.await_args.kwargs
+        assert kwargs["agent_id"] == "specific-agent"
+        assert kwargs["status"] == "open"
+        assert kwargs["exclude_archived"] is True
 
     @pytest.mark.asyncio
     async def test_in_memory_fallback(self):
@@ -2239,6 +2409,31 @@ class TestLinkDiscoveries:
         assert result["reason"] == "related topic"
         assert result["bidirectional"] is False
 
+    @pytest.mark.asyncio
+    async def test_link_records_durable_edges(self):
+        """Each created edge lands in discovery_edges tagged source=link."""
+        kg, mock_db = make_kg_with_mock_db()
+        mock_db.graph_query.side_effect = [[["d1", "d2"]], None, None]
+
+        await kg.link_discoveries("d1", "d2", reason="same bug", strength=0.7, bidirectional=True)
+
+        rows = mock_db._mock_conn.executemany.await_args.args[1]
+        assert [(r[0], r[1], r[2], r[3]) for r in rows] == [
+            ("d1", "d2", "related", 0.7),
+            ("d2", "d1", "related", 0.7),
+        ]
+        assert json.loads(rows[0][4]) == {"source": "link", "reason": "same bug"}
+
+    @pytest.mark.asyncio
+    async def test_link_succeeds_when_durable_write_fails(self):
+        """The graph edge exists either way; a failed row write only logs."""
+        kg, mock_db = make_kg_with_mock_db()
+        mock_db.graph_query.side_effect = [[["d1", "d2"]], None]
+        mock_db._mock_conn.executemany.side_effect = Exception("fk violation")
+
+        result = await kg.link_discoveries("d1", "d2")
+        assert result["success"] is True
+
     @pytest.mark.asyncio
     async def test_successful_bidirectional_link(self):
         """Should create two RELATED_TO edges."""
@@ -16,6 +16,7 @@ async def test_load_rehydrates_when_age_empty_and_postgres_has_data():
     kg._rehydrate_from_postgres = AsyncMock(
         return_value={"discoveries": 5, "related_edges": 2}
     )
+    kg.load_edge_index = AsyncMock()
 
     await kg.load()
 
@@ -31,7 +32,35 @@ async def test_load_skips_rehydrate_when_age_already_has_data():
     kg._count_postgres_discoveries = AsyncMock(return_value=5)
     kg._count_age_discoveries = AsyncMock(return_value=3)
     kg._rehydrate_from_postgres = AsyncMock()
+    kg.load_edge_index = AsyncMock()
 
     await kg.load()
 
     kg._rehydrate_from_postgres.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("expansion,flag,loads", [
+    ("1", None, True), ("1", "0", False), (None, None, False),
+])
+async def test_load_builds_edge_index_only_for_graph_expansion(monkeypatch, expansion, flag, loads):
+    if expansion is None:
+        monkeypatch.delenv("UNITARES_ENABLE_GRAPH_EXPANSION", raising=False)
+    else:
+        monkeypatch.setenv("UNITARES_ENABLE_GRAPH_EXPANSION", expansion)
+    if flag is None:
+        monkeypatch.delenv("UNITARES_EDGE_INDEX", raising=False)
+    else:
+        monkeypatch.setenv("UNITARES_EDGE_INDEX", flag)
+    kg = KnowledgeGraphAGE()
+    db = AsyncMock()
+    db.graph_available.return_value = True
+    kg._get_db = AsyncMock(return_value=db)
+    kg._count_postgres_discoveries = AsyncMock(return_value=0)
+    kg._count_age_discoveries = AsyncMock()
+    kg.load_edge_index = AsyncMock()
+
+    await kg.load()
+
+    kg._count_age_discoveries.assert_not_called()
+    assert kg.load_edge_index.await_count == int(loads)
@@ -268,6 +268,38 @@ def test_ephemeral_tags_are_set():
     assert "test" in EPHEMERAL_TAGS
 
 
+# --- Embedding coverage ---
+
+
+@pytest.mark.asyncio
+async def test_embedding_coverage_counts_missing_and_stale():
+    """Coverage reports missing and hash-stale embeddings for the active table."""
+    db = MagicMock()
+    db._pool.fetchval = AsyncMock(side_effect=[10, 8, 3])
+
+    with patch("src.db.get_db", return_value=db):
+        cov = await KnowledgeGraphLifecycle()._embedding_coverage()
+
+    assert cov["with_embeddings"] == 8
+    assert cov["without_embeddings"] == 2
+    assert cov["stale"] == 3
+    assert cov["ratio"] == 0.8
+    assert "discovery_embedding_hash" in db._pool.fetchval.await_args_list[2].args[0]
+
+
+@pytest.mark.asyncio
+async def test_embedding_coverage_without_content_hash_column():
+    """Before migration 040 the stale probe fails; coverage still reports."""
+    db = MagicMock()
+    db._pool.fetchval = AsyncMock(side_effect=[10, 8, Exception("column e.content_hash does not exist")])
+
+    with patch("src.db.get_db", return_value=db):
+        cov = await KnowledgeGraphLifecycle()._embedding_coverage()
+
+    assert cov["with_embeddings"] == 8
+    assert cov["stale"] is None
+
+
 # --- Threshold Tests ---
 
 
@@ -55,6 +55,10 @@ class _FakeKgBackend(KnowledgeGraphMixin):
     def acquire(self):
         return _AcquireContext(self.conn)
 
+    async def run_unit(self, work, *, timeout=None, transaction=False):
+        self.last_unit_transaction = transaction
+        return await work(self.conn)
+
 
 @pytest.mark.asyncio
 async def test_kg_add_discovery_persists_provenance_chain():
@@ -100,6 +104,84 @@ def test_row_to_discovery_dict_decodes_provenance_chain_json():
     assert result["provenance_chain"] == [{"agent_id": "parent"}]
 
 
+def _vector_row(**kw):
+    row = {
+        "id": "d1", "agent_id": "a", "type": "insight", "summary": "s",
+        "created_at": datetime(2026, 5, 1, tzinfo=timezone.utc),
+        "similarity": 0.91, "responses_from": ["d7"],
+    }
+    row.update(kw)
+    return row
+
+
+@pytest.mark.asyncio
+async def test_kg_vector_search_unfiltered_is_one_query():
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=[_vector_row()])
+    conn.execute = AsyncMock()
+    conn.fetchval = AsyncMock()
+    backend = _FakeKgBackend(conn)
+
+    rows = await backend.kg_vector_search("core.discovery_embeddings", "[0.1]", 10, 0.3)
+
+    assert conn.fetch.await_count == 1
+    conn.execute.assert_not_awaited()
+    assert backend.last_unit_transaction is False
+    sql, *params = conn.fetch.await_args.args
+    assert "JOIN knowledge.discoveries d ON d.id = de.discovery_id" in sql
+    assert "responses_from" in sql
+    assert params == ["[0.1]", 0.3, 10]
+    assert rows[0]["id"] == "d1"
+    assert rows[0]["similarity"] == 0.91
+    assert rows[0]["responses_from"] == ["d7"]
+    assert rows[0]["timestamp"] == "2026-05-01T00:00:00+00:00"
+
+
+@pytest.mark.asyncio
+async def test_kg_vector_search_pushes_filters_and_widens_hnsw_scan():
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=[])
+    conn.execute = AsyncMock()
+    conn.fetchval = AsyncMock(return_value="0.8.0")
+    backend = _FakeKgBackend(conn)
+
+    await backend.kg_vector_search(
+        "core.discovery_embeddings", "[0.1]", 20, 0.3,
+        agent_id="agent-1", type="bug_found", tags=["Perf"], exclude_archived=True,
+    )
+
+    sql, *params = conn.fetch.await_args.args
+    assert "d.agent_id = $4" in sql
+    assert "d.type = $5" in sql
+    assert "d.tags && $6::text[]" in sql
+    assert "d.status <> 'archived'" in sql
+    assert params[3:5] == ["agent-1", "bug_found"]
+    assert backend.last_unit_transaction is True
+    settings = conn.execute.await_args.args[0]
+    assert "SET LOCAL hnsw.ef_search = 200" in settings
+    assert "hnsw.iterative_scan = relaxed_order" in settings
+
+    # Capability is probed once per backend.
+    conn.fetchval.reset_mock()
+    await backend.kg_vector_search("core.discovery_embeddings", "[0.1]", 500, 0.3, agent_id="a")
+    conn.fetchval.assert_not_awaited()
+    assert "SET LOCAL hnsw.ef_search = 1000" in conn.execute.await_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_kg_vector_search_old_pgvector_skips_iterative_scan():
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=[])
+    conn.execute = AsyncMock()
+    conn.fetchval = AsyncMock(return_value="0.7.4")
+    backend = _FakeKgBackend(conn)
+
+    await backend.kg_vector_search("core.discovery_embeddings", "[0.1]", 10, 0.3, status="open")
+
+    settings = conn.execute.await_args.args[0]
+    assert settings == "SET LOCAL hnsw.ef_search = 100"
+
+
 @pytest.mark.asyncio
 class TestUpdateDiscoveryTimestampCoercion:
     async def _make_backend(self, captured: list):
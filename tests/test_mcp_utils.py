@@ -388,6 +388,27 @@ class TestSuccessResponse:
         success_response({"x": 1}, agent_id="my-a")
         ms.assert_called_once_with(agent_id="my-a", arguments=None)
 
+    @patch("src.mcp_handlers.support.agent_auth.compute_agent_signature", return_value={"uuid": "u1"})
+    def test_carries_structured_payload(self, ms):
+        from src.mcp_handlers.serialization import structured_payload
+        r = success_response({"ts": date(2026, 1, 15), "n": [1, 2]})
+        assert isinstance(r[0], TextContent)
+        assert structured_payload(r[0]) == _parse_tc(r[0])
+
+    @patch("src.mcp_handlers.support.agent_auth.compute_agent_signature", return_value={"uuid": "u1"})
+    def test_reassigned_text_drops_payload(self, ms):
+        from src.mcp_handlers.serialization import structured_payload
+        r = success_response({"x": 1})
+        r[0].text = '{"x": 2}'
+        assert structured_payload(r[0]) is None
+
+    @pytest.mark.parametrize("encoder", ["stdlib", "orjson"])
+    @patch("src.mcp_handlers.support.agent_auth.compute_agent_signature", return_value={"uuid": "u1"})
+    def test_encoder_selection_round_trips(self, ms, encoder, monkeypatch):
+        monkeypatch.setenv("UNITARES_JSON_ENCODER", encoder)
+        d = _parse_tc(success_response({"msg": "h\u00e9", "big": 2 ** 70, "k": {1: "a"}})[0])
+        assert d["msg"] == "h\u00e9" and d["big"] == 2 ** 70 and d["k"] == {"1": "a"}
+
 
 class TestFormatMetricsReport:
     def test_basic(self):
@@ -383,7 +383,7 @@ def test_write_state_file_is_atomic_against_crash_mid_write(tmp_path):
     state_file = tmp_path / "agent_state.json"
     state_file.write_text('{"old": "content"}')
 
-    with patch("src.agent_monitor_state.json.dump", side_effect=RuntimeError("crash")):
+    with patch("src.monitor_state_log.json.dump", side_effect=RuntimeError("crash")):
         with pytest.raises(RuntimeError):
             _write_state_file(state_file, {"new": "data"})
 
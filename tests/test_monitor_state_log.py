@@ -0,0 +1,191 @@
+"""
+Tests for src/monitor_state_log.py - append-only delta persistence of
+per-agent monitor state (snapshot + delta log, compaction, replay).
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src import monitor_state_log
+from src.monitor_state_log import (
+    apply_delta,
+    delta_log_path,
+    diff_state,
+    read_state_file,
+    write_state,
+)
+
+
+@pytest.fixture
+def delta_mode(monkeypatch):
+    monkeypatch.setenv("UNITARES_MONITOR_STATE_PERSISTENCE", "delta")
+    monkeypatch.setattr(monitor_state_log, "_shadows", {})
+
+
+# ============================================================================
+# diff_state / apply_delta
+# ============================================================================
+
+class TestDiffApply:
+
+    def _roundtrip(self, prev, cur):
+        delta = diff_state(prev, cur)
+        rebuilt = apply_delta(json.loads(json.dumps(prev)), json.loads(json.dumps(delta)))
+        assert rebuilt == cur
+        return delta
+
+    def test_scalars(self):
+        delta = self._roundtrip({"E": 0.5, "n": 1, "same": "x"}, {"E": 0.6, "n": 2, "same": "x"})
+        assert delta == {"set": {"E": 0.6, "n": 2}}
+
+    def test_unchanged_is_empty(self):
+        assert diff_state({"a": [1, 2], "b": {"c": 1}}, {"a": [1, 2], "b": {"c": 1}}) == {}
+
+    def test_growing_history_appends_tail_only(self):
+        delta = self._roundtrip({"h": [1.0, 2.0]}, {"h": [1.0, 2.0, 3.0]})
+        assert delta == {"app": {"h": [[3.0], 3]}}
+
+    def test_sliding_window(self):
+        prev = {"h": list(range(100))}
+        cur = {"h": list(range(2, 102))}
+        delta = self._roundtrip(prev, cur)
+        assert delta == {"win": {"h": [100, 101]}}
+
+    def test_rewritten_list_stored_whole(self):
+        delta = self._roundtrip({"h": [1, 2, 3]}, {"h": [7, 8]})
+        assert delta == {"set": {"h": [7, 8]}}
+
+    def test_nested_dict_and_removed_keys(self):
+        prev = {"gov": {"tau": 0.4, "history": [{"v": "a"}]}, "gone": 1}
+        cur = {"gov": {"tau": 0.5, "history": [{"v": "a"}, {"v": "b"}]}, "new": 2}
+        delta = self._roundtrip(prev, cur)
+        assert delta["del"] == ["gone"]
+        assert delta["sub"]["gov"] == {"set": {"tau": 0.5}, "app": {"history": [[{"v": "b"}], 2]}}
+
+
+# ============================================================================
+# write_state / read_state_file
+# ============================================================================
+
+class TestWriteAndReplay:
+
+    def test_snapshot_mode_writes_full_file(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("UNITARES_MONITOR_STATE_PERSISTENCE", raising=False)
+        state_file = tmp_path / "a_state.json"
+        write_state(state_file, {"E": 0.5, "h": [1]})
+        write_state(state_file, {"E": 0.6, "h": [1, 2]})
+        assert json.loads(state_file.read_text()) == {"E": 0.6, "h": [1, 2]}
+        assert not delta_log_path(state_file).exists()
+
+    def test_delta_mode_appends_and_replays(self, tmp_path, delta_mode):
+        state_file = tmp_path / "a_state.json"
+        states = [{"E": 0.5 + i / 100, "n": i, "h": list(range(max(0, i - 4), i + 1))} for i in range(10)]
+        for st in states:
+            write_state(state_file, st)
+        # First save is the snapshot; the other nine are one line each.
+        assert len(delta_log_path(state_file).read_text().splitlines()) == 9
+        loaded, applied = read_state_file(state_file)
+        assert applied == 9
+        assert loaded == states[-1]
+
+    def test_compaction_truncates_log(self, tmp_path, delta_mode, monkeypatch):
+        monkeypatch.setattr(monitor_state_log, "COMPACT_EVERY", 3)
+        state_file = tmp_path / "a_state.json"
+        for i in range(5):
+            write_state(state_file, {"n": i})
+        # snapshot(0), deltas 1..3, snapshot(4)
+        assert delta_log_path(state_file).read_text() == ""
+        assert read_state_file(state_file) == ({"n": 4}, 0)
+
+    def test_stale_generation_lines_skipped(self, tmp_path, delta_mode):
+        state_file = tmp_path / "a_state.json"
+        write_state(state_file, {"n": 0})
+        write_state(state_file, {"n": 1})
+        stale = delta_log_path(state_file).read_text()
+        # New process: first save compacts, then a crash leaves old lines behind.
+        monitor_state_log.forget(state_file)
+        write_state(state_file, {"n": 10})
+        with open(delta_log_path(state_file), "w") as f:
+            f.write(stale)
+        assert read_state_file(state_file) == ({"n": 10}, 0)
+
+    def test_torn_final_line_ends_replay(self, tmp_path, delta_mode):
+        state_file = tmp_path / "a_state.json"
+        write_state(state_file, {"n": 0})
+        write_state(state_file, {"n": 1})
+        with open(delta_log_path(state_file), "a") as f:
+            f.write('{"gen": "x", "d": {"se')
+        assert read_state_file(state_file) == ({"n": 1}, 1)
+
+    def test_switching_back_to_snapshot_removes_log(self, tmp_path, delta_mode, monkeypatch):
+        state_file = tmp_path / "a_state.json"
+        write_state(state_file, {"n": 0})
+        write_state(state_file, {"n": 1})
+        monkeypatch.setenv("UNITARES_MONITOR_STATE_PERSISTENCE", "snapshot")
+        write_state(state_file, {"n": 2})
+        assert not delta_log_path(state_file).exists()
+        assert read_state_file(state_file) == ({"n": 2}, 0)
+
+
+# ============================================================================
+# Real monitor: bytes per check-in and cold-load time
+# ============================================================================
+
+@pytest.fixture
+def isolated_data_dir(tmp_path, monkeypatch):
+    import src._imports
+    monkeypatch.setattr(src._imports, 'ensure_project_root', lambda: str(tmp_path))
+    (tmp_path / "data" / "agents").mkdir(parents=True, exist_ok=True)
+    return tmp_path
+
+
+def _run_updates(monitor, n):
+    for i in range(n):
+        monitor.process_update({
+            "response_text": f"step {i}",
+            "complexity": 0.3 + (i % 5) / 20,
+            "parameters": [0.5] * 128,
+        })
+        monitor.save_persisted_state()
+
+
+class TestMonitorDeltaPersistence:
+
+    def test_delta_bytes_per_checkin_and_cold_load(self, isolated_data_dir, delta_mode, monkeypatch):
+        from src.governance_monitor import UNITARESMonitor
+        monkeypatch.setattr(monitor_state_log, "COMPACT_EVERY", 10_000)
+        monkeypatch.setattr(monitor_state_log, "COMPACT_BYTES", 10**9)
+
+        monitor = UNITARESMonitor(agent_id="delta_agent", load_state=False)
+        _run_updates(monitor, 120)  # fill the 100-entry history windows
+
+        state_file = isolated_data_dir / "data" / "agents" / "delta_agent_state.json"
+        log = delta_log_path(state_file)
+        before = log.stat().st_size
+        _run_updates(monitor, 20)
+        per_checkin = (log.stat().st_size - before) / 20
+
+        # What snapshot mode would rewrite on every check-in at this point.
+        full_snapshot_bytes = len(json.dumps(
+            monitor_state_log._shadows[str(state_file)]["data"], indent=2
+        ).encode('utf-8'))
+        assert full_snapshot_bytes > 10 * per_checkin
+        assert per_checkin < 2048, f"delta line averaged {per_checkin:.0f} bytes"
+
+        start = time.perf_counter()
+        reloaded = UNITARESMonitor(agent_id="delta_agent", load_state=True)
+        cold_load_s = time.perf_counter() - start
+        # 140 deltas on top of the initial snapshot; generous bound for CI hosts.
+        assert cold_load_s < 2.0, f"cold load took {cold_load_s:.3f}s"
+
+        assert reloaded.state.to_dict_with_history() == monitor.state.to_dict_with_history()
+        assert reloaded.last_update == monitor.last_update
+        assert (reloaded._behavioral_state.to_dict_with_history()
+                == monitor._behavioral_state.to_dict_with_history())
@@ -1322,6 +1322,76 @@ class TestHandleAggregateMetrics:
                 )
 
 
+# ---------------------------------------------------------------------------
+# Fleet index backing (compare_me_to_similar / aggregate_metrics)
+# ---------------------------------------------------------------------------
+
+class TestFleetIndexBacking:
+    """Indexed agents are read from src.fleet_index, not from their monitors."""
+
+    @staticmethod
+    def _index(agent_id, **metrics):
+        from src.fleet_index import fleet_index
+        row = {"E": 0.75, "I": 0.85, "S": 0.15, "coherence": 0.65, "phi": 0.6,
+               "verdict": "safe", "regime": "nominal", "status": "healthy", "risk_score": 0.2,
+               "decision_statistics": {"proceed": 4, "pause": 1}}
+        row.update(metrics)
+        fleet_index.record(agent_id, row, _make_state(coherence=row["coherence"]))
+
+    @pytest.mark.asyncio
+    async def test_compare_me_does_not_hydrate_indexed_peers(self):
+        me = "aaaaaaaa-bbbb-cccc-dddd-000000000000"
+        near = "aaaaaaaa-bbbb-cccc-dddd-111111111111"
+        far = "aaaaaaaa-bbbb-cccc-dddd-222222222222"
+        archived = "aaaaaaaa-bbbb-cccc-dddd-333333333333"
+        self._index(near, E=0.76)
+        self._index(far, E=0.2)
+        self._index(archived, E=0.75)
+        my_monitor = _make_monitor(me, metrics={"E": 0.75, "I": 0.85, "S": 0.15, "coherence": 0.65})
+        server = _build_mock_server(
+            monitors_dict={me: my_monitor},
+            metadata_dict={
+                me: _make_metadata(me), near: _make_metadata(near, total_updates=8),
+                far: _make_metadata(far), archived: _make_metadata(archived, status="archived"),
+            },
+        )
+
+        with patch(_PATCH_SERVER, server), \
+             patch(_PATCH_GET_MCP_SERVER, return_value=server), \
+             patch(_PATCH_CTX, return_value=me):
+            from src.mcp_handlers.observability.handlers import handle_compare_me_to_similar
+            result = await handle_compare_me_to_similar({"agent_id": me})
+
+        data = parse_result(result)
+        assert [a["agent_id"] for a in data["similar_agents"]] == [near]
+        assert data["similar_agents"][0]["metrics"]["verdict"] == "safe"
+        assert data["similar_agents"][0]["similarity_score"] == pytest.approx(1 - 0.01 / 4)
+        server.get_or_create_monitor.assert_called_once_with(me)
+
+    @pytest.mark.asyncio
+    async def test_aggregate_reads_indexed_agents_without_monitors(self):
+        id1 = "aaaaaaaa-bbbb-cccc-dddd-111111111111"
+        id2 = "aaaaaaaa-bbbb-cccc-dddd-222222222222"
+        self._index(id1, risk_score=0.2, verdict="safe")
+        self._index(id2, risk_score=0.4, verdict="caution", status="moderate")
+        server = _build_mock_server(metadata_dict={
+            id1: _make_metadata(id1, total_updates=3), id2: _make_metadata(id2, total_updates=4),
+        })
+
+        with patch(_PATCH_SERVER, server), \
+             patch(_PATCH_CTX, return_value=None):
+            from src.mcp_handlers.observability.handlers import handle_aggregate_metrics
+            result = await handle_aggregate_metrics({})
+
+        agg = parse_result(result)["aggregate"]
+        server.load_monitor_state.assert_not_called()
+        assert agg["agents_with_data"] == 2 and agg["total_updates"] == 7
+        assert agg["mean_risk_score"] == pytest.approx(0.3)
+        assert agg["health_breakdown"]["moderate"] == 1
+        assert agg["verdict_distribution"]["safe"] == 1
+        assert agg["decision_distribution"]["proceed"] == 8
+
+
 # ---------------------------------------------------------------------------
 # handle_observe (unified router) -- test via consolidated module
 # ---------------------------------------------------------------------------
@@ -165,3 +165,27 @@ class TestModuleFunctions:
     def test_snapshot_func(self):
         snap = snapshot()
         assert isinstance(snap, dict)
+
+
+# ============================================================================
+# PerfMonitor - counters
+# ============================================================================
+
+class TestPerfMonitorCounters:
+
+    def test_incr_totals_in_snapshot(self):
+        pm = PerfMonitor()
+        pm.incr("cache.hit")
+        pm.incr("cache.hit", 3)
+        pm.incr("cache.miss", 0)  # ignored
+        snap = pm.snapshot()
+        assert snap["cache.hit"] == {"total": 4}
+        assert "cache.miss" not in snap
+
+    def test_counter_beside_timings(self):
+        pm = PerfMonitor()
+        pm.record_ms("op", 5.0)
+        pm.incr("op", 2)
+        snap = pm.snapshot()
+        assert snap["op"]["count"] == 1
+        assert snap["op"]["total"] == 2
@@ -699,6 +699,42 @@ class TestAgentStateOperations:
         result = await backend.get_agent_state_history(999999)
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_batched_checkins_of_one_agent_record_every_state(self, backend):
+        """Two check-ins of one agent in one batch share an executemany transaction;
+        both rows must land (UNIQUE (identity_id, recorded_at)) and the later one wins."""
+        from types import SimpleNamespace
+        from unittest.mock import AsyncMock, patch
+
+        from src.mcp_handlers.updates.context import UpdateContext
+        from src.mcp_handlers.updates.phases import persist_agent_states
+
+        agent_id, identity_id = await _create_identity_with_agent(backend)
+
+        def ctx(S):  # S is stored as the entropy column
+            return UpdateContext(
+                agent_id=agent_id,
+                result={"decision": {"action": "proceed"}},
+                metrics_dict={"E": 0.7, "I": 0.8, "S": S, "V": 0.0, "coherence": 0.5, "regime": "EXPLORATION"},
+                health_status=SimpleNamespace(value="healthy"),
+                risk_score=0.2,
+            )
+
+        contexts = [ctx(0.2), ctx(0.4)]
+        with patch("src.agent_storage.get_db", return_value=backend), \
+             patch("src.agent_storage._ensure_db_ready", new=AsyncMock()), \
+             patch.object(backend, "record_agent_state", wraps=backend.record_agent_state) as single:
+            recorded = await persist_agent_states(contexts)
+
+        assert recorded == contexts
+        single.assert_not_called()  # no per-update fallback after a failed bulk insert
+        history = await backend.get_agent_state_history(identity_id, exclude_synthetic=True)
+        assert [round(h.entropy, 2) for h in history] == [0.4, 0.2]
+        latest = await backend.get_latest_agent_state(identity_id)
+        assert latest.entropy == pytest.approx(0.4)
+        assert {r.identity_id: r.entropy for r in await backend.get_all_latest_agent_states()}[identity_id] == \
+            pytest.approx(0.4)
+
 
 # ============================================================================
 # Audit Operations
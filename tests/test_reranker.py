@@ -0,0 +1,136 @@
+"""
+Tests for src/reranker.py - score cache keys, pair scoring and rerank().
+The batcher and cache themselves are covered in test_inference_batching.py.
+
+Uses a mocked CrossEncoder whose score is derived from the pair text, so no
+model download is needed.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src import reranker as rr
+from src.perf_monitor import perf_monitor
+
+
+@pytest.fixture(autouse=True)
+def cross_encoder_available(monkeypatch):
+    monkeypatch.setattr(rr, "CROSS_ENCODER_AVAILABLE", True)
+
+
+def _pair_model():
+    """predict() scores a pair by len(doc) - len(query)."""
+    model = MagicMock()
+    model.predict.side_effect = lambda pairs, batch_size=None, show_progress_bar=False: [
+        float(len(d) - len(q)) for q, d in pairs
+    ]
+    return model
+
+
+def _reranker(**kwargs):
+    kwargs.setdefault("batch_window_ms", 5)
+    r = rr.CrossEncoderReranker(**kwargs)
+    r._model = _pair_model()
+    return r
+
+
+def _predicted(r):
+    return [len(c.args[0]) for c in r._model.predict.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_scores_match_order_and_repeat_is_cached():
+    r = _reranker()
+    docs = ["aa", "bbbb", "c"]
+
+    first = await r.score_pairs("q", docs, doc_ids=["d1", "d2", "d3"])
+    second = await r.score_pairs(" q ", docs, doc_ids=["d1", "d2", "d3"])
+
+    assert first == second == [1.0, 3.0, 0.0]
+    assert _predicted(r) == [3]
+    cache = r.stats()["cache"]
+    assert (cache["hits"], cache["misses"]) == (3, 3)
+
+
+@pytest.mark.asyncio
+async def test_changed_text_is_rescored():
+    r = _reranker()
+    await r.score_pairs("q", ["old text"], doc_ids=["d1"])
+    scores = await r.score_pairs("q", ["new longer text"], doc_ids=["d1"])
+
+    assert scores == [14.0]
+    assert _predicted(r) == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_pairs_of_different_queries_share_one_predict_batch():
+    r = _reranker(cache_size=0)
+    results = await asyncio.gather(r.score_pairs("q", ["aa", "b"]), r.score_pairs("qqq", ["dddd"]))
+
+    assert results == [[1.0, 0.0], [1.0]]
+    assert r._model.predict.call_args.args[0] == [("q", "aa"), ("q", "b"), ("qqq", "dddd")]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_discovery_drops_its_scores():
+    r = _reranker()
+    await r.score_pairs("q1", ["a", "b"], doc_ids=["d1", "d2"])
+    await r.score_pairs("q2", ["a"], doc_ids=["d1"])
+
+    with patch.object(rr, "_reranker", r):
+        rr.invalidate_discovery("d1")
+
+    assert r.stats()["cache"]["size"] == 1
+    await r.score_pairs("q1", ["a", "b"], doc_ids=["d1", "d2"])
+    assert _predicted(r) == [2, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_and_misses_reach_perf_monitor():
+    before = perf_monitor.snapshot()
+    r = _reranker()
+    await r.score_pairs("q", ["a", "b"], doc_ids=["d1", "d2"])
+    await r.score_pairs("q", ["a", "c"], doc_ids=["d1", "d3"])
+
+    after = perf_monitor.snapshot()
+
+    def delta(op):
+        return after.get(op, {}).get("total", 0) - before.get(op, {}).get("total", 0)
+
+    assert delta("reranker.cache.hit") == 1
+    assert delta("reranker.cache.miss") == 3
+    assert "reranker.score_pairs" in after
+
+
+@pytest.mark.asyncio
+async def test_rerank_passes_ids_and_caps_pool():
+    r = _reranker()
+    candidates = [(f"d{i}", "x" * i) for i in range(1, 8)]
+
+    with patch.object(rr, "_reranker", r):
+        ranked = await rr.rerank("q", candidates, top_k=3, max_rerank_size=5)
+        rr.invalidate_discovery("d5")
+
+    assert ranked == [("d5", 4.0), ("d4", 3.0), ("d3", 2.0)]
+    assert _predicted(r) == [5]
+    assert r.stats()["cache"]["size"] == 4
+
+
+def test_storage_invalidation_is_noop_without_reranker_module():
+    from src.knowledge_graph import invalidate_rerank_scores
+
+    with patch.dict(sys.modules, {"src.reranker": None}):
+        invalidate_rerank_scores("d1")  # nothing loaded, nothing to drop
+
+    seen = []
+    fake = MagicMock(invalidate_discovery=seen.append)
+    with patch.dict(sys.modules, {"src.reranker": fake}):
+        invalidate_rerank_scores("d1")
+    assert seen == ["d1"]
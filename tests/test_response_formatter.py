@@ -959,3 +959,32 @@ class TestUpdateResponseServiceMergesWarnings:
         )
         # Order of first occurrence preserved; a comes before b before c
         assert result["warnings"] == ["a", "b", "c"]
+
+
+class TestResolveResponseMode:
+    """resolve_response_mode runs before enrichment, from pre-enrichment data."""
+
+    def test_per_call_mode_wins(self):
+        from src.mcp_handlers.response_formatter import resolve_response_mode
+        assert resolve_response_mode({}, {"response_mode": "Compact "}) == "compact"
+
+    def test_auto_without_enrichment_uses_arguments_for_sensor_data(self, monkeypatch):
+        from src.mcp_handlers.response_formatter import resolve_response_mode
+        monkeypatch.delenv("UNITARES_PROCESS_UPDATE_RESPONSE_MODE", raising=False)
+        healthy = {"metrics": {"health_status": "healthy"}}
+        assert resolve_response_mode(healthy, {}) == "mirror"
+        assert resolve_response_mode(healthy, {"sensor_data": {"temp": 1}}) == "minimal"
+        assert resolve_response_mode(healthy, {"parameters": [{"key": "sensor_data", "value": "{}"}]}) == "minimal"
+        assert resolve_response_mode({"status": "critical"}, {}) == "standard"
+
+    def test_mode_fields_cover_formatter_inputs(self):
+        """Every key the compact formatter copies must be in its planned field set."""
+        from src.mcp_handlers.response_formatter import fields_for_mode, format_response
+        kept = fields_for_mode("compact")
+        data = {k: {"name": k} for k in kept}
+        data["trajectory_identity"] = {"trust_tier": {"name": "verified"}}
+        data["learning_context"] = {"dropped": True}
+        full = format_response(dict(data), {"response_mode": "compact"})
+        without_extra = format_response({k: v for k, v in data.items() if k in kept}, {"response_mode": "compact"})
+        assert full == without_extra
+        assert fields_for_mode("full") is None
@@ -3,7 +3,13 @@
 import math
 import pytest
 
-from src.retrieval import rrf_fuse, apply_tag_boost, expand_with_neighbors
+from src.retrieval import (
+    apply_tag_boost,
+    collect_seed_neighbors,
+    expand_with_neighbors,
+    graph_expansion_type_weights,
+    rrf_fuse,
+)
 
 
 class TestRRFFuse:
@@ -134,3 +140,41 @@ class TestGraphExpansion:
         assert scores["x"] == pytest.approx(0.2)
         assert scores["y"] == pytest.approx(0.2)
         assert scores["z"] == pytest.approx(0.2)
+
+    def test_weighted_neighbors_override_edge_weight(self):
+        scored = [("a", 0.4)]
+        result = expand_with_neighbors(scored, {"a": {"x": 0.5, "y": 0.125}}, edge_weight=0.9)
+        scores = dict(result)
+        assert scores["x"] == pytest.approx(0.2)
+        assert scores["y"] == pytest.approx(0.05)
+
+
+class TestSeedNeighbors:
+
+    class Doc:
+        def __init__(self, related_to=(), responses_from=(), response_to=None):
+            self.related_to = list(related_to)
+            self.responses_from = list(responses_from)
+            self.response_to = response_to
+
+    def test_falls_back_to_pooled_doc_edges(self):
+        from types import SimpleNamespace
+        pool = {
+            "a": self.Doc(related_to=["x", "a"], responses_from=["y"],
+                          response_to=SimpleNamespace(discovery_id="z")),
+        }
+        assert collect_seed_neighbors(["a", "missing"], pool) == {"a": {"x", "y", "z"}}
+
+    def test_uses_edge_index_with_configured_weights(self, monkeypatch):
+        from src.edge_index import TypedEdgeIndex
+        monkeypatch.setenv("UNITARES_GRAPH_EXPANSION_HOPS", "2")
+        monkeypatch.setenv("UNITARES_GRAPH_EXPANSION_WEIGHTS", "supersedes=0.25")
+        index = TypedEdgeIndex([("a", "b", "related"), ("b", "c", "related"), ("d", "a", "supersedes")])
+
+        neighbors = collect_seed_neighbors(["a"], {}, edge_index=index)
+
+        assert neighbors == {"a": {"b": 0.5, "d": 0.25, "c": 0.25}}
+
+    def test_type_weights_ignore_unknown_and_malformed(self, monkeypatch):
+        monkeypatch.setenv("UNITARES_GRAPH_EXPANSION_WEIGHTS", "related=0.8,bogus=1,responds_to=x")
+        assert graph_expansion_type_weights() == {"related": 0.8, "responds_to": 0.5, "supersedes": 0.0}
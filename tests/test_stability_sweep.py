@@ -0,0 +1,155 @@
+"""
+Parity tests for the batched forms in governance_core.stability - each must
+reproduce its scalar counterpart point for point.
+"""
+
+import numpy as np
+import pytest
+
+from governance_core import (
+    DEFAULT_PARAMS, DEFAULT_THETA, State, Theta,
+    clear_sweep_cache, contraction_batch, equilibrium_batch, gershgorin_batch,
+    jacobian_batch, optimize_stability_metric, sweep_stability,
+)
+from governance_core.dynamics import compute_equilibrium
+from governance_core.parameters import get_active_params
+from governance_core.stability import _analytical_jacobian, _check_contraction
+
+TOL = dict(rtol=0, atol=1e-12)
+
+
+def _scalar_sweep(n_points, complexity=0.5, eta2=DEFAULT_THETA.eta2):
+    p = get_active_params()  # what sweep_stability uses by default
+    rates = np.empty((n_points, n_points))
+    for i, c1 in enumerate(np.linspace(p.C1_min, p.C1_max, n_points)):
+        for j, eta1 in enumerate(np.linspace(p.eta1_min, p.eta1_max, n_points)):
+            theta = Theta(C1=c1, eta1=eta1, eta2=eta2)
+            eq = compute_equilibrium(p, theta, complexity=complexity)
+            J = _analytical_jacobian(eq, p, theta, complexity)
+            rates[i, j] = _check_contraction(J)["contraction_rate"]
+    return rates
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_sweep_cache()
+    yield
+    clear_sweep_cache()
+
+
+@pytest.mark.parametrize("integrator", ["rk4", "euler"])
+def test_equilibrium_batch_matches_compute_equilibrium(integrator, monkeypatch):
+    monkeypatch.setenv("UNITARES_INTEGRATOR", integrator)
+    rng = np.random.default_rng(0)
+    theta = Theta(C1=rng.uniform(0.5, 1.5, 6), eta1=rng.uniform(0.1, 0.5, 6), eta2=0.2)
+    cx = rng.uniform(0, 1, 6)
+
+    batch = equilibrium_batch(DEFAULT_PARAMS, theta, cx)
+
+    assert batch.shape == (6, 4)
+    for i in range(6):
+        eq = compute_equilibrium(
+            DEFAULT_PARAMS, Theta(C1=theta.C1[i], eta1=theta.eta1[i], eta2=0.2), complexity=cx[i],
+        )
+        np.testing.assert_allclose(batch[i], [eq.E, eq.I, eq.S, eq.V], **TOL)
+
+
+@pytest.mark.parametrize("i_mode", ["linear", "logistic"])
+def test_jacobian_batch_matches_analytical_including_barriers(i_mode, monkeypatch):
+    monkeypatch.setenv("UNITARES_I_DYNAMICS", i_mode)
+    p = DEFAULT_PARAMS
+    rng = np.random.default_rng(1)
+    states = np.column_stack([
+        rng.uniform(p.E_min, p.E_max, 40), rng.uniform(p.I_min, p.I_max, 40),
+        rng.uniform(p.S_min, p.S_max, 40), rng.uniform(p.V_min, p.V_max, 40),
+    ])
+    states[:5] = [p.E_min, p.I_max, p.S_min, p.V_max]  # inside every barrier margin
+    theta = Theta(C1=rng.uniform(0.5, 1.5, 40), eta1=0.3, eta2=rng.uniform(0.1, 0.5, 40))
+
+    J = jacobian_batch(states, p, theta)
+
+    for i in range(40):
+        row = Theta(C1=theta.C1[i], eta1=0.3, eta2=theta.eta2[i])
+        np.testing.assert_allclose(J[i], _analytical_jacobian(State(*states[i]), p, row), **TOL)
+
+
+def test_contraction_and_gershgorin_batches_match_scalar_forms():
+    rng = np.random.default_rng(2)
+    stack = rng.normal(0, 1, (3, 5, 4, 4))
+    M = np.diag([0.1, 0.2, 1.0, 0.08])
+
+    plain, metric = contraction_batch(stack), contraction_batch(stack, M)
+    disks = gershgorin_batch(stack)
+
+    assert plain["max_eigenvalue"].shape == (3, 5) and disks["radii"].shape == (3, 5, 4)
+    for idx in np.ndindex(3, 5):
+        for result, scalar in ((plain, _check_contraction(stack[idx])),
+                               (metric, _check_contraction(stack[idx], M))):
+            np.testing.assert_allclose(result["eigenvalues"][idx], scalar["eigenvalues"], **TOL)
+            assert result["is_contracting"][idx] == scalar["is_contracting"]
+        J = stack[idx]
+        radii = np.abs(J).sum(axis=1) - np.abs(np.diag(J))
+        np.testing.assert_allclose(disks["radii"][idx], radii, **TOL)
+        assert disks["max_real_bound"][idx] == pytest.approx(np.max(np.diag(J) + radii), abs=1e-12)
+    np.testing.assert_array_equal(contraction_batch(stack, np.diag(M))["eigenvalues"], metric["eigenvalues"])
+
+
+def test_sweep_matches_scalar_loop_and_honours_eta2():
+    result = sweep_stability(n_points=4, workers=1, use_cache=False)
+    np.testing.assert_allclose(result["contraction_rates"], _scalar_sweep(4), **TOL)
+    assert result["min_rate"] == pytest.approx(np.min(_scalar_sweep(4)), abs=1e-12)
+
+    theta = Theta(C1=DEFAULT_THETA.C1, eta1=DEFAULT_THETA.eta1, eta2=0.45)
+    shifted = sweep_stability(theta_base=theta, n_points=3, workers=1, use_cache=False)
+    np.testing.assert_allclose(shifted["contraction_rates"], _scalar_sweep(3, eta2=0.45), **TOL)
+
+
+def test_sweep_complexity_axis_and_chunking(monkeypatch):
+    import governance_core.stability as stability
+
+    monkeypatch.setattr(stability, "_SWEEP_MIN_CHUNK", 7)
+    values = [0.1, 0.9]
+    result = sweep_stability(n_points=3, complexity_values=values, workers=1, use_cache=False)
+
+    rates = np.array(result["contraction_rates"])
+    assert rates.shape == (2, 3, 3) and result["complexity_values"] == values
+    for k, cx in enumerate(values):
+        np.testing.assert_allclose(rates[k], _scalar_sweep(3, complexity=cx), **TOL)
+        single = sweep_stability(n_points=3, complexity=cx, workers=1, use_cache=False)
+        np.testing.assert_allclose(single["contraction_rates"], rates[k], **TOL)
+
+
+def test_sweep_cache_hits_and_returns_copies(monkeypatch):
+    import governance_core.stability as stability
+
+    monkeypatch.setenv("UNITARES_I_DYNAMICS", "linear")
+    first = sweep_stability(n_points=3, workers=1)
+    first["contraction_rates"][0][0] = 99.0
+
+    def fail(*args):
+        raise AssertionError("cached sweep was recomputed")
+
+    monkeypatch.setattr(stability, "_sweep_chunk", fail)
+    again = sweep_stability(n_points=3, workers=1)
+    assert again["contraction_rates"][0][0] != 99.0
+    with pytest.raises(AssertionError):
+        sweep_stability(n_points=3, workers=1, use_cache=False)
+
+    monkeypatch.setenv("UNITARES_I_DYNAMICS", "logistic")  # mode is part of the key
+    with pytest.raises(AssertionError):
+        sweep_stability(n_points=3, workers=1)
+
+
+def test_optimize_over_jacobian_stack_uses_worst_point():
+    p = DEFAULT_PARAMS
+    theta = Theta(C1=np.array([0.6, 1.0, 1.4]), eta1=0.3, eta2=DEFAULT_THETA.eta2)
+    J = jacobian_batch(equilibrium_batch(p, theta), p, theta)
+
+    single = optimize_stability_metric(jacobians=J[1:2])
+    point = Theta(C1=1.0, eta1=0.3, eta2=DEFAULT_THETA.eta2)
+    assert single == optimize_stability_metric(params=p, theta=point)
+
+    joint = optimize_stability_metric(jacobians=J)
+    rates = contraction_batch(J, np.array(joint["optimal_M"]))["contraction_rate"]
+    assert joint["optimal_contraction_rate"] == pytest.approx(rates.min(), abs=1e-12)
+    assert joint["optimal_contraction_rate"] <= single["optimal_contraction_rate"] + 1e-9
@@ -9,8 +9,10 @@ Covers:
 - acquire_agent_lock (sync): acquire/release, lock file contents, sequential
   re-acquisition, exception release, independent agents, timeout, auto_cleanup,
   mock fcntl contention, cleanup disabled
-- acquire_agent_lock_async: basic acquire/release, exception release, timeout,
-  sequential re-acquisition
+- acquire_agent_lock_async (file fence): basic acquire/release, exception
+  release, timeout, sequential re-acquisition
+- AgentLockTable / acquire_agent_lock_async (no fence): mutual exclusion, FIFO
+  wakeups, timeout, table cleanup, no lock files, wait histogram
 """
 
 import asyncio
@@ -26,7 +28,7 @@ from unittest.mock import patch, MagicMock
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.state_locking import is_process_alive, StateLockManager
+from src.state_locking import is_process_alive, AgentLockTable, StateLockManager
 
 
 # ============================================================================
@@ -403,7 +405,7 @@ class TestAcquireAgentLockAsync:
     @pytest.mark.asyncio
     async def test_async_acquire_and_release(self, tmp_path):
         """Async lock should acquire and release correctly."""
-        mgr = StateLockManager(lock_dir=tmp_path)
+        mgr = StateLockManager(lock_dir=tmp_path, fence="file")
 
         async with mgr.acquire_agent_lock_async("async_test", timeout=2.0, max_retries=1):
             lock_file = tmp_path / "async_test.lock"
@@ -412,7 +414,7 @@ class TestAcquireAgentLockAsync:
     @pytest.mark.asyncio
     async def test_async_lock_file_contents(self, tmp_path):
         """Async lock file should contain correct JSON metadata."""
-        mgr = StateLockManager(lock_dir=tmp_path)
+        mgr = StateLockManager(lock_dir=tmp_path, fence="file")
 
         async with mgr.acquire_agent_lock_async("async_info", timeout=2.0, max_retries=1):
             lock_file = tmp_path / "async_info.lock"
@@ -425,7 +427,7 @@ class TestAcquireAgentLockAsync:
     @pytest.mark.asyncio
     async def test_async_sequential_acquisitions(self, tmp_path):
         """Two sequential async acquisitions of same agent should succeed."""
-        mgr = StateLockManager(lock_dir=tmp_path)
+        mgr = StateLockManager(lock_dir=tmp_path, fence="file")
 
         async with mgr.acquire_agent_lock_async("async_seq", timeout=2.0, max_retries=1):
             pass
@@ -436,7 +438,7 @@ class TestAcquireAgentLockAsync:
     @pytest.mark.asyncio
     async def test_async_lock_released_on_exception(self, tmp_path):
         """Async lock should release on exception."""
-        mgr = StateLockManager(lock_dir=tmp_path)
+        mgr = StateLockManager(lock_dir=tmp_path, fence="file")
 
         with pytest.raises(ValueError):
             async with mgr.acquire_agent_lock_async("async_exc", timeout=2.0, max_retries=1):
@@ -456,7 +458,7 @@ class TestAcquireAgentLockAsync:
         local (due to those import statements) but never binds it, causing
         UnboundLocalError on `await asyncio.sleep(...)`.
         """
-        mgr = StateLockManager(lock_dir=tmp_path, auto_cleanup_stale=True)
+        mgr = StateLockManager(lock_dir=tmp_path, auto_cleanup_stale=True, fence="file")
         lock_file = tmp_path / "async_held.lock"
 
         fd = os.open(str(lock_file), os.O_CREAT | os.O_RDWR)
@@ -473,7 +475,7 @@ class TestAcquireAgentLockAsync:
     @pytest.mark.asyncio
     async def test_async_different_agents_independent(self, tmp_path):
         """Different agent IDs should have independent async locks."""
-        mgr = StateLockManager(lock_dir=tmp_path)
+        mgr = StateLockManager(lock_dir=tmp_path, fence="file")
 
         async with mgr.acquire_agent_lock_async("async_A", timeout=2.0, max_retries=1):
             async with mgr.acquire_agent_lock_async("async_B", timeout=2.0, max_retries=1):
@@ -483,7 +485,7 @@ class TestAcquireAgentLockAsync:
     @pytest.mark.asyncio
     async def test_async_auto_cleanup_before_acquire(self, tmp_path):
         """Async acquisition should clean stale locks before acquiring."""
-        mgr = StateLockManager(lock_dir=tmp_path, auto_cleanup_stale=True)
+        mgr = StateLockManager(lock_dir=tmp_path, auto_cleanup_stale=True, fence="file")
         lock_file = tmp_path / "async_stale.lock"
 
         lock_file.write_text(json.dumps({
@@ -497,7 +499,7 @@ class TestAcquireAgentLockAsync:
     @pytest.mark.asyncio
     async def test_async_does_not_block_event_loop(self, tmp_path):
         """Async lock should use asyncio.sleep, allowing other tasks to run."""
-        mgr = StateLockManager(lock_dir=tmp_path)
+        mgr = StateLockManager(lock_dir=tmp_path, fence="file")
         other_task_ran = False
 
         async def other_task():
@@ -509,3 +511,173 @@ class TestAcquireAgentLockAsync:
             await other_task()
 
         assert other_task_ran
+
+
+# ============================================================================
+# In-process lock table (default, no cross-process fence)
+# ============================================================================
+
+class TestAgentLockTable:
+
+    @pytest.mark.asyncio
+    async def test_mutual_exclusion_and_fifo(self):
+        table = AgentLockTable()
+        order = []
+        first_in = asyncio.Event()
+        release_first = asyncio.Event()
+
+        async def holder():
+            async with table.hold("a", timeout=2.0):
+                order.append("holder")
+                first_in.set()
+                await release_first.wait()
+
+        async def waiter(n):
+            async with table.hold("a", timeout=2.0):
+                order.append(n)
+
+        t0 = asyncio.create_task(holder())
+        await first_in.wait()
+        waiters = []
+        for n in range(5):
+            waiters.append(asyncio.create_task(waiter(n)))
+            await asyncio.sleep(0)
+        assert table.locked("a")
+        release_first.set()
+        await asyncio.gather(t0, *waiters)
+        assert order == ["holder", 0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_and_leaves_lock_usable(self):
+        table = AgentLockTable()
+        async with table.hold("a", timeout=1.0):
+            with pytest.raises(TimeoutError, match="'a'"):
+                async with table.hold("a", timeout=0.05):
+                    pass
+        async with table.hold("a", timeout=0.05):
+            pass
+
+    @pytest.mark.asyncio
+    async def test_timeout_applies_when_lock_looks_free(self):
+        class StuckLock:
+            def locked(self):
+                return False
+
+            async def acquire(self):
+                await asyncio.Event().wait()
+
+        table = AgentLockTable()
+        with patch("src.state_locking.asyncio.Lock", StuckLock):
+            with pytest.raises(TimeoutError, match="'a'"):
+                async with table.hold("a", timeout=0.05):
+                    pass
+        assert len(table) == 0
+
+    @pytest.mark.asyncio
+    async def test_entries_dropped_when_idle(self):
+        table = AgentLockTable()
+        async with table.hold("a", timeout=1.0):
+            async with table.hold("b", timeout=1.0):
+                assert len(table) == 2
+        assert len(table) == 0
+
+    @pytest.mark.asyncio
+    async def test_released_on_exception(self):
+        table = AgentLockTable()
+        with pytest.raises(ValueError):
+            async with table.hold("a", timeout=1.0):
+                raise ValueError("boom")
+        assert not table.locked("a")
+        assert len(table) == 0
+
+
+class TestAcquireAgentLockAsyncLocal:
+
+    def test_fence_defaults_to_none(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("UNITARES_AGENT_LOCK_FENCE", raising=False)
+        assert StateLockManager(lock_dir=tmp_path).fence == "none"
+
+    def test_fence_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("UNITARES_AGENT_LOCK_FENCE", "file")
+        assert StateLockManager(lock_dir=tmp_path).fence == "file"
+        monkeypatch.setenv("UNITARES_AGENT_LOCK_FENCE", "bogus")
+        assert StateLockManager(lock_dir=tmp_path).fence == "none"
+
+    @pytest.mark.asyncio
+    async def test_no_lock_file_or_executor(self, tmp_path):
+        mgr = StateLockManager(lock_dir=tmp_path, fence="none")
+        with patch.object(mgr, "_check_and_clean_stale_lock") as cleanup:
+            async with mgr.acquire_agent_lock_async("local", timeout=1.0, max_retries=1):
+                assert mgr.local_locks.locked("local")
+        cleanup.assert_not_called()
+        assert not (tmp_path / "local.lock").exists()
+
+    @pytest.mark.asyncio
+    async def test_serializes_same_agent(self, tmp_path):
+        mgr = StateLockManager(lock_dir=tmp_path, fence="none")
+        inside = 0
+        max_inside = 0
+
+        async def update():
+            nonlocal inside, max_inside
+            async with mgr.acquire_agent_lock_async("shared", timeout=2.0, max_retries=1):
+                inside += 1
+                max_inside = max(max_inside, inside)
+                await asyncio.sleep(0.001)
+                inside -= 1
+
+        await asyncio.gather(*(update() for _ in range(20)))
+        assert max_inside == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_budget_spans_retries(self, tmp_path):
+        mgr = StateLockManager(lock_dir=tmp_path, fence="none")
+        async with mgr.acquire_agent_lock_async("busy", timeout=1.0, max_retries=1):
+            start = time.monotonic()
+            with pytest.raises(TimeoutError):
+                async with mgr.acquire_agent_lock_async("busy", timeout=0.05, max_retries=2):
+                    pass
+            assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_fence_gets_only_the_remaining_budget(self, tmp_path):
+        from contextlib import asynccontextmanager
+        mgr = StateLockManager(lock_dir=tmp_path, fence="file")
+        seen = []
+
+        @asynccontextmanager
+        async def fake_fence(agent_id, timeout, max_retries):
+            seen.append(timeout * max_retries)
+            yield
+
+        async def holder():
+            async with mgr.local_locks.hold("busy", timeout=1.0):
+                await asyncio.sleep(0.15)
+
+        task = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        with patch.object(mgr, "_acquire_file_lock_async", fake_fence):
+            async with mgr.acquire_agent_lock_async("busy", timeout=0.1, max_retries=3):
+                pass
+        await task
+        assert len(seen) == 1 and seen[0] <= 0.3 - 0.1
+
+    @pytest.mark.asyncio
+    async def test_fence_skipped_when_budget_spent(self, tmp_path):
+        mgr = StateLockManager(lock_dir=tmp_path, fence="file")
+        with patch.object(mgr, "_acquire_file_lock_async") as fence, \
+                patch("src.state_locking.time.perf_counter", side_effect=[0.0, 10.0]):
+            with pytest.raises(TimeoutError, match="'spent'"):
+                async with mgr.acquire_agent_lock_async("spent", timeout=1.0, max_retries=2):
+                    pass
+        fence.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_wait_histogram_observed(self, tmp_path):
+        from src.metrics_registry import AGENT_LOCK_WAIT
+        mgr = StateLockManager(lock_dir=tmp_path, fence="none")
+        metric = AGENT_LOCK_WAIT.labels(fence="none")
+        before = sum(b.get() for b in metric._buckets)
+        async with mgr.acquire_agent_lock_async("hist", timeout=1.0, max_retries=1):
+            pass
+        assert sum(b.get() for b in metric._buckets) == before + 1
@@ -228,3 +228,109 @@ class TestGetUnusedTools:
 
         unused = tracker.get_unused_tools(["tool1", "tool2"])
         assert unused == []
+
+
+# ============================================================================
+# ToolUsageAggregator - in-memory window counters
+# ============================================================================
+
+class TestToolUsageAggregator:
+
+    def test_window_counts(self):
+        from src.tool_usage_tracker import ToolUsageAggregator
+        agg = ToolUsageAggregator(horizon_hours=2, bucket_seconds=60)
+        now = datetime.now().timestamp()
+        agg.record("search", "a1", True, ts=now)
+        agg.record("search", "a1", False, ts=now - 120)
+        agg.record("write", "a2", True, ts=now)
+        agg.record("search", "a1", True, ts=now - 3 * 3600)  # outside horizon
+
+        assert agg.window_counts(1, agent_id="a1", now=now) == {"search": [2, 1]}
+        assert agg.window_counts(1, now=now) == {"search": [2, 1], "write": [1, 1]}
+        assert agg.window_counts(1, agent_id="nobody", now=now) == {}
+
+    def test_stale_ring_slot_not_counted(self):
+        from src.tool_usage_tracker import ToolUsageAggregator
+        agg = ToolUsageAggregator(horizon_hours=1, bucket_seconds=60)
+        now = datetime.now().timestamp()
+        # Same ring slot, one full lap earlier.
+        agg.record("search", "a1", True, ts=now - 3600)
+        assert agg.window_counts(1, agent_id="a1", now=now) == {}
+
+    def test_covers(self):
+        from src.tool_usage_tracker import ToolUsageAggregator
+        agg = ToolUsageAggregator(horizon_hours=24)
+        assert agg.covers(1)
+        assert agg.covers(24)
+        assert not agg.covers(24 * 7)
+
+    def test_load_records_accepts_db_rows(self):
+        from src.tool_usage_tracker import ToolUsageAggregator
+        from datetime import timezone
+        agg = ToolUsageAggregator(horizon_hours=1)
+        rows = [
+            {"ts": datetime.now(timezone.utc), "tool_name": "search", "agent_id": "a1", "success": True},
+            {"ts": datetime.now(timezone.utc), "tool_name": "search", "agent_id": "a1", "success": False},
+            {"ts": datetime.now(timezone.utc) - timedelta(hours=5), "tool_name": "old", "agent_id": "a1"},
+            {"ts": datetime.now(timezone.utc), "tool_name": "store_knowledge", "agent_id": "a1"},
+        ]
+        assert agg.load_records(rows, removed_tools={"store_knowledge"}) == 2
+        assert agg.window_counts(1, agent_id="a1") == {"search": [2, 1]}
+
+
+class TestAggregatedUsageStats:
+
+    def _write_raw(self, log_file, entries):
+        with open(log_file, 'a') as f:
+            for entry in entries:
+                json.dump(entry, f)
+                f.write('\n')
+
+    def test_matches_scan_path(self, tmp_path, monkeypatch):
+        log_file = tmp_path / "usage.jsonl"
+        tracker = ToolUsageTracker(log_file=log_file)
+        for i in range(6):
+            tracker.log_tool_call("search", agent_id="a1", success=i % 3 != 0)
+        tracker.log_tool_call("write", agent_id="a1")
+        tracker.log_tool_call("write", agent_id="a2", success=False, error_type="boom")
+
+        fast = tracker.get_usage_stats(window_hours=1, agent_id="a1")
+        fleet = tracker.get_usage_stats(window_hours=1)
+
+        monkeypatch.setenv("UNITARES_TOOL_USAGE_AGGREGATOR", "0")
+        scan_tracker = ToolUsageTracker(log_file=log_file)
+        assert scan_tracker.aggregator is None
+        assert fast == scan_tracker.get_usage_stats(window_hours=1, agent_id="a1")
+        scan_fleet = scan_tracker.get_usage_stats(window_hours=1)
+        assert fleet["tools"] == scan_fleet["tools"]
+        assert fleet["total_calls"] == scan_fleet["total_calls"] == 8
+
+    def test_lazy_rebuild_reads_existing_log(self, tmp_path):
+        log_file = tmp_path / "usage.jsonl"
+        now = datetime.now()
+        self._write_raw(log_file, [
+            {"timestamp": now.isoformat(), "tool_name": "search", "agent_id": "a1", "success": True},
+            {"timestamp": (now - timedelta(hours=3)).isoformat(), "tool_name": "search", "agent_id": "a1", "success": True},
+        ])
+        tracker = ToolUsageTracker(log_file=log_file)
+        stats = tracker.get_usage_stats(window_hours=1, agent_id="a1")
+        assert stats["total_calls"] == 1
+        assert stats["agent_usage"] == {"a1": {"search": 1}}
+
+    def test_live_calls_after_rebuild_not_double_counted(self, tmp_path):
+        log_file = tmp_path / "usage.jsonl"
+        tracker = ToolUsageTracker(log_file=log_file)
+        tracker.log_tool_call("search", agent_id="a1")
+        assert tracker.get_usage_stats(window_hours=1, agent_id="a1")["total_calls"] == 1
+        tracker.log_tool_call("search", agent_id="a1")
+        assert tracker.get_usage_stats(window_hours=1, agent_id="a1")["total_calls"] == 2
+        assert tracker.rebuild_aggregator() == 2
+        assert tracker.get_usage_stats(window_hours=1, agent_id="a1")["total_calls"] == 2
+
+    def test_long_window_falls_back_to_scan(self, tmp_path):
+        log_file = tmp_path / "usage.jsonl"
+        tracker = ToolUsageTracker(log_file=log_file)
+        self._write_raw(log_file, [
+            {"timestamp": (datetime.now() - timedelta(days=3)).isoformat(), "tool_name": "search", "success": True},
+        ])
+        assert tracker.get_usage_stats(window_hours=24 * 7)["total_calls"] == 1
@@ -994,3 +994,204 @@ class TestDTWSimilarity:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+def _reference_dtw(s1, s2, window=None):
+    """Unbanded (or banded) O(n*m) DTW on nested lists, mean-L1 local cost."""
+    n, m = len(s1), len(s2)
+    w = max(n, m) if window is None else max(window, abs(n - m))
+    inf = float("inf")
+    dtw = [[inf] * (m + 1) for _ in range(n + 1)]
+    dtw[0][0] = 0.0
+    for i in range(1, n + 1):
+        for j in range(max(1, i - w), min(m, i + w) + 1):
+            a, b = s1[i - 1], s2[j - 1]
+            if isinstance(a, (int, float)):
+                cost = abs(a - b)
+            else:
+                cost = sum(abs(x - y) for x, y in zip(a, b)) / len(a)
+            dtw[i][j] = cost + min(dtw[i - 1][j], dtw[i][j - 1], dtw[i - 1][j - 1])
+    return dtw[n][m] / max(n, m)
+
+
+class TestBandedDTW:
+    """Banded, row-vectorized DTW with LB_Keogh pruning."""
+
+    def test_matches_reference_table(self):
+        import random
+        from src.trajectory_identity import _dtw_distance
+
+        rng = random.Random(7)
+        for _ in range(50):
+            a = [rng.random() for _ in range(rng.randint(1, 40))]
+            b = [rng.random() for _ in range(rng.randint(1, 40))]
+            assert _dtw_distance(a, b, window=40) == pytest.approx(_reference_dtw(a, b), abs=1e-12)
+            assert _dtw_distance(a, b, window=3) == pytest.approx(_reference_dtw(a, b, 3), abs=1e-12)
+
+    def test_band_defaults_and_env_override(self, monkeypatch):
+        import math
+        import src.trajectory_identity as ti
+
+        a = [math.sin(i / 4) for i in range(200)]
+        b = [math.sin(i / 4 + 1.5) for i in range(200)]
+        banded = ti._dtw_distance(a, b)  # 10% band = 20 samples
+        assert banded == pytest.approx(_reference_dtw(a, b, 20), abs=1e-12)
+        assert banded >= ti._dtw_distance(a, b, window=200)
+
+        monkeypatch.setattr(ti, "DTW_BAND", 1.0)
+        assert ti._dtw_distance(a, b) == pytest.approx(_reference_dtw(a, b), abs=1e-12)
+
+    def test_lb_keogh_bounds_and_cutoff_prunes(self):
+        import random
+        from src.trajectory_identity import _dtw_distance, _dtw_similarity, lb_keogh
+
+        rng = random.Random(3)
+        for _ in range(30):
+            a = [rng.random() for _ in range(60)]
+            b = [rng.random() for _ in range(60)]
+            dist = _dtw_distance(a, b)
+            assert lb_keogh(a, b) <= dist + 1e-12
+            assert _dtw_distance(a, b, cutoff=dist + 1e-9) == pytest.approx(dist, abs=1e-12)
+            assert _dtw_distance(a, b, cutoff=dist * 0.99) == float("inf")
+
+        sim = _dtw_similarity(a, b)
+        assert _dtw_similarity(a, b, min_similarity=sim - 1e-9) == pytest.approx(sim)
+        assert _dtw_similarity(a, b, min_similarity=min(1.0, sim + 0.01)) == 0.0
+        assert lb_keogh(a, b[:30]) == 0.0  # unequal lengths: no bound
+
+    def test_nearest_trajectories_matches_brute_force(self):
+        import random
+        from src.trajectory_identity import _dtw_distance, nearest_trajectories
+
+        rng = random.Random(11)
+        query = [rng.random() for _ in range(50)]
+        candidates = {f"agent-{i}": [rng.random() for _ in range(50)] for i in range(40)}
+        candidates["twin"] = [x + 0.01 for x in query]
+
+        found = nearest_trajectories(query, candidates, k=3)
+
+        brute = sorted((_dtw_distance(query, c), key) for key, c in candidates.items())[:3]
+        assert [key for key, _ in found] == [key for _, key in brute]
+        assert found[0][0] == "twin"
+        assert [d for _, d in found] == pytest.approx([d for d, _ in brute], abs=1e-12)
+
+    def test_eisv_aligned_as_one_multivariate_series(self):
+        import math
+        from src.trajectory_identity import TrajectorySignature, _dtw_similarity
+
+        def sig(phase, n=40, drop=None):
+            attractor = {
+                f"{dim}_trajectory": [0.5 + 0.1 * math.sin(i / 5 + phase + k) for i in range(n)]
+                for k, dim in enumerate("EISV")
+            }
+            if drop:
+                attractor[f"{drop}_trajectory"] = attractor[f"{drop}_trajectory"][:20]
+            return TrajectorySignature(attractor=attractor)
+
+        s1, s2 = sig(0.0), sig(0.4)
+        stacked = [[s1.attractor[f"{d}_trajectory"][i] for d in "EISV"] for i in range(40)]
+        other = [[s2.attractor[f"{d}_trajectory"][i] for d in "EISV"] for i in range(40)]
+        assert s1.trajectory_shape_similarity(s2) == pytest.approx(_dtw_similarity(stacked, other))
+        assert s1.trajectory_shape_similarity(s1) == pytest.approx(1.0)
+
+        # Ragged lengths fall back to averaging per-dimension alignments
+        ragged = sig(0.4, drop="S")
+        per_dim = [
+            _dtw_similarity(s1.attractor[f"{d}_trajectory"], ragged.attractor[f"{d}_trajectory"])
+            for d in "EISV"
+        ]
+        assert s1.trajectory_shape_similarity(ragged) == pytest.approx(sum(per_dim) / 4)
+
+
+class TestBhattacharyya:
+    """NumPy / Cholesky Bhattacharyya coefficient."""
+
+    def test_matches_closed_form(self):
+        import math
+        import numpy as np
+        from src.trajectory_identity import bhattacharyya_similarity
+
+        rng = np.random.default_rng(5)
+        for _ in range(20):
+            a, b = rng.normal(size=(4, 4)), rng.normal(size=(4, 4))
+            c1, c2 = a @ a.T + 0.1 * np.eye(4), b @ b.T + 0.1 * np.eye(4)
+            mu1, mu2 = rng.random(4), rng.random(4)
+            r1, r2 = c1 + 1e-6 * np.eye(4), c2 + 1e-6 * np.eye(4)
+            avg = (r1 + r2) / 2
+            diff = mu1 - mu2
+            d_b = diff @ np.linalg.inv(avg) @ diff / 8 + 0.5 * math.log(
+                np.linalg.det(avg) / math.sqrt(np.linalg.det(r1) * np.linalg.det(r2)))
+            expected = min(1.0, math.exp(-d_b))
+            got = bhattacharyya_similarity(mu1.tolist(), c1.tolist(), mu2.tolist(), c2.tolist())
+            assert got == pytest.approx(expected, abs=1e-10)
+
+    def test_non_positive_definite_falls_back_to_center_distance(self):
+        import math
+        from src.trajectory_identity import bhattacharyya_similarity
+
+        indefinite = [[1.0, 0.0], [0.0, -1.0]]
+        sim = bhattacharyya_similarity([0.0, 0.0], indefinite, [0.3, 0.4], [[1.0, 0.0], [0.0, 1.0]])
+        assert sim == pytest.approx(math.exp(-0.5 * 2))
+
+    def test_signature_memoizes_covariance_factors(self):
+        from src.trajectory_identity import TrajectorySignature
+
+        attractor = {"center": [0.5, 0.5], "covariance": [[0.02, 0.0], [0.0, 0.03]]}
+        sig, other = TrajectorySignature(attractor=attractor), TrajectorySignature(attractor=dict(attractor))
+        assert sig.similarity(other) == pytest.approx(1.0)
+        assert "gaussian" in sig._derived
+        assert sig == TrajectorySignature(attractor=attractor)  # memo is not part of equality
+
+
+class TestSignatureCache:
+    """Per-agent signature cache, versioned by the stored timestamps."""
+
+    def _metadata(self, stamp, center):
+        return {
+            "trajectory_genesis": {"attractor": {"center": center}, "observation_count": 10},
+            "trajectory_genesis_at": stamp,
+        }
+
+    def test_hit_until_restamped(self):
+        from src.trajectory_identity import SignatureCache
+
+        cache = SignatureCache(max_size=2)
+        meta = self._metadata("2026-10-01T00:00:00", [0.5, 0.5])
+        first = cache.get("a", meta, "genesis")
+        assert cache.get("a", meta, "genesis") is first
+
+        restamped = self._metadata("2026-10-02T00:00:00", [0.9, 0.9])
+        fresh = cache.get("a", restamped, "genesis")
+        assert fresh is not first and fresh.attractor["center"] == [0.9, 0.9]
+
+        unstamped = {"trajectory_genesis": {"attractor": {"center": [0.1]}}}
+        assert cache.get("b", unstamped, "genesis") is not cache.get("b", unstamped, "genesis")
+        assert cache.get("c", {}, "current") is None
+
+        cache.get("d", meta, "genesis")
+        cache.get("e", meta, "genesis")
+        assert cache.get("a", restamped, "genesis") is not fresh  # evicted (LRU, 2 entries)
+
+    @pytest.mark.asyncio
+    async def test_verify_reuses_parsed_signatures(self):
+        from src.trajectory_identity import TrajectorySignature, verify_trajectory_identity
+
+        meta = self._metadata("2026-10-01T00:00:00", [0.5, 0.5, 0.5, 0.5])
+        meta["trajectory_current"] = {"attractor": {"center": [0.5, 0.5, 0.5, 0.5]}}
+        meta["trajectory_updated_at"] = "2026-10-01T00:05:00"
+        test_sig = TrajectorySignature(attractor={"center": [0.5, 0.5, 0.5, 0.5]})
+
+        with patch('src.db.get_db') as mock_db, \
+             patch('src.trajectory_identity.TrajectorySignature.from_dict',
+                   wraps=TrajectorySignature.from_dict) as parse:
+            mock_identity = MagicMock()
+            mock_identity.metadata = meta
+            mock_db_instance = AsyncMock()
+            mock_db_instance.get_identity = AsyncMock(return_value=mock_identity)
+            mock_db.return_value = mock_db_instance
+
+            first = await verify_trajectory_identity("cache-uuid", test_sig)
+            second = await verify_trajectory_identity("cache-uuid", test_sig)
+
+        assert first == second and first["verified"] is True
+        assert parse.call_count == 2  # genesis + current, parsed once
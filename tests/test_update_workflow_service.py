@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.mcp_handlers.updates.context import UpdateContext
-from src.services.update_workflow_service import run_process_update_workflow
+from src.services.update_workflow_service import run_process_update_batch, run_process_update_workflow
 from tests.helpers import make_agent_meta, make_mock_server, make_monitor, parse_result
 
 
@@ -230,7 +230,7 @@ async def test_enrichment_runs_outside_lock():
     ctx.mcp_server.lock_manager.acquire_agent_lock_async.return_value = _OrderTrackingLock()
     ctx.mcp_server.monitors = {"agent-123": {"dummy": True}}
 
-    async def fake_enrichment(c):
+    async def fake_enrichment(c, **kwargs):
         call_order.append("enrichment_ran")
 
     with patch("src.mcp_handlers.updates.phases.resolve_identity_and_guards", new=AsyncMock(return_value=None)), \
@@ -299,6 +299,155 @@ async def test_post_update_effects_run_outside_lock():
         f"Post-update effects ran inside the lock! Order: {call_order}"
 
 
+def _batch_ctx(server, agent_uuid, text):
+    return SimpleNamespace(
+        mcp_server=server,
+        agent_uuid=agent_uuid,
+        arguments={"response_text": text},
+        agent_id="",
+        is_new_agent=True,
+        defer_state_record=False,
+    )
+
+
+async def _fake_resolve(ctx):
+    from src.mcp_handlers.context import get_context_agent_id
+    ctx.agent_uuid = get_context_agent_id()
+    ctx.agent_id = ctx.agent_uuid
+    for name in ("session_key", "session_resolution_source", "trajectory_confidence",
+                 "label", "loop", "dialectic_enforcement_warning"):
+        setattr(ctx, name, None)
+    ctx.identity_assurance = {"tier": "strong"}
+    ctx.declared_agent_id = ctx.agent_uuid
+    ctx.key_was_generated = ctx.api_key_auto_retrieved = False
+    ctx.is_new_agent = False
+    return None
+
+
+@pytest.mark.asyncio
+async def test_batch_groups_by_agent_and_locks_each_agent_once():
+    server = MagicMock()
+    server.lock_manager.acquire_agent_lock_async.side_effect = lambda *a, **k: _DummyLock()
+    server.monitors = {}
+    contexts = [
+        _batch_ctx(server, "uuid-a", "a1"),
+        _batch_ctx(server, "uuid-b", "b1"),
+        _batch_ctx(server, "uuid-a", "a2"),
+    ]
+    applied = []
+
+    async def fake_locked(ctx):
+        applied.append(ctx.arguments["response_text"])
+
+    async def fake_respond(ctx, **kwargs):
+        return [ctx.arguments["response_text"]]
+
+    resolve = AsyncMock(side_effect=_fake_resolve)
+    persist = AsyncMock(side_effect=lambda ctxs: list(ctxs))
+    recorded_effects = AsyncMock()
+    with patch("src.mcp_handlers.updates.phases.resolve_identity_and_guards", new=resolve), \
+         patch("src.mcp_handlers.updates.phases.handle_onboarding_and_resume", new=AsyncMock(return_value=None)), \
+         patch("src.mcp_handlers.updates.phases.transform_inputs", return_value=None), \
+         patch("src.mcp_handlers.updates.phases.prepare_unlocked_inputs", new=AsyncMock()), \
+         patch("src.mcp_handlers.updates.phases.execute_locked_update", new=AsyncMock(side_effect=fake_locked)), \
+         patch("src.mcp_handlers.updates.phases.execute_post_update_effects", new=AsyncMock()), \
+         patch("src.mcp_handlers.updates.phases.execute_recorded_effects", new=recorded_effects), \
+         patch("src.mcp_handlers.updates.phases.persist_agent_states", new=persist), \
+         patch("src.services.update_workflow_service._respond", new=AsyncMock(side_effect=fake_respond)):
+        results = await run_process_update_batch(contexts)
+
+    assert results == [["a1"], ["b1"], ["a2"]]
+    assert resolve.await_count == 2
+    locked_agents = sorted(c.args[0] for c in server.lock_manager.acquire_agent_lock_async.call_args_list)
+    assert locked_agents == ["uuid-a", "uuid-b"]
+    assert applied.index("a1") < applied.index("a2")
+    assert contexts[2].agent_id == "uuid-a"
+    assert all(c.defer_state_record for c in contexts)
+    persist.assert_awaited_once()
+    assert persist.await_args.args[0] == contexts
+    assert [c.args[0] for c in recorded_effects.await_args_list if c.args[0].agent_uuid == "uuid-a"] == \
+        [contexts[0], contexts[2]]
+
+
+@pytest.mark.asyncio
+async def test_batch_skips_recorded_effects_when_state_row_is_gated():
+    """STRICT_IDENTITY_REQUIRED: an update whose state row was skipped runs no later effects."""
+    server = MagicMock()
+    server.lock_manager.acquire_agent_lock_async.side_effect = lambda *a, **k: _DummyLock()
+    server.monitors = {}
+    contexts = [_batch_ctx(server, "uuid-a", "a1"), _batch_ctx(server, "uuid-b", "b1")]
+    recorded_effects = AsyncMock()
+
+    with patch("src.mcp_handlers.updates.phases.resolve_identity_and_guards", new=AsyncMock(side_effect=_fake_resolve)), \
+         patch("src.mcp_handlers.updates.phases.handle_onboarding_and_resume", new=AsyncMock(return_value=None)), \
+         patch("src.mcp_handlers.updates.phases.transform_inputs", return_value=None), \
+         patch("src.mcp_handlers.updates.phases.prepare_unlocked_inputs", new=AsyncMock()), \
+         patch("src.mcp_handlers.updates.phases.execute_locked_update", new=AsyncMock(return_value=None)), \
+         patch("src.mcp_handlers.updates.phases.execute_post_update_effects", new=AsyncMock()), \
+         patch("src.mcp_handlers.updates.phases.execute_recorded_effects", new=recorded_effects), \
+         patch("src.mcp_handlers.updates.phases.persist_agent_states",
+               new=AsyncMock(side_effect=lambda ctxs: [c for c in ctxs if c.agent_uuid != "uuid-b"])), \
+         patch("src.services.update_workflow_service._respond", new=AsyncMock(return_value=["ok"])):
+        results = await run_process_update_batch(contexts)
+
+    assert results == [["ok"], ["ok"]]
+    assert [c.args[0] for c in recorded_effects.await_args_list] == [contexts[0]]
+
+
+def _recorded_ctx(agent_id, E):
+    return UpdateContext(
+        agent_id=agent_id,
+        result={"decision": {"action": "proceed"}},
+        metrics_dict={"E": E, "I": 0.8, "S": 0.1, "V": 0.0, "coherence": 0.5, "regime": "EXPLORATION"},
+        health_status=SimpleNamespace(value="healthy"),
+        risk_score=0.2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_persist_agent_states_returns_only_contexts_past_strict_identity_gate(monkeypatch):
+    from src.mcp_handlers.updates.phases import persist_agent_states
+
+    monkeypatch.setenv("STRICT_IDENTITY_REQUIRED", "1")
+    contexts = [_recorded_ctx("known", 0.6), _recorded_ctx("orphan", 0.7), _recorded_ctx("known", 0.8)]
+    storage = MagicMock(
+        record_agent_states=AsyncMock(return_value=["orphan"]),
+        record_agent_state=AsyncMock(side_effect=ValueError("identity not found")),
+        create_agent=AsyncMock(),
+    )
+    with patch("src.mcp_handlers.updates.phases.agent_storage", storage):
+        recorded = await persist_agent_states(contexts)
+
+    assert recorded == [contexts[0], contexts[2]]
+    assert [r["E"] for r in storage.record_agent_states.await_args.args[0]] == [0.6, 0.7, 0.8]
+    storage.create_agent.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_batch_lock_timeout_fails_only_that_agents_items():
+    class _Locks:
+        def acquire_agent_lock_async(self, agent_id, **kwargs):
+            if agent_id == "uuid-b":
+                raise TimeoutError("lock timeout")
+            return _DummyLock()
+
+    server = MagicMock(lock_manager=_Locks(), monitors={})
+    contexts = [_batch_ctx(server, "uuid-a", "a1"), _batch_ctx(server, "uuid-b", "b1")]
+
+    with patch("src.mcp_handlers.updates.phases.resolve_identity_and_guards", new=AsyncMock(side_effect=_fake_resolve)), \
+         patch("src.mcp_handlers.updates.phases.handle_onboarding_and_resume", new=AsyncMock(return_value=None)), \
+         patch("src.mcp_handlers.updates.phases.transform_inputs", return_value=None), \
+         patch("src.mcp_handlers.updates.phases.prepare_unlocked_inputs", new=AsyncMock()), \
+         patch("src.mcp_handlers.updates.phases.execute_locked_update", new=AsyncMock(return_value=None)), \
+         patch("src.mcp_handlers.updates.phases.execute_post_update_effects", new=AsyncMock()), \
+         patch("src.mcp_handlers.updates.phases.persist_agent_states", new=AsyncMock(return_value=[])), \
+         patch("src.services.update_workflow_service._lock_timeout_response", new=AsyncMock(return_value=["timeout"])), \
+         patch("src.services.update_workflow_service._respond", new=AsyncMock(return_value=["ok"])):
+        results = await run_process_update_batch(contexts)
+
+    assert results == [["ok"], ["timeout"]]
+
+
 @pytest.mark.asyncio
 async def test_run_process_update_workflow_real_spine_with_edge_mocks():
     """Exercise the real workflow spine while mocking only storage/DB-style edges."""
@@ -463,3 +612,47 @@ async def test_run_process_update_workflow_real_spine_blocks_explicitly_archived
     harness.storage.update_agent.assert_not_called()
     metadata_cache.invalidate.assert_not_called()
     audit_logger.log_auto_resume.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "response_mode,planning,expect_fields",
+    [("compact", "1", True), ("full", "1", False), ("compact", "0", False)],
+)
+async def test_enrichment_planned_from_resolved_response_mode(monkeypatch, response_mode, planning, expect_fields):
+    """The workflow resolves the response mode first and hands the kept fields to the pipeline."""
+    from src.mcp_handlers.response_formatter import MODE_FIELDS
+
+    monkeypatch.setenv("UNITARES_ENRICHMENT_PLANNING", planning)
+    ctx = SimpleNamespace(
+        mcp_server=MagicMock(),
+        agent_id="agent-123",
+        agent_uuid="uuid-123",
+        arguments={"response_mode": response_mode},
+        identity_assurance={"tier": "strong"},
+        result={"status": "ok"},
+        meta=None,
+        is_new_agent=False,
+        key_was_generated=False,
+        api_key_auto_retrieved=False,
+        task_type="mixed",
+        loop=AsyncMock(),
+    )
+    ctx.mcp_server.lock_manager.acquire_agent_lock_async.return_value = _DummyLock()
+    ctx.mcp_server.monitors = {"agent-123": {"dummy": True}}
+    pipeline = AsyncMock()
+
+    with patch("src.mcp_handlers.updates.phases.resolve_identity_and_guards", new=AsyncMock(return_value=None)), \
+         patch("src.mcp_handlers.updates.phases.handle_onboarding_and_resume", new=AsyncMock(return_value=None)), \
+         patch("src.mcp_handlers.updates.phases.transform_inputs", return_value=None), \
+         patch("src.mcp_handlers.updates.phases.execute_locked_update", new=AsyncMock(return_value=None)), \
+         patch("src.mcp_handlers.updates.phases.prepare_unlocked_inputs", new=AsyncMock()), \
+         patch("src.mcp_handlers.updates.phases.execute_post_update_effects", new=AsyncMock()), \
+         patch("src.mcp_handlers.updates.pipeline.run_enrichment_pipeline", new=pipeline), \
+         patch("src.mcp_handlers.response_formatter.format_response", return_value={"status": "formatted"}) as fmt, \
+         patch("src.services.update_workflow_service.serialize_process_update_response", return_value=["done"]):
+        await run_process_update_workflow(ctx)
+
+    fields = pipeline.await_args.kwargs["fields"]
+    assert fields == (MODE_FIELDS[response_mode] if expect_fields else None)
+    assert fmt.call_args.kwargs["response_mode"] == response_mode
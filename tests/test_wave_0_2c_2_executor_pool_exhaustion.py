@@ -150,3 +150,47 @@ async def test_emit_failure_does_not_mask_connection_error():
         with pytest.raises(ConnectionError, match="pool exhausted"):
             async with backend.acquire():
                 pytest.fail("body must not execute")
+
+
+@pytest.mark.asyncio
+async def test_run_unit_acquire_timeout_maps_to_same_exhaustion_path():
+    """run_unit ships the unit of work to ExecutorPool.run in one hop; an
+    acquire timeout there must surface exactly like backend.acquire()'s."""
+    import time
+
+    from src.db.executor_pool import ExecutorPool
+    from src.db.postgres_backend import PostgresBackend
+
+    async def timeout_aenter():
+        raise asyncio.TimeoutError()
+
+    acquire_ctx = MagicMock()
+    acquire_ctx.__aenter__ = MagicMock(side_effect=timeout_aenter)
+    acquire_ctx.__aexit__ = AsyncMock(return_value=None)
+    raw_pool = MagicMock()
+    raw_pool.acquire = MagicMock(return_value=acquire_ctx)
+    raw_pool.close = AsyncMock()
+    raw_pool.get_size = MagicMock(return_value=25)
+    raw_pool.get_max_size = MagicMock(return_value=25)
+    raw_pool.get_idle_size = MagicMock(return_value=0)
+
+    backend = PostgresBackend()
+    backend._pool = ExecutorPool(raw_pool)
+    backend._last_pool_check = time.time()  # skip the periodic health check
+
+    async def work(conn):
+        pytest.fail("work must not execute")
+
+    try:
+        with patch(
+            "src.coordination_failure_emit.emit_coordination_failure_sync"
+        ) as mock_emit:
+            with pytest.raises(ConnectionError, match="pool exhausted"):
+                await backend.run_unit(work, timeout=2)
+    finally:
+        await backend._pool.close()
+
+    mock_emit.assert_called_once()
+    kwargs = mock_emit.call_args.kwargs
+    assert kwargs["event_type"] == SATURATION_EVENT_TYPE
+    assert kwargs["payload"]["timeout_s"] == 2